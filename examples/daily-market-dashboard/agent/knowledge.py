@@ -1,11 +1,15 @@
-"""Knowledge-folder helpers based on markdown + ripgrep search."""
+"""Knowledge-folder helpers: markdown listing, ripgrep search and an in-memory BM25 index."""
 
 from __future__ import annotations
 
+import heapq
 import logging
+import math
+import os
 import re
+import stat
 import subprocess
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from agent.path_utils import is_within
@@ -124,6 +128,11 @@ def search_knowledge_markdown(
 
 def build_knowledge_pattern(query: str) -> str:
     """Build a safe OR pattern from query terms for ripgrep usage."""
+    return "|".join(_to_rg_pattern_term(term) for term in extract_query_terms(query))
+
+
+def extract_query_terms(query: str) -> list[str]:
+    """Pick up to four distinct, non-stopword search terms from a chat prompt."""
     terms: list[str] = []
     seen: set[str] = set()
     for token in re.split(r"\s+", query.strip()):
@@ -144,7 +153,7 @@ def build_knowledge_pattern(query: str) -> str:
             break
     if not terms and query.strip():
         terms = [query.strip()]
-    return "|".join(_to_rg_pattern_term(term) for term in terms)
+    return terms
 
 
 def _to_rg_pattern_term(term: str) -> str:
@@ -249,3 +258,208 @@ def _fallback_python_search(
                 if len(matches) >= max_hits:
                     return matches
     return matches
+
+
+# ASCII words and single non-ASCII characters (CJK text has no spaces).
+_INDEX_TOKEN_RE = re.compile(r"[a-z0-9_]+|[^\x00-\x7f]")
+_WORD_TERM_RE = re.compile(r"[A-Za-z0-9_]+")
+
+
+def _index_tokens(text: str) -> list[str]:
+    """Lower-cased index tokens of a line, plus bigrams of adjacent non-ASCII characters."""
+    tokens = _INDEX_TOKEN_RE.findall(text.lower())
+    bigrams = [
+        left + right
+        for left, right in zip(tokens, tokens[1:])
+        if not left.isascii() and not right.isascii()
+    ]
+    return tokens + bigrams
+
+
+@dataclass
+class _IndexedLine:
+    path: str
+    line: int
+    snippet: str
+    text: str  # lower-cased, for substring terms
+    length: int
+
+
+@dataclass
+class _IndexedFile:
+    mtime_ns: int
+    size: int
+    line_ids: list[int] = field(default_factory=list)
+    tokens: set[str] = field(default_factory=set)
+
+
+class KnowledgeIndex:
+    """In-memory BM25 index over the lines of the knowledge markdown files.
+
+    Each non-blank line is one indexed document, so hits stay line-level like
+    the ripgrep search. ``refresh()`` (run by every ``search()``) only stats
+    the folder; a file is re-read when its mtime or size changes and dropped
+    when it disappears. Matching is case-insensitive: ASCII word terms match
+    whole words, any other term (CJK, ``S&P``) matches as a substring.
+    """
+
+    def __init__(
+        self, knowledge_dir: Path, project_root: Path, *, k1: float = 1.5, b: float = 0.75
+    ):
+        self.knowledge_dir = knowledge_dir
+        self.project_root = project_root.resolve()
+        self._knowledge_root = knowledge_dir.resolve()
+        self._rel_dir = str(self._knowledge_root.relative_to(self.project_root))
+        self.k1 = k1
+        self.b = b
+        self._files: dict[str, _IndexedFile] = {}
+        self._lines: dict[int, _IndexedLine] = {}
+        self._postings: dict[str, dict[int, int]] = {}  # token -> {line id: term frequency}
+        self._total_length = 0
+        self._next_id = 0
+        self._norms: dict[int, float] | None = None  # BM25 length norms, reset on change
+
+    def files(self) -> list[str]:
+        """Sorted project-relative paths of the indexed files, as of the last refresh."""
+        return sorted(self._files)
+
+    def refresh(self) -> None:
+        """Re-index new and modified files and drop deleted ones."""
+        seen: set[str] = set()
+        base = str(self.knowledge_dir)
+        # os.walk + stat instead of rglob + resolve: this runs on every query.
+        for dirpath, _dirnames, filenames in os.walk(base):
+            for name in filenames:
+                if not name.endswith(".md"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    file_stat = os.lstat(path)
+                    if stat.S_ISLNK(file_stat.st_mode):
+                        # Only follow links whose target stays inside the knowledge folder.
+                        if not is_within(Path(path).resolve(), self._knowledge_root):
+                            continue
+                        file_stat = os.stat(path)
+                except OSError:
+                    continue
+                if not stat.S_ISREG(file_stat.st_mode):
+                    continue
+                rel_path = os.path.join(self._rel_dir, path[len(base) + 1 :])
+                seen.add(rel_path)
+                indexed = self._files.get(rel_path)
+                if indexed and (indexed.mtime_ns, indexed.size) == (
+                    file_stat.st_mtime_ns,
+                    file_stat.st_size,
+                ):
+                    continue
+                if indexed:
+                    self._remove(rel_path)
+                self._add(rel_path, Path(path), file_stat.st_mtime_ns, file_stat.st_size)
+        for rel_path in [name for name in self._files if name not in seen]:
+            self._remove(rel_path)
+
+    def search(self, query: str, *, max_hits: int) -> list[KnowledgeMatch]:
+        """Return up to ``max_hits`` lines ranked by BM25 score for the query terms."""
+        if not query.strip():
+            return []
+        self.refresh()
+        if not self._lines:
+            return []
+
+        line_count = len(self._lines)
+        if self._norms is None:
+            avg_length = self._total_length / line_count
+            self._norms = {
+                line_id: self.k1 * (1 - self.b + self.b * line.length / avg_length)
+                for line_id, line in self._lines.items()
+            }
+        norms = self._norms
+        scores: dict[int, float] = {}
+        for term in extract_query_terms(query):
+            frequencies = self._term_frequencies(term)
+            if not frequencies:
+                continue
+            idf = math.log(1 + (line_count - len(frequencies) + 0.5) / (len(frequencies) + 0.5))
+            weight = idf * (self.k1 + 1)
+            for line_id, tf in frequencies.items():
+                scores[line_id] = scores.get(line_id, 0.0) + weight * tf / (tf + norms[line_id])
+
+        lines = self._lines
+        ranked = heapq.nsmallest(
+            max_hits,
+            scores,
+            key=lambda line_id: (-scores[line_id], lines[line_id].path, lines[line_id].line),
+        )
+        return [
+            KnowledgeMatch(path=hit.path, line=hit.line, snippet=hit.snippet)
+            for hit in (lines[line_id] for line_id in ranked)
+        ]
+
+    def _term_frequencies(self, term: str) -> dict[int, int]:
+        lowered = term.lower()
+        if _WORD_TERM_RE.fullmatch(term):
+            return self._postings.get(lowered, {})
+
+        # Substring term: narrow candidates with tokens that must appear
+        # whole (non-ASCII characters and bigrams, ASCII words not at the term
+        # edges, which may be part of a longer word), then verify.
+        keys = [token for token in _index_tokens(lowered) if not token.isascii()]
+        words = _INDEX_TOKEN_RE.findall(lowered)
+        keys += [
+            word
+            for position, word in enumerate(words)
+            if word.isascii() and 0 < position < len(words) - 1
+        ]
+        if keys:
+            postings = [self._postings.get(key, {}) for key in keys]
+            candidates = set(min(postings, key=len)).intersection(*postings)
+        else:
+            candidates = set(self._lines)
+        frequencies = {}
+        for line_id in candidates:
+            count = self._lines[line_id].text.count(lowered)
+            if count:
+                frequencies[line_id] = count
+        return frequencies
+
+    def _add(self, rel_path: str, path: Path, mtime_ns: int, size: int) -> None:
+        self._norms = None
+        indexed = _IndexedFile(mtime_ns=mtime_ns, size=size)
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            logger.warning("Could not read knowledge file %s", rel_path)
+            return
+        for line_no, line in enumerate(text.splitlines(), 1):
+            snippet = line.strip()
+            if not snippet:
+                continue
+            tokens = _index_tokens(snippet)
+            line_id = self._next_id
+            self._next_id += 1
+            self._lines[line_id] = _IndexedLine(
+                path=rel_path,
+                line=line_no,
+                snippet=snippet,
+                text=snippet.lower(),
+                length=len(tokens) or 1,
+            )
+            self._total_length += len(tokens) or 1
+            for token in tokens:
+                line_postings = self._postings.setdefault(token, {})
+                line_postings[line_id] = line_postings.get(line_id, 0) + 1
+            indexed.line_ids.append(line_id)
+            indexed.tokens.update(tokens)
+        self._files[rel_path] = indexed
+
+    def _remove(self, rel_path: str) -> None:
+        self._norms = None
+        indexed = self._files.pop(rel_path)
+        for token in indexed.tokens:
+            line_postings = self._postings[token]
+            for line_id in indexed.line_ids:
+                line_postings.pop(line_id, None)
+            if not line_postings:
+                del self._postings[token]
+        for line_id in indexed.line_ids:
+            self._total_length -= self._lines.pop(line_id).length
@@ -6,6 +6,7 @@ import json
 import logging
 import subprocess
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
@@ -15,10 +16,9 @@ from agent.attachments import cleanup_all_uploads, persist_attachments
 from agent.client import ClaudeChatAgent
 from agent.context_builder import PromptContextBuilder
 from agent.knowledge import (
+    KnowledgeIndex,
     build_knowledge_preamble,
-    list_knowledge_markdown_files,
     resolve_knowledge_dir,
-    search_knowledge_markdown,
 )
 from agent.sanitizer import sanitize
 from config.settings import (
@@ -295,6 +295,21 @@ def _initialize_session_state() -> None:
         st.session_state.attachment_session_id = uuid4().hex
     if "request_timestamps" not in st.session_state:
         st.session_state.request_timestamps = []
+    if KNOWLEDGE_ENABLED and "knowledge_index" not in st.session_state:
+        try:
+            _knowledge_index(resolve_knowledge_dir(PROJECT_ROOT, KNOWLEDGE_DIR))
+        except ValueError:
+            pass  # reported on the first prompt by _build_prompt_context
+
+
+def _knowledge_index(knowledge_dir: Path) -> KnowledgeIndex:
+    """Return this session's knowledge index, building it on first use."""
+    index = st.session_state.get("knowledge_index")
+    if index is None or index.knowledge_dir != knowledge_dir:
+        index = KnowledgeIndex(knowledge_dir, PROJECT_ROOT)
+        index.refresh()
+        st.session_state.knowledge_index = index
+    return index
 
 
 def _cleanup_uploads_on_startup_once() -> None:
@@ -366,14 +381,9 @@ def _build_prompt_context(
 
     if KNOWLEDGE_ENABLED:
         try:
-            knowledge_dir = resolve_knowledge_dir(PROJECT_ROOT, KNOWLEDGE_DIR)
-            knowledge_files = list_knowledge_markdown_files(knowledge_dir, PROJECT_ROOT)
-            knowledge_matches = search_knowledge_markdown(
-                prompt,
-                knowledge_dir=knowledge_dir,
-                project_root=PROJECT_ROOT,
-                max_hits=KNOWLEDGE_MAX_HITS,
-            )
+            knowledge_index = _knowledge_index(resolve_knowledge_dir(PROJECT_ROOT, KNOWLEDGE_DIR))
+            knowledge_matches = knowledge_index.search(prompt, max_hits=KNOWLEDGE_MAX_HITS)
+            knowledge_files = knowledge_index.files()
             builder.add_knowledge_preamble(
                 build_knowledge_preamble(knowledge_files, knowledge_matches)
             )
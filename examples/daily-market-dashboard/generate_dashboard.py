@@ -4,8 +4,16 @@
 Produces a unified markdown report in knowledge/daily_dashboard_YYYY-MM-DD.md
 and removes dashboards older than 3 days.
 
+Before the skills start, a prefetch stage downloads the public CSV datasets
+they share into a local cache directory once; skills that accept
+``--data-dir`` read those copies instead of downloading their own. With
+``--fmp-cache`` the FMP based skills also share an on-disk API response cache
+(``FMP_CACHE_DIR``) in the same directory, so a same-day regeneration reuses
+their price history.
+
 Usage:
     python3 generate_dashboard.py --project-root ../.. --lang ja
+    python3 generate_dashboard.py --project-root ../.. --timeout 180
 """
 
 from __future__ import annotations
@@ -14,10 +22,13 @@ import argparse
 import glob
 import json
 import logging
+import os
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -29,7 +40,30 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 DASHBOARD_DIR = Path(__file__).resolve().parent / "knowledge"
+CACHE_DIR = Path(__file__).resolve().parent / "cache"
 RETENTION_DAYS = 3
+SKILL_TIMEOUT = 120
+
+# Public CSV datasets read by more than one run (file name -> URL). File
+# names match the URL basenames the skills look for under --data-dir.
+PREFETCH_DATASETS: dict[str, str] = {
+    "uptrend_ratio_timeseries.csv": (
+        "https://raw.githubusercontent.com/tradermonty/uptrend-dashboard/"
+        "main/data/uptrend_ratio_timeseries.csv"
+    ),
+    "sector_summary.csv": (
+        "https://raw.githubusercontent.com/tradermonty/uptrend-dashboard/"
+        "main/data/sector_summary.csv"
+    ),
+    "market_breadth_data.csv": (
+        "https://tradermonty.github.io/market-breadth-analysis/market_breadth_data.csv"
+    ),
+    "market_breadth_summary.csv": (
+        "https://tradermonty.github.io/market-breadth-analysis/market_breadth_summary.csv"
+    ),
+}
+# Prefetched files younger than this are reused without a download
+PREFETCH_MAX_AGE = 3600
 
 
 # ---------------------------------------------------------------------------
@@ -68,6 +102,11 @@ _I18N: dict[str, dict[str, str]] = {
             "Market Top Detector and Economic Calendar require interactive execution. "
             "Run `/market-top-detector` or `/economic-calendar-fetcher` in chat."
         ),
+        "run_timing": "Run Timing",
+        "col_status": "Status",
+        "col_seconds": "Seconds",
+        "data_prefetch": "Data prefetch",
+        "prefetch_detail": "{fetched} fetched, {cached} cached, {failed} failed",
         "generated_at": "Generated at",
     },
     "ja": {
@@ -101,6 +140,11 @@ _I18N: dict[str, dict[str, str]] = {
             "Market Top Detector と Economic Calendar はインタラクティブな実行が必要です。"
             "チャットで `/market-top-detector` や `/economic-calendar-fetcher` を実行してください。"
         ),
+        "run_timing": "実行時間",
+        "col_status": "状態",
+        "col_seconds": "秒",
+        "data_prefetch": "データ事前取得",
+        "prefetch_detail": "取得 {fetched} / キャッシュ {cached} / 失敗 {failed}",
         "generated_at": "生成日時",
     },
 }
@@ -117,7 +161,11 @@ def _t(lang: str, key: str) -> str:
 
 
 def _skill_defs(project_root: Path) -> list[dict[str, Any]]:
-    """Return the 5 skill execution definitions (no API key required)."""
+    """Return the 5 skill execution definitions (no API key required).
+
+    ``datasets`` lists the prefetched files a skill can read offline; when all
+    of them are available, ``offline_args`` is appended to its arguments.
+    """
     skills_dir = project_root / "skills"
     return [
         {
@@ -131,6 +179,8 @@ def _skill_defs(project_root: Path) -> list[dict[str, Any]]:
             "script": str(skills_dir / "uptrend-analyzer" / "scripts" / "uptrend_analyzer.py"),
             "args": ["--output-dir", "{tmpdir}"],
             "glob": "uptrend_analysis_*.json",
+            "datasets": ["uptrend_ratio_timeseries.csv", "sector_summary.csv"],
+            "offline_args": ["--data-dir", "{datadir}"],
         },
         {
             "name": "Market Breadth",
@@ -139,12 +189,16 @@ def _skill_defs(project_root: Path) -> list[dict[str, Any]]:
             ),
             "args": ["--output-dir", "{tmpdir}"],
             "glob": "market_breadth_*.json",
+            "datasets": ["market_breadth_data.csv", "market_breadth_summary.csv"],
+            "offline_args": ["--data-dir", "{datadir}"],
         },
         {
             "name": "Theme Detector",
             "script": str(skills_dir / "theme-detector" / "scripts" / "theme_detector.py"),
             "args": ["--output-dir", "{tmpdir}"],
             "glob": "theme_detector_*.json",
+            "datasets": ["uptrend_ratio_timeseries.csv"],
+            "offline_args": ["--data-dir", "{datadir}"],
         },
         {
             "name": "VCP Screener",
@@ -155,37 +209,128 @@ def _skill_defs(project_root: Path) -> list[dict[str, Any]]:
     ]
 
 
+# ---------------------------------------------------------------------------
+# Prefetch
+# ---------------------------------------------------------------------------
+
+
+def _download(url: str, dest: Path) -> None:
+    """Download ``url`` to ``dest`` atomically so a reader never sees a torn file."""
+    fd, tmp_path = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f, urllib.request.urlopen(url, timeout=30) as resp:
+            f.write(resp.read())
+        os.replace(tmp_path, dest)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _prefetch_one(url: str, dest: Path, max_age: float) -> str:
+    """Make ``dest`` a fresh copy of ``url``; return "cached", "fetched" or "error"."""
+    try:
+        if time.time() - dest.stat().st_mtime < max_age:
+            return "cached"
+    except OSError:
+        pass
+    try:
+        _download(url, dest)
+    except Exception as exc:
+        logger.warning("Prefetch of %s failed: %s", url, exc)
+        return "error"
+    return "fetched"
+
+
+def prefetch_datasets(
+    cache_dir: Path,
+    datasets: dict[str, str] | None = None,
+    max_age: float = PREFETCH_MAX_AGE,
+) -> dict[str, Any]:
+    """Download the shared CSV datasets into ``cache_dir`` once, concurrently.
+
+    Returns:
+        ``{"data_dir", "files": {file name: "fetched" | "cached" | "error"},
+        "elapsed"}``. Skills needing a file that failed fall back to
+        downloading it themselves.
+    """
+    datasets = PREFETCH_DATASETS if datasets is None else datasets
+    start = time.perf_counter()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max(len(datasets), 1)) as pool:
+        statuses = pool.map(
+            lambda item: _prefetch_one(item[1], cache_dir / item[0], max_age),
+            datasets.items(),
+        )
+        files = dict(zip(datasets, statuses))
+    return {
+        "data_dir": str(cache_dir),
+        "files": files,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def _skill_args(skill_def: dict[str, Any], prefetch: dict[str, Any] | None) -> list[str]:
+    """Skill arguments, switched to offline input when its datasets were prefetched."""
+    datasets = skill_def.get("datasets")
+    if not prefetch or not datasets:
+        return list(skill_def["args"])
+    files = prefetch["files"]
+    if any(files.get(name) not in ("fetched", "cached") for name in datasets):
+        return list(skill_def["args"])
+    offline = [a.replace("{datadir}", prefetch["data_dir"]) for a in skill_def["offline_args"]]
+    return [*skill_def["args"], *offline]
+
+
 # ---------------------------------------------------------------------------
 # Execution helpers
 # ---------------------------------------------------------------------------
 
 
-def _run_skill(name: str, script: str, args: list[str], tmpdir: str) -> dict[str, Any]:
-    """Run a single skill script and return its JSON output."""
+def _run_skill(
+    name: str,
+    script: str,
+    args: list[str],
+    tmpdir: str,
+    timeout: float = SKILL_TIMEOUT,
+    env: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Run a single skill script; ``elapsed`` is its wall time in seconds."""
     resolved_args = [a.replace("{tmpdir}", tmpdir) for a in args]
     cmd = [sys.executable, script, *resolved_args]
     logger.info("Running %s: %s", name, " ".join(cmd))
 
+    start = time.perf_counter()
     try:
         result = subprocess.run(
             cmd,
             capture_output=True,
             text=True,
-            timeout=120,
+            timeout=timeout,
+            env=env,
         )
     except subprocess.TimeoutExpired:
-        logger.warning("%s timed out after 120s", name)
-        return {"name": name, "status": "timeout", "data": None}
+        logger.warning("%s timed out after %ss", name, timeout)
+        return _run_result(name, "timeout", start)
     except Exception as exc:
         logger.warning("%s failed to execute: %s", name, exc)
-        return {"name": name, "status": "error", "data": None}
+        return _run_result(name, "error", start)
 
     if result.returncode != 0:
         stderr_preview = (result.stderr or "")[:300]
         logger.warning("%s exited with code %d: %s", name, result.returncode, stderr_preview)
-        return {"name": name, "status": "error", "data": None}
+        return _run_result(name, "error", start)
 
-    return {"name": name, "status": "ok", "data": None}
+    return _run_result(name, "ok", start)
+
+
+def _run_result(name: str, status: str, start: float) -> dict[str, Any]:
+    return {
+        "name": name,
+        "status": status,
+        "data": None,
+        "elapsed": time.perf_counter() - start,
+    }
 
 
 def _collect_json(tmpdir: str, pattern: str) -> Any | None:
@@ -204,10 +349,30 @@ def _collect_json(tmpdir: str, pattern: str) -> Any | None:
         return None
 
 
-def run_all_skills(project_root: Path) -> dict[str, Any]:
-    """Run all 5 skills in parallel and return collected JSON results."""
+def run_all_skills(
+    project_root: Path,
+    prefetch: dict[str, Any] | None = None,
+    timeout: float = SKILL_TIMEOUT,
+    fmp_cache_dir: Path | None = None,
+) -> dict[str, Any]:
+    """Run all 5 skills in parallel and return collected JSON results.
+
+    Args:
+        project_root: Root of the claude-trading-skills repository
+        prefetch: Result of ``prefetch_datasets``
+        timeout: Per-skill timeout in seconds
+        fmp_cache_dir: Shared FMP response cache for the skills, unless
+            FMP_CACHE_DIR is already set (default: no shared cache)
+
+    Returns:
+        Results keyed by skill name, in skill definition order
+    """
     defs = _skill_defs(project_root)
     results: dict[str, Any] = {}
+    env = None
+    if fmp_cache_dir is not None:
+        env = dict(os.environ)
+        env.setdefault("FMP_CACHE_DIR", str(fmp_cache_dir))
 
     with tempfile.TemporaryDirectory(prefix="dashboard_") as tmpdir:
         futures = {}
@@ -217,8 +382,10 @@ def run_all_skills(project_root: Path) -> dict[str, Any]:
                     _run_skill,
                     skill_def["name"],
                     skill_def["script"],
-                    skill_def["args"],
+                    _skill_args(skill_def, prefetch),
                     tmpdir,
+                    timeout,
+                    env,
                 )
                 futures[future] = skill_def
 
@@ -234,7 +401,7 @@ def run_all_skills(project_root: Path) -> dict[str, Any]:
                 run_result["data"] = data
                 results[skill_def["name"]] = run_result
 
-    return results
+    return {skill_def["name"]: results[skill_def["name"]] for skill_def in defs}
 
 
 # ---------------------------------------------------------------------------
@@ -253,8 +420,43 @@ def _safe_get(data: Any, *keys: str, default: Any = "N/A") -> Any:
     return current
 
 
-def generate_markdown(results: dict[str, Any], today: date, lang: str = "en") -> str:
-    """Build the unified dashboard markdown from skill results."""
+def _timing_lines(results: dict[str, Any], prefetch: dict[str, Any] | None, lang: str) -> list[str]:
+    """Per-skill wall time table; empty when nothing was timed."""
+    timed = [(name, r) for name, r in results.items() if isinstance(r.get("elapsed"), (int, float))]
+    if not timed and not prefetch:
+        return []
+    lines = [f"## {_t(lang, 'run_timing')}", ""]
+    lines.append(
+        f"| {_t(lang, 'col_skill')} | {_t(lang, 'col_status')} | {_t(lang, 'col_seconds')} |"
+    )
+    lines.append("|-------|--------|--------:|")
+    if prefetch:
+        statuses = list(prefetch.get("files", {}).values())
+        detail = _t(lang, "prefetch_detail").format(
+            fetched=statuses.count("fetched"),
+            cached=statuses.count("cached"),
+            failed=statuses.count("error"),
+        )
+        lines.append(
+            f"| {_t(lang, 'data_prefetch')} | {detail} | {prefetch.get('elapsed', 0.0):.1f} |"
+        )
+    for name, result in timed:
+        lines.append(f"| {name} | {result.get('status', 'unknown')} | {result['elapsed']:.1f} |")
+    lines.append("")
+    return lines
+
+
+def generate_markdown(
+    results: dict[str, Any],
+    today: date,
+    lang: str = "en",
+    prefetch: dict[str, Any] | None = None,
+) -> str:
+    """Build the unified dashboard markdown from skill results.
+
+    A run timing table is added when results carry ``elapsed`` seconds or
+    ``prefetch`` (the result of ``prefetch_datasets``) is given.
+    """
     lines: list[str] = []
     lines.append(f"# {_t(lang, 'title')}  {today.isoformat()}")
     lines.append("")
@@ -385,6 +587,9 @@ def generate_markdown(results: dict[str, Any], today: date, lang: str = "en") ->
         lines.append(f"*VCP Screener {_t(lang, 'no_data')}*")
     lines.append("")
 
+    # --- Run Timing ---
+    lines.extend(_timing_lines(results, prefetch, lang))
+
     # --- Note ---
     lines.append("---")
     lines.append("")
@@ -434,6 +639,28 @@ def main() -> None:
         default="en",
         help="Dashboard language (default: en)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=CACHE_DIR,
+        help=f"Directory for prefetched datasets and the FMP cache (default: {CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        action="store_true",
+        help="Let every skill download its own data",
+    )
+    parser.add_argument(
+        "--fmp-cache",
+        action="store_true",
+        help="Share an FMP API response cache between skills in <cache-dir>/fmp",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=SKILL_TIMEOUT,
+        help=f"Per-skill timeout in seconds (default: {SKILL_TIMEOUT})",
+    )
     args = parser.parse_args()
     project_root = args.project_root.resolve()
 
@@ -442,17 +669,32 @@ def main() -> None:
         sys.exit(1)
 
     logger.info("Project root: %s", project_root)
-    logger.info("Running 5 skills in parallel...")
 
-    results = run_all_skills(project_root)
+    prefetch = None
+    if not args.no_prefetch:
+        logger.info("Prefetching shared datasets into %s...", args.cache_dir)
+        prefetch = prefetch_datasets(args.cache_dir.resolve())
+        logger.info("  prefetch: %s (%.1fs)", prefetch["files"], prefetch["elapsed"])
+
+    logger.info("Running 5 skills in parallel...")
+    fmp_cache_dir = args.cache_dir.resolve() / "fmp" if args.fmp_cache else None
+    results = run_all_skills(
+        project_root, prefetch=prefetch, timeout=args.timeout, fmp_cache_dir=fmp_cache_dir
+    )
 
     for name, result in results.items():
         status = result.get("status", "unknown")
         has_data = result.get("data") is not None
-        logger.info("  %s: status=%s, has_data=%s", name, status, has_data)
+        logger.info(
+            "  %s: status=%s, has_data=%s, %.1fs",
+            name,
+            status,
+            has_data,
+            result.get("elapsed", 0.0),
+        )
 
     today = date.today()
-    markdown = generate_markdown(results, today, lang=args.lang)
+    markdown = generate_markdown(results, today, lang=args.lang, prefetch=prefetch)
 
     DASHBOARD_DIR.mkdir(parents=True, exist_ok=True)
     output_path = DASHBOARD_DIR / f"daily_dashboard_{today.isoformat()}.md"
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import sys
+import tempfile
 import unittest
 from datetime import date
 from pathlib import Path
@@ -10,7 +12,14 @@ from pathlib import Path
 # Add parent to path so we can import the module
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from generate_dashboard import _safe_get, generate_markdown
+from generate_dashboard import (
+    _run_skill,
+    _safe_get,
+    _skill_args,
+    _skill_defs,
+    generate_markdown,
+    prefetch_datasets,
+)
 
 
 class TestSafeGet(unittest.TestCase):
@@ -154,6 +163,134 @@ class TestGenerateMarkdown(unittest.TestCase):
         assert "Market Top Detector" in md
         assert "/economic-calendar-fetcher" in md
 
+    def test_no_timing_section_without_timings(self):
+        md = generate_markdown(self._make_results(), date(2026, 3, 18))
+        assert "Run Timing" not in md
+
+    def test_timing_section_lists_prefetch_and_skills(self):
+        results = self._make_results(
+            **{
+                "FTD Detector": {"status": "ok", "data": None, "elapsed": 12.34},
+                "VCP Screener": {"status": "timeout", "data": None, "elapsed": 120.0},
+            }
+        )
+        prefetch = {
+            "data_dir": "/tmp/cache",
+            "files": {"a.csv": "fetched", "b.csv": "cached", "c.csv": "error"},
+            "elapsed": 0.81,
+        }
+        md = generate_markdown(results, date(2026, 3, 18), prefetch=prefetch)
+        assert "## Run Timing" in md
+        assert "| Data prefetch | 1 fetched, 1 cached, 1 failed | 0.8 |" in md
+        assert "| FTD Detector | ok | 12.3 |" in md
+        assert "| VCP Screener | timeout | 120.0 |" in md
+        assert md.index("## Run Timing") < md.index("> **Note**")
+
+    def test_timing_section_japanese(self):
+        results = self._make_results(**{"FTD Detector": {"status": "ok", "elapsed": 1.0}})
+        md = generate_markdown(results, date(2026, 3, 18), lang="ja")
+        assert "## 実行時間" in md
+
+
+class TestPrefetch(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.source = self.tmp / "source.csv"
+        self.source.write_text("Metric,Value\nA,1\n", encoding="utf-8")
+        self.cache_dir = self.tmp / "cache"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_fetches_then_reuses_fresh_copies(self):
+        datasets = {
+            "summary.csv": self.source.as_uri(),
+            "missing.csv": (self.tmp / "missing.csv").as_uri(),
+        }
+        first = prefetch_datasets(self.cache_dir, datasets)
+        assert first["files"] == {"summary.csv": "fetched", "missing.csv": "error"}
+        assert first["data_dir"] == str(self.cache_dir)
+        assert (self.cache_dir / "summary.csv").read_text(encoding="utf-8") == "Metric,Value\nA,1\n"
+        assert not (self.cache_dir / "missing.csv").exists()
+        assert not list(self.cache_dir.glob("*.tmp"))
+
+        second = prefetch_datasets(self.cache_dir, datasets)
+        assert second["files"]["summary.csv"] == "cached"
+
+    def test_stale_copy_is_downloaded_again(self):
+        datasets = {"summary.csv": self.source.as_uri()}
+        prefetch_datasets(self.cache_dir, datasets)
+        old = (self.cache_dir / "summary.csv").stat().st_mtime - 7200
+        os.utime(self.cache_dir / "summary.csv", (old, old))
+        self.source.write_text("Metric,Value\nA,2\n", encoding="utf-8")
+
+        result = prefetch_datasets(self.cache_dir, datasets, max_age=3600)
+        assert result["files"]["summary.csv"] == "fetched"
+        assert "A,2" in (self.cache_dir / "summary.csv").read_text(encoding="utf-8")
+
+
+class TestSkillArgs(unittest.TestCase):
+    def _def(self, name):
+        return next(d for d in _skill_defs(Path("/repo")) if d["name"] == name)
+
+    def test_offline_args_added_when_all_datasets_prefetched(self):
+        prefetch = {
+            "data_dir": "/cache",
+            "files": {"uptrend_ratio_timeseries.csv": "cached", "sector_summary.csv": "fetched"},
+        }
+        args = _skill_args(self._def("Uptrend Analyzer"), prefetch)
+        assert args == ["--output-dir", "{tmpdir}", "--data-dir", "/cache"]
+
+    def test_partial_prefetch_keeps_online_args(self):
+        prefetch = {
+            "data_dir": "/cache",
+            "files": {"market_breadth_data.csv": "fetched", "market_breadth_summary.csv": "error"},
+        }
+        assert _skill_args(self._def("Market Breadth"), prefetch) == ["--output-dir", "{tmpdir}"]
+
+    def test_skills_without_datasets_and_no_prefetch(self):
+        prefetch = {"data_dir": "/cache", "files": {}}
+        assert _skill_args(self._def("VCP Screener"), prefetch) == ["--output-dir", "{tmpdir}"]
+        assert _skill_args(self._def("Theme Detector"), None) == ["--output-dir", "{tmpdir}"]
+
+    def test_every_prefetchable_dataset_has_a_url(self):
+        from generate_dashboard import PREFETCH_DATASETS
+
+        for skill_def in _skill_defs(Path("/repo")):
+            for name in skill_def.get("datasets", []):
+                assert PREFETCH_DATASETS[name].endswith("/" + name)
+
+
+class TestRunSkill(unittest.TestCase):
+    def _script(self, tmpdir, body):
+        path = Path(tmpdir) / "skill.py"
+        path.write_text(body, encoding="utf-8")
+        return str(path)
+
+    def test_records_status_and_elapsed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ok = _run_skill("Ok", self._script(tmpdir, "pass\n"), [], tmpdir)
+            assert ok["status"] == "ok" and ok["elapsed"] >= 0
+            failed = _run_skill("Bad", self._script(tmpdir, "raise SystemExit(3)\n"), [], tmpdir)
+            assert failed["status"] == "error" and "elapsed" in failed
+
+    def test_timeout(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = self._script(tmpdir, "import time\ntime.sleep(5)\n")
+            result = _run_skill("Slow", script, [], tmpdir, timeout=0.5)
+        assert result["status"] == "timeout"
+        assert 0.5 <= result["elapsed"] < 5
+
+    def test_env_is_passed_through(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            script = self._script(
+                tmpdir,
+                "import os, sys\nsys.exit(0 if os.environ.get('FMP_CACHE_DIR') == 'x' else 1)\n",
+            )
+            env = {**os.environ, "FMP_CACHE_DIR": "x"}
+            assert _run_skill("Env", script, [], tmpdir, env=env)["status"] == "ok"
+
 
 if __name__ == "__main__":
     unittest.main()
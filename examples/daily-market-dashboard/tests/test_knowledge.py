@@ -0,0 +1,115 @@
+"""Tests for the in-memory BM25 knowledge index (agent/knowledge.py)."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from agent.knowledge import KnowledgeIndex, KnowledgeMatch, _fallback_python_search
+
+DASHBOARD = """# Daily Dashboard 2026-03-02
+
+## Market Breadth
+Breadth score 62 with breadth thrust pending.
+S&P 500 closed higher; breadth improving.
+
+## Themes
+AI semiconductors lead; semiconductors breadth narrow.
+日本株は半導体が主導、日経平均は反発。
+"""
+
+NOTES = """# Notes
+VCP setups in semiconductors.
+Uptrend ratio below 40.
+"""
+
+
+class TestKnowledgeIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        self.knowledge = self.root / "knowledge"
+        (self.knowledge / "archive").mkdir(parents=True)
+        (self.knowledge / "daily_dashboard_2026-03-02.md").write_text(DASHBOARD, encoding="utf-8")
+        (self.knowledge / "archive" / "notes.md").write_text(NOTES, encoding="utf-8")
+        (self.knowledge / "ignored.txt").write_text("breadth", encoding="utf-8")
+        self.index = KnowledgeIndex(self.knowledge, self.root)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _hits(self, query, max_hits=10):
+        return [(m.path, m.line) for m in self.index.search(query, max_hits=max_hits)]
+
+    def test_ranks_lines_by_bm25(self):
+        matches = self.index.search("breadth thrust", max_hits=3)
+        assert matches[0] == KnowledgeMatch(
+            path="knowledge/daily_dashboard_2026-03-02.md",
+            line=4,
+            snippet="Breadth score 62 with breadth thrust pending.",
+        )
+        assert len(matches) == 3
+        assert self.index.files() == [
+            "knowledge/archive/notes.md",
+            "knowledge/daily_dashboard_2026-03-02.md",
+        ]
+
+    def test_word_hits_match_the_regex_search(self):
+        for query in ("breadth", "semiconductors uptrend", "VCP ratio AI"):
+            expected = _fallback_python_search(
+                pattern="|".join(rf"\b{term}\b" for term in query.split()),
+                knowledge_dir=self.knowledge,
+                project_root=self.root,
+                max_hits=100,
+            )
+            assert sorted(self._hits(query, 100)) == sorted((m.path, m.line) for m in expected)
+
+    def test_substring_terms(self):
+        path = "knowledge/daily_dashboard_2026-03-02.md"
+        assert self._hits("半導体") == [(path, 9)]
+        assert self._hits("日経平均") == [(path, 9)]
+        assert self._hits("S&P") == [(path, 5)]
+        assert self._hits("反発した") == []
+
+    def test_empty_and_stopword_queries(self):
+        assert self.index.search("   ", max_hits=5) == []
+        assert self._hits("the") == []
+
+    def test_refresh_reindexes_only_changed_files(self):
+        self._hits("breadth")
+        notes = self.knowledge / "archive" / "notes.md"
+        notes.write_text("# Notes\nFTD confirmed on day 5.\n", encoding="utf-8")
+        stat = notes.stat()
+        os.utime(notes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as reads:
+            assert self._hits("FTD") == [("knowledge/archive/notes.md", 2)]
+        assert [call.args[0].name for call in reads.call_args_list] == ["notes.md"]
+        assert self._hits("VCP") == []
+
+        (self.knowledge / "daily_dashboard_2026-03-02.md").unlink()
+        assert self._hits("breadth") == []
+        assert self.index.files() == ["knowledge/archive/notes.md"]
+        live_ids = set(self.index._lines)
+        assert all(set(postings) <= live_ids for postings in self.index._postings.values())
+
+    def test_skips_symlinks_that_escape_the_knowledge_dir(self):
+        outside = self.root / "outside"
+        outside.mkdir()
+        (outside / "secret.md").write_text("secret apikey token\n", encoding="utf-8")
+        (self.knowledge / "link.md").symlink_to(outside / "secret.md")
+        (self.knowledge / "alias.md").symlink_to(self.knowledge / "archive" / "notes.md")
+
+        assert self._hits("apikey") == []
+        assert "knowledge/link.md" not in self.index.files()
+        assert ("knowledge/alias.md", 2) in self._hits("VCP")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,6 +73,8 @@ def test_api_stats_budget_shape(rel_path, monkeypatch):
         "api_calls_made",
         "max_api_calls",
         "rate_limit_reached",
+        "disk_cache_hits",
+        "disk_cache_misses",
         "budget_remaining",
     }
     assert stats["max_api_calls"] == 200
@@ -98,7 +100,13 @@ def test_family_a_quote_surface_no_budget(rel_path, monkeypatch):
     # No budget surface: __init__ takes no max_api_calls, stats omit budget keys.
     client = mod.FMPClient(api_key="test_key")  # pragma: allowlist secret
     stats = client.get_api_stats()
-    assert set(stats) == {"cache_entries", "api_calls_made", "rate_limit_reached"}
+    assert set(stats) == {
+        "cache_entries",
+        "api_calls_made",
+        "rate_limit_reached",
+        "disk_cache_hits",
+        "disk_cache_misses",
+    }
 
 
 @pytest.mark.parametrize("rel_path", SPECIALS)
@@ -253,3 +261,238 @@ def test_constituents_none_when_fmp_and_csv_both_fail(rel_path, monkeypatch):
         mod.requests, "get", lambda url, **kwargs: _FakeCsvResponse(500, "upstream down")
     )
     assert client.get_sp500_constituents() is None
+
+
+# --- Shared on-disk response cache -------------------------------------------
+
+
+class _FakeJsonResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self._payload = payload
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+
+_HIST_URL = "https://financialmodelingprep.com/stable/historical-price-eod/full"
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_A + FAMILY_B)
+def test_disk_cache_shared_across_clients(rel_path, monkeypatch, tmp_path):
+    """A second client (e.g. another skill's process) is served from disk."""
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+    payload = [{"symbol": "SPY", "date": "2026-01-02", "close": 1.0}]
+    calls = []
+
+    first = mod.FMPClient(api_key="key_a", cache_dir=str(tmp_path))  # pragma: allowlist secret
+    monkeypatch.setattr(
+        first.session, "get", lambda url, **kw: calls.append(url) or _FakeJsonResponse(payload)
+    )
+    assert first._rate_limited_get(_HIST_URL, {"symbol": "SPY"}) == payload
+    assert first.get_api_stats()["disk_cache_misses"] == 1
+
+    # Different API key, same request: served from disk without an HTTP call.
+    second = mod.FMPClient(api_key="key_b", cache_dir=str(tmp_path))  # pragma: allowlist secret
+    monkeypatch.setattr(second.session, "get", lambda url, **kw: pytest.fail("network hit"))
+    assert second._rate_limited_get(_HIST_URL, {"symbol": "SPY"}) == payload
+    stats = second.get_api_stats()
+    assert stats["disk_cache_hits"] == 1
+    assert stats["api_calls_made"] == 0
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_A)
+def test_disk_cache_skips_quotes_and_respects_expiry(rel_path, monkeypatch, tmp_path):
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+    client = mod.FMPClient(api_key="test_key", cache_dir=str(tmp_path))  # pragma: allowlist secret
+    calls = []
+    monkeypatch.setattr(
+        client.session, "get", lambda url, **kw: calls.append(url) or _FakeJsonResponse([{"x": 1}])
+    )
+
+    quote_url = "https://financialmodelingprep.com/stable/quote"
+    client._rate_limited_get(quote_url, {"symbol": "SPY"})
+    client._rate_limited_get(quote_url, {"symbol": "SPY"})
+    assert len(calls) == 2  # real-time quotes never touch disk
+    assert not any(tmp_path.rglob("*.json"))
+
+    client._rate_limited_get(_HIST_URL, {"symbol": "SPY"})
+    monkeypatch.setattr(mod.time, "time", lambda: 4102444800.0)  # 2100-01-01: expired
+    client._rate_limited_get(_HIST_URL, {"symbol": "SPY"})
+    assert len(calls) == 4
+    assert client.get_api_stats()["disk_cache_hits"] == 0
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_A + FAMILY_B)
+def test_disk_cache_skips_error_message_payloads(rel_path, monkeypatch, tmp_path):
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+    client = mod.FMPClient(api_key="test_key", cache_dir=str(tmp_path))  # pragma: allowlist secret
+    error = {"Error Message": "Limit Reach . Please upgrade your plan"}
+    monkeypatch.setattr(client.session, "get", lambda url, **kw: _FakeJsonResponse(error))
+
+    client._rate_limited_get(_HIST_URL, {"symbol": "SPY"})
+    assert not any(tmp_path.rglob("*.json"))
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_B)
+def test_disk_cache_hit_does_not_consume_budget(rel_path, monkeypatch, tmp_path):
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    warm = mod.FMPClient(api_key="test_key", cache_dir=str(tmp_path))  # pragma: allowlist secret
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+    monkeypatch.setattr(warm.session, "get", lambda url, **kw: _FakeJsonResponse([{"x": 1}]))
+    warm._rate_limited_get(_HIST_URL, {"symbol": "SPY"})
+
+    client = mod.FMPClient(
+        api_key="test_key",  # pragma: allowlist secret
+        max_api_calls=0,
+        cache_dir=str(tmp_path),
+    )
+    assert client._rate_limited_get(_HIST_URL, {"symbol": "SPY"}) == [{"x": 1}]
+    with pytest.raises(mod.ApiCallBudgetExceeded):
+        client._rate_limited_get(_HIST_URL, {"symbol": "QQQ"})
+
+
+def test_next_eod_refresh_skips_weekend_and_waits_for_publish():
+    mod = _load(FAMILY_A[0])
+    ny = mod._NY_TZ
+
+    def at(day, hour, minute=0):
+        return mod.datetime(2026, 1, day, hour, minute, tzinfo=ny).timestamp()
+
+    # Friday 2026-01-09 after the publish time -> Monday 2026-01-12 16:00.
+    assert mod._next_eod_refresh(at(9, 19)) == at(12, 16)
+    # Intraday fetch expires at that day's close (refreshes the partial bar).
+    assert mod._next_eod_refresh(at(13, 12)) == at(13, 16)
+    # Fetched after the close but before FMP publishes the bar: short-lived.
+    assert mod._next_eod_refresh(at(13, 16, 5)) == at(13, 18)
+    assert mod._next_eod_refresh(at(9, 17)) == at(9, 18)
+
+
+# --- Concurrent batch fetching / token bucket ---------------------------------
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_A + FAMILY_B)
+def test_plan_tier_sizes_pool_and_limiter(rel_path, monkeypatch):
+    monkeypatch.delenv("FMP_PLAN", raising=False)
+    mod = _load(rel_path)
+    serial = mod.FMPClient(api_key="test_key")  # pragma: allowlist secret
+    assert serial.max_workers == 1
+    assert serial._limiter is None  # legacy RATE_LIMIT_DELAY pacing
+
+    premium = mod.FMPClient(api_key="test_key", plan="premium")  # pragma: allowlist secret
+    assert premium.max_workers == 8
+    assert premium._limiter.rate == pytest.approx(750 / 60)
+
+    monkeypatch.setenv("FMP_PLAN", "bogus")
+    with pytest.raises(ValueError, match="Unknown FMP plan"):
+        mod.FMPClient(api_key="test_key")  # pragma: allowlist secret
+
+
+def test_token_bucket_paces_after_burst(monkeypatch):
+    mod = _load(FAMILY_A[0])
+    clock = {"now": 100.0}
+    slept = []
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(mod.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(mod.time, "sleep", fake_sleep)
+    bucket = mod._TokenBucket(rate=10.0, capacity=2)
+    for _ in range(4):
+        bucket.acquire()
+    # Two burst tokens, then one token every 0.1s.
+    assert slept == [pytest.approx(0.1), pytest.approx(0.1)]
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_A)
+def test_concurrent_batch_historical_keeps_fallback(rel_path, monkeypatch):
+    """Worker-pool batches match the serial result, stable->v3 fallback included."""
+    monkeypatch.delenv("FMP_PLAN", raising=False)
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+    symbols = [f"S{i}" for i in range(12)]
+
+    def fake_get(url, params=None, **kwargs):
+        if "/stable/" in url:
+            return _FakeJsonResponse([])  # stable returns nothing -> fall back
+        symbol = url.rsplit("/", 1)[-1]
+        return _FakeJsonResponse({"symbol": symbol, "historical": [{"close": len(symbol)}]})
+
+    results = []
+    for workers in (1, 4):
+        client = mod.FMPClient(
+            api_key="test_key",  # pragma: allowlist secret
+            plan="ultimate",
+            max_workers=workers,
+        )
+        monkeypatch.setattr(client.session, "get", fake_get)
+        results.append(client.get_batch_historical(symbols, days=20))
+        # The per-endpoint circuit breaker still trips under concurrency.
+        assert _HIST_URL in client._disabled_endpoints
+    assert list(results[1]) == symbols
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_A + FAMILY_B)
+def test_429_retry_budget_is_per_call(rel_path, monkeypatch):
+    """Another worker's success during the 60s back-off must not grant extra retries."""
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    client = mod.FMPClient(api_key="test_key")  # pragma: allowlist secret
+    throttled = _FakeJsonResponse(None)
+    throttled.status_code = 429
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        return _FakeJsonResponse([{"ok": 1}]) if url.endswith("/ok") else throttled
+
+    def fake_sleep(seconds):
+        if seconds == 60:  # a concurrent worker succeeds while this one backs off
+            assert client._rate_limited_get("https://example.test/ok") == [{"ok": 1}]
+        if len(calls) > 10:
+            pytest.fail("unbounded 429 retry loop")
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    monkeypatch.setattr(mod.time, "sleep", fake_sleep)
+    assert client._rate_limited_get("https://example.test/limited") is None
+    assert calls.count("https://example.test/limited") == 1 + client.max_retries
+    assert client.rate_limit_reached is True
+
+
+@pytest.mark.parametrize("rel_path", FAMILY_B)
+def test_concurrent_company_profiles(rel_path, monkeypatch):
+    monkeypatch.delenv("FMP_CACHE_DIR", raising=False)
+    mod = _load(rel_path)
+    client = mod.FMPClient(
+        api_key="test_key",  # pragma: allowlist secret
+        plan="starter",
+        max_workers=4,
+    )
+    monkeypatch.setattr(mod.time, "sleep", lambda s: None)
+
+    def fake_get(url, params=None, **kwargs):
+        symbol = (params or {}).get("symbol") or url.rsplit("/", 1)[-1]
+        return _FakeJsonResponse([{"symbol": symbol, "marketCap": 1}])
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    symbols = ["AAPL", "MSFT", "NVDA", "AMZN", "META"]
+    profiles = client.get_company_profiles(symbols)
+    assert sorted(profiles) == sorted(symbols)
+    assert client.get_api_stats()["api_calls_made"] == len(symbols)
+    # Second call is served from the in-process cache.
+    client.get_company_profiles(symbols)
+    assert client.get_api_stats()["api_calls_made"] == len(symbols)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Batch Chart Detection with a Content-Hash Result Cache
+
+Runs detect_uptrend_ratio.py or detect_breadth_values.py over a directory of
+chart images in one invocation:
+
+1. Images (.jpeg/.jpg/.png) are hashed with SHA-256
+2. Results cached under (detector, detector VERSION, image hash) are reused,
+   so renamed or re-downloaded copies of an image are not decoded again
+3. Remaining images are decoded and analyzed across a process pool; each
+   worker imports OpenCV and the detector once
+4. One JSON line per image is written in file-name order
+
+Requirements:
+    pip install opencv-python numpy
+
+Usage:
+    python batch_detect.py charts/archive --detector uptrend
+    python batch_detect.py charts/archive --detector breadth --workers 4 --output breadth.jsonl
+    python batch_detect.py charts/archive --detector uptrend --no-cache
+
+Output (one line per image):
+    {"file": "2026-01-05.jpeg", "sha256": "...", "cached": false, "result": {...}}
+    {"file": "broken.jpeg", "sha256": "...", "cached": false, "error": "..."}
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# detector name -> (module, class, detection method)
+DETECTORS = {
+    "uptrend": ("detect_uptrend_ratio", "UptrendRatioDetector", "detect"),
+    "breadth": ("detect_breadth_values", "BreadthChartDetector", "analyze"),
+}
+
+IMAGE_SUFFIXES = (".jpeg", ".jpg", ".png")
+CACHE_FILENAME = ".chart_detection_cache.json"
+
+
+def _detector_class(detector: str):
+    module_name, class_name, _method = DETECTORS[detector]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def detector_version(detector: str) -> str:
+    """Version string of a detector; part of every cache key."""
+    return _detector_class(detector).VERSION
+
+
+def _json_default(value: Any) -> Any:
+    """JSON fallback for NumPy scalars in detector results."""
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def run_detector(detector: str, image_path: str) -> dict[str, Any]:
+    """Analyze one image and return a JSON-safe result; runs inside pool workers."""
+    _module, _class, method = DETECTORS[detector]
+    result = getattr(_detector_class(detector)(image_path), method)()
+    return json.loads(json.dumps(result, default=_json_default))
+
+
+def _run_detector_safely(task: tuple[str, str]) -> tuple[Optional[dict], Optional[str]]:
+    detector, image_path = task
+    try:
+        return run_detector(detector, image_path), None
+    except Exception as e:  # one unreadable chart must not end the batch
+        return None, f"{type(e).__name__}: {e}"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_images(image_dir: Path) -> list[Path]:
+    """Chart images directly inside ``image_dir``, sorted by file name."""
+    return sorted(
+        path
+        for path in image_dir.iterdir()
+        if path.is_file() and path.suffix.lower() in IMAGE_SUFFIXES
+    )
+
+
+class ResultCache:
+    """Detection results persisted as JSON, keyed by detector, version and image SHA-256."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: dict[str, dict] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict):
+            self.entries = payload
+
+    @staticmethod
+    def key(detector: str, version: str, sha256: str) -> str:
+        return f"{detector}:{version}:{sha256}"
+
+    def get(self, key: str) -> Optional[dict]:
+        return self.entries.get(key)
+
+    def put(self, key: str, result: dict) -> None:
+        self.entries[key] = result
+
+    def save(self) -> None:
+        """Atomically write the cache so an interrupted run never leaves a torn file."""
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Failed to write cache {self.path}: {e}", file=sys.stderr)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def _with_path(result: dict[str, Any], path: Path) -> dict[str, Any]:
+    """Copy of a result recording ``path``; cached results may come from another file name."""
+    result = json.loads(json.dumps(result))
+    if isinstance(result.get("image"), dict):
+        result["image"]["path"] = str(path)
+    return result
+
+
+def process_directory(
+    image_dir: str,
+    detector: str,
+    workers: int = 1,
+    cache: Optional[ResultCache] = None,
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """
+    Run ``detector`` on every chart image in ``image_dir``.
+
+    Args:
+        image_dir: Directory of chart images (not searched recursively)
+        detector: Key of DETECTORS ("uptrend" or "breadth")
+        workers: Process count; 1 analyzes inline in the calling process
+        cache: Optional result cache; updated in memory, saved by the caller
+
+    Returns:
+        Tuple of (rows in file-name order, counts of images/cached/analyzed/errors)
+    """
+    version = detector_version(detector)
+    rows = []
+    pending: dict[str, list[dict]] = {}  # sha256 -> rows awaiting that image's result
+    paths: dict[str, str] = {}
+    for path in find_images(Path(image_dir)):
+        sha256 = file_sha256(path)
+        row = {"file": path.name, "sha256": sha256, "cached": False}
+        rows.append(row)
+        cached = cache.get(ResultCache.key(detector, version, sha256)) if cache else None
+        if cached is not None:
+            row.update(cached=True, result=_with_path(cached, path))
+        else:
+            pending.setdefault(sha256, []).append(row)
+            paths.setdefault(sha256, str(path))
+
+    # Identical images in one run are analyzed once
+    tasks = [(detector, paths[sha256]) for sha256 in pending]
+    pool = None
+    if workers > 1 and len(tasks) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+    try:
+        outcomes = (pool.map if pool else map)(_run_detector_safely, tasks)
+        for (sha256, waiting), (result, error) in zip(pending.items(), outcomes):
+            if result is not None and cache is not None:
+                cache.put(ResultCache.key(detector, version, sha256), result)
+            for row in waiting:
+                if error is not None:
+                    row["error"] = error
+                else:
+                    row["result"] = _with_path(result, Path(image_dir) / row["file"])
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    stats = {
+        "images": len(rows),
+        "cached": sum(row["cached"] for row in rows),
+        "analyzed": sum("result" in row and not row["cached"] for row in rows),
+        "errors": sum("error" in row for row in rows),
+    }
+    return rows, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run a chart detector over a directory of images with a result cache.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python batch_detect.py charts/archive --detector uptrend
+  python batch_detect.py charts/archive --detector breadth --workers 4 --output breadth.jsonl
+        """,
+    )
+    parser.add_argument("image_dir", help="Directory containing chart images")
+    parser.add_argument("--detector", required=True, choices=sorted(DETECTORS))
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Process count (default: CPUs)"
+    )
+    parser.add_argument(
+        "--cache-file", help=f"Result cache path (default: <image_dir>/{CACHE_FILENAME})"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Analyze every image")
+    parser.add_argument("--output", help="Write JSON lines here instead of stdout")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.image_dir):
+        print(f"Error: Directory not found: {args.image_dir}", file=sys.stderr)
+        sys.exit(1)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache_file or os.path.join(args.image_dir, CACHE_FILENAME))
+
+    rows, stats = process_directory(args.image_dir, args.detector, args.workers, cache)
+    if cache is not None:
+        cache.save()
+
+    lines = "".join(json.dumps(row) + "\n" for row in rows)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(lines)
+    else:
+        sys.stdout.write(lines)
+
+    print(
+        f"{stats['images']} images: {stats['cached']} cached, "
+        f"{stats['analyzed']} analyzed, {stats['errors']} errors",
+        file=sys.stderr,
+    )
+    sys.exit(1 if stats["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -50,6 +50,10 @@ class BreadthChartDetector:
     - Pink background: Indicates downtrend periods
     """
 
+    # Bump whenever detection logic or thresholds change: batch_detect.py keys
+    # cached results on it, so a new version re-processes every image.
+    VERSION = "1"
+
     # Reference values for Y-axis calibration
     RED_LINE_VALUE = 0.73  # Upper reference line
     BLUE_LINE_VALUE = 0.23  # Lower reference line
@@ -215,7 +219,10 @@ class BreadthChartDetector:
 
         if not red_detected or not blue_detected:
             # Fallback: estimate based on image dimensions
-            print("Warning: Could not detect reference lines. Using estimated calibration.")
+            print(
+                "Warning: Could not detect reference lines. Using estimated calibration.",
+                file=sys.stderr,
+            )
             chart_top = int(self.height * 0.1)
             chart_bottom = int(self.height * 0.85)
 
@@ -10,6 +10,7 @@ This script analyzes chart images to:
 2. Detect the rightmost filled area (GREEN = uptrend, RED = downtrend)
 3. Find the top edge of the filled area to get the current percentage
 4. Determine trend direction from recent data points
+5. Optionally digitize the whole plotted series (one point per pixel column)
 
 Requirements:
     pip install opencv-python numpy
@@ -18,6 +19,7 @@ Usage:
     python detect_uptrend_ratio.py <image_path>
     python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg
     python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg --debug
+    python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg --series-csv series.csv
 
 Output:
     {
@@ -30,6 +32,7 @@ Output:
 """
 
 import argparse
+import csv
 import json
 import os
 import sys
@@ -54,6 +57,10 @@ class UptrendRatioDetector:
     - Orange dashed lines: Reference at 0.40 (40%) upper and 0.10 (10%) lower
     """
 
+    # Bump whenever detection logic or thresholds change: batch_detect.py keys
+    # cached results on it, so a new version re-processes every image.
+    VERSION = "1"
+
     # Reference values for Y-axis calibration
     # NOTE: The actual chart uses 37% (not 40%) for the upper reference line
     UPPER_REFERENCE = 0.37  # Upper orange reference line (37%)
@@ -85,6 +92,12 @@ class UptrendRatioDetector:
     GRAY_HSV_LOW = np.array([0, 0, 100])
     GRAY_HSV_HIGH = np.array([30, 60, 220])
 
+    # Minimum colored pixels for a column to count as plotted data (Issue #5b)
+    MIN_COLUMN_PIXELS = 3
+
+    # Plausible value range for the Uptrend Ratio; detected values are clamped to it
+    VALUE_CLAMP = (0.0, 0.55)
+
     def __init__(self, image_path: str):
         """
         Initialize the detector with an image path.
@@ -111,6 +124,10 @@ class UptrendRatioDetector:
             False,
         )  # Cache for reference line detection
 
+        # Per-image mask and column reductions (computed on first use)
+        self._masks: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._profile: Optional[dict[str, np.ndarray]] = None
+
         # Detection results
         self._current_value: Optional[float] = None
         self._current_color: Optional[str] = None
@@ -350,13 +367,18 @@ class UptrendRatioDetector:
             return 0
         return int((value - self.y_offset) / self.y_scale)
 
-    def _detect_current_value_and_color(self) -> tuple[Optional[float], Optional[str]]:
+    def _color_masks(self) -> tuple[np.ndarray, np.ndarray]:
         """
-        Detect the current value and color at the right edge of the chart.
+        Green and red fill masks with the gray moving-average line removed.
+
+        Computed once per image and shared by value, trend and series detection.
 
         Returns:
-            Tuple of (value, color) where color is 'GREEN', 'RED', or 'UNKNOWN'
+            Tuple of (green_mask, red_mask)
         """
+        if self._masks is not None:
+            return self._masks
+
         # Create masks for green and red areas
         green_mask = self._create_color_mask(self.GREEN_HSV_LOW, self.GREEN_HSV_HIGH)
         red_mask = self._create_color_mask(
@@ -375,28 +397,65 @@ class UptrendRatioDetector:
             self.debug_info["red_mask"] = red_mask
             self.debug_info["gray_mask"] = gray_mask
 
+        self._masks = (green_mask, red_mask)
+        return self._masks
+
+    def _column_profile(self) -> dict[str, np.ndarray]:
+        """
+        Reduce the color masks column-wise in one pass.
+
+        Returns:
+            Dict of per-column arrays: ``green``/``red`` pixel counts,
+            ``colored`` (pixels in either mask), ``green_top``/``red_top``
+            (topmost row of each color, -1 when absent)
+        """
+        if self._profile is not None:
+            return self._profile
+
+        green_mask, red_mask = self._color_masks()
+        green = green_mask > 0
+        red = red_mask > 0
+        green_counts = np.count_nonzero(green, axis=0)
+        red_counts = np.count_nonzero(red, axis=0)
+
+        # argmax returns the first (topmost) True row; 0 for empty columns
+        self._profile = {
+            "green": green_counts,
+            "red": red_counts,
+            "colored": np.count_nonzero(green | red, axis=0),
+            "green_top": np.where(green_counts > 0, green.argmax(axis=0), -1),
+            "red_top": np.where(red_counts > 0, red.argmax(axis=0), -1),
+        }
+        return self._profile
+
+    def _detect_current_value_and_color(self) -> tuple[Optional[float], Optional[str]]:
+        """
+        Detect the current value and color at the right edge of the chart.
+
+        Returns:
+            Tuple of (value, color) where color is 'GREEN', 'RED', or 'UNKNOWN'
+        """
+        green_mask, red_mask = self._color_masks()
+        profile = self._column_profile()
+
         # Strategy: Find the EXACT rightmost column with data and analyze ONLY that column
         # The chart is filled from bottom, so we need to find where colored pixels END (top edge)
 
-        # Find the rightmost column that has colored pixels
-        combined_mask = cv2.bitwise_or(green_mask, red_mask)
-
         # FIX (Issue #5): Collect ALL colored columns, then select the TRUE rightmost
         # Previous bug: Early break selected FIRST column with >10 pixels, not the actual rightmost
         # This caused GREEN (4-8px) to be skipped and RED (29px) in an earlier column to be selected
         # FIX (Issue #5b): Lower threshold from 10 to 3 pixels to detect thin lines
         # Real case: 6px GREEN (true rightmost) was excluded, 29px RED (older data) was selected
-        colored_cols = []
-        for col in range(self.width - 1, max(0, self.width - 150), -1):
-            col_pixels = np.sum(combined_mask[:, col] > 0)
-            if col_pixels >= 3:  # At least 3 pixels of colored data (lowered from 10)
-                colored_cols.append(col)
+        search_start = max(0, self.width - 150) + 1
+        colored_cols = search_start + np.flatnonzero(
+            profile["colored"][search_start:] >= self.MIN_COLUMN_PIXELS
+        )
 
         # Select the absolute rightmost column (maximum index)
-        if colored_cols:
-            rightmost_col = max(colored_cols)
+        if len(colored_cols):
+            rightmost_col = int(colored_cols.max())
             self.debug_info["colored_cols_found"] = len(colored_cols)
-            self.debug_info["colored_cols_range"] = (min(colored_cols), max(colored_cols))
+            self.debug_info["colored_cols_range"] = (int(colored_cols.min()), rightmost_col)
         else:
             # Fallback: use last 5% of width
             rightmost_col = int(self.width * 0.95)
@@ -450,7 +509,7 @@ class UptrendRatioDetector:
         value = self._pixel_to_value(top_edge_y)
 
         # Clamp to reasonable range (0-0.55 for Uptrend Ratio)
-        value = max(0.0, min(0.55, value))
+        value = max(self.VALUE_CLAMP[0], min(self.VALUE_CLAMP[1], value))
 
         self.debug_info["detected_value"] = value
 
@@ -466,17 +525,8 @@ class UptrendRatioDetector:
         Returns:
             'RISING', 'FALLING', 'FLAT', or 'UNKNOWN'
         """
-        # Create combined color mask with gray exclusion (Issue #4 fix)
-        green_mask = self._create_color_mask(self.GREEN_HSV_LOW, self.GREEN_HSV_HIGH)
-        red_mask = self._create_color_mask(
-            self.RED_HSV_LOW1, self.RED_HSV_HIGH1, self.RED_HSV_LOW2, self.RED_HSV_HIGH2
-        )
-
-        # Exclude gray MA line to prevent false detection
-        gray_mask = self._create_color_mask(self.GRAY_HSV_LOW, self.GRAY_HSV_HIGH)
-        green_mask = cv2.bitwise_and(green_mask, cv2.bitwise_not(gray_mask))
-        red_mask = cv2.bitwise_and(red_mask, cv2.bitwise_not(gray_mask))
-
+        # Combined color mask with gray exclusion (Issue #4 fix)
+        green_mask, red_mask = self._color_masks()
         combined_mask = cv2.bitwise_or(green_mask, red_mask)
 
         # Sample points from right 30% of image
@@ -521,6 +571,37 @@ class UptrendRatioDetector:
         else:
             return "FLAT"
 
+    def digitize_series(self) -> list[dict[str, Any]]:
+        """
+        Recover the plotted Uptrend Ratio for every pixel column of the chart.
+
+        Applies the current-value rules to all columns at once: a column with at
+        least MIN_COLUMN_PIXELS colored pixels is a data point, its color is the
+        dominant fill (RED on ties) and its value is the top edge of that fill.
+        The last point is the column detect() reports as the current value.
+
+        Returns:
+            List of {"x", "value", "color"} dicts in left-to-right order, where
+            x is the pixel column; empty if the image cannot be calibrated
+        """
+        if self.img_hsv is None:
+            if not self._load_image() or not self._calibrate_y_axis():
+                return []
+        elif not self.calibration_success:
+            return []
+
+        profile = self._column_profile()
+        is_red = (profile["red"] >= profile["green"]) & (profile["red"] > 0)
+        xs = np.flatnonzero(profile["colored"] >= self.MIN_COLUMN_PIXELS)
+        top_edges = np.where(is_red, profile["red_top"], profile["green_top"])[xs]
+        values = np.clip(self.y_scale * top_edges + self.y_offset, *self.VALUE_CLAMP)
+        colors = np.where(is_red[xs], "RED", "GREEN")
+
+        return [
+            {"x": x, "value": round(value, 3), "color": color}
+            for x, value, color in zip(xs.tolist(), values.tolist(), colors.tolist())
+        ]
+
     def _assess_confidence(self) -> str:
         """
         Assess confidence level of the detection.
@@ -763,6 +844,23 @@ def format_result_for_human(result: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _json_default(value: Any) -> Any:
+    """JSON fallback for NumPy scalars (and masks, when --debug) in debug_info."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return f"<array shape={value.shape}>"
+    return str(value)
+
+
+def write_series_csv(series: list[dict[str, Any]], output_path: str) -> None:
+    """Write a digitized series as CSV with columns x, value, color."""
+    with open(output_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["x", "value", "color"])
+        writer.writeheader()
+        writer.writerows(series)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Detect current value and trend from US Stock Market Uptrend Ratio charts.",
@@ -772,6 +870,7 @@ Examples:
   python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg
   python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg --debug
   python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg --json
+  python detect_uptrend_ratio.py charts/2026-01-05/uptrend_ratio.jpeg --series-csv ratio.csv
         """,
     )
 
@@ -780,6 +879,11 @@ Examples:
         "--debug", action="store_true", help="Save debug images showing detection process"
     )
     parser.add_argument("--json", action="store_true", help="Output results as JSON only")
+    parser.add_argument(
+        "--series-csv",
+        metavar="PATH",
+        help="Also digitize every pixel column and write x,value,color rows to PATH",
+    )
 
     args = parser.parse_args()
 
@@ -792,10 +896,15 @@ Examples:
         result = detector.detect(debug=args.debug)
 
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(json.dumps(result, indent=2, default=_json_default))
         else:
             print(format_result_for_human(result))
 
+        if args.series_csv and result["confidence"] != "FAILED":
+            series = detector.digitize_series()
+            write_series_csv(series, args.series_csv)
+            print(f"Series ({len(series)} columns) written to: {args.series_csv}", file=sys.stderr)
+
         # Exit with error code if detection failed
         if result["confidence"] == "FAILED":
             sys.exit(1)
@@ -5,6 +5,7 @@ Pytest fixtures for breadth-chart-analyst tests.
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Add scripts directory to path for imports
@@ -46,3 +47,23 @@ def nonexistent_image():
 def scripts_dir():
     """Path to the scripts directory."""
     return Path(__file__).parent.parent / "scripts"
+
+
+@pytest.fixture
+def synthetic_uptrend_chart(tmp_path):
+    """PNG chart with reference lines at y=100 (37%) and y=300 (10%) and a sloped fill.
+
+    Columns 400-589 are filled RED and 590-779 GREEN, from y=380 up to
+    y = 340 - (x - 400) // 2.
+    """
+    cv2 = pytest.importorskip("cv2")
+
+    img = np.full((400, 800, 3), 255, dtype=np.uint8)
+    for x in range(400, 780):
+        img[340 - (x - 400) // 2 : 381, x] = (60, 60, 230) if x < 590 else (0, 200, 0)
+    img[100, :] = (80, 160, 240)
+    img[300, :] = (80, 160, 240)
+
+    path = tmp_path / "uptrend.png"
+    cv2.imwrite(str(path), img)
+    return str(path)
@@ -0,0 +1,120 @@
+"""
+Tests for batch_detect.py (directory mode with content-hash result cache)
+"""
+
+import json
+import shutil
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def chart_dir(synthetic_uptrend_chart, tmp_path):
+    """Directory with the synthetic chart, a renamed copy and a non-image file."""
+    charts = tmp_path / "charts"
+    charts.mkdir()
+    shutil.copy(synthetic_uptrend_chart, charts / "2026-01-05.png")
+    shutil.copy(synthetic_uptrend_chart, charts / "2026-01-06.png")
+    (charts / "notes.txt").write_text("not a chart", encoding="utf-8")
+    return charts
+
+
+def _count_runs(monkeypatch):
+    import batch_detect
+
+    calls = []
+    run_detector = batch_detect.run_detector
+
+    def counting(detector, image_path):
+        calls.append(image_path)
+        return run_detector(detector, image_path)
+
+    monkeypatch.setattr(batch_detect, "run_detector", counting)
+    return calls
+
+
+class TestProcessDirectory:
+    def test_results_match_single_image_detection(self, chart_dir):
+        from batch_detect import process_directory
+        from detect_uptrend_ratio import UptrendRatioDetector
+
+        rows, stats = process_directory(str(chart_dir), "uptrend")
+
+        assert [row["file"] for row in rows] == ["2026-01-05.png", "2026-01-06.png"]
+        expected = UptrendRatioDetector(str(chart_dir / "2026-01-06.png")).detect()
+        assert rows[1]["result"]["current_value"] == expected["current_value"]
+        assert rows[1]["result"]["image"]["path"] == str(chart_dir / "2026-01-06.png")
+        assert stats == {"images": 2, "cached": 0, "analyzed": 2, "errors": 0}
+
+    def test_cache_skips_known_images(self, chart_dir, tmp_path, monkeypatch):
+        from batch_detect import ResultCache, process_directory
+
+        calls = _count_runs(monkeypatch)
+        cache_path = tmp_path / "cache.json"
+        cache = ResultCache(cache_path)
+        first, _stats = process_directory(str(chart_dir), "uptrend", cache=cache)
+        cache.save()
+        assert len(calls) == 1  # identical images are analyzed once
+
+        shutil.copy(chart_dir / "2026-01-05.png", chart_dir / "renamed.png")
+        rows, stats = process_directory(str(chart_dir), "uptrend", cache=ResultCache(cache_path))
+
+        assert len(calls) == 1
+        assert stats["cached"] == 3 and all(row["cached"] for row in rows)
+        assert rows[0]["result"] == first[0]["result"]
+        assert rows[2]["result"]["image"]["path"] == str(chart_dir / "renamed.png")
+
+    def test_detector_version_invalidates_cache(self, chart_dir, monkeypatch):
+        from batch_detect import ResultCache, process_directory
+        from detect_uptrend_ratio import UptrendRatioDetector
+
+        calls = _count_runs(monkeypatch)
+        cache = ResultCache(chart_dir / "cache.json")
+        process_directory(str(chart_dir), "uptrend", cache=cache)
+        monkeypatch.setattr(UptrendRatioDetector, "VERSION", "test-bump")
+        _rows, stats = process_directory(str(chart_dir), "uptrend", cache=cache)
+
+        assert len(calls) == 2
+        assert stats["analyzed"] == 2
+
+    def test_process_pool_matches_inline(self, chart_dir):
+        from batch_detect import process_directory
+
+        # Force distinct content so every image becomes a separate task
+        with open(chart_dir / "2026-01-06.png", "ab") as f:
+            f.write(b"\0")
+        inline, _stats = process_directory(str(chart_dir), "uptrend")
+        pooled, _stats = process_directory(str(chart_dir), "uptrend", workers=2)
+
+        assert pooled == inline
+
+    def test_unreadable_image_is_reported_and_not_cached(self, tmp_path):
+        from batch_detect import ResultCache, process_directory
+
+        (tmp_path / "broken.jpeg").write_text("not an image", encoding="utf-8")
+        cache = ResultCache(tmp_path / "cache.json")
+        rows, stats = process_directory(str(tmp_path), "breadth", cache=cache)
+
+        assert "Could not read image" in rows[0]["error"]
+        assert stats["errors"] == 1
+        assert cache.entries == {}
+
+
+def test_cli_writes_json_lines_and_cache(chart_dir, tmp_path, monkeypatch, capsys):
+    from batch_detect import CACHE_FILENAME, main
+
+    output = tmp_path / "out.jsonl"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["batch_detect.py", str(chart_dir), "--detector", "uptrend", "--output", str(output)],
+    )
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+
+    assert exit_info.value.code == 0
+    rows = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [row["result"]["current_color"] for row in rows] == ["GREEN", "GREEN"]
+    assert (chart_dir / CACHE_FILENAME).exists()
+    assert "2 images: 0 cached, 2 analyzed, 0 errors" in capsys.readouterr().err
@@ -470,3 +470,63 @@ class TestMultiColorRightmostDetection:
         # Value should be reasonable (not the erroneous 23% from wrong column)
         assert "current_value" in result
         assert 0.05 <= result["current_value"] <= 0.70
+
+
+# =============================================================================
+# Test 12: Full-Series Digitization
+# =============================================================================
+
+
+class TestSeriesDigitization:
+    """Tests for recovering the whole plotted series."""
+
+    def test_series_recovers_every_column(self, synthetic_uptrend_chart):
+        from detect_uptrend_ratio import UptrendRatioDetector
+
+        series = UptrendRatioDetector(synthetic_uptrend_chart).digitize_series()
+
+        assert [point["x"] for point in series] == list(range(400, 780))
+        for point in series:
+            top = 340 - (point["x"] - 400) // 2
+            expected = 0.37 + (top - 100) * (0.10 - 0.37) / 200
+            assert point["value"] == pytest.approx(expected, abs=1e-3)
+            assert point["color"] == ("RED" if point["x"] < 590 else "GREEN")
+
+    def test_last_point_is_current_value(self, synthetic_uptrend_chart):
+        from detect_uptrend_ratio import UptrendRatioDetector
+
+        detector = UptrendRatioDetector(synthetic_uptrend_chart)
+        result = detector.detect()
+        last = detector.digitize_series()[-1]
+
+        assert last["x"] == result["debug_info"]["rightmost_col"] == 779
+        assert last["value"] == result["current_value"]
+        assert last["color"] == result["current_color"] == "GREEN"
+        assert result["trend_direction"] == "RISING"
+
+    def test_cli_writes_series_csv(self, synthetic_uptrend_chart, tmp_path, monkeypatch, capsys):
+        import csv
+        import json
+        import sys
+
+        from detect_uptrend_ratio import main
+
+        output = tmp_path / "series.csv"
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "detect_uptrend_ratio.py",
+                synthetic_uptrend_chart,
+                "--json",
+                "--series-csv",
+                str(output),
+            ],
+        )
+        main()
+
+        assert json.loads(capsys.readouterr().out)["current_color"] == "GREEN"
+        with open(output, encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 380
+        assert rows[0] == {"x": "400", "value": "0.046", "color": "RED"}
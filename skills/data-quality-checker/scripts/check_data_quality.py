@@ -8,13 +8,18 @@ as warnings for human review.
 from __future__ import annotations
 
 import argparse
+import bisect
 import calendar
+import hashlib
 import json
 import os
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import date, datetime
+from pathlib import Path
 
 SEVERITY_ORDER: dict[str, int] = {"ERROR": 0, "WARNING": 1, "INFO": 2}
 
@@ -33,6 +38,40 @@ class Finding:
         return (SEVERITY_ORDER.get(self.severity, 99), self.line_number or 0)
 
 
+_HEADING_PAT = re.compile(r"^#{1,6}\s")
+_DOCUMENT_YEAR_PAT = re.compile(r"(?:^|\D)(20[2-3]\d)(?:\D|$)")
+
+
+class Document:
+    """A document tokenized once and shared by every check.
+
+    Holds the split lines, each line's start offset (a match offset maps to
+    its line number by binary search instead of counting newlines in the
+    prefix), the heading line indices and the first year mentioned.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.lines = content.split("\n")
+        self.line_starts: list[int] = []
+        offset = 0
+        for line in self.lines:
+            self.line_starts.append(offset)
+            offset += len(line) + 1
+        self.heading_indices = [i for i, line in enumerate(self.lines) if _HEADING_PAT.match(line)]
+        year_match = _DOCUMENT_YEAR_PAT.search(content)
+        self.year = int(year_match.group(1)) if year_match else None
+
+    def line_number(self, offset: int) -> int:
+        """1-based line number of a character offset."""
+        return bisect.bisect_right(self.line_starts, offset)
+
+
+def as_document(content: str | Document) -> Document:
+    """Return ``content`` tokenized, reusing an existing Document."""
+    return content if isinstance(content, Document) else Document(content)
+
+
 # ---------------------------------------------------------------------------
 # Price Scale Check
 # ---------------------------------------------------------------------------
@@ -60,22 +99,25 @@ SCALE_RATIOS: dict[tuple[str, str], float] = {
 }
 
 
-def _extract_instrument_prices(content: str) -> dict[str, list[tuple[float, int]]]:
+_TICKER_PAT = re.compile(
+    r"(?:^|[\s(])"
+    r"("
+    + "|".join(re.escape(t) for t in sorted(INSTRUMENT_DIGIT_HINTS, key=len, reverse=True))
+    + r")"
+    r"(?:[)\s:,])",
+)
+_DOLLAR_PRICE_PAT = re.compile(r"\$([0-9,]+(?:\.[0-9]+)?)")
+
+
+def _extract_instrument_prices(doc: Document) -> dict[str, list[tuple[float, int]]]:
     """Extract all (price, line_number) mentions for each known instrument."""
     mentions: dict[str, list[tuple[float, int]]] = {}
+    content = doc.content
 
-    tickers = sorted(INSTRUMENT_DIGIT_HINTS.keys(), key=len, reverse=True)
-    ticker_alt = "|".join(re.escape(t) for t in tickers)
-    ticker_pat = re.compile(
-        r"(?:^|[\s(])"
-        r"(" + ticker_alt + r")"
-        r"(?:[)\s:,])",
-    )
-
-    for tmatch in ticker_pat.finditer(content):
+    for tmatch in _TICKER_PAT.finditer(content):
         instrument = tmatch.group(1)
         rest = content[tmatch.end() - 1 : tmatch.end() + 80]
-        price_m = re.search(r"\$([0-9,]+(?:\.[0-9]+)?)", rest)
+        price_m = _DOLLAR_PRICE_PAT.search(rest)
         if not price_m:
             continue
         price_str = price_m.group(1).replace(",", "")
@@ -85,16 +127,16 @@ def _extract_instrument_prices(content: str) -> dict[str, list[tuple[float, int]
             continue
         if price <= 0:
             continue
-        line_num = content[: tmatch.start()].count("\n") + 1
+        line_num = doc.line_number(tmatch.start())
         mentions.setdefault(instrument, []).append((price, line_num))
 
     return mentions
 
 
-def check_price_scale(content: str) -> list[Finding]:
+def check_price_scale(content: str | Document) -> list[Finding]:
     """Check for price scale inconsistencies using digit heuristics and ratio analysis."""
     findings: list[Finding] = []
-    mentions = _extract_instrument_prices(content)
+    mentions = _extract_instrument_prices(as_document(content))
 
     # --- Digit count heuristics ---
     for instrument, price_list in mentions.items():
@@ -155,18 +197,26 @@ NOTATION_GROUPS: dict[str, list[str]] = {
 }
 
 
-def check_notation(content: str) -> list[Finding]:
+# Case-insensitive only for longer terms to avoid false positives
+_NOTATION_PATS: dict[str, list[tuple[str, re.Pattern[str]]]] = {
+    group_name: [
+        (
+            v,
+            re.compile(r"(?<!\w)" + re.escape(v) + r"(?!\w)", re.IGNORECASE if len(v) > 3 else 0),
+        )
+        for v in variants
+    ]
+    for group_name, variants in NOTATION_GROUPS.items()
+}
+
+
+def check_notation(content: str | Document) -> list[Finding]:
     """Check for inconsistent instrument notation within the same document."""
     findings: list[Finding] = []
+    text = as_document(content).content
 
-    for group_name, variants in NOTATION_GROUPS.items():
-        found: list[str] = []
-        for v in variants:
-            # Use case-insensitive only for longer terms to avoid false positives
-            flags = re.IGNORECASE if len(v) > 3 else 0
-            pattern = re.compile(r"(?<!\w)" + re.escape(v) + r"(?!\w)", flags)
-            if pattern.search(content):
-                found.append(v)
+    for group_name, variants in _NOTATION_PATS.items():
+        found = [v for v, pattern in variants if pattern.search(text)]
         if len(found) > 1:
             findings.append(
                 Finding(
@@ -254,11 +304,20 @@ def _resolve_en_weekday(weekday_str: str) -> int | None:
     return None
 
 
+_FILENAME_DATE_PAT = re.compile(r"(20[2-3]\d)-\d{2}-\d{2}")
+
+
+def _filename_year(filepath: str | None) -> int | None:
+    """Year of the first YYYY-MM-DD date in a file path, if any."""
+    fname_match = _FILENAME_DATE_PAT.search(filepath) if filepath else None
+    return int(fname_match.group(1)) if fname_match else None
+
+
 def infer_year(
     month: int,
     day: int,
     as_of: date | None,
-    content: str,
+    content: str | Document,
     filepath: str | None = None,
 ) -> int:
     """Infer year for dates without explicit year.
@@ -280,31 +339,40 @@ def infer_year(
         return candidate
 
     # Search document for a 4-digit year (2020-2039)
-    year_match = re.search(r"(?:^|\D)(20[2-3]\d)(?:\D|$)", content)
-    if year_match:
-        return int(year_match.group(1))
+    doc = as_document(content)
+    if doc.year is not None:
+        return doc.year
 
     # Search filename for YYYY-MM-DD pattern
-    if filepath:
-        fname_match = re.search(r"(20[2-3]\d)-\d{2}-\d{2}", filepath)
-        if fname_match:
-            return int(fname_match.group(1))
+    fname_year = _filename_year(filepath)
+    if fname_year is not None:
+        return fname_year
 
     # Fallback to current year
     return date.today().year
 
 
+_EN_YEAR_DATE_PAT = re.compile(r"(\w+)\s+(\d{1,2}),?\s+(\d{4})\s*\((\w+)\)", re.IGNORECASE)
+_EN_NO_YEAR_DATE_PAT = re.compile(r"(\w+)\s+(\d{1,2})\s*\((\w+)\)", re.IGNORECASE)
+_YEAR_BEFORE_PAT = re.compile(r"\d{4}\s*$")
+_JA_DATE_PAT = re.compile(r"(\d{1,2})月(\d{1,2})日[（(]([月火水木金土日])(?:曜日)?[）)]")
+_JA_SLASH_DATE_PAT = re.compile(r"(\d{1,2})/(\d{1,2})[（(]([月火水木金土日])[）)]")
+
+
 def check_dates(
-    content: str, as_of: date | None = None, filepath: str | None = None
+    content: str | Document, as_of: date | None = None, filepath: str | None = None
 ) -> list[Finding]:
     """Check date-weekday mismatches in English and Japanese content."""
     findings: list[Finding] = []
+    doc = as_document(content)
+    content = doc.content
 
     # ---- English with year: "February 28, 2026 (Friday)" ----
-    en_year_pat = re.compile(r"(\w+)\s+(\d{1,2}),?\s+(\d{4})\s*\((\w+)\)", re.IGNORECASE)
-    en_year_spans: list[tuple[int, int]] = []
+    # finditer spans are sorted and disjoint; the no-year pass bisects them.
+    en_year_starts: list[int] = []
+    en_year_ends: list[int] = []
 
-    for m in en_year_pat.finditer(content):
+    for m in _EN_YEAR_DATE_PAT.finditer(content):
         month_str = m.group(1)
         day_str = m.group(2)
         year_str = m.group(3)
@@ -319,13 +387,14 @@ def check_dates(
         except ValueError:
             continue
 
-        en_year_spans.append((m.start(), m.end()))
+        en_year_starts.append(m.start())
+        en_year_ends.append(m.end())
 
         actual_weekday = d.weekday()
         stated_weekday = _resolve_en_weekday(weekday_str)
 
         if stated_weekday is not None and stated_weekday != actual_weekday:
-            line_num = content[: m.start()].count("\n") + 1
+            line_num = doc.line_number(m.start())
             actual_name = calendar.day_name[actual_weekday]
             findings.append(
                 Finding(
@@ -340,16 +409,11 @@ def check_dates(
             )
 
     # ---- English without year: "Feb 28 (Fri)" or "January 15 (Wed)" ----
-    en_no_year_pat = re.compile(r"(\w+)\s+(\d{1,2})\s*\((\w+)\)", re.IGNORECASE)
-
-    for m in en_no_year_pat.finditer(content):
-        # Skip if overlapping with a year-pattern match
-        overlaps = False
-        for ys, ye in en_year_spans:
-            if not (m.end() <= ys or m.start() >= ye):
-                overlaps = True
-                break
-        if overlaps:
+    for m in _EN_NO_YEAR_DATE_PAT.finditer(content):
+        # Skip if overlapping with a year-pattern match: only the last span
+        # starting before this match ends can reach into it.
+        last = bisect.bisect_left(en_year_starts, m.end()) - 1
+        if last >= 0 and en_year_ends[last] > m.start():
             continue
 
         month_str = m.group(1)
@@ -362,10 +426,10 @@ def check_dates(
 
         # Check for year immediately before this match
         before = content[max(0, m.start() - 10) : m.start()]
-        if re.search(r"\d{4}\s*$", before):
+        if _YEAR_BEFORE_PAT.search(before):
             continue
 
-        year = infer_year(month, int(day_str), as_of, content, filepath)
+        year = infer_year(month, int(day_str), as_of, doc, filepath)
         try:
             d = date(year, month, int(day_str))
         except ValueError:
@@ -375,7 +439,7 @@ def check_dates(
         stated_weekday = _resolve_en_weekday(weekday_str)
 
         if stated_weekday is not None and stated_weekday != actual_weekday:
-            line_num = content[: m.start()].count("\n") + 1
+            line_num = doc.line_number(m.start())
             actual_name = calendar.day_name[actual_weekday]
             findings.append(
                 Finding(
@@ -391,13 +455,12 @@ def check_dates(
             )
 
     # ---- Japanese: "1月1日（木）" or "1月1日（木曜日）" ----
-    ja_pat = re.compile(r"(\d{1,2})月(\d{1,2})日[（(]([月火水木金土日])(?:曜日)?[）)]")
-    for m in ja_pat.finditer(content):
+    for m in _JA_DATE_PAT.finditer(content):
         month_val = int(m.group(1))
         day_val = int(m.group(2))
         weekday_char = m.group(3)
 
-        year = infer_year(month_val, day_val, as_of, content, filepath)
+        year = infer_year(month_val, day_val, as_of, doc, filepath)
         try:
             d = date(year, month_val, day_val)
         except ValueError:
@@ -408,7 +471,7 @@ def check_dates(
 
         if stated_weekday is not None and stated_weekday != actual_weekday:
             ja_names = {0: "月", 1: "火", 2: "水", 3: "木", 4: "金", 5: "土", 6: "日"}
-            line_num = content[: m.start()].count("\n") + 1
+            line_num = doc.line_number(m.start())
             findings.append(
                 Finding(
                     severity="WARNING",
@@ -423,13 +486,12 @@ def check_dates(
             )
 
     # ---- Japanese slash format: "1/1(木)" ----
-    ja_slash_pat = re.compile(r"(\d{1,2})/(\d{1,2})[（(]([月火水木金土日])[）)]")
-    for m in ja_slash_pat.finditer(content):
+    for m in _JA_SLASH_DATE_PAT.finditer(content):
         month_val = int(m.group(1))
         day_val = int(m.group(2))
         weekday_char = m.group(3)
 
-        year = infer_year(month_val, day_val, as_of, content, filepath)
+        year = infer_year(month_val, day_val, as_of, doc, filepath)
         try:
             d = date(year, month_val, day_val)
         except ValueError:
@@ -440,7 +502,7 @@ def check_dates(
 
         if stated_weekday is not None and stated_weekday != actual_weekday:
             ja_names = {0: "月", 1: "火", 2: "水", 3: "木", 4: "金", 5: "土", 6: "日"}
-            line_num = content[: m.start()].count("\n") + 1
+            line_num = doc.line_number(m.start())
             findings.append(
                 Finding(
                     severity="WARNING",
@@ -480,26 +542,22 @@ ALLOCATION_TABLE_KEYWORDS: list[str] = [
 ]
 
 
-def find_allocation_sections(content: str) -> list[str]:
+def find_allocation_sections(content: str | Document) -> list[str]:
     """Find sections that are allocation-related."""
     sections: list[str] = []
-    lines = content.split("\n")
+    doc = as_document(content)
+    lines = doc.lines
 
     # ---- Heading-based sections ----
-    for i, line in enumerate(lines):
-        if not re.match(r"^#{1,6}\s", line):
-            continue
-        heading_text = re.sub(r"^#{1,6}\s+", "", line).strip().lower()
+    headings = doc.heading_indices
+    for pos, i in enumerate(headings):
+        heading_text = re.sub(r"^#{1,6}\s+", "", lines[i]).strip().lower()
         # Skip ポジション alone (without 配分)
         if "ポジション" in heading_text and "配分" not in heading_text:
             continue
         if any(kw.lower() in heading_text for kw in ALLOCATION_HEADING_KEYWORDS):
-            section_lines: list[str] = []
-            for j in range(i + 1, len(lines)):
-                if re.match(r"^#{1,6}\s", lines[j]):
-                    break
-                section_lines.append(lines[j])
-            sections.append("\n".join(section_lines))
+            end = headings[pos + 1] if pos + 1 < len(headings) else len(lines)
+            sections.append("\n".join(lines[i + 1 : end]))
 
     # ---- Table-based allocations ----
     in_table = False
@@ -574,7 +632,7 @@ def extract_percentage_values(
     return values
 
 
-def check_allocations(content: str) -> list[Finding]:
+def check_allocations(content: str | Document) -> list[Finding]:
     """Check allocation totals in allocation sections only."""
     findings: list[Finding] = []
     sections = find_allocation_sections(content)
@@ -629,21 +687,18 @@ _MOVEMENT_WORDS = re.compile(
 )
 _BARE_NUMBER = re.compile(r"\b(\d+(?:\.\d+)?)\b")
 _HAS_UNIT = re.compile(r"(\$\d|\d\s*%|\d\s*bp|\d\s*bps)", re.IGNORECASE)
+_BASIS_POINTS = re.compile(r"\d+\s*bp", re.IGNORECASE)
+_PERCENT_RATE = re.compile(r"(?:yield|rate|利回り|金利).*?\d+(?:\.\d+)?%", re.IGNORECASE)
 
 
-def check_units(content: str) -> list[Finding]:
+def check_units(content: str | Document) -> list[Finding]:
     """Check for missing or mixed units."""
     findings: list[Finding] = []
+    doc = as_document(content)
 
     # Check for mixed bp and % for rates/yields
-    has_bp = bool(re.search(r"\d+\s*bp", content, re.IGNORECASE))
-    has_pct_rate = bool(
-        re.search(
-            r"(?:yield|rate|利回り|金利).*?\d+(?:\.\d+)?%",
-            content,
-            re.IGNORECASE,
-        )
-    )
+    has_bp = bool(_BASIS_POINTS.search(doc.content))
+    has_pct_rate = bool(_PERCENT_RATE.search(doc.content))
     if has_bp and has_pct_rate:
         findings.append(
             Finding(
@@ -654,7 +709,7 @@ def check_units(content: str) -> list[Finding]:
         )
 
     # Check for bare numbers near instrument + movement words without units
-    for line_idx, line in enumerate(content.split("\n"), 1):
+    for line_idx, line in enumerate(doc.lines, 1):
         if _INSTRUMENT_WORDS.search(line) and _MOVEMENT_WORDS.search(line):
             if _BARE_NUMBER.search(line) and not _HAS_UNIT.search(line):
                 findings.append(
@@ -683,15 +738,16 @@ ALL_CHECKS = {
 
 
 def run_checks(
-    content: str,
+    content: str | Document,
     checks: list[str] | None = None,
     as_of: date | None = None,
     filepath: str | None = None,
 ) -> list[Finding]:
-    """Run specified checks (or all) on content."""
+    """Run specified checks (or all) on content, tokenizing it once for all of them."""
     if checks is None:
         checks = list(ALL_CHECKS.keys())
 
+    content = as_document(content)
     all_findings: list[Finding] = []
     for check_name in checks:
         func = ALL_CHECKS.get(check_name)
@@ -735,12 +791,208 @@ def generate_report(findings: list[Finding], source_file: str) -> str:
     return "\n".join(lines) + "\n"
 
 
+# ---------------------------------------------------------------------------
+# Directory batch mode
+# ---------------------------------------------------------------------------
+
+CACHE_VERSION = 1
+# Bump whenever a check's logic or thresholds change: FindingsCache keys
+# findings by it, so a bump invalidates every cached --dir result.
+CHECKER_VERSION = "1"
+CACHE_FILENAME = ".data_quality_cache.json"
+REPORT_SUFFIX = ".md"
+OWN_REPORT_PREFIX = "data_quality_"
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_documents(root: Path) -> list[Path]:
+    """Markdown files under ``root``, skipping this checker's own reports."""
+    return sorted(
+        path
+        for path in root.rglob(f"*{REPORT_SUFFIX}")
+        if path.is_file() and not path.name.startswith(OWN_REPORT_PREFIX)
+    )
+
+
+def check_file(
+    path: str, checks: list[str] | None = None, as_of: date | None = None
+) -> list[Finding]:
+    """Run the checks on one file and return its findings."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    return run_checks(content, checks, as_of, filepath=path)
+
+
+def _check_file_safely(task: tuple) -> tuple[list[dict] | None, str | None]:
+    path, checks, as_of = task
+    try:
+        return [asdict(f) for f in check_file(path, checks, as_of)], None
+    except (OSError, UnicodeDecodeError) as e:  # one unreadable file must not end the batch
+        return None, f"{type(e).__name__}: {e}"
+
+
+class FindingsCache:
+    """Findings persisted as JSON, keyed by file SHA-256 and everything else they depend on."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.entries: dict[str, list[dict]] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+            self.entries = payload.get("entries", {})
+
+    @staticmethod
+    def key(sha256: str, checks: list[str] | None, as_of: date | None, filepath: str) -> str:
+        # Without --as-of, year inference can fall back to the file name or
+        # the current year, so both are part of the key.
+        checks_key = ",".join(checks) if checks is not None else "all"
+        year_source = (
+            as_of.isoformat() if as_of else f"{_filename_year(filepath) or ''}/{date.today().year}"
+        )
+        return f"{CHECKER_VERSION}:{sha256}:{checks_key}:{year_source}"
+
+    def get(self, key: str) -> list[dict] | None:
+        return self.entries.get(key)
+
+    def put(self, key: str, findings: list[dict]) -> None:
+        self.entries[key] = findings
+
+    def save(self) -> None:
+        """Atomically write the cache so an interrupted run never leaves a torn file."""
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "entries": self.entries}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Failed to write cache {self.path}: {e}", file=sys.stderr)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def check_directory(
+    root: str,
+    checks: list[str] | None = None,
+    as_of: date | None = None,
+    workers: int = 1,
+    cache: FindingsCache | None = None,
+) -> tuple[dict[str, list[Finding]], dict[str, str], dict[str, int]]:
+    """Check every markdown file under ``root``.
+
+    Args:
+        root: Reports directory, searched recursively
+        checks: Check names to run (default: all)
+        as_of: Reference date for year inference
+        workers: Process count; 1 checks inline in the calling process
+        cache: Optional findings cache; updated in memory, saved by the caller
+
+    Returns:
+        Tuple of (findings per relative path, errors per relative path,
+        counts of files/cached/checked/errors)
+    """
+    root_path = Path(root)
+    results: dict[str, list[Finding]] = {}
+    errors: dict[str, str] = {}
+    tasks: list[tuple] = []
+    task_keys: list[tuple[str, str | None]] = []
+    cached = 0
+    for path in find_documents(root_path):
+        name = path.relative_to(root_path).as_posix()
+        key = None
+        if cache is not None:
+            try:
+                key = FindingsCache.key(file_sha256(path), checks, as_of, str(path))
+            except OSError as e:
+                errors[name] = f"{type(e).__name__}: {e}"
+                continue
+            hit = cache.get(key)
+            if hit is not None:
+                results[name] = [Finding(**f) for f in hit]
+                cached += 1
+                continue
+        tasks.append((str(path), checks, as_of))
+        task_keys.append((name, key))
+
+    pool = None
+    if workers > 1 and len(tasks) > 1:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(tasks)))
+    try:
+        outcomes = (pool.map if pool else map)(_check_file_safely, tasks)
+        for (name, key), (findings, error) in zip(task_keys, outcomes):
+            if error is not None:
+                errors[name] = error
+                continue
+            if cache is not None and key is not None:
+                cache.put(key, findings)
+            results[name] = [Finding(**f) for f in findings]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    stats = {
+        "files": len(results) + len(errors),
+        "cached": cached,
+        "checked": len(results) - cached,
+        "errors": len(errors),
+    }
+    return dict(sorted(results.items())), errors, stats
+
+
+def generate_batch_report(
+    results: dict[str, list[Finding]], errors: dict[str, str], source_dir: str
+) -> str:
+    """Generate a markdown report covering every checked file."""
+    total = sum(len(findings) for findings in results.values())
+    lines = [
+        "# Data Quality Report",
+        f"**Source:** {source_dir}",
+        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        f"**Files checked:** {len(results)}",
+        f"**Total findings:** {total}",
+        "",
+    ]
+
+    if errors:
+        lines.append(f"## Unreadable files ({len(errors)})")
+        lines.extend(f"- `{name}`: {error}" for name, error in sorted(errors.items()))
+        lines.append("")
+
+    flagged = {name: findings for name, findings in results.items() if findings}
+    if not flagged:
+        lines.append("No issues found.")
+        return "\n".join(lines) + "\n"
+
+    for name, findings in flagged.items():
+        lines.append(f"## {name} ({len(findings)})")
+        for f in findings:
+            loc = f" (line {f.line_number})" if f.line_number else ""
+            lines.append(f"- **{f.severity} [{f.category}]**{loc}: {f.message}")
+        lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Build CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Validate data quality in market analysis documents"
     )
-    parser.add_argument("--file", required=True, help="Path to markdown file to check")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help="Path to markdown file to check")
+    source.add_argument("--dir", help="Check every markdown file under this directory (recursive)")
     parser.add_argument(
         "--checks",
         help="Comma-separated list of checks to run (default: all)",
@@ -754,21 +1006,82 @@ def build_parser() -> argparse.ArgumentParser:
         "--as-of",
         help="Reference date for year inference (YYYY-MM-DD)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes used with --dir (default: CPUs)",
+    )
+    parser.add_argument(
+        "--cache-file", help=f"Findings cache for --dir (default: <dir>/{CACHE_FILENAME})"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Check every file with --dir")
     return parser
 
 
+def _print_summary(findings: list[Finding]) -> None:
+    if findings:
+        errors = sum(1 for f in findings if f.severity == "ERROR")
+        warnings = sum(1 for f in findings if f.severity == "WARNING")
+        infos = sum(1 for f in findings if f.severity == "INFO")
+        print(f"\nFindings: {errors} errors, {warnings} warnings, {infos} info")
+    else:
+        print("\nNo issues found.")
+
+
+def _run_directory(args: argparse.Namespace, checks: list[str] | None, as_of: date | None):
+    """``--dir`` mode: check a reports tree and write one combined report pair."""
+    if args.workers < 1:
+        print("Error: --workers must be >= 1", file=sys.stderr)
+        sys.exit(1)
+    cache = None
+    if not args.no_cache:
+        cache = FindingsCache(args.cache_file or os.path.join(args.dir, CACHE_FILENAME))
+
+    results, errors, stats = check_directory(args.dir, checks, as_of, args.workers, cache)
+    if cache is not None:
+        cache.save()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+
+    json_path = os.path.join(args.output_dir, f"data_quality_{timestamp}.json")
+    with open(json_path, "w", encoding="utf-8") as jf:
+        json.dump(
+            {
+                "files": {name: [asdict(f) for f in fs] for name, fs in results.items()},
+                "errors": errors,
+            },
+            jf,
+            indent=2,
+            ensure_ascii=False,
+        )
+    print(f"JSON report: {json_path}")
+
+    md_path = os.path.join(args.output_dir, f"data_quality_{timestamp}.md")
+    with open(md_path, "w", encoding="utf-8") as mf:
+        mf.write(generate_batch_report(results, errors, args.dir))
+    print(f"Markdown report: {md_path}")
+
+    print(
+        f"\n{stats['files']} files: {stats['cached']} cached, "
+        f"{stats['checked']} checked, {stats['errors']} unreadable"
+    )
+    _print_summary([f for findings in results.values() for f in findings])
+
+
 def main() -> None:
     """Entry point for CLI usage."""
     parser = build_parser()
     args = parser.parse_args()
 
-    if not os.path.isfile(args.file):
+    if args.dir is not None and not os.path.isdir(args.dir):
+        print(f"Error: Directory not found: {args.dir}", file=sys.stderr)
+        sys.exit(1)
+    if args.file is not None and not os.path.isfile(args.file):
         print(f"Error: File not found: {args.file}", file=sys.stderr)
         sys.exit(1)
 
-    with open(args.file, encoding="utf-8") as f:
-        content = f.read()
-
     checks = [c.strip() for c in args.checks.split(",")] if args.checks else None
     as_of_date: date | None = None
     if args.as_of:
@@ -778,6 +1091,13 @@ def main() -> None:
             print(f"Error: Invalid date format: {args.as_of}", file=sys.stderr)
             sys.exit(1)
 
+    if args.dir is not None:
+        _run_directory(args, checks, as_of_date)
+        return
+
+    with open(args.file, encoding="utf-8") as f:
+        content = f.read()
+
     findings = run_checks(content, checks, as_of_date, filepath=args.file)
 
     # Always exit 0 (advisory mode) unless script error
@@ -803,13 +1123,7 @@ def main() -> None:
     print(f"Markdown report: {md_path}")
 
     # Summary
-    if findings:
-        errors = sum(1 for f in findings if f.severity == "ERROR")
-        warnings = sum(1 for f in findings if f.severity == "WARNING")
-        infos = sum(1 for f in findings if f.severity == "INFO")
-        print(f"\nFindings: {errors} errors, {warnings} warnings, {infos} info")
-    else:
-        print("\nNo issues found.")
+    _print_summary(findings)
 
 
 if __name__ == "__main__":
@@ -13,9 +13,12 @@ import tempfile
 from datetime import date
 
 from check_data_quality import (
+    Document,
     Finding,
+    FindingsCache,
     check_allocations,
     check_dates,
+    check_directory,
     check_notation,
     check_price_scale,
     check_units,
@@ -598,3 +601,130 @@ class TestEdgeCases:
                 assert result.returncode == 0
         finally:
             os.unlink(tmpfile)
+
+
+# ──────────────────────────────────────────────
+# Shared Document and Directory Batch Mode
+# ──────────────────────────────────────────────
+
+SAMPLE_REPORT = (
+    "# Weekly Report 2026\n"
+    "GLD: $2,800 and GC: $2,650\n"
+    "Gold and GLD are mixed.\n"
+    "January 1, 2026 (Monday) then Feb 28 (Fri)\n"
+    "## Allocation\n"
+    "- Stocks 60%\n"
+    "- Bonds 30%\n"
+    "## Notes\n"
+    "Gold rose 12 today. yield 4.5% vs 25bp\n"
+)
+
+
+class TestDocument:
+    """Document tokenization shared by all checks."""
+
+    def test_line_numbers_match_newline_counts(self):
+        doc = Document(SAMPLE_REPORT)
+        for offset in range(len(SAMPLE_REPORT) + 1):
+            assert doc.line_number(offset) == SAMPLE_REPORT[:offset].count("\n") + 1
+        assert doc.heading_indices == [0, 4, 7]
+        assert doc.year == 2026
+
+    def test_checks_accept_a_shared_document(self):
+        doc = Document(SAMPLE_REPORT)
+        for check in (check_price_scale, check_notation, check_allocations, check_units):
+            assert check(doc) == check(SAMPLE_REPORT)
+        assert check_dates(doc, None, "x.md") == check_dates(SAMPLE_REPORT, None, "x.md")
+        assert run_checks(doc) == run_checks(SAMPLE_REPORT)
+
+
+class TestDirectoryBatch:
+    """--dir mode with a process pool and a findings cache."""
+
+    def _tree(self, root):
+        (root / "daily" / "2026-02-27").mkdir(parents=True)
+        (root / "daily" / "2026-02-27" / "market.md").write_text(SAMPLE_REPORT, encoding="utf-8")
+        (root / "clean.md").write_text("Hello world.\n", encoding="utf-8")
+        (root / "weekday.md").write_text("Feb 28 (Fri)\n", encoding="utf-8")
+        (root / "data_quality_2026-01-01_000000.md").write_text(SAMPLE_REPORT, encoding="utf-8")
+        (root / "notes.txt").write_text(SAMPLE_REPORT, encoding="utf-8")
+
+    def test_directory_matches_single_file_checks(self, tmp_path):
+        self._tree(tmp_path)
+        results, errors, stats = check_directory(str(tmp_path))
+
+        assert list(results) == ["clean.md", "daily/2026-02-27/market.md", "weekday.md"]
+        assert errors == {}
+        for name, findings in results.items():
+            path = str(tmp_path / name)
+            with open(path, encoding="utf-8") as f:
+                assert findings == run_checks(f.read(), filepath=path)
+        assert results["daily/2026-02-27/market.md"]
+        assert stats == {"files": 3, "cached": 0, "checked": 3, "errors": 0}
+
+        pooled, _errors, _stats = check_directory(str(tmp_path), workers=2)
+        assert pooled == results
+
+    def test_cache_reuses_unchanged_files(self, tmp_path):
+        self._tree(tmp_path)
+        cache = FindingsCache(tmp_path / ".cache" / "findings.json")
+        first, _errors, _stats = check_directory(str(tmp_path), cache=cache)
+        cache.save()
+
+        cache = FindingsCache(tmp_path / ".cache" / "findings.json")
+        (tmp_path / "clean.md").write_text("GLD: $2,800\n", encoding="utf-8")
+        second, _errors, stats = check_directory(str(tmp_path), cache=cache)
+
+        assert stats == {"files": 3, "cached": 2, "checked": 1, "errors": 0}
+        assert second["daily/2026-02-27/market.md"] == first["daily/2026-02-27/market.md"]
+        assert [f.category for f in second["clean.md"]] == ["price_scale"]
+
+        # Findings depend on the reference date, so it is part of the key.
+        _results, _errors, stats = check_directory(
+            str(tmp_path), as_of=date(2026, 2, 28), cache=cache
+        )
+        assert stats["cached"] == 0
+
+    def test_checker_version_bump_invalidates_cache(self, tmp_path, monkeypatch):
+        import check_data_quality
+
+        self._tree(tmp_path)
+        cache = FindingsCache(tmp_path / "findings.json")
+        check_directory(str(tmp_path), cache=cache)
+        _results, _errors, stats = check_directory(str(tmp_path), cache=cache)
+        assert stats["cached"] == 3
+
+        monkeypatch.setattr(check_data_quality, "CHECKER_VERSION", "test-bump")
+        _results, _errors, stats = check_directory(str(tmp_path), cache=cache)
+        assert stats["cached"] == 0
+
+    def test_unreadable_file_is_reported(self, tmp_path):
+        self._tree(tmp_path)
+        (tmp_path / "binary.md").write_bytes(b"\xff\xfe\x00bad")
+        results, errors, stats = check_directory(str(tmp_path))
+        assert list(errors) == ["binary.md"]
+        assert "binary.md" not in results
+        assert stats["errors"] == 1
+
+    def test_cli_dir_mode(self, tmp_path):
+        self._tree(tmp_path / "reports")
+        out_dir = tmp_path / "out"
+        result = subprocess.run(
+            [
+                sys.executable,
+                os.path.join(SCRIPTS_DIR, "check_data_quality.py"),
+                "--dir",
+                str(tmp_path / "reports"),
+                "--output-dir",
+                str(out_dir),
+                "--workers",
+                "1",
+            ],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert "3 files: 0 cached, 3 checked, 0 unreadable" in result.stdout
+        assert (tmp_path / "reports" / ".data_quality_cache.json").exists()
+        reports = sorted(p.suffix for p in out_dir.iterdir())
+        assert reports == [".json", ".md"]
@@ -6,9 +6,11 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import os
 import re
 import shlex
 import subprocess
+import tempfile
 from datetime import date, datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -286,6 +288,89 @@ def score_reversal_candidate(
     return round(clamp(score), 2)
 
 
+def _score_inputs(frame: Any, *columns: str) -> list[Any]:
+    """Float arrays for the named columns (zeros when a column is absent)."""
+    _, np = _require_pandas()
+    return [
+        frame[name].to_numpy(dtype=float) if name in frame else np.zeros(len(frame))
+        for name in columns
+    ]
+
+
+def score_breakout_frame(frame: Any, regime_label: str, hint_boost: Any = 0.0) -> Any:
+    """Vectorized score_breakout_candidate over every row of *frame* (unrounded)."""
+    _, np = _require_pandas()
+    rs_rank, rel_volume, close_pos, atr_pct, close, high20_prev = _score_inputs(
+        frame, "rs_rank_pct", "rel_volume", "close_pos", "atr_pct", "close", "high20_prev"
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        breakout_strength = np.where(high20_prev > 0, (close / high20_prev) - 1.0, 0.0)
+
+    regime_component = {"RiskOn": 10.0, "Neutral": 5.0, "RiskOff": -5.0}.get(regime_label, 0.0)
+    atr_penalty = np.clip((atr_pct - 0.08) / 0.07, 0.0, 1.0) * 15.0
+
+    score = (
+        np.clip(rs_rank, 0.0, 1.0) * 40.0
+        + np.clip(rel_volume / 3.0, 0.0, 1.0) * 20.0
+        + np.clip(breakout_strength / 0.08, 0.0, 1.0) * 20.0
+        + np.clip(close_pos, 0.0, 1.0) * 10.0
+        + regime_component
+        + hint_boost
+        - atr_penalty
+    )
+    return np.clip(score, 0.0, 100.0)
+
+
+def score_gap_frame(frame: Any, regime_label: str, hint_boost: Any = 0.0) -> Any:
+    """Vectorized score_gap_candidate over every row of *frame* (unrounded)."""
+    _, np = _require_pandas()
+    gap, rel_volume, close_pos, close, ma50, ma200, atr_pct = _score_inputs(
+        frame, "gap", "rel_volume", "close_pos", "close", "ma50", "ma200", "atr_pct"
+    )
+
+    trend_score = np.where((close > ma50) & (ma50 > 0), 10.0, 0.0) + np.where(
+        (close > ma200) & (ma200 > 0), 10.0, 0.0
+    )
+
+    regime_component = {"RiskOn": 8.0, "Neutral": 4.0, "RiskOff": -8.0}.get(regime_label, 0.0)
+    atr_penalty = np.clip((atr_pct - 0.10) / 0.08, 0.0, 1.0) * 10.0
+
+    score = (
+        np.clip(gap / 0.12, 0.0, 1.0) * 35.0
+        + np.clip(rel_volume / 4.0, 0.0, 1.0) * 25.0
+        + np.clip(close_pos, 0.0, 1.0) * 20.0
+        + trend_score
+        + regime_component
+        + hint_boost
+        - atr_penalty
+    )
+    return np.clip(score, 0.0, 100.0)
+
+
+def score_reversal_frame(frame: Any, regime_label: str, hint_boost: Any = 0.0) -> Any:
+    """Vectorized score_reversal_candidate over every row of *frame* (unrounded)."""
+    _, np = _require_pandas()
+    ret_1d, rel_volume, atr_pct, close, ma200 = _score_inputs(
+        frame, "ret_1d", "rel_volume", "atr_pct", "close", "ma200"
+    )
+
+    shock_component = np.clip(np.abs(np.minimum(ret_1d, 0.0)) / 0.18, 0.0, 1.0) * 45.0
+    volume_component = np.clip(rel_volume / 4.0, 0.0, 1.0) * 20.0
+    trend_component = np.where((close > ma200) & (ma200 > 0), 15.0, 5.0)
+    regime_component = {"RiskOff": 12.0, "Neutral": 7.0, "RiskOn": 2.0}.get(regime_label, 0.0)
+    atr_penalty = np.clip((atr_pct - 0.14) / 0.10, 0.0, 1.0) * 12.0
+
+    score = (
+        shock_component
+        + volume_component
+        + trend_component
+        + regime_component
+        + hint_boost
+        - atr_penalty
+    )
+    return np.clip(score, 0.0, 100.0)
+
+
 def build_ticket_payload(
     candidate: dict[str, Any],
     as_of_date: date,
@@ -602,13 +687,52 @@ def _require_pandas() -> tuple[Any, Any]:
     return pd, np
 
 
-def compute_features(
-    ohlcv_path: Path,
-    as_of_date: date | None,
-) -> tuple[Any, Any, date]:
-    """Load OHLCV parquet and compute per-symbol features."""
-    pd, np = _require_pandas()
-    df = pd.read_parquet(ohlcv_path)
+class SymbolWindows:
+    """Rolling windows over a (symbol, timestamp)-sorted frame that never cross symbols.
+
+    Symbol boundaries are located once; every rolling feature then runs as a
+    single pandas window kernel over the whole column with precomputed
+    per-row bounds, instead of one Python callback (or one re-factorized
+    groupby) per symbol.  Window bounds match per-symbol ``rolling`` exactly,
+    so results are identical to the grouped computation.
+    """
+
+    def __init__(self, symbols: Any):
+        _, np = _require_pandas()
+        codes = symbols.to_numpy()
+        positions = np.arange(len(codes))
+        is_first = np.ones(len(codes), dtype=bool)
+        is_first[1:] = codes[1:] != codes[:-1]
+        self.group_start = np.maximum.accumulate(np.where(is_first, positions, 0))
+        self.offset = positions - self.group_start  # bars since the symbol's first row
+
+    def shift(self, values: Any, periods: int) -> Any:
+        """Per-symbol ``shift(periods)`` for positive *periods*."""
+        return values.shift(periods).where(self.offset >= periods)
+
+    def rolling(self, values: Any, window: int, min_periods: int, how: str, **kwargs: Any) -> Any:
+        """Per-symbol ``rolling(window, min_periods).<how>(**kwargs)``."""
+        _, np = _require_pandas()
+        from pandas.api.indexers import BaseIndexer
+
+        group_start = self.group_start
+
+        class _Bounds(BaseIndexer):
+            def get_window_bounds(
+                self, num_values=0, min_periods=None, center=None, closed=None, step=None
+            ):
+                end = np.arange(1, num_values + 1, dtype=np.int64)
+                start = np.maximum(group_start[:num_values], end - window).astype(np.int64)
+                return start, end
+
+        rolling = values.rolling(_Bounds(window_size=window), min_periods=min_periods)
+        return getattr(rolling, how)(**kwargs)
+
+
+def _normalize_ohlcv(df: Any) -> Any:
+    """Select OHLCV columns, upper-case symbols and sort by (symbol, timestamp)."""
+    pd, _ = _require_pandas()
+    df = df.copy()
     df.columns = [str(col).lower() for col in df.columns]
 
     missing = sorted(REQUIRED_OHLCV_COLUMNS - set(df.columns))
@@ -621,56 +745,73 @@ def compute_features(
     frame = frame.dropna(subset=["symbol", "timestamp", "open", "high", "low", "close", "volume"])
     frame = frame.sort_values(["symbol", "timestamp"]).reset_index(drop=True)
     frame["date"] = frame["timestamp"].dt.date
+    return frame
 
-    available_dates = sorted(frame["date"].dropna().unique())
-    if not available_dates:
-        raise AutoDetectError("no valid timestamps found in OHLCV")
 
+def _resolve_target_date(available_dates: list[date], as_of_date: date | None) -> date:
+    """as_of_date if it has data, else the latest available date before it."""
     target_date = as_of_date or available_dates[-1]
     if target_date not in available_dates:
         prior_dates = [d for d in available_dates if d <= target_date]
         if not prior_dates:
             raise AutoDetectError(f"no OHLCV data at or before as_of={target_date.isoformat()}")
         target_date = prior_dates[-1]
+    return target_date
 
-    frame = frame[frame["date"] <= target_date].copy()
-    group = frame.groupby("symbol", sort=False)
 
-    frame["prev_close"] = group["close"].shift(1)
+def _add_features(frame: Any) -> Any:
+    """Add every rolling feature column to a normalized, symbol-sorted frame."""
+    pd, np = _require_pandas()
+    windows = SymbolWindows(frame["symbol"])
+
+    frame["prev_close"] = windows.shift(frame["close"], 1)
     frame["ret_1d"] = frame["close"] / frame["prev_close"] - 1.0
 
-    frame["ma20"] = group["close"].transform(lambda s: s.rolling(20, min_periods=20).mean())
-    frame["ma50"] = group["close"].transform(lambda s: s.rolling(50, min_periods=50).mean())
-    frame["ma200"] = group["close"].transform(lambda s: s.rolling(200, min_periods=200).mean())
+    frame["ma20"] = windows.rolling(frame["close"], 20, 20, "mean")
+    frame["ma50"] = windows.rolling(frame["close"], 50, 50, "mean")
+    frame["ma200"] = windows.rolling(frame["close"], 200, 200, "mean")
 
-    frame["vol_avg20"] = group["volume"].transform(lambda s: s.rolling(20, min_periods=20).mean())
+    frame["vol_avg20"] = windows.rolling(frame["volume"], 20, 20, "mean")
     frame["rel_volume"] = frame["volume"] / frame["vol_avg20"]
 
-    frame["high20_prev"] = group["high"].transform(
-        lambda s: s.shift(1).rolling(20, min_periods=20).max()
-    )
-    frame["low20_prev"] = group["low"].transform(
-        lambda s: s.shift(1).rolling(20, min_periods=20).min()
-    )
+    frame["high20_prev"] = windows.rolling(windows.shift(frame["high"], 1), 20, 20, "max")
+    frame["low20_prev"] = windows.rolling(windows.shift(frame["low"], 1), 20, 20, "min")
     frame["close_pos"] = (
         (frame["close"] - frame["low"]) / (frame["high"] - frame["low"]).replace(0, np.nan)
     ).clip(0, 1)
     frame["gap"] = frame["open"] / frame["prev_close"] - 1.0
-    frame["rs_120"] = group["close"].transform(lambda s: s / s.shift(120) - 1.0)
+    frame["rs_120"] = frame["close"] / windows.shift(frame["close"], 120) - 1.0
 
     tr1 = frame["high"] - frame["low"]
     tr2 = (frame["high"] - frame["prev_close"]).abs()
     tr3 = (frame["low"] - frame["prev_close"]).abs()
     frame["tr"] = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    frame["atr14"] = group["tr"].transform(lambda s: s.rolling(14, min_periods=14).mean())
+    frame["atr14"] = windows.rolling(frame["tr"], 14, 14, "mean")
     frame["atr_pct"] = frame["atr14"] / frame["close"]
 
     for metric in ("ret_1d", "rel_volume", "gap", "atr_pct"):
-        rolling_mean = group[metric].transform(lambda s: s.rolling(60, min_periods=30).mean())
-        rolling_std = group[metric].transform(lambda s: s.rolling(60, min_periods=30).std(ddof=0))
+        rolling_mean = windows.rolling(frame[metric], 60, 30, "mean")
+        rolling_std = windows.rolling(frame[metric], 60, 30, "std", ddof=0)
         frame[f"{metric}_z"] = (frame[metric] - rolling_mean) / rolling_std.replace(0, np.nan)
 
-    frame = frame.replace([np.inf, -np.inf], np.nan)
+    return frame.replace([np.inf, -np.inf], np.nan)
+
+
+def build_feature_frame(df: Any, as_of_date: date | None) -> tuple[Any, Any, date]:
+    """Compute per-symbol features from an OHLCV frame (see compute_features).
+
+    Every rolling feature is a single window pass over the symbol-sorted
+    frame (see SymbolWindows), so cost scales with rows rather than with the
+    number of symbols.
+    """
+    frame = _normalize_ohlcv(df)
+
+    available_dates = sorted(frame["date"].dropna().unique())
+    if not available_dates:
+        raise AutoDetectError("no valid timestamps found in OHLCV")
+    target_date = _resolve_target_date(available_dates, as_of_date)
+
+    frame = _add_features(frame[frame["date"] <= target_date].copy())
 
     latest = frame[frame["date"] == target_date].copy()
     if latest.empty:
@@ -679,15 +820,576 @@ def compute_features(
     return frame, latest, target_date
 
 
+def compute_features(
+    ohlcv_path: Path,
+    as_of_date: date | None,
+) -> tuple[Any, Any, date]:
+    """Load OHLCV parquet and compute per-symbol features."""
+    pd, _ = _require_pandas()
+    return build_feature_frame(pd.read_parquet(ohlcv_path), as_of_date)
+
+
+# -- Incremental feature store -----------------------------------------------
+#
+# compute_features() recomputes every rolling feature over the whole history
+# to read one date.  With --feature-store, the per-symbol rolling state
+# (trailing bar windows and z-score histories) is persisted together with the
+# recent feature rows, and later runs read only bars on/after the stored date
+# and advance that state one bar at a time.
+
+FEATURE_STORE_VERSION = 1
+STORE_BAR_WINDOW = 200  # longest bar lookback (ma200); covers rs_120 and ATR14 too
+STORE_Z_WINDOW = 60  # z-score window
+STORE_FRAME_DAYS = 90  # feature-row dates kept (correlation-chain lookback)
+STORE_REBUILD_SHARE = 0.25  # above this share of symbols needing history, rebuild all
+
+_BAR_COLUMNS = ("open", "high", "low", "close", "volume")
+_Z_METRICS = ("ret_1d", "rel_volume", "gap", "atr_pct")
+_FEATURE_COLUMNS = (
+    "prev_close",
+    "ret_1d",
+    "ma20",
+    "ma50",
+    "ma200",
+    "vol_avg20",
+    "rel_volume",
+    "high20_prev",
+    "low20_prev",
+    "close_pos",
+    "gap",
+    "rs_120",
+    "tr",
+    "atr14",
+    "atr_pct",
+    "ret_1d_z",
+    "rel_volume_z",
+    "gap_z",
+    "atr_pct_z",
+)
+
+
+def _timestamps_ns(timestamps: Any) -> Any:
+    """UTC timestamps as int64 nanoseconds."""
+    return timestamps.dt.tz_convert(None).astype("datetime64[ns]").to_numpy().view("int64")
+
+
+def _window_features(bars: Any) -> dict[str, Any]:
+    """Feature values for the newest bar of each (symbol, STORE_BAR_WINDOW, OHLCV) window.
+
+    Windows are right-aligned and NaN-padded, so a window with fewer bars
+    than a feature's lookback yields NaN, like ``min_periods`` does in
+    _add_features().
+    """
+    _, np = _require_pandas()
+    opens, highs, lows, closes, volumes = (bars[:, :, i] for i in range(len(_BAR_COLUMNS)))
+    close = closes[:, -1]
+    prev_close = closes[:, -2]
+    high_low = highs[:, -1] - lows[:, -1]
+    tr_window = np.fmax(
+        np.fmax(highs[:, -14:] - lows[:, -14:], np.abs(highs[:, -14:] - closes[:, -15:-1])),
+        np.abs(lows[:, -14:] - closes[:, -15:-1]),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        features = {
+            "prev_close": prev_close,
+            "ret_1d": close / prev_close - 1.0,
+            "ma20": closes[:, -20:].mean(axis=1),
+            "ma50": closes[:, -50:].mean(axis=1),
+            "ma200": closes[:, -200:].mean(axis=1),
+            "vol_avg20": volumes[:, -20:].mean(axis=1),
+            "high20_prev": highs[:, -21:-1].max(axis=1),
+            "low20_prev": lows[:, -21:-1].min(axis=1),
+            "close_pos": np.clip(
+                (close - lows[:, -1]) / np.where(high_low == 0, np.nan, high_low), 0, 1
+            ),
+            "gap": opens[:, -1] / prev_close - 1.0,
+            "rs_120": close / closes[:, -121] - 1.0,
+            "tr": tr_window[:, -1],
+            "atr14": tr_window.mean(axis=1),
+        }
+        features["rel_volume"] = volumes[:, -1] / features["vol_avg20"]
+        features["atr_pct"] = features["atr14"] / close
+    return features
+
+
+def _window_zscores(history: Any) -> Any:
+    """Z-score of the newest value in each (symbol, STORE_Z_WINDOW, metric) history.
+
+    Mirrors ``rolling(60, min_periods=30)`` mean/std(ddof=0): NaN entries are
+    skipped and fewer than 30 observations give NaN.
+    """
+    _, np = _require_pandas()
+    valid = ~np.isnan(history)
+    count = valid.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(valid, history, 0.0).sum(axis=1) / count
+        deviation = np.where(valid, history - mean[:, None, :], 0.0)
+        std = np.sqrt((deviation**2).sum(axis=1) / count)
+        zscores = (history[:, -1, :] - mean) / np.where(std == 0, np.nan, std)
+    zscores[count < 30] = np.nan
+    return zscores
+
+
+class FeatureStore:
+    """Per-symbol rolling feature state persisted between auto-detect runs.
+
+    Holds, for the OHLCV file it was built from:
+    - ``bars``: the last STORE_BAR_WINDOW OHLCV bars per symbol;
+    - ``z_history``: the last STORE_Z_WINDOW values of each z-scored metric;
+    - ``frame``: feature rows for the last STORE_FRAME_DAYS dates, which is
+      everything compute_regime() and the research scanners read;
+    - ``month_end``: monthly_closes() over the full history.
+    """
+
+    STATE_FILE = "feature_state.npz"
+    META_FILE = "feature_meta.json"
+
+    def __init__(
+        self,
+        source: str,
+        target_date: date,
+        symbols: Any,
+        last_ts: Any,
+        bars: Any,
+        z_history: Any,
+        frame: Any,
+        month_end: Any,
+    ):
+        self.source = source
+        self.target_date = target_date
+        self.symbols = symbols
+        self.last_ts = last_ts
+        self.bars = bars
+        self.z_history = z_history
+        self.frame = frame
+        self.month_end = month_end
+
+    @classmethod
+    def from_feature_frame(cls, source: str, frame: Any, target_date: date) -> FeatureStore:
+        """Build the state from a full-history _add_features() frame."""
+        _, np = _require_pandas()
+        frame = frame.sort_values(["symbol", "timestamp"], kind="stable").reset_index(drop=True)
+        codes_raw = frame["symbol"].to_numpy()
+        positions = np.arange(len(frame))
+        is_last = np.ones(len(frame), dtype=bool)
+        is_last[:-1] = codes_raw[:-1] != codes_raw[1:]
+        last_pos = np.flatnonzero(is_last)
+        codes = np.searchsorted(last_pos, positions)  # symbol index of each row
+        from_end = last_pos[codes] - positions  # 0 on a symbol's newest bar
+
+        bars = np.full((len(last_pos), STORE_BAR_WINDOW, len(_BAR_COLUMNS)), np.nan)
+        keep = from_end < STORE_BAR_WINDOW
+        bars[codes[keep], STORE_BAR_WINDOW - 1 - from_end[keep]] = frame.loc[
+            keep, list(_BAR_COLUMNS)
+        ].to_numpy(dtype=float)
+        z_history = np.full((len(last_pos), STORE_Z_WINDOW, len(_Z_METRICS)), np.nan)
+        keep = from_end < STORE_Z_WINDOW
+        z_history[codes[keep], STORE_Z_WINDOW - 1 - from_end[keep]] = frame.loc[
+            keep, list(_Z_METRICS)
+        ].to_numpy(dtype=float)
+
+        return cls(
+            source=source,
+            target_date=target_date,
+            symbols=codes_raw[last_pos].astype(str),
+            last_ts=_timestamps_ns(frame["timestamp"])[last_pos],
+            bars=bars,
+            z_history=z_history,
+            frame=_recent_rows(frame),
+            month_end=monthly_closes(frame),
+        )
+
+    @classmethod
+    def load(cls, store_dir: Path, source: str) -> FeatureStore | None:
+        """Load the store for *source*, or None if absent, stale-format or for another file."""
+        pd, np = _require_pandas()
+        meta_path = store_dir / cls.META_FILE
+        state_path = store_dir / cls.STATE_FILE
+        if not meta_path.exists() or not state_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if meta.get("version") != FEATURE_STORE_VERSION or meta.get("source") != source:
+            return None
+        with np.load(state_path, allow_pickle=False) as state:
+            if str(state["target_date"]) != meta.get("target_date"):
+                return None  # state and meta written by different runs
+            frame = pd.DataFrame({"symbol": state["frame_symbol"].astype(object)})
+            frame["timestamp"] = pd.to_datetime(state["frame_timestamp"], unit="ns", utc=True)
+            for column in (*_BAR_COLUMNS, *_FEATURE_COLUMNS):
+                frame[column] = state[f"frame_{column}"]
+            frame["date"] = frame["timestamp"].dt.date
+            month_end = pd.DataFrame(
+                {
+                    "symbol": state["month_symbol"].astype(object),
+                    "month": pd.PeriodIndex.from_ordinals(state["month_ordinal"], freq="M"),
+                    "close": state["month_close"],
+                }
+            )
+            return cls(
+                source=source,
+                target_date=date.fromisoformat(meta["target_date"]),
+                symbols=state["symbols"],
+                last_ts=state["last_ts"],
+                bars=state["bars"],
+                z_history=state["z_history"],
+                frame=frame,
+                month_end=month_end,
+            )
+
+    def save(self, store_dir: Path) -> None:
+        """Write state then meta, each atomically (meta last marks a complete save)."""
+        pd, np = _require_pandas()
+        store_dir.mkdir(parents=True, exist_ok=True)
+        arrays = {
+            "target_date": np.array(self.target_date.isoformat()),
+            "symbols": np.asarray(self.symbols, dtype=str),
+            "last_ts": self.last_ts,
+            "bars": self.bars,
+            "z_history": self.z_history,
+            "frame_symbol": self.frame["symbol"].to_numpy(dtype=str),
+            "frame_timestamp": _timestamps_ns(self.frame["timestamp"]),
+            "month_symbol": self.month_end["symbol"].to_numpy(dtype=str),
+            "month_ordinal": pd.PeriodIndex(self.month_end["month"]).asi8,
+            "month_close": self.month_end["close"].to_numpy(dtype=float),
+        }
+        for column in (*_BAR_COLUMNS, *_FEATURE_COLUMNS):
+            arrays[f"frame_{column}"] = self.frame[column].to_numpy(dtype=float)
+
+        fd, tmp = tempfile.mkstemp(dir=store_dir, suffix=".npz.tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                np.savez(handle, **arrays)
+            os.replace(tmp, store_dir / self.STATE_FILE)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        meta = {
+            "version": FEATURE_STORE_VERSION,
+            "source": self.source,
+            "target_date": self.target_date.isoformat(),
+            "symbols": int(len(self.symbols)),
+        }
+        fd, tmp = tempfile.mkstemp(dir=store_dir, suffix=".json.tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(meta, handle, indent=2)
+        os.replace(tmp, store_dir / self.META_FILE)
+
+    def symbols_needing_history(self, rows: Any) -> set[str]:
+        """Symbols in *rows* (bars on/after target_date) that cannot be advanced in place.
+
+        A symbol needs its full history when it is new to the store, when the
+        file's copy of its stored last bar differs (split/dividend
+        re-adjustment), when bars were inserted at or before its last bar, or
+        when its last stored bar is on/after target_date but missing from
+        *rows* (the history was rewritten).  A symbol whose last bar predates
+        target_date (it skipped that session) advances over the missing
+        dates, as the batch engine does.
+        """
+        pd, np = _require_pandas()
+        codes = pd.Index(self.symbols).get_indexer(rows["symbol"])
+        known = codes >= 0
+        ts = _timestamps_ns(rows["timestamp"])
+        last_ts = np.where(known, self.last_ts[np.maximum(codes, 0)], 0)
+        stored_bar = self.bars[np.maximum(codes, 0), -1]
+        values = rows[list(_BAR_COLUMNS)].to_numpy(dtype=float)
+
+        overlap = known & (ts == last_ts)
+        adjusted = overlap & ~np.isclose(values, stored_bar, rtol=1e-9, atol=0.0).all(axis=1)
+        inserted = known & (ts < last_ts)
+        expects_overlap = known & (last_ts >= pd.Timestamp(self.target_date, tz="UTC").value)
+        gapped = np.setdiff1d(codes[expects_overlap], codes[overlap])
+
+        symbols = rows["symbol"].to_numpy()
+        return set(symbols[~known | adjusted | inserted]) | set(self.symbols[gapped])
+
+    def advance(self, rows: Any) -> None:
+        """Append *rows* (new bars of known, continuous symbols) one timestamp at a time."""
+        pd, np = _require_pandas()
+        if rows.empty:
+            return
+        symbol_index = pd.Index(self.symbols)
+        new_frames = []
+        for ts_value, step in rows.sort_values(["timestamp", "symbol"]).groupby(
+            "timestamp", sort=True
+        ):
+            idx = symbol_index.get_indexer(step["symbol"])
+            values = step[list(_BAR_COLUMNS)].to_numpy(dtype=float)
+            self.bars[idx] = np.concatenate([self.bars[idx, 1:], values[:, None, :]], axis=1)
+            features = _window_features(self.bars[idx])
+
+            metrics = np.column_stack([features[name] for name in _Z_METRICS])
+            self.z_history[idx] = np.concatenate(
+                [self.z_history[idx, 1:], metrics[:, None, :]], axis=1
+            )
+            zscores = _window_zscores(self.z_history[idx])
+            for pos, name in enumerate(_Z_METRICS):
+                features[f"{name}_z"] = zscores[:, pos]
+
+            step_frame = step[["symbol", "timestamp", *_BAR_COLUMNS, "date"]].copy()
+            for column in _FEATURE_COLUMNS:
+                step_frame[column] = features[column]
+            new_frames.append(step_frame.replace([np.inf, -np.inf], np.nan))
+            self.last_ts[idx] = _timestamps_ns(step["timestamp"])
+
+        new_rows = pd.concat(new_frames, ignore_index=True)
+        self.frame = _recent_rows(pd.concat([self.frame, new_rows], ignore_index=True))
+        self.month_end = _merge_month_end(self.month_end, monthly_closes(new_rows))
+
+    def replace_symbols(self, rebuilt: FeatureStore) -> None:
+        """Swap in state rebuilt from full history for ``rebuilt.symbols``."""
+        pd, np = _require_pandas()
+        replaced = set(rebuilt.symbols.tolist())
+        keep = ~np.isin(self.symbols, rebuilt.symbols)
+        self.symbols = np.concatenate([self.symbols[keep], rebuilt.symbols])
+        self.last_ts = np.concatenate([self.last_ts[keep], rebuilt.last_ts])
+        self.bars = np.concatenate([self.bars[keep], rebuilt.bars])
+        self.z_history = np.concatenate([self.z_history[keep], rebuilt.z_history])
+        self.frame = _recent_rows(
+            pd.concat(
+                [self.frame[~self.frame["symbol"].isin(replaced)], rebuilt.frame],
+                ignore_index=True,
+            )
+        )
+        self.month_end = _merge_month_end(
+            self.month_end[~self.month_end["symbol"].isin(replaced)], rebuilt.month_end
+        )
+
+
+def _recent_rows(frame: Any) -> Any:
+    """Rows on the last STORE_FRAME_DAYS dates, sorted by (symbol, timestamp)."""
+    dates = sorted(frame["date"].unique())
+    recent = frame[frame["date"] >= dates[-STORE_FRAME_DAYS]] if dates else frame
+    return recent.sort_values(["symbol", "timestamp"], kind="stable").reset_index(drop=True)
+
+
+def _merge_month_end(month_end: Any, updates: Any) -> Any:
+    pd, _ = _require_pandas()
+    merged = pd.concat([month_end, updates], ignore_index=True)
+    merged = merged.drop_duplicates(["symbol", "month"], keep="last")
+    return merged.sort_values(["symbol", "month"], kind="stable").reset_index(drop=True)
+
+
+def _read_ohlcv_since(ohlcv_path: Path, since: date) -> Any:
+    """Read bars with timestamp >= *since*, pushing the filter into parquet when possible."""
+    pd, _ = _require_pandas()
+    try:
+        return pd.read_parquet(
+            ohlcv_path, filters=[("timestamp", ">=", pd.Timestamp(since, tz="UTC"))]
+        )
+    except (TypeError, ValueError, NotImplementedError):
+        # e.g. string or tz-naive timestamp columns; filter after a full read.
+        return pd.read_parquet(ohlcv_path)
+
+
+def compute_features_incremental(
+    ohlcv_path: Path,
+    as_of_date: date | None,
+    store_dir: Path,
+) -> tuple[Any, Any, date, Any, str]:
+    """compute_features() backed by a FeatureStore in *store_dir*.
+
+    Returns (recent_frame, latest, target_date, month_end, status).  The
+    frame holds the last STORE_FRAME_DAYS dates of feature rows; pass
+    ``month_end`` to scan_calendar_anomaly_candidates().  ``status`` says
+    how the store was used: "reused", "advanced", "rebuilt" or "bypassed"
+    (``as_of`` before the stored date; computed from scratch, store kept).
+    """
+    pd, _ = _require_pandas()
+    source = str(Path(ohlcv_path).resolve())
+    store = FeatureStore.load(store_dir, source)
+
+    if store is not None and as_of_date is not None and as_of_date < store.target_date:
+        frame, latest, target_date = compute_features(ohlcv_path, as_of_date)
+        return frame, latest, target_date, monthly_closes(frame), "bypassed"
+
+    def rebuild() -> tuple[Any, Any, date, Any, str]:
+        frame, latest, target_date = compute_features(ohlcv_path, as_of_date)
+        rebuilt = FeatureStore.from_feature_frame(source, frame, target_date)
+        rebuilt.save(store_dir)
+        return rebuilt.frame, latest, target_date, rebuilt.month_end, "rebuilt"
+
+    if store is None:
+        return rebuild()
+
+    rows = _normalize_ohlcv(_read_ohlcv_since(ohlcv_path, store.target_date))
+    rows = rows[rows["date"] >= store.target_date]
+    new_dates = sorted(d for d in rows["date"].unique() if d > store.target_date)
+    target_date = _resolve_target_date([store.target_date, *new_dates], as_of_date)
+    rows = rows[rows["date"] <= target_date]
+
+    status = "reused"
+    if target_date > store.target_date:
+        stale = store.symbols_needing_history(rows)
+        if len(stale) > STORE_REBUILD_SHARE * len(store.symbols):
+            return rebuild()
+        codes = pd.Index(store.symbols).get_indexer(rows["symbol"])
+        fresh = (codes >= 0) & ~rows["symbol"].isin(stale).to_numpy()
+        fresh &= _timestamps_ns(rows["timestamp"]) > store.last_ts[codes]
+        store.advance(rows[fresh])
+        if stale:
+            history = _normalize_ohlcv(pd.read_parquet(ohlcv_path))
+            history = history[history["symbol"].isin(stale) & (history["date"] <= target_date)]
+            store.replace_symbols(
+                FeatureStore.from_feature_frame(source, _add_features(history), target_date)
+            )
+        store.target_date = target_date
+        store.save(store_dir)
+        status = "advanced"
+
+    latest = store.frame[store.frame["date"] == target_date].copy()
+    if latest.empty:
+        raise AutoDetectError(f"no rows found for target date {target_date.isoformat()}")
+    return store.frame, latest, target_date, store.month_end, status
+
+
+CORR_MAX_GAP_PATTERNS = 16  # above this many gap patterns, use the blocked kernel
+CORR_BLOCK_COLUMNS = 128  # columns per block in the blocked kernel
+
+
+def average_pair_correlation(
+    returns: Any,
+    min_periods: int = 5,
+    sample_size: int | None = None,
+    seed: int = 0,
+) -> float:
+    """Mean off-diagonal Pearson correlation of the columns of a (dates, symbols) array.
+
+    Equivalent to ``nanmean`` over the off-diagonal of
+    ``DataFrame(returns).corr(min_periods=min_periods)`` (pairwise-complete
+    observations; pairs with fewer than ``min_periods`` shared dates or a
+    constant series are skipped) without building the N x N matrix.
+
+    Columns are grouped by missing-data pattern.  With at most
+    ``CORR_MAX_GAP_PATTERNS`` patterns (a dense or nearly dense universe) the
+    sum runs over standardized-return group sums in O(N * T); on a more
+    ragged universe (IPOs, halts) pair sums come from masked dot products
+    over blocks of ``CORR_BLOCK_COLUMNS`` columns, so memory stays
+    O(block * N) either way.
+
+    ``sample_size`` restricts the estimate to a random subset of that many
+    usable columns (seeded by ``seed``), bounding the cost on very large
+    universes.  Returns NaN when no pair qualifies.
+    """
+    _, np = _require_pandas()
+    values = np.asarray(returns, dtype=float)
+    if values.ndim != 2:
+        raise ValueError("returns must be a 2-D (dates, symbols) array")
+    valid = ~np.isnan(values)
+    usable = valid.sum(axis=0) >= max(min_periods, 2)
+    values, valid = values[:, usable], valid[:, usable]
+    if sample_size is not None and values.shape[1] > sample_size:
+        picked = np.sort(np.random.default_rng(seed).choice(values.shape[1], sample_size, False))
+        values, valid = values[:, picked], valid[:, picked]
+    if values.shape[1] < 2:
+        return float("nan")
+
+    patterns, group_of = np.unique(valid.T, axis=0, return_inverse=True)
+    if len(patterns) > CORR_MAX_GAP_PATTERNS:
+        total, pairs = _blocked_correlation_sums(values, valid, min_periods)
+    else:
+        total, pairs = _grouped_correlation_sums(values, patterns, group_of.ravel(), min_periods)
+    return total / pairs if pairs else float("nan")
+
+
+def _grouped_correlation_sums(
+    values: Any, patterns: Any, group_of: Any, min_periods: int
+) -> tuple[float, int]:
+    """Sum and count of pairwise correlations for columns grouped by gap pattern.
+
+    For two groups sharing the date mask ``m``, each member is centred and
+    scaled to unit norm on ``m``; the sum of their pairwise correlations is
+    then the dot product of the two groups' summed standardized vectors
+    (minus the diagonal within a group).  Cost is O(G^2 * T + G * N * T).
+    """
+    _, np = _require_pandas()
+    members = [np.flatnonzero(group_of == g) for g in range(len(patterns))]
+    summed: dict[tuple[int, bytes], tuple[Any, int]] = {}
+
+    def standardized_sum(group: int, mask: Any) -> tuple[Any, int]:
+        key = (group, mask.tobytes())
+        if key not in summed:
+            block = values[np.ix_(mask, members[group])]
+            # Constant on this mask: correlation undefined.  Compare the raw
+            # values, since centring may leave rounding residue.
+            keep = np.ptp(block, axis=0) > 0
+            block = block[:, keep] - block[:, keep].mean(axis=0)
+            norm = np.sqrt((block**2).sum(axis=0))
+            summed[key] = ((block / norm).sum(axis=1), int(keep.sum()))
+        return summed[key]
+
+    total = 0.0
+    pairs = 0
+    for a in range(len(patterns)):
+        for b in range(a, len(patterns)):
+            mask = patterns[a] & patterns[b]
+            if mask.sum() < min_periods:
+                continue
+            sum_a, n_a = standardized_sum(a, mask)
+            if a == b:
+                # Off-diagonal sum: |sum z|^2 minus the unit diagonal terms.
+                total += float(sum_a @ sum_a) - n_a
+                pairs += n_a * (n_a - 1)
+            else:
+                sum_b, n_b = standardized_sum(b, mask)
+                total += 2.0 * float(sum_a @ sum_b)
+                pairs += 2 * n_a * n_b
+    return total, pairs
+
+
+def _blocked_correlation_sums(values: Any, valid: Any, min_periods: int) -> tuple[float, int]:
+    """Sum and count of pairwise-complete correlations, one column block at a time.
+
+    Per-pair counts, sums, sums of squares and cross products over the shared
+    dates are masked dot products (zero-filled values times the 0/1 validity
+    matrix), so each block of rows of the correlation matrix is reduced to a
+    sum as soon as it is formed.  Columns are centred on their own mean first
+    to keep the one-pass variance formula accurate.
+    """
+    _, np = _require_pandas()
+    mask = valid.astype(float)
+    counts = mask.sum(axis=0)
+    centred = np.where(valid, values - np.nansum(values, axis=0) / counts, 0.0)
+    squared = centred * centred
+    total = 0.0
+    pairs = 0
+    n_cols = values.shape[1]
+    for start in range(0, n_cols, CORR_BLOCK_COLUMNS):
+        block = slice(start, min(start + CORR_BLOCK_COLUMNS, n_cols))
+        shared = mask[:, block].T @ mask
+        sum_x = centred[:, block].T @ mask
+        sum_y = mask[:, block].T @ centred
+        sum_xx = squared[:, block].T @ mask
+        sum_yy = mask[:, block].T @ squared
+        sum_xy = centred[:, block].T @ centred
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var_x = sum_xx - sum_x * sum_x / shared
+            var_y = sum_yy - sum_y * sum_y / shared
+            corr = (sum_xy - sum_x * sum_y / shared) / np.sqrt(var_x * var_y)
+            # A series constant on the shared dates leaves only rounding residue.
+            keep = (shared >= min_periods) & (var_x > 1e-12 * sum_xx) & (var_y > 1e-12 * sum_yy)
+        rows = np.arange(block.start, block.stop)
+        keep[rows - start, rows] = False
+        total += float(corr[keep].sum())
+        pairs += int(keep.sum())
+    return total, pairs
+
+
 def compute_regime(
     full_frame: Any,
     latest: Any,
     target_date: date,
     min_price: float,
     min_avg_volume: float,
+    corr_sample: int | None = None,
 ) -> tuple[str, dict[str, Any], Any]:
-    """Compute market regime label and summary metrics."""
-    _, np = _require_pandas()
+    """Compute market regime label and summary metrics.
+
+    ``corr_sample`` estimates the 20-day average pair correlation from that
+    many randomly chosen symbols instead of the whole universe.
+    """
 
     tradable = latest[
         (latest["close"] >= min_price)
@@ -711,14 +1413,9 @@ def compute_regime(
 
     recent = full_frame[full_frame["date"].isin(last_20_dates)][["date", "symbol", "ret_1d"]].copy()
     pivot = recent.pivot(index="date", columns="symbol", values="ret_1d")
-    avg_pair_corr = float("nan")
-    if pivot.shape[1] >= 2:
-        corr = pivot.corr(min_periods=5)
-        if corr.shape[0] >= 2:
-            mask = ~np.eye(corr.shape[0], dtype=bool)
-            vals = corr.values[mask]
-            if vals.size > 0:
-                avg_pair_corr = float(np.nanmean(vals))
+    avg_pair_corr = average_pair_correlation(
+        pivot.to_numpy(dtype=float), min_periods=5, sample_size=corr_sample
+    )
 
     spy_rows = full_frame[full_frame["symbol"] == "SPY"].copy()
     spy_today = spy_rows[spy_rows["date"] == target_date].tail(1)
@@ -824,29 +1521,35 @@ def detect_anomalies(
     }
     threshold = 2.0
 
-    for _, row in tradable.iterrows():
-        symbol = str(row["symbol"])
-        for z_col, value_col in metric_map.items():
-            z_val = row.get(z_col)
-            if z_val is None or (isinstance(z_val, float) and math.isnan(z_val)):
-                continue
-            abs_z = abs(float(z_val))
-            if abs_z < threshold:
-                continue
-            value = row.get(value_col)
-            anomalies.append(
-                {
-                    "scope": "stock",
-                    "symbol": symbol,
-                    "metric": value_col,
-                    "value": round(float(value), 5)
-                    if value is not None and not math.isnan(float(value))
-                    else None,
-                    "z": round(float(z_val), 3),
-                    "abs_z": round(abs_z, 3),
-                    "comment": f"{value_col} z-score exceeded {threshold}",
-                }
+    # Threshold each z column as an array; only hits become Python dicts.
+    # Hits are keyed (row position, metric position) so ties keep row order.
+    symbols = tradable["symbol"].astype(str).tolist()
+    hits: list[tuple[int, int, dict[str, Any]]] = []
+    for metric_pos, (z_col, value_col) in enumerate(metric_map.items()):
+        z_vals = tradable[z_col].to_numpy(dtype=float)
+        values = tradable[value_col].to_numpy(dtype=float)
+        with np.errstate(invalid="ignore"):
+            positions = np.flatnonzero(np.abs(z_vals) >= threshold)
+        for pos in positions.tolist():
+            z_val = float(z_vals[pos])
+            value = float(values[pos])
+            hits.append(
+                (
+                    pos,
+                    metric_pos,
+                    {
+                        "scope": "stock",
+                        "symbol": symbols[pos],
+                        "metric": value_col,
+                        "value": None if math.isnan(value) else round(value, 5),
+                        "z": round(z_val, 3),
+                        "abs_z": round(abs(z_val), 3),
+                        "comment": f"{value_col} z-score exceeded {threshold}",
+                    },
+                )
             )
+    hits.sort(key=lambda hit: (hit[0], hit[1]))
+    anomalies.extend(record for _, _, record in hits)
 
     anomalies.sort(key=lambda item: item.get("abs_z", 0.0), reverse=True)
 
@@ -937,29 +1640,28 @@ def scan_candidates(
             ["gap >= 4%", "rel_volume >= 2.0", "close_pos >= 0.5", "close > ma50"],
         ),
     ):
-        subset = tradable[mask].copy()
+        subset = tradable[mask]
         if subset.empty:
             continue
 
-        for _, row in subset.iterrows():
-            symbol = str(row["symbol"]).upper()
-            row_dict = row.to_dict()
-            boost, matched_hints = hint_match_boost(symbol, family, hints)
-
-            if family == "pivot_breakout":
-                score = score_breakout_candidate(
-                    row_dict, regime_label=regime_label, hint_boost=boost
-                )
-                hypothesis_type = "breakout"
-            else:
-                score = score_gap_candidate(row_dict, regime_label=regime_label, hint_boost=boost)
-                hypothesis_type = "earnings_drift"
+        symbols = subset["symbol"].astype(str).str.upper().tolist()
+        hint_matches = [hint_match_boost(symbol, family, hints) for symbol in symbols]
+        boosts = np.array([boost for boost, _ in hint_matches], dtype=float)
+        if family == "pivot_breakout":
+            scores = score_breakout_frame(subset, regime_label=regime_label, hint_boost=boosts)
+            hypothesis_type = "breakout"
+        else:
+            scores = score_gap_frame(subset, regime_label=regime_label, hint_boost=boosts)
+            hypothesis_type = "earnings_drift"
 
+        for symbol, (_, matched_hints), score, row in zip(
+            symbols, hint_matches, scores.tolist(), subset.to_dict("records")
+        ):
             record = {
                 "symbol": symbol,
                 "entry_family": family,
                 "hypothesis_type": hypothesis_type,
-                "priority_score": score,
+                "priority_score": round(score, 2),
                 "close": float(row.get("close", np.nan)),
                 "gap": float(row.get("gap", np.nan)),
                 "rel_volume": float(row.get("rel_volume", np.nan)),
@@ -995,24 +1697,25 @@ def scan_reversal_candidates(
         & (tradable["rel_volume"] >= 1.8)
         & (tradable["close"] > tradable["ma200"] * 0.85)
     )
-    subset = tradable[mask].copy()
+    subset = tradable[mask]
     if subset.empty:
         return []
 
+    symbols = subset["symbol"].astype(str).str.upper().tolist()
+    hint_matches = [hint_match_boost(symbol, "panic_reversal", hints) for symbol in symbols]
+    boosts = np.array([boost * 0.6 for boost, _ in hint_matches], dtype=float)
+    scores = score_reversal_frame(subset, regime_label=regime_label, hint_boost=boosts)
+
     candidates: list[dict[str, Any]] = []
-    for _, row in subset.iterrows():
-        symbol = str(row["symbol"]).upper()
-        row_dict = row.to_dict()
-        boost, matched_hints = hint_match_boost(symbol, "panic_reversal", hints)
-        score = score_reversal_candidate(
-            row_dict, regime_label=regime_label, hint_boost=boost * 0.6
-        )
+    for symbol, (_, matched_hints), score, row in zip(
+        symbols, hint_matches, scores.tolist(), subset.to_dict("records")
+    ):
         candidates.append(
             {
                 "symbol": symbol,
                 "entry_family": "panic_reversal",
                 "hypothesis_type": "panic_reversal",
-                "priority_score": score,
+                "priority_score": round(score, 2),
                 "holding_horizon": "5D",
                 "ret_1d": float(row.get("ret_1d", np.nan)),
                 "rel_volume": float(row.get("rel_volume", np.nan)),
@@ -1220,18 +1923,28 @@ def scan_correlation_chain_candidates(
     return list(deduped.values())[: max(top_n, 0)]
 
 
+def monthly_closes(full_frame: Any) -> Any:
+    """Last close per (symbol, calendar month), sorted by symbol then month."""
+    season = full_frame[["symbol", "timestamp", "close"]].copy()
+    season["month"] = season["timestamp"].dt.tz_convert(None).dt.to_period("M")
+    return season.groupby(["symbol", "month"], as_index=False)["close"].last()
+
+
 def scan_calendar_anomaly_candidates(
     full_frame: Any,
     tradable: Any,
     target_date: date,
     top_n: int = 3,
+    month_end: Any | None = None,
 ) -> list[dict[str, Any]]:
-    """Detect month-of-year seasonal anomaly candidates."""
+    """Detect month-of-year seasonal anomaly candidates.
+
+    ``month_end`` (the monthly_closes() table) may be supplied when
+    ``full_frame`` only holds recent rows, e.g. from the feature store.
+    """
     pd, _ = _require_pandas()
 
-    season = full_frame[["symbol", "timestamp", "close"]].copy()
-    season["month"] = season["timestamp"].dt.to_period("M")
-    month_end = season.groupby(["symbol", "month"], as_index=False)["close"].last()
+    month_end = (monthly_closes(full_frame) if month_end is None else month_end).copy()
     month_end["monthly_ret"] = month_end.groupby("symbol")["close"].pct_change()
     month_end["month_num"] = month_end["month"].dt.month
 
@@ -1403,11 +2116,10 @@ def scan_futures_trigger_candidates(
     frame["date"] = frame["timestamp"].dt.date
     frame = frame.sort_values(["symbol", "timestamp"])
     frame["ret_1d"] = frame.groupby("symbol")["close"].pct_change()
-    frame["ret_z"] = frame.groupby("symbol")["ret_1d"].transform(
-        lambda s: (
-            (s - s.rolling(60, min_periods=30).mean()) / s.rolling(60, min_periods=30).std(ddof=0)
-        )
-    )
+    windows = SymbolWindows(frame["symbol"])
+    frame["ret_z"] = (
+        frame["ret_1d"] - windows.rolling(frame["ret_1d"], 60, 30, "mean")
+    ) / windows.rolling(frame["ret_1d"], 60, 30, "std", ddof=0)
 
     day = frame[frame["date"] == target_date].copy()
     if day.empty:
@@ -1685,6 +2397,17 @@ def parse_args() -> argparse.Namespace:
         choices=["phase1", "phase1_statistical", "phase2"],
         help="Validation stage when --pipeline-root is provided",
     )
+    parser.add_argument(
+        "--corr-sample",
+        type=int,
+        default=None,
+        help="Estimate average pair correlation from N random symbols (default: all)",
+    )
+    parser.add_argument(
+        "--feature-store",
+        default=None,
+        help="Optional directory for the incremental feature store (reused across daily runs)",
+    )
     return parser.parse_args()
 
 
@@ -1696,6 +2419,7 @@ def main() -> int:
     news_path = Path(args.news_reactions).resolve() if args.news_reactions else None
     futures_path = Path(args.futures_ohlcv).resolve() if args.futures_ohlcv else None
     futures_map_path = Path(args.futures_map).resolve() if args.futures_map else None
+    store_dir = Path(args.feature_store).resolve() if args.feature_store else None
     as_of_date = parse_as_of_date(args.as_of)
 
     if not ohlcv_path.exists():
@@ -1716,15 +2440,25 @@ def main() -> int:
 
     try:
         base_hints = read_hints(hints_path)
-        full_frame, latest, resolved_date = compute_features(
-            ohlcv_path=ohlcv_path, as_of_date=as_of_date
-        )
+        month_end = None
+        store_status = None
+        if store_dir is not None:
+            full_frame, latest, resolved_date, month_end, store_status = (
+                compute_features_incremental(
+                    ohlcv_path=ohlcv_path, as_of_date=as_of_date, store_dir=store_dir
+                )
+            )
+        else:
+            full_frame, latest, resolved_date = compute_features(
+                ohlcv_path=ohlcv_path, as_of_date=as_of_date
+            )
         regime_label, market_summary, tradable = compute_regime(
             full_frame=full_frame,
             latest=latest,
             target_date=resolved_date,
             min_price=args.min_price,
             min_avg_volume=args.min_avg_volume,
+            corr_sample=args.corr_sample,
         )
         anomalies = detect_anomalies(
             tradable=tradable,
@@ -1779,6 +2513,7 @@ def main() -> int:
                 tradable=tradable,
                 target_date=resolved_date,
                 top_n=max(args.top_research_n, 0),
+                month_end=month_end,
             )
         )
 
@@ -1827,6 +2562,8 @@ def main() -> int:
         return 1
 
     print(f"[OK] as_of={resolved_date.isoformat()} regime={regime_label}")
+    if store_status is not None:
+        print(f"[OK] feature_store={store_status} dir={store_dir}")
     print(
         "[OK] "
         f"watchlist={len(watchlist)} exportable_tickets={len(exportable_paths)} "
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Benchmark the grouped feature engine against the per-symbol lambda version.
+
+The legacy implementation (``groupby().transform(lambda ...)`` per feature
+and ``iterrows()`` scanners) is kept here as the reference.  Both paths run
+on the same OHLCV frame; the script reports timings and exits non-zero if
+features, anomalies or candidates differ.
+
+Usage:
+    python3 benchmark_feature_engine.py --symbols 6000 --days 300
+    python3 benchmark_feature_engine.py --ohlcv data/ohlcv.parquet
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import auto_detect_candidates as adc
+
+
+def synthetic_ohlcv(n_symbols: int, n_days: int, seed: int = 7) -> Any:
+    """Random-walk OHLCV panel (plus SPY) with a few missing bars."""
+    pd, np = adc._require_pandas()
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end="2026-03-13", periods=n_days, tz="UTC")
+    symbols = ["SPY"] + [f"S{i:05d}" for i in range(n_symbols - 1)]
+
+    n = len(symbols) * n_days
+    rets = rng.normal(0.0005, 0.02, size=(len(symbols), n_days))
+    rets[:, -1] += rng.choice([0.0, 0.06, -0.09], size=len(symbols), p=[0.9, 0.06, 0.04])
+    close = 50.0 * np.exp(np.cumsum(rets, axis=1))
+    spread = np.abs(rng.normal(0.0, 0.012, size=close.shape)) * close
+    open_ = close * (1.0 + rng.normal(0.0, 0.01, size=close.shape))
+    frame = pd.DataFrame(
+        {
+            "symbol": np.repeat(symbols, n_days),
+            "timestamp": np.tile(dates, len(symbols)),
+            "open": open_.ravel(),
+            "high": (np.maximum(open_, close) + spread).ravel(),
+            "low": (np.minimum(open_, close) - spread).ravel(),
+            "close": close.ravel(),
+            "volume": rng.lognormal(13.0, 0.6, size=n),
+        }
+    )
+    # Drop ~1% of bars so some symbols have gaps and short histories.
+    return frame[rng.random(n) > 0.01].sample(frac=1.0, random_state=seed)
+
+
+# -- Legacy reference ----------------------------------------------------------
+
+
+def legacy_feature_frame(df: Any, as_of_date: date | None) -> tuple[Any, Any, date]:
+    """Pre-vectorization compute_features body (one lambda per symbol per feature)."""
+    pd, np = adc._require_pandas()
+    frame = df.copy()
+    frame.columns = [str(col).lower() for col in frame.columns]
+    frame = frame[["symbol", "timestamp", "open", "high", "low", "close", "volume"]].copy()
+    frame["symbol"] = frame["symbol"].astype(str).str.upper()
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True, errors="coerce")
+    frame = frame.dropna(subset=["symbol", "timestamp", "open", "high", "low", "close", "volume"])
+    frame = frame.sort_values(["symbol", "timestamp"]).reset_index(drop=True)
+    frame["date"] = frame["timestamp"].dt.date
+
+    available_dates = sorted(frame["date"].dropna().unique())
+    target_date = as_of_date or available_dates[-1]
+    if target_date not in available_dates:
+        target_date = [d for d in available_dates if d <= target_date][-1]
+
+    frame = frame[frame["date"] <= target_date].copy()
+    group = frame.groupby("symbol", sort=False)
+
+    frame["prev_close"] = group["close"].shift(1)
+    frame["ret_1d"] = frame["close"] / frame["prev_close"] - 1.0
+    frame["ma20"] = group["close"].transform(lambda s: s.rolling(20, min_periods=20).mean())
+    frame["ma50"] = group["close"].transform(lambda s: s.rolling(50, min_periods=50).mean())
+    frame["ma200"] = group["close"].transform(lambda s: s.rolling(200, min_periods=200).mean())
+    frame["vol_avg20"] = group["volume"].transform(lambda s: s.rolling(20, min_periods=20).mean())
+    frame["rel_volume"] = frame["volume"] / frame["vol_avg20"]
+    frame["high20_prev"] = group["high"].transform(
+        lambda s: s.shift(1).rolling(20, min_periods=20).max()
+    )
+    frame["low20_prev"] = group["low"].transform(
+        lambda s: s.shift(1).rolling(20, min_periods=20).min()
+    )
+    frame["close_pos"] = (
+        (frame["close"] - frame["low"]) / (frame["high"] - frame["low"]).replace(0, np.nan)
+    ).clip(0, 1)
+    frame["gap"] = frame["open"] / frame["prev_close"] - 1.0
+    frame["rs_120"] = group["close"].transform(lambda s: s / s.shift(120) - 1.0)
+
+    tr1 = frame["high"] - frame["low"]
+    tr2 = (frame["high"] - frame["prev_close"]).abs()
+    tr3 = (frame["low"] - frame["prev_close"]).abs()
+    frame["tr"] = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    frame["atr14"] = group["tr"].transform(lambda s: s.rolling(14, min_periods=14).mean())
+    frame["atr_pct"] = frame["atr14"] / frame["close"]
+
+    for metric in ("ret_1d", "rel_volume", "gap", "atr_pct"):
+        rolling_mean = group[metric].transform(lambda s: s.rolling(60, min_periods=30).mean())
+        rolling_std = group[metric].transform(lambda s: s.rolling(60, min_periods=30).std(ddof=0))
+        frame[f"{metric}_z"] = (frame[metric] - rolling_mean) / rolling_std.replace(0, np.nan)
+
+    frame = frame.replace([np.inf, -np.inf], np.nan)
+    latest = frame[frame["date"] == target_date].copy()
+    return frame, latest, target_date
+
+
+def legacy_scan(
+    tradable: Any, regime_label: str, hints: list[dict[str, Any]], top_n: int
+) -> dict[str, Any]:
+    """Row-by-row scoring with the scalar score_* functions."""
+    anomalies = []
+    for _, row in tradable.iterrows():
+        for metric in ("ret_1d", "rel_volume", "gap", "atr_pct"):
+            z_val = row.get(f"{metric}_z")
+            if z_val is None or math.isnan(z_val) or abs(z_val) < 2.0:
+                continue
+            value = float(row.get(metric))
+            anomalies.append(
+                (
+                    round(abs(float(z_val)), 3),
+                    str(row["symbol"]),
+                    metric,
+                    None if math.isnan(value) else round(value, 5),
+                )
+            )
+    anomalies.sort(key=lambda item: item[0], reverse=True)
+
+    scored = []
+    families = (
+        ("pivot_breakout", adc.score_breakout_candidate, 1.0),
+        ("gap_up_continuation", adc.score_gap_candidate, 1.0),
+        ("panic_reversal", adc.score_reversal_candidate, 0.6),
+    )
+    masks = _legacy_masks(tradable)
+    for family, scorer, boost_scale in families:
+        for _, row in tradable[masks[family]].iterrows():
+            symbol = str(row["symbol"]).upper()
+            boost, _ = adc.hint_match_boost(symbol, family, hints)
+            scored.append(
+                (
+                    family,
+                    symbol,
+                    scorer(row.to_dict(), regime_label, hint_boost=boost * boost_scale),
+                )
+            )
+    return {"anomalies": anomalies, "scored": scored}
+
+
+def _legacy_masks(tradable: Any) -> dict[str, Any]:
+    return {
+        "pivot_breakout": (
+            (tradable["close"] > tradable["ma50"])
+            & (tradable["ma50"] > tradable["ma200"])
+            & (tradable["close"] > tradable["high20_prev"])
+            & (tradable["rel_volume"] >= 1.5)
+            & (tradable["close_pos"] >= 0.55)
+            & (tradable["rs_rank_pct"] >= 0.70)
+        ),
+        "gap_up_continuation": (
+            (tradable["gap"] >= 0.04)
+            & (tradable["rel_volume"] >= 2.0)
+            & (tradable["close_pos"] >= 0.50)
+            & (tradable["close"] > tradable["ma50"])
+        ),
+        "panic_reversal": (
+            (tradable["ret_1d"] <= -0.07)
+            & (tradable["rel_volume"] >= 1.8)
+            & (tradable["close"] > tradable["ma200"] * 0.85)
+        ),
+    }
+
+
+def vectorized_scan(
+    tradable: Any, regime_label: str, hints: list[dict[str, Any]], top_n: int
+) -> dict[str, Any]:
+    """Same summary as legacy_scan, produced by the module's scanners."""
+    anomalies = [
+        (item["abs_z"], item["symbol"], item["metric"], item["value"])
+        for item in adc.detect_anomalies(tradable, {}, top_k=len(tradable) * 4)
+    ]
+    watchlist, _ = adc.scan_candidates(tradable, regime_label, hints, top_n)
+    reversals = adc.scan_reversal_candidates(tradable, regime_label, hints, top_n=len(tradable))
+    scored = [(c["entry_family"], c["symbol"], c["priority_score"]) for c in watchlist + reversals]
+    return {"anomalies": anomalies, "scored": scored}
+
+
+# -- Comparison ----------------------------------------------------------------
+
+
+def _timed(fn, *args) -> tuple[Any, float]:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def run_benchmark(df: Any, as_of_date: date | None = None) -> dict[str, Any]:
+    """Run both engines on *df*; ``match`` is True when every output agrees."""
+    pd, _ = adc._require_pandas()
+    (old_frame, old_latest, old_date), old_features_s = _timed(legacy_feature_frame, df, as_of_date)
+    (new_frame, new_latest, new_date), new_features_s = _timed(
+        adc.build_feature_frame, df, as_of_date
+    )
+
+    mismatches = []
+    if old_date != new_date:
+        mismatches.append("target_date")
+    try:
+        pd.testing.assert_frame_equal(old_frame, new_frame, check_exact=True)
+    except AssertionError as exc:
+        mismatches.append(f"features: {str(exc).splitlines()[0]}")
+
+    regime_label, _, tradable = adc.compute_regime(
+        new_frame, new_latest, new_date, min_price=0.0, min_avg_volume=0.0
+    )
+    hints = adc.normalize_hints(
+        [{"title": "breakouts", "preferred_entry_family": "pivot_breakout"}]
+    )
+    old_scan, old_scan_s = _timed(legacy_scan, tradable, regime_label, hints, 10)
+    new_scan, new_scan_s = _timed(vectorized_scan, tradable, regime_label, hints, 10)
+    if old_scan["anomalies"] != new_scan["anomalies"]:
+        mismatches.append("anomalies")
+    # Watchlist order is score-sorted; compare as multisets of (family, symbol, score).
+    if sorted(old_scan["scored"]) != sorted(new_scan["scored"]):
+        mismatches.append("candidate scores")
+
+    return {
+        "rows": int(len(new_frame)),
+        "symbols": int(new_frame["symbol"].nunique()),
+        "legacy_features_s": round(old_features_s, 3),
+        "vectorized_features_s": round(new_features_s, 3),
+        "legacy_scan_s": round(old_scan_s, 3),
+        "vectorized_scan_s": round(new_scan_s, 3),
+        "speedup": round((old_features_s + old_scan_s) / max(new_features_s + new_scan_s, 1e-9), 1),
+        "match": not mismatches,
+        "mismatches": mismatches,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ohlcv", default=None, help="OHLCV parquet (default: synthetic panel)")
+    parser.add_argument("--symbols", type=int, default=6000, help="Synthetic universe size")
+    parser.add_argument("--days", type=int, default=300, help="Synthetic history length")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--as-of", default=None, help="Target date YYYY-MM-DD")
+    args = parser.parse_args()
+
+    pd, _ = adc._require_pandas()
+    if args.ohlcv:
+        df = pd.read_parquet(Path(args.ohlcv).resolve())
+    else:
+        df = synthetic_ohlcv(args.symbols, args.days, args.seed)
+    result = run_benchmark(df, adc.parse_as_of_date(args.as_of))
+    print(json.dumps(result, indent=2))
+    return 0 if result["match"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 """Unit tests for auto_detect_candidates.py (pandas-independent parts)."""
 
+import math
 from datetime import date
 from subprocess import CompletedProcess
 
@@ -186,6 +187,212 @@ def test_build_ticket_payload_panic_reversal_hypothesis() -> None:
     assert "rebound probability" in payload["hypothesis"]
 
 
+def test_vectorized_scores_match_scalar_scorers() -> None:
+    """score_*_frame must reproduce the per-record score_* functions exactly."""
+    pytest.importorskip("pandas")
+    import numpy as np
+    import pandas as pd
+
+    frame = pd.DataFrame(
+        {
+            "rs_rank_pct": [0.95, 1.5, 0.2, np.nan],
+            "rel_volume": [2.4, 8.0, 0.0, 3.1],
+            "close_pos": [0.7, 1.2, 0.1, 0.6],
+            "atr_pct": [0.03, 0.12, 0.30, 0.05],
+            "close": [105.0, 120.0, 40.0, 80.0],
+            "high20_prev": [100.0, 100.0, 0.0, 79.0],
+            "gap": [0.05, 0.2, -0.02, 0.06],
+            "ma50": [95.0, 90.0, 45.0, np.nan],
+            "ma200": [90.0, 80.0, 0.0, 70.0],
+            "ret_1d": [-0.09, 0.03, -0.25, -0.08],
+        }
+    )
+    boosts = np.array([0.0, 12.0, 6.0, 20.0])
+    records = frame.to_dict("records")
+    pairs = (
+        (adc.score_breakout_frame, adc.score_breakout_candidate),
+        (adc.score_gap_frame, adc.score_gap_candidate),
+        (adc.score_reversal_frame, adc.score_reversal_candidate),
+    )
+    for regime in ("RiskOn", "Neutral", "RiskOff"):
+        for vectorized, scalar in pairs:
+            scores = vectorized(frame, regime_label=regime, hint_boost=boosts).tolist()
+            expected = [
+                scalar(record, regime_label=regime, hint_boost=boost)
+                for record, boost in zip(records, boosts.tolist())
+            ]
+            assert [round(score, 2) for score in scores] == pytest.approx(expected, nan_ok=True)
+
+
+def test_feature_engine_matches_legacy_reference() -> None:
+    """Grouped feature engine and scanners agree with the lambda/iterrows reference."""
+    pytest.importorskip("pandas")
+    import benchmark_feature_engine
+
+    df = benchmark_feature_engine.synthetic_ohlcv(n_symbols=12, n_days=260, seed=3)
+    result = benchmark_feature_engine.run_benchmark(df)
+    assert result["mismatches"] == []
+    assert result["symbols"] == 12
+
+    # An as-of date in the past truncates history the same way.
+    result = benchmark_feature_engine.run_benchmark(df, date(2026, 2, 2))
+    assert result["match"] is True
+
+
+def test_average_pair_correlation_matches_pairwise_corr() -> None:
+    """Equals the off-diagonal nanmean of DataFrame.corr(min_periods=5) on ragged data."""
+    pytest.importorskip("pandas")
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(11)
+    returns = rng.normal(0.0, 0.02, size=(20, 40)) + rng.normal(0.0, 0.01, size=(20, 1))
+    returns[rng.random(returns.shape) < 0.15] = np.nan
+    returns[:, 0] = 0.01  # constant: excluded from every pair
+    returns[:17, 1] = np.nan  # too short to pair
+    returns[:10, 2] = np.nan  # pairs only on the last 10 dates
+
+    corr = pd.DataFrame(returns).corr(min_periods=5).to_numpy()
+    expected = float(np.nanmean(corr[~np.eye(corr.shape[0], dtype=bool)]))
+    assert adc.average_pair_correlation(returns) == pytest.approx(expected, abs=1e-12)
+    assert adc.average_pair_correlation(returns, sample_size=40) == pytest.approx(expected)
+
+    sampled = adc.average_pair_correlation(returns, sample_size=20, seed=3)
+    assert sampled == adc.average_pair_correlation(returns, sample_size=20, seed=3)
+    assert -1.0 <= sampled <= 1.0
+    assert math.isnan(adc.average_pair_correlation(returns[:, :2]))
+    assert math.isnan(adc.average_pair_correlation(np.empty((20, 0))))
+
+
+def test_average_pair_correlation_ragged_universe_paths_agree(monkeypatch) -> None:
+    """Grouped and blocked kernels both match DataFrame.corr on a ragged universe."""
+    pytest.importorskip("pandas")
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(5)
+    returns = rng.normal(0.0, 0.02, size=(20, 300)) + rng.normal(0.0, 0.01, size=(20, 1))
+    returns[rng.random(returns.shape) < 0.15] = np.nan  # ~hundreds of gap patterns
+    returns[:12, :30] = np.nan  # recent IPOs
+    returns[:, 40] = 0.01  # constant: excluded from every pair
+
+    corr = pd.DataFrame(returns).corr(min_periods=5).to_numpy()
+    expected = float(np.nanmean(corr[~np.eye(corr.shape[0], dtype=bool)]))
+    blocked = adc.average_pair_correlation(returns)
+    monkeypatch.setattr(adc, "CORR_MAX_GAP_PATTERNS", 10**6)
+    grouped = adc.average_pair_correlation(returns)
+    assert blocked == pytest.approx(expected, abs=1e-12)
+    assert grouped == pytest.approx(expected, abs=1e-12)
+
+    # A dense universe takes the grouped path by default; force the blocked one.
+    dense = returns[:, 50:].copy()
+    dense[np.isnan(dense)] = 0.0
+    monkeypatch.setattr(adc, "CORR_MAX_GAP_PATTERNS", 16)
+    grouped = adc.average_pair_correlation(dense)
+    monkeypatch.setattr(adc, "CORR_MAX_GAP_PATTERNS", 0)
+    assert adc.average_pair_correlation(dense) == pytest.approx(grouped, abs=1e-12)
+
+
+def _fake_parquet(monkeypatch, tables: dict) -> None:
+    """Serve ``tables[path]`` from pandas.read_parquet, honouring a timestamp >= filter."""
+    import pandas as pd
+
+    def read_parquet(path, filters=None, **kwargs):
+        frame = tables["ohlcv"].copy()
+        for column, op, value in filters or []:
+            assert (column, op) == ("timestamp", ">=")
+            frame = frame[pd.to_datetime(frame[column], utc=True) >= value]
+        return frame
+
+    monkeypatch.setattr(pd, "read_parquet", read_parquet)
+
+
+def _assert_matches_batch(frame, df) -> None:
+    import pandas as pd
+
+    full, _, _ = adc.build_feature_frame(df, None)
+    expected = full[full["date"] >= sorted(full["date"].unique())[-adc.STORE_FRAME_DAYS]]
+    expected = expected.sort_values(["symbol", "timestamp"]).reset_index(drop=True)
+    got = frame[expected.columns].reset_index(drop=True)
+    got["timestamp"] = got["timestamp"].astype(expected["timestamp"].dtype)
+    pd.testing.assert_frame_equal(got, expected, check_exact=False, rtol=1e-9, atol=1e-12)
+
+
+def test_feature_store_advances_to_batch_result(tmp_path, monkeypatch) -> None:
+    """Advancing the stored state day by day reproduces build_feature_frame()."""
+    pytest.importorskip("pandas")
+    import benchmark_feature_engine
+    import pandas as pd
+
+    df = benchmark_feature_engine.synthetic_ohlcv(n_symbols=30, n_days=260, seed=5)
+    tables = {"ohlcv": df}
+    _fake_parquet(monkeypatch, tables)
+    ohlcv, store_dir = tmp_path / "ohlcv.parquet", tmp_path / "store"
+    dates = sorted(pd.to_datetime(df["timestamp"]).dt.date.unique())
+
+    *_, status = adc.compute_features_incremental(ohlcv, dates[-4], store_dir)
+    assert status == "rebuilt"
+    frame, latest, target, month_end, status = adc.compute_features_incremental(
+        ohlcv, None, store_dir
+    )
+    assert (status, target) == ("advanced", dates[-1])
+    assert set(latest["date"]) == {dates[-1]}
+    _assert_matches_batch(frame, df)
+    pd.testing.assert_frame_equal(
+        month_end, adc.monthly_closes(adc.build_feature_frame(df, None)[0])
+    )
+
+    *_, status = adc.compute_features_incremental(ohlcv, None, store_dir)
+    assert status == "reused"
+
+
+def test_feature_store_rebuilds_adjusted_and_new_symbols(tmp_path, monkeypatch) -> None:
+    """A split re-adjustment or a new listing recomputes that symbol from full history."""
+    pytest.importorskip("pandas")
+    import benchmark_feature_engine
+    import pandas as pd
+
+    df = benchmark_feature_engine.synthetic_ohlcv(n_symbols=30, n_days=260, seed=6)
+    tables = {"ohlcv": df}
+    _fake_parquet(monkeypatch, tables)
+    ohlcv, store_dir = tmp_path / "ohlcv.parquet", tmp_path / "store"
+    dates = sorted(pd.to_datetime(df["timestamp"]).dt.date.unique())
+    adc.compute_features_incremental(ohlcv, dates[-3], store_dir)
+
+    adjusted = df.copy()
+    split = adjusted["symbol"] == "S00003"
+    adjusted.loc[split, ["open", "high", "low", "close"]] /= 2.0
+    adjusted.loc[split, "volume"] *= 2.0
+    listing = df[df["symbol"] == "S00004"].copy()
+    listing["symbol"] = "NEWCO"
+    adjusted = pd.concat([adjusted, listing], ignore_index=True)
+    tables["ohlcv"] = adjusted
+
+    frame, latest, _, _, status = adc.compute_features_incremental(ohlcv, None, store_dir)
+    assert status == "advanced"
+    assert "NEWCO" in set(latest["symbol"])
+    _assert_matches_batch(frame, adjusted)
+
+
+def test_feature_store_bypassed_for_earlier_as_of(tmp_path, monkeypatch) -> None:
+    """An as-of date before the stored one is computed from scratch; the store is kept."""
+    pytest.importorskip("pandas")
+    import benchmark_feature_engine
+
+    df = benchmark_feature_engine.synthetic_ohlcv(n_symbols=10, n_days=140, seed=8)
+    _fake_parquet(monkeypatch, {"ohlcv": df})
+    ohlcv, store_dir = tmp_path / "ohlcv.parquet", tmp_path / "store"
+    adc.compute_features_incremental(ohlcv, None, store_dir)
+    state = (store_dir / adc.FeatureStore.STATE_FILE).read_bytes()
+
+    _, _, target, _, status = adc.compute_features_incremental(ohlcv, date(2026, 1, 15), store_dir)
+    assert (status, target) == ("bypassed", date(2026, 1, 15))
+    assert (store_dir / adc.FeatureStore.STATE_FILE).read_bytes() == state
+    store = adc.FeatureStore.load(store_dir, str(ohlcv.resolve()))
+    assert store is not None and store.target_date == date(2026, 3, 13)
+    assert adc.FeatureStore.load(store_dir, str(tmp_path / "other.parquet")) is None
+
+
 def test_scan_news_reaction_candidates_canonical_conditions() -> None:
     """Verify scanner emits canonical threshold conditions, not raw values."""
     pytest.importorskip("pandas")
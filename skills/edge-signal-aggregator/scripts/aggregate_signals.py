@@ -11,8 +11,13 @@ from __future__ import annotations
 import argparse
 import glob
 import json
+import math
+import os
 import sys
+import tempfile
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -96,52 +101,69 @@ def load_config(config_path: str | None) -> dict[str, Any]:
     return merged
 
 
-def load_json_files(pattern: str | None) -> list[dict[str, Any]]:
+_PARSE_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, OSError)
+if YAML_AVAILABLE:
+    _PARSE_ERRORS += (yaml.YAMLError,)
+
+DEFAULT_PARSE_WORKERS = 4
+
+
+def _read_document(path: str, fmt: str) -> dict[str, Any] | None:
+    """Parse one JSON/YAML report; list roots are wrapped as ``{"items": [...]}``."""
+    try:
+        with open(path) as fp:
+            data = json.load(fp) if fmt == "json" else yaml.safe_load(fp)
+    except _PARSE_ERRORS as e:
+        print(f"Warning: Failed to load {path}: {e}", file=sys.stderr)
+        return None
+    if isinstance(data, dict):
+        data["_source_file"] = path
+        return data
+    if isinstance(data, list):
+        return {"_source_file": path, "items": data}
+    if fmt == "json":
+        print(
+            f"Warning: Unsupported JSON root in {path}: {type(data).__name__}",
+            file=sys.stderr,
+        )
+    return None
+
+
+def _parse_files(
+    files: list[str], fmt: str, workers: int = DEFAULT_PARSE_WORKERS
+) -> Iterator[dict[str, Any]]:
+    """Yield the parsed documents of ``files`` in order, reading them in a thread pool."""
+    if workers <= 1 or len(files) <= 1:
+        for path in files:
+            document = _read_document(path, fmt)
+            if document is not None:
+                yield document
+        return
+    with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+        for document in pool.map(_read_document, files, [fmt] * len(files)):
+            if document is not None:
+                yield document
+
+
+def load_json_files(
+    pattern: str | None, workers: int = DEFAULT_PARSE_WORKERS
+) -> list[dict[str, Any]]:
     """Load all JSON files matching the glob pattern."""
     if not pattern:
         return []
-    files = glob.glob(pattern)
-    results = []
-    for f in files:
-        try:
-            with open(f) as fp:
-                data = json.load(fp)
-                if isinstance(data, dict):
-                    data["_source_file"] = f
-                    results.append(data)
-                elif isinstance(data, list):
-                    results.append({"_source_file": f, "items": data})
-                else:
-                    print(
-                        f"Warning: Unsupported JSON root in {f}: {type(data).__name__}",
-                        file=sys.stderr,
-                    )
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Warning: Failed to load {f}: {e}", file=sys.stderr)
-    return results
+    return list(_parse_files(glob.glob(pattern), "json", workers))
 
 
-def load_yaml_files(pattern: str | None) -> list[dict[str, Any]]:
+def load_yaml_files(
+    pattern: str | None, workers: int = DEFAULT_PARSE_WORKERS
+) -> list[dict[str, Any]]:
     """Load all YAML files matching the glob pattern."""
     if not pattern:
         return []
     if not YAML_AVAILABLE:
         print("Warning: PyYAML not installed, cannot load YAML files", file=sys.stderr)
         return []
-    files = glob.glob(pattern)
-    results = []
-    for f in files:
-        try:
-            with open(f) as fp:
-                data = yaml.safe_load(fp)
-                if isinstance(data, dict):
-                    data["_source_file"] = f
-                    results.append(data)
-                elif isinstance(data, list):
-                    results.append({"_source_file": f, "items": data})
-        except (OSError, yaml.YAMLError) as e:
-            print(f"Warning: Failed to load {f}: {e}", file=sys.stderr)
-    return results
+    return list(_parse_files(glob.glob(pattern), "yaml", workers))
 
 
 def normalize_direction(value: str | None, default: str = "NEUTRAL") -> str:
@@ -534,6 +556,157 @@ def extract_signals_from_hints(data: list[dict]) -> list[dict]:
     return signals
 
 
+# Upstream sources in aggregation order: (CLI destination, file format, extractor).
+SIGNAL_SOURCES = (
+    ("edge_candidates", "json", extract_signals_from_edge_candidates),
+    ("edge_concepts", "yaml", extract_signals_from_concepts),
+    ("themes", "json", extract_signals_from_themes),
+    ("sectors", "json", extract_signals_from_sectors),
+    ("institutional", "json", extract_signals_from_institutional),
+    ("hints", "yaml", extract_signals_from_hints),
+)
+
+
+class SignalCache:
+    """Extracted signals per input file, persisted as JSON.
+
+    Entries are keyed by source and absolute path and are valid while the
+    file's mtime and size are unchanged, so a re-run after one new report only
+    parses that report. Signals that would not survive a JSON round trip
+    unchanged (e.g. YAML dates, NaN scores) are not cached, which keeps a cached
+    run identical to a fresh one.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == self.VERSION:
+            self.entries = payload.get("files", {})
+
+    @staticmethod
+    def _key(source: str, path: str) -> str:
+        return f"{source}:{os.path.abspath(path)}"
+
+    def get(self, source: str, path: str, stat: os.stat_result) -> list[dict] | None:
+        entry = self.entries.get(self._key(source, path))
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.hits += 1
+            # The stored source_file is whatever path spelling the first run used.
+            return [{**signal, "source_file": path} for signal in entry["signals"]]
+        self.misses += 1
+        return None
+
+    def put(self, source: str, path: str, stat: os.stat_result, signals: list[dict]) -> None:
+        try:
+            stored = json.loads(json.dumps(signals))
+        except (TypeError, ValueError):
+            return
+        if stored != signals:
+            return
+        self.entries[self._key(source, path)] = {
+            "path": os.path.abspath(path),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "signals": stored,
+        }
+
+    def save(self) -> None:
+        """Atomically write the cache, dropping entries whose files are gone."""
+        files = {key: entry for key, entry in self.entries.items() if os.path.exists(entry["path"])}
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "files": files}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: Failed to write signal cache {self.path}: {e}", file=sys.stderr)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def iter_source_signals(
+    source: str,
+    pattern: str | None,
+    cache: SignalCache | None = None,
+    workers: int = DEFAULT_PARSE_WORKERS,
+) -> Iterator[dict]:
+    """Yield the signals of every file matching ``pattern`` for one upstream source.
+
+    Files are extracted one at a time (every extractor handles each document
+    independently, so the result equals extracting the whole glob at once).
+    Cache misses are parsed ahead in a thread pool (at most ``2 * workers``
+    documents in flight) while earlier files are being yielded; output keeps
+    glob order.
+    """
+    if not pattern:
+        return
+    fmt, extractor = next((fmt, fn) for name, fmt, fn in SIGNAL_SOURCES if name == source)
+    if fmt == "yaml" and not YAML_AVAILABLE:
+        print("Warning: PyYAML not installed, cannot load YAML files", file=sys.stderr)
+        return
+
+    plan = []
+    for path in glob.glob(pattern):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stat = None
+        cached = cache.get(source, path, stat) if cache is not None and stat else None
+        plan.append((path, stat, cached))
+
+    misses = [path for path, _stat, cached in plan if cached is None]
+    pool = None
+    parsed = {}
+    pending = iter(misses)
+    # At most ``window`` parsed documents are held ahead of the consumer.
+    window = 2 * workers
+    if workers > 1 and len(misses) > 1:
+        pool = ThreadPoolExecutor(max_workers=min(workers, len(misses)))
+    try:
+        for path, stat, cached in plan:
+            if cached is not None:
+                yield from cached
+                continue
+            if pool is not None:
+                while len(parsed) < window:
+                    ahead = next(pending, None)
+                    if ahead is None:
+                        break
+                    parsed[ahead] = pool.submit(_read_document, ahead, fmt)
+            future = parsed.pop(path, None)
+            document = future.result() if future else _read_document(path, fmt)
+            if document is None:
+                continue
+            signals = extractor([document])
+            if cache is not None and stat is not None:
+                cache.put(source, path, stat, signals)
+            yield from signals
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def stream_signals(
+    patterns: dict[str, str | None],
+    cache: SignalCache | None = None,
+    workers: int = DEFAULT_PARSE_WORKERS,
+) -> Iterator[dict]:
+    """Yield normalized signals from every upstream source in ``SIGNAL_SOURCES`` order."""
+    for source, _fmt, _extractor in SIGNAL_SOURCES:
+        yield from iter_source_signals(source, patterns.get(source), cache, workers)
+
+
 def calculate_ticker_overlap(tickers_a: list[str], tickers_b: list[str]) -> float:
     """Calculate Jaccard similarity between two ticker lists."""
     if not tickers_a or not tickers_b:
@@ -573,16 +746,100 @@ def are_signals_similar(sig_a: dict, sig_b: dict, config: dict) -> bool:
     return ticker_sim >= ticker_threshold or text_sim >= similarity_threshold
 
 
+def _ticker_tokens(tickers: Any) -> set[str]:
+    """Normalized ticker set, as compared by calculate_ticker_overlap."""
+    return set(t.upper() for t in tickers) if tickers else set()
+
+
+def _title_tokens(title: Any) -> set[str]:
+    """Normalized word set, as compared by calculate_text_similarity."""
+    return set(title.lower().split()) if title else set()
+
+
+def _jaccard(set_a: set[str], set_b: set[str]) -> float:
+    if not set_a or not set_b:
+        return 0.0
+    return len(set_a & set_b) / len(set_a | set_b)
+
+
+def _prefix_length(size: int, threshold: float) -> int:
+    """Tokens of a set that must be indexed so no pair with Jaccard >= threshold is missed.
+
+    Jaccard(A, B) >= t implies |A & B| >= ceil(t * |A|), and two sets sharing
+    that many tokens share one among the first ``|A| - ceil(t * |A|) + 1`` of
+    each set under any common token order (prefix filtering). The epsilon
+    rounds the bound down, which only lengthens the prefix.
+    """
+    if not threshold <= 1.0:  # above 1 (or NaN) no pair can qualify
+        return 0
+    return size - max(1, math.ceil(threshold * size - 1e-9)) + 1
+
+
+class _PrefixIndex:
+    """Inverted index from (direction, token) to signals, over each set's rarest tokens.
+
+    Tokens are ordered by ascending document frequency, so the indexed prefix
+    holds the rarest tokens of each set and common words such as "the" are
+    rarely indexed at all.
+    """
+
+    def __init__(self, token_sets: list[set[str]], directions: list[Any], threshold: float):
+        frequency: dict[str, int] = defaultdict(int)
+        for tokens in token_sets:
+            for token in tokens:
+                frequency[token] += 1
+        rank = {
+            token: position
+            for position, token in enumerate(sorted(frequency, key=lambda t: (frequency[t], t)))
+        }
+
+        self.prefixes = []
+        self.postings: dict[tuple[Any, str], list[int]] = defaultdict(list)
+        for index, (tokens, direction) in enumerate(zip(token_sets, directions)):
+            prefix = sorted(tokens, key=rank.__getitem__)[: _prefix_length(len(tokens), threshold)]
+            self.prefixes.append(prefix)
+            for token in prefix:
+                self.postings[(direction, token)].append(index)
+
+    def candidates(self, index: int, direction: Any) -> set[int]:
+        found: set[int] = set()
+        for token in self.prefixes[index]:
+            found.update(self.postings.get((direction, token), ()))
+        return found
+
+
 def deduplicate_signals(signals: list[dict], config: dict) -> tuple[list[dict], list[dict]]:
     """
     Deduplicate signals, merging similar ones.
     Returns (deduplicated_signals, dedup_log).
+
+    Equivalent to comparing every pair with ``are_signals_similar``, but
+    ticker and word sets are normalized once per signal and only pairs that
+    share a direction and an indexed ticker or title token are compared.
     """
     if not signals:
         return [], []
 
+    dedup_config = config.get("deduplication", {})
+    similarity_threshold = dedup_config.get("similarity_threshold", 0.80)
+    ticker_threshold = dedup_config.get("ticker_overlap_threshold", 0.50)
+
     # Sort by raw score descending so we keep highest-scoring as primary
     sorted_signals = sorted(signals, key=lambda s: s.get("raw_score", 0), reverse=True)
+    directions = [sig.get("direction") for sig in sorted_signals]
+    ticker_sets = [_ticker_tokens(sig.get("tickers", [])) for sig in sorted_signals]
+    word_sets = [_title_tokens(sig.get("title", "")) for sig in sorted_signals]
+
+    # A non-positive threshold makes every same-direction pair similar,
+    # so blocking cannot prune anything.
+    compare_all = not (ticker_threshold > 0 and similarity_threshold > 0)
+    if compare_all:
+        by_direction: dict[Any, list[int]] = defaultdict(list)
+        for index, direction in enumerate(directions):
+            by_direction[direction].append(index)
+    else:
+        ticker_index = _PrefixIndex(ticker_sets, directions, ticker_threshold)
+        word_index = _PrefixIndex(word_sets, directions, similarity_threshold)
 
     merged = []
     dedup_log = []
@@ -591,14 +848,28 @@ def deduplicate_signals(signals: list[dict], config: dict) -> tuple[list[dict],
     for i, sig in enumerate(sorted_signals):
         if i in used_indices:
             continue
+        used_indices.add(i)
+
+        # Every earlier signal is already used, so only later ones can merge.
+        direction = directions[i]
+        if compare_all:
+            candidates = by_direction[direction]
+        else:
+            candidates = sorted(
+                ticker_index.candidates(i, direction) | word_index.candidates(i, direction)
+            )
 
         # Find all signals similar to this one
         duplicates = []
-        for j, other in enumerate(sorted_signals):
-            if j != i and j not in used_indices:
-                if are_signals_similar(sig, other, config):
-                    duplicates.append((j, other))
-                    used_indices.add(j)
+        for j in candidates:
+            if j <= i or j in used_indices:
+                continue
+            if (
+                _jaccard(ticker_sets[i], ticker_sets[j]) >= ticker_threshold
+                or _jaccard(word_sets[i], word_sets[j]) >= similarity_threshold
+            ):
+                duplicates.append(sorted_signals[j])
+                used_indices.add(j)
 
         # Create merged signal
         merged_signal = sig.copy()
@@ -612,7 +883,8 @@ def deduplicate_signals(signals: list[dict], config: dict) -> tuple[list[dict],
         merged_signal["merged_from"] = []
 
         # Merge duplicates
-        for dup_idx, dup in duplicates:
+        merged_tickers = set(ticker_sets[i])
+        for dup in duplicates:
             merged_signal["contributing_skills"].append(
                 {
                     "skill": dup["skill"],
@@ -621,13 +893,10 @@ def deduplicate_signals(signals: list[dict], config: dict) -> tuple[list[dict],
                 }
             )
             merged_signal["merged_from"].append(f"{dup['skill']}:{dup['signal_ref']}")
-
-            # Merge tickers
-            existing_tickers = set(t.upper() for t in merged_signal.get("tickers", []))
-            new_tickers = set(t.upper() for t in dup.get("tickers", []))
-            merged_signal["tickers"] = sorted(existing_tickers | new_tickers)
+            merged_tickers.update(t.upper() for t in dup.get("tickers", []))
 
         if duplicates:
+            merged_signal["tickers"] = sorted(merged_tickers)
             dedup_log.append(
                 {
                     "merged_into": f"{sig['skill']}:{sig['signal_ref']}",
@@ -637,7 +906,6 @@ def deduplicate_signals(signals: list[dict], config: dict) -> tuple[list[dict],
             )
 
         merged.append(merged_signal)
-        used_indices.add(i)
 
     return merged, dedup_log
 
@@ -887,7 +1155,16 @@ def aggregate_signals(
     all_signals.extend(extract_signals_from_sectors(sectors))
     all_signals.extend(extract_signals_from_institutional(institutional))
     all_signals.extend(extract_signals_from_hints(hints))
+    return aggregate_signal_stream(all_signals, config)
+
+
+def aggregate_signal_stream(signals: Iterable[dict], config: dict) -> dict:
+    """Deduplicate, score and rank normalized signals from any iterable.
 
+    Deduplication ranks every signal by score, so the stream is collected
+    once here; upstream parsing and extraction stay lazy.
+    """
+    all_signals = list(signals)
     total_input = len(all_signals)
 
     # Deduplicate
@@ -1065,6 +1342,16 @@ def main() -> int:
         type=float,
         help="Minimum conviction score for output filtering (overrides config)",
     )
+    parser.add_argument(
+        "--cache-file",
+        help="JSON file caching extracted signals per input file (keyed by path, mtime, size)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_PARSE_WORKERS,
+        help=f"Threads used to parse input files (default: {DEFAULT_PARSE_WORKERS})",
+    )
     parser.add_argument(
         "--output-dir",
         default="reports/",
@@ -1077,6 +1364,8 @@ def main() -> int:
     )
 
     args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
 
     # Check if at least one input is provided
     if not any(
@@ -1098,24 +1387,13 @@ def main() -> int:
     if args.min_conviction is not None:
         config["min_conviction"] = args.min_conviction
 
-    # Load input files
-    edge_candidates = load_json_files(args.edge_candidates)
-    edge_concepts = load_yaml_files(args.edge_concepts)
-    themes = load_json_files(args.themes)
-    sectors = load_json_files(args.sectors)
-    institutional = load_json_files(args.institutional)
-    hints = load_yaml_files(args.hints)
-
-    # Run aggregation
-    result = aggregate_signals(
-        edge_candidates=edge_candidates,
-        edge_concepts=edge_concepts,
-        themes=themes,
-        sectors=sectors,
-        institutional=institutional,
-        hints=hints,
-        config=config,
-    )
+    # Stream signals from the input files and run aggregation
+    cache = SignalCache(args.cache_file) if args.cache_file else None
+    patterns = {source: getattr(args, source) for source, _fmt, _extractor in SIGNAL_SOURCES}
+    result = aggregate_signal_stream(stream_signals(patterns, cache, args.workers), config)
+    if cache is not None:
+        cache.save()
+        print(f"Signal cache: {cache.hits} file(s) reused, {cache.misses} parsed")
 
     # Create output directory
     output_dir = Path(args.output_dir)
@@ -9,6 +9,8 @@ from pathlib import Path
 import pytest
 from aggregate_signals import (
     DEFAULT_CONFIG,
+    SignalCache,
+    aggregate_signal_stream,
     aggregate_signals,
     apply_contradiction_adjustments,
     are_signals_similar,
@@ -25,9 +27,12 @@ from aggregate_signals import (
     generate_markdown_report,
     horizon_bucket,
     load_config,
+    load_json_files,
+    load_yaml_files,
     normalize_direction,
     normalize_score,
     normalize_score_auto,
+    stream_signals,
 )
 
 
@@ -199,6 +204,84 @@ class TestDeduplication:
         assert len(log) == 1
         assert len(deduped[0]["contributing_skills"]) == 2
 
+    @staticmethod
+    def _pairwise_dedup(signals, config):
+        """Reference: compare every remaining pair with are_signals_similar."""
+        ordered = sorted(signals, key=lambda s: s.get("raw_score", 0), reverse=True)
+        used, groups = set(), []
+        for i, sig in enumerate(ordered):
+            if i in used:
+                continue
+            used.add(i)
+            group = [sig["signal_ref"]]
+            tickers = {t.upper() for t in sig.get("tickers", [])}
+            for j, other in enumerate(ordered):
+                if j not in used and are_signals_similar(sig, other, config):
+                    used.add(j)
+                    group.append(other["signal_ref"])
+                    tickers |= {t.upper() for t in other.get("tickers", [])}
+            groups.append((group, sorted(tickers) if len(group) > 1 else sig.get("tickers", [])))
+        return groups
+
+    @pytest.mark.parametrize(
+        "thresholds", [(0.8, 0.5), (0.3, 0.2), (1.0, 1.0), (0.0, 0.5), (0.8, 1.5)]
+    )
+    def test_indexed_matches_pairwise_comparison(self, thresholds):
+        """Blocking never changes which signals merge or the merged tickers."""
+        import random
+
+        rng = random.Random(sum(thresholds))
+        words = ["ai", "infrastructure", "growth", "energy", "the", "of", "rally", "chips"]
+        pool = ["NVDA", "amd", "AVGO", "XOM", "CVX", "MSFT", "TSM"]
+        signals = [
+            {
+                "skill": "theme_detector",
+                "signal_ref": f"s{n}",
+                "title": " ".join(rng.sample(words, rng.randint(0, 4))) or None,
+                "tickers": rng.sample(pool, rng.randint(0, 3)),
+                "direction": rng.choice(["LONG", "SHORT"]),
+                "raw_score": rng.random(),
+            }
+            for n in range(150)
+        ]
+        config = {
+            "deduplication": {
+                "similarity_threshold": thresholds[0],
+                "ticker_overlap_threshold": thresholds[1],
+            }
+        }
+
+        deduped, _log = deduplicate_signals(signals, config)
+
+        assert [
+            (
+                [sig["signal_ref"]] + [ref.split(":")[1] for ref in sig["merged_from"]],
+                sig["tickers"],
+            )
+            for sig in deduped
+        ] == self._pairwise_dedup(signals, config)
+
+    def test_common_words_do_not_hide_matches(self):
+        """Signals sharing only frequent words still merge on a rare ticker."""
+        signals = [
+            {
+                "skill": "theme_detector",
+                "signal_ref": f"t{n}",
+                "title": f"the {n} sector {n * 7} rotation {n * 11}",
+                "tickers": [f"T{n}"],
+                "direction": "LONG",
+                "raw_score": 1.0 - n / 100,
+            }
+            for n in range(20)
+        ]
+        signals.append({**signals[7], "signal_ref": "dup", "title": "Other", "raw_score": 0.01})
+
+        deduped, log = deduplicate_signals(signals, DEFAULT_CONFIG)
+
+        assert len(deduped) == 20
+        assert log[0]["merged_into"] == "theme_detector:t7"
+        assert log[0]["duplicates_removed"] == ["theme_detector:dup"]
+
 
 class TestContradictionDetection:
     """Tests for detect_contradictions function."""
@@ -801,3 +884,149 @@ class TestIndividualTicketYAML:
         assert signals[0]["tickers"] == ["NVDA"]
         assert signals[0]["raw_score"] == pytest.approx(0.885, rel=1e-2)
         assert signals[0]["direction"] == "LONG"
+
+
+def _write_reports(directory: Path) -> dict:
+    """Two edge-candidate JSON files, a theme JSON file and a hints YAML file."""
+    for n in range(2):
+        (directory / f"edge_{n}.json").write_text(
+            json.dumps(
+                {
+                    "tickets": [
+                        {
+                            "ticket_id": f"T{n}",
+                            "title": "AI Infrastructure Growth",
+                            "score": 0.8 - n / 10,
+                            "tickers": ["NVDA", "AMD"],
+                            "direction": "LONG",
+                        }
+                    ]
+                }
+            ),
+            encoding="utf-8",
+        )
+    (directory / "themes.json").write_text(
+        json.dumps(
+            {
+                "themes": [
+                    {"theme_id": "th1", "theme_name": "Energy", "score": 70, "tickers": ["XOM"]}
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    (directory / "hints.yaml").write_text(
+        "hints:\n  - hint_id: h1\n    title: Banks\n    tickers: [JPM]\n    direction: SHORT\n",
+        encoding="utf-8",
+    )
+    return {
+        "edge_candidates": str(directory / "edge_*.json"),
+        "themes": str(directory / "themes.json"),
+        "hints": str(directory / "hints.yaml"),
+    }
+
+
+class TestStreamingIngestion:
+    """Tests for thread-pooled, cached signal ingestion."""
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_stream_matches_loaded_aggregation(self, tmp_path: Path, workers: int):
+        patterns = _write_reports(tmp_path)
+        expected = aggregate_signals(
+            edge_candidates=load_json_files(patterns["edge_candidates"], workers),
+            edge_concepts=[],
+            themes=load_json_files(patterns["themes"]),
+            sectors=[],
+            institutional=[],
+            hints=load_yaml_files(patterns["hints"]),
+            config=DEFAULT_CONFIG,
+        )
+        result = aggregate_signal_stream(stream_signals(patterns, workers=workers), DEFAULT_CONFIG)
+
+        expected.pop("generated_at")
+        result.pop("generated_at")
+        assert result == expected
+        assert result["summary"]["total_input_signals"] == 4
+
+    def test_cache_reextracts_only_changed_files(self, tmp_path: Path, monkeypatch):
+        import aggregate_signals as module
+
+        patterns = _write_reports(tmp_path)
+        cache_path = tmp_path / "cache" / "signals.json"
+        cache = SignalCache(cache_path)
+        first = list(stream_signals(patterns, cache))
+        cache.save()
+
+        parsed = []
+        read_document = module._read_document
+        monkeypatch.setattr(
+            module,
+            "_read_document",
+            lambda path, fmt: parsed.append(path) or read_document(path, fmt),
+        )
+        assert list(stream_signals(patterns, SignalCache(cache_path))) == first
+        assert parsed == []
+
+        (tmp_path / "edge_2.json").write_text(json.dumps({"tickets": []}), encoding="utf-8")
+        cache = SignalCache(cache_path)
+        assert list(stream_signals(patterns, cache)) == first
+        assert parsed == [str(tmp_path / "edge_2.json")]
+        assert (cache.hits, cache.misses) == (4, 1)
+
+    def test_parse_ahead_window_is_bounded(self, tmp_path: Path, monkeypatch):
+        import time
+
+        import aggregate_signals as module
+
+        for n in range(20):
+            (tmp_path / f"edge_{n:02d}.json").write_text(
+                json.dumps({"tickets": [{"ticket_id": f"T{n}", "title": "t", "tickers": ["X"]}]}),
+                encoding="utf-8",
+            )
+        parsed = []
+        read_document = module._read_document
+        monkeypatch.setattr(
+            module,
+            "_read_document",
+            lambda path, fmt: parsed.append(path) or read_document(path, fmt),
+        )
+        stream = module.iter_source_signals(
+            "edge_candidates", str(tmp_path / "edge_*.json"), workers=2
+        )
+        next(stream)
+        time.sleep(0.2)  # give the pool time to run anything already submitted
+        assert len(parsed) <= 4
+        assert len(list(stream)) == 19
+        assert len(parsed) == 20
+
+    def test_cache_skips_signals_that_do_not_round_trip(self, tmp_path: Path):
+        (tmp_path / "hints.yaml").write_text(
+            "generated_at: 2026-01-05\nhints:\n  - hint_id: h1\n    title: Dated\n",
+            encoding="utf-8",
+        )
+        cache = SignalCache(tmp_path / "signals.json")
+        signals = list(stream_signals({"hints": str(tmp_path / "hints.yaml")}, cache))
+
+        assert signals[0]["timestamp"].isoformat() == "2026-01-05"
+        assert cache.entries == {}
+
+    def test_main_writes_signal_cache(self, tmp_path: Path, monkeypatch, capsys):
+        import sys
+
+        from aggregate_signals import main
+
+        patterns = _write_reports(tmp_path)
+        argv = [
+            "aggregate_signals.py",
+            "--edge-candidates",
+            patterns["edge_candidates"],
+            "--cache-file",
+            str(tmp_path / "signals.json"),
+            "--output-dir",
+            str(tmp_path / "out"),
+        ]
+        monkeypatch.setattr(sys, "argv", argv)
+        assert main() == 0
+        assert main() == 0
+
+        assert "Signal cache: 2 file(s) reused, 0 parsed" in capsys.readouterr().out
@@ -11,13 +11,20 @@ Features:
 - Rate limiting (0.3s between requests)
 - Automatic retry on 429 errors
 - Session caching for duplicate requests
+- Optional shared on-disk response cache (FMP_CACHE_DIR or cache_dir=)
+- Optional concurrent batch fetching sized from the FMP plan tier (FMP_PLAN or plan=)
 - Batch quote support
 """
 
+import hashlib
+import json
 import os
 import sys
+import tempfile
+import threading
 import time
-from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
 try:
@@ -118,6 +125,107 @@ def _normalize_eod_flat_list(data, symbols_str: str, limit: Optional[int] = None
     return {"symbol": matched_symbol or symbols_str, "historical": historical}
 
 
+# --- Shared on-disk response cache (opt-in via FMP_CACHE_DIR / cache_dir=) ---
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _NY_TZ = ZoneInfo("America/New_York")
+except (ImportError, KeyError):  # no tzdata (e.g. bare Windows): EST approximation
+    _NY_TZ = timezone(timedelta(hours=-5))
+
+# Disk TTL in seconds, matched by substring against the request URL. ``None``
+# marks EOD price history, which expires at the next EOD refresh point instead
+# of after a fixed TTL. URLs matching no row (quotes, aftermarket) never hit disk.
+_DISK_CACHE_TTL = (
+    ("historical-price", None),
+    ("profile", 24 * 3600),
+    ("earning", 6 * 3600),
+    ("sp500", 24 * 3600),
+)
+_DISK_CACHE_VERSION = 1
+
+# New York hours at which cached EOD history goes stale on a weekday: the
+# 16:00 session close (drops the partial intraday bar) and 18:00, by which
+# FMP has published the closing bar (drops a fetch that raced the publish).
+_EOD_REFRESH_HOURS = (16, 18)
+
+
+def _next_eod_refresh(now: float) -> float:
+    """Epoch seconds of the first EOD refresh point (see _EOD_REFRESH_HOURS) after ``now``.
+
+    Weekends are skipped; exchange holidays are not modelled, so on a holiday
+    an EOD entry merely expires early and is refetched.
+    """
+    current = datetime.fromtimestamp(now, _NY_TZ)
+    day = current.replace(hour=0, minute=0, second=0, microsecond=0)
+    while True:
+        if day.weekday() < 5:
+            for hour in _EOD_REFRESH_HOURS:
+                boundary = day.replace(hour=hour)
+                if boundary > current:
+                    return boundary.timestamp()
+        day += timedelta(days=1)
+
+
+def _is_disk_cacheable(url: str) -> bool:
+    return any(fragment in url for fragment, _ in _DISK_CACHE_TTL)
+
+
+def _disk_cache_expiry(url: str, now: float) -> Optional[float]:
+    """Return when a response for ``url`` fetched at ``now`` goes stale.
+
+    EOD history is immutable once its closing bar is published, so it stays
+    valid until the next session close. An intraday fetch expires at today's
+    close (refreshes the partial bar) and one made between the close and the
+    publish time expires at the publish time (picks up the missing bar).
+    Returns None when ``url`` is not disk-cacheable.
+    """
+    for fragment, ttl in _DISK_CACHE_TTL:
+        if fragment in url:
+            return _next_eod_refresh(now) if ttl is None else now + ttl
+    return None
+
+
+def _disk_cache_key(url: str, params: Optional[dict]) -> str:
+    """Content address for a request: SHA-256 of the URL plus normalized params.
+
+    The API key is excluded so every key (and every skill) shares one entry.
+    """
+    norm = {str(k): str(v) for k, v in (params or {}).items() if k != "apikey"}
+    payload = json.dumps([_DISK_CACHE_VERSION, url, norm], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket shared by all worker threads of one client.
+
+    ``rate`` is tokens per second; ``capacity`` bounds the burst, so a pool of
+    N workers may fire at most N requests back-to-back before being paced.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                # Tolerance absorbs float drift in the refill (0.1 * 10 == 0.99999...).
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class FMPClient:
     """Client for Financial Modeling Prep API with rate limiting and caching"""
 
@@ -126,19 +234,55 @@ class FMPClient:
 
     _ENDPOINT_FAILURE_THRESHOLD = 3  # disable endpoint after N consecutive failures
 
-    def __init__(self, api_key: Optional[str] = None):
+    # FMP plan tier -> (calls per minute, default batch worker count). With no
+    # plan the client keeps the serial RATE_LIMIT_DELAY pacing.
+    PLAN_TIERS = {
+        "starter": (300, 4),
+        "premium": (750, 8),
+        "ultimate": (3000, 16),
+    }
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        plan: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ):
         self.api_key = api_key or os.getenv("FMP_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "FMP API key required. Set FMP_API_KEY environment variable "
                 "or pass api_key parameter."
             )
+        plan = (plan or os.getenv("FMP_PLAN") or "").strip().lower() or None
+        if plan is not None and plan not in self.PLAN_TIERS:
+            raise ValueError(
+                f"Unknown FMP plan {plan!r}; expected one of {', '.join(self.PLAN_TIERS)}"
+            )
+        calls_per_minute, default_workers = self.PLAN_TIERS.get(plan, (None, 1))
+        self.plan = plan
+        self.max_workers = max(1, max_workers or default_workers)
+        if calls_per_minute is None and self.max_workers > 1:
+            calls_per_minute = 60.0 / self.RATE_LIMIT_DELAY
+        # Shared limiter for the concurrent path; None keeps the serial sleep.
+        self._limiter = (
+            _TokenBucket(calls_per_minute / 60.0, capacity=self.max_workers)
+            if calls_per_minute
+            else None
+        )
+        # Guards counters and circuit-breaker state touched by worker threads.
+        self._lock = threading.Lock()
+        self._tls = threading.local()
         self.session = requests.Session()
+        if self.max_workers > 1:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.max_workers)
+            self.session.mount("https://", adapter)
         self.session.headers.update({"apikey": self.api_key})
         self.cache = {}
         self.last_call_time = 0
         self.rate_limit_reached = False
-        self.retry_count = 0
+        self.retry_count = 0  # total 429 retries across calls (stats only)
         self.max_retries = 1
         self.api_calls_made = 0
         # Circuit breaker: track consecutive failures per endpoint URL prefix
@@ -148,10 +292,27 @@ class FMPClient:
         # so _request_with_fallback can surface suppressed errors even when
         # an endpoint was called with quiet=True.
         self._last_error: Optional[str] = None
+        # Cross-process response store shared by every generated client that
+        # points at the same directory. Disabled unless a directory is given.
+        self.disk_cache_dir = cache_dir or os.getenv("FMP_CACHE_DIR") or None
+        self.disk_cache_hits = 0
+        self.disk_cache_misses = 0
 
     def _rate_limited_get(
-        self, url: str, params: Optional[dict] = None, quiet: bool = False
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        quiet: bool = False,
+        _retries: int = 0,
     ) -> Optional[dict]:
+        disk_key = None
+        if self.disk_cache_dir and _is_disk_cacheable(url):
+            disk_key = _disk_cache_key(url, params)
+            cached = self._disk_cache_read(disk_key)
+            if cached is not None:
+                self._last_error = None
+                return cached
+
         self._last_error = None
         if self.rate_limit_reached:
             self._last_error = "daily rate limit already reached"
@@ -160,28 +321,41 @@ class FMPClient:
         if params is None:
             params = {}
 
-        elapsed = time.time() - self.last_call_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
+        if self._limiter is not None:
+            self._limiter.acquire()
+        else:
+            elapsed = time.time() - self.last_call_time
+            if elapsed < self.RATE_LIMIT_DELAY:
+                time.sleep(self.RATE_LIMIT_DELAY - elapsed)
 
         try:
             response = self.session.get(url, params=params, timeout=30)
-            self.last_call_time = time.time()
-            self.api_calls_made += 1
+            with self._lock:
+                self.last_call_time = time.time()
+                self.api_calls_made += 1
 
             if response.status_code == 200:
-                self.retry_count = 0
-                return response.json()
+                data = response.json()
+                # FMP reports some failures as a 200 with an "Error Message"
+                # body; never share those through the key-agnostic disk cache.
+                is_error = isinstance(data, dict) and "Error Message" in data
+                if disk_key is not None and data and not is_error:
+                    self._disk_cache_write(disk_key, url, data)
+                return data
             elif response.status_code == 429:
-                self.retry_count += 1
-                if self.retry_count <= self.max_retries:
+                # The retry budget is per call (threaded through the recursion),
+                # so concurrent workers never reset or exhaust each other's.
+                if _retries < self.max_retries:
+                    with self._lock:
+                        self.retry_count += 1
                     print("WARNING: Rate limit exceeded. Waiting 60 seconds...", file=sys.stderr)
                     time.sleep(60)
-                    return self._rate_limited_get(url, params, quiet=quiet)
+                    return self._rate_limited_get(url, params, quiet=quiet, _retries=_retries + 1)
                 else:
                     self._last_error = "HTTP 429 (daily rate limit)"
                     print("ERROR: Daily API rate limit reached.", file=sys.stderr)
-                    self.rate_limit_reached = True
+                    with self._lock:
+                        self.rate_limit_reached = True
                     return None
             else:
                 msg = f"HTTP {response.status_code} - {response.text[:200]}"
@@ -197,6 +371,66 @@ class FMPClient:
             print(f"ERROR: Request exception: {e}", file=sys.stderr)
             return None
 
+    # _last_error is per-thread so concurrent batch workers never read another
+    # worker's failure reason in _request_with_fallback.
+    @property
+    def _last_error(self) -> Optional[str]:
+        return getattr(self._tls, "last_error", None)
+
+    @_last_error.setter
+    def _last_error(self, value: Optional[str]) -> None:
+        self._tls.last_error = value
+
+    def _map_concurrent(self, fn, items: list) -> list:
+        """Apply ``fn`` to each item on the worker pool, preserving input order.
+
+        Runs a plain loop when ``max_workers`` is 1, so the default client
+        behaves exactly like the serial implementation. Exceptions raised by
+        ``fn`` (e.g. a budget stop) propagate to the caller either way.
+        """
+        if self.max_workers <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def _disk_cache_path(self, key: str) -> str:
+        return os.path.join(self.disk_cache_dir, key[:2], f"{key}.json")
+
+    def _disk_cache_read(self, key: str):
+        """Return the fresh cached payload for ``key``, or None (counted as a miss)."""
+        try:
+            with open(self._disk_cache_path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            entry = None
+        fresh = isinstance(entry, dict) and entry.get("expires_at", 0) > time.time()
+        with self._lock:
+            if fresh:
+                self.disk_cache_hits += 1
+            else:
+                self.disk_cache_misses += 1
+        return entry.get("data") if fresh else None
+
+    def _disk_cache_write(self, key: str, url: str, data) -> None:
+        """Atomically store ``data`` so concurrent processes never read a torn file."""
+        now = time.time()
+        expires_at = _disk_cache_expiry(url, now)
+        if expires_at is None:
+            return
+        path = self._disk_cache_path(key)
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            entry = {"url": url, "fetched_at": now, "expires_at": expires_at, "data": data}
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"WARN: disk cache write failed ({e})", file=sys.stderr)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
     def _request_with_fallback(self, endpoint_key, symbols_str, extra_params=None):
         """Try stable endpoint first, fall back to v3 for legacy users.
 
@@ -305,10 +539,11 @@ class FMPClient:
 
     def _record_endpoint_failure(self, base_url: str) -> None:
         """Track consecutive failures and disable endpoint after threshold."""
-        failures = self._endpoint_failures.get(base_url, 0) + 1
-        self._endpoint_failures[base_url] = failures
-        if failures >= self._ENDPOINT_FAILURE_THRESHOLD:
-            self._disabled_endpoints.add(base_url)
+        with self._lock:
+            failures = self._endpoint_failures.get(base_url, 0) + 1
+            self._endpoint_failures[base_url] = failures
+            if failures >= self._ENDPOINT_FAILURE_THRESHOLD:
+                self._disabled_endpoints.add(base_url)
 
     def get_quote(self, symbols: str) -> Optional[list[dict]]:
         """Fetch real-time quote data for one or more symbols (comma-separated)"""
@@ -325,20 +560,22 @@ class FMPClient:
         """Fetch quotes for a list of symbols, batching up to 5 per request"""
         results = {}
         batch_size = 5
-        for i in range(0, len(symbols), batch_size):
-            batch = symbols[i : i + batch_size]
-            batch_str = ",".join(batch)
-            quotes = self.get_quote(batch_str)
+        batches = [
+            ",".join(symbols[i : i + batch_size]) for i in range(0, len(symbols), batch_size)
+        ]
+        for quotes in self._map_concurrent(self.get_quote, batches):
             if quotes:
                 for q in quotes:
                     results[q["symbol"]] = q
         return results
 
     def get_batch_historical(self, symbols: list[str], days: int = 50) -> dict[str, list[dict]]:
-        """Fetch historical prices for multiple symbols"""
+        """Fetch historical prices for multiple symbols (concurrently when a plan is set)"""
         results = {}
-        for symbol in symbols:
-            data = self.get_historical_prices(symbol, days=days)
+        fetched = self._map_concurrent(
+            lambda symbol: self.get_historical_prices(symbol, days=days), symbols
+        )
+        for symbol, data in zip(symbols, fetched):
             if data and "historical" in data:
                 results[symbol] = data["historical"]
         return results
@@ -389,4 +626,6 @@ class FMPClient:
             "cache_entries": len(self.cache),
             "api_calls_made": self.api_calls_made,
             "rate_limit_reached": self.rate_limit_reached,
+            "disk_cache_hits": self.disk_cache_hits,
+            "disk_cache_misses": self.disk_cache_misses,
         }
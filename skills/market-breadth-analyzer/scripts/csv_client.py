@@ -8,10 +8,14 @@ No API key required.
 Data sources:
   Detail:  https://tradermonty.github.io/market-breadth-analysis/market_breadth_data.csv
   Summary: https://tradermonty.github.io/market-breadth-analysis/market_breadth_summary.csv
+
+Any source may also be a local file path (e.g. a copy prefetched by the daily
+dashboard), which is read from disk instead of downloaded.
 """
 
 import csv
 import io
+import os
 import sys
 from datetime import datetime
 from typing import Optional
@@ -37,6 +41,27 @@ DETAIL_COLUMNS = {
 }
 
 TIMEOUT = 30
+DETAIL_FILENAME = "market_breadth_data.csv"
+SUMMARY_FILENAME = "market_breadth_summary.csv"
+
+
+def is_local_source(source: str) -> bool:
+    """True when ``source`` names a file on disk rather than an HTTP(S) URL."""
+    return not source.startswith(("http://", "https://"))
+
+
+def _read_source(source: str) -> str:
+    """Return the text of a URL or local CSV file.
+
+    Raises:
+        requests.RequestException, OSError: on download or read failure.
+    """
+    if is_local_source(source):
+        with open(os.path.expanduser(source), encoding="utf-8") as f:
+            return f.read()
+    resp = requests.get(source, timeout=TIMEOUT)
+    resp.raise_for_status()
+    return resp.text
 
 
 def fetch_detail_csv(url: str = DEFAULT_DETAIL_URL) -> list[dict]:
@@ -47,14 +72,13 @@ def fetch_detail_csv(url: str = DEFAULT_DETAIL_URL) -> list[dict]:
     """
     print(f"  Fetching detail CSV from {url}...", end=" ", flush=True)
     try:
-        resp = requests.get(url, timeout=TIMEOUT)
-        resp.raise_for_status()
-    except requests.RequestException as e:
+        text = _read_source(url)
+    except (requests.RequestException, OSError) as e:
         print("FAILED")
         print(f"ERROR: Failed to fetch detail CSV: {e}", file=sys.stderr)
         return []
 
-    reader = csv.DictReader(io.StringIO(resp.text))
+    reader = csv.DictReader(io.StringIO(text))
     rows = []
 
     for line_num, raw_row in enumerate(reader, start=2):
@@ -85,14 +109,13 @@ def fetch_summary_csv(url: str = DEFAULT_SUMMARY_URL) -> dict[str, str]:
     """
     print(f"  Fetching summary CSV from {url}...", end=" ", flush=True)
     try:
-        resp = requests.get(url, timeout=TIMEOUT)
-        resp.raise_for_status()
-    except requests.RequestException as e:
+        text = _read_source(url)
+    except (requests.RequestException, OSError) as e:
         print("FAILED")
         print(f"ERROR: Failed to fetch summary CSV: {e}", file=sys.stderr)
         return {}
 
-    reader = csv.DictReader(io.StringIO(resp.text))
+    reader = csv.DictReader(io.StringIO(text))
     summary = {}
     for raw_row in reader:
         metric = raw_row.get("Metric", "").strip()
@@ -163,7 +186,9 @@ def check_data_freshness(
 
 
 def _check_last_modified(url: str) -> Optional[str]:
-    """Check HTTP Last-Modified header via HEAD request."""
+    """Check HTTP Last-Modified header via HEAD request (None for local files)."""
+    if is_local_source(url):
+        return None
     try:
         resp = requests.head(url, timeout=10, allow_redirects=True)
         resp.raise_for_status()
@@ -40,6 +40,8 @@ from calculators.trend_level_calculator import calculate_breadth_level_trend
 from csv_client import (
     DEFAULT_DETAIL_URL,
     DEFAULT_SUMMARY_URL,
+    DETAIL_FILENAME,
+    SUMMARY_FILENAME,
     check_data_freshness,
     fetch_detail_csv,
     fetch_summary_csv,
@@ -57,12 +59,20 @@ def parse_arguments():
     parser.add_argument(
         "--detail-url",
         default=DEFAULT_DETAIL_URL,
-        help="URL for detail CSV (market_breadth_data.csv)",
+        help="URL or local path for detail CSV (market_breadth_data.csv)",
     )
     parser.add_argument(
         "--summary-url",
         default=DEFAULT_SUMMARY_URL,
-        help="URL for summary CSV (market_breadth_summary.csv)",
+        help="URL or local path for summary CSV (market_breadth_summary.csv)",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help=(
+            f"Read {DETAIL_FILENAME} and {SUMMARY_FILENAME} from this directory "
+            "instead of downloading them (overrides --detail-url/--summary-url)"
+        ),
     )
     parser.add_argument(
         "--output-dir",
@@ -70,7 +80,11 @@ def parse_arguments():
         help="Output directory for reports (default: current directory)",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.data_dir:
+        args.detail_url = os.path.join(args.data_dir, DETAIL_FILENAME)
+        args.summary_url = os.path.join(args.data_dir, SUMMARY_FILENAME)
+    return args
 
 
 def main():
@@ -95,7 +109,7 @@ def main():
 
     summary = fetch_summary_csv(args.summary_url)
 
-    freshness = check_data_freshness(detail_rows)
+    freshness = check_data_freshness(detail_rows, detail_url=args.detail_url)
     if freshness.get("warning"):
         print(f"  WARNING: {freshness['warning']}")
     else:
@@ -0,0 +1,57 @@
+"""Tests for csv_client.py — local-file sources for prefetched CSVs."""
+
+import pytest
+from csv_client import (
+    _check_last_modified,
+    fetch_detail_csv,
+    fetch_summary_csv,
+    is_local_source,
+)
+
+DETAIL_CSV = (
+    "Date,S&P500_Price,Breadth_Index_Raw,Breadth_Index_200MA,Breadth_Index_8MA,"
+    "Breadth_200MA_Trend,Bearish_Signal,Is_Peak,Is_Trough,Is_Trough_8MA_Below_04\n"
+    "2025-01-03,5010.0,0.55,0.52,0.56,1,False,False,False,False\n"
+    "2025-01-02,5000.0,0.50,0.51,0.54,1,False,True,False,False\n"
+)
+
+
+@pytest.mark.parametrize(
+    "source, local",
+    [
+        ("https://example.com/data.csv", False),
+        ("http://example.com/data.csv", False),
+        ("/tmp/market_breadth_data.csv", True),
+        ("data/market_breadth_data.csv", True),
+    ],
+)
+def test_is_local_source(source, local):
+    assert is_local_source(source) is local
+
+
+def test_fetch_detail_csv_reads_local_file(tmp_path):
+    path = tmp_path / "market_breadth_data.csv"
+    path.write_text(DETAIL_CSV, encoding="utf-8")
+
+    rows = fetch_detail_csv(str(path))
+
+    assert [row["Date"] for row in rows] == ["2025-01-02", "2025-01-03"]
+    assert rows[0]["Is_Peak"] is True
+    assert rows[1]["Breadth_Index_8MA"] == pytest.approx(0.56)
+
+
+def test_fetch_summary_csv_reads_local_file(tmp_path):
+    path = tmp_path / "market_breadth_summary.csv"
+    path.write_text("Metric,Value\nTotal Peaks,12\n,ignored\n", encoding="utf-8")
+
+    assert fetch_summary_csv(str(path)) == {"Total Peaks": "12"}
+
+
+def test_missing_local_file_returns_empty(tmp_path, capsys):
+    assert fetch_detail_csv(str(tmp_path / "missing.csv")) == []
+    assert fetch_summary_csv(str(tmp_path / "missing.csv")) == {}
+    assert "Failed to fetch detail CSV" in capsys.readouterr().err
+
+
+def test_last_modified_skips_local_files(tmp_path):
+    assert _check_last_modified(str(tmp_path / "market_breadth_data.csv")) is None
@@ -33,6 +33,7 @@ import time
 import numpy as np
 import pandas as pd
 import requests
+from price_cache import PriceCache, load_prices_dir
 from scipy import stats
 from statsmodels_support import require_statsmodels
 
@@ -96,8 +97,17 @@ def _fetch_raw_historical(symbol, api_key, params=None):
     return None
 
 
-def fetch_historical_prices(symbol, api_key, lookback_days=365):
+def fetch_historical_prices(symbol, api_key, lookback_days=365, cache=None):
     """Fetch historical adjusted close prices for a symbol"""
+    if cache is not None:
+        prices, _status = cache.get(
+            symbol, lambda params: _fetch_raw_historical(symbol, api_key, params)
+        )
+        if prices is None:
+            print(f"ERROR: No data found for {symbol}")
+            return None
+        return prices.iloc[-lookback_days:]
+
     data = _fetch_raw_historical(symbol, api_key)
     if not data:
         print(f"ERROR: No data found for {symbol}")
@@ -425,6 +435,16 @@ def main():
     parser.add_argument(
         "--exit-zscore", type=float, default=0.0, help="Z-score threshold for exit (default: 0.0)"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Keep per-symbol price files here and only fetch bars newer than the cache",
+    )
+    parser.add_argument(
+        "--prices-dir",
+        type=str,
+        help="Offline mode: read <SYMBOL>.csv/.parquet price files instead of calling FMP",
+    )
     parser.add_argument("--api-key", type=str, help="FMP API key (or set FMP_API_KEY env variable)")
 
     args = parser.parse_args()
@@ -439,16 +459,31 @@ def main():
         parser.error("--exit-zscore must be finite and greater than or equal to 0")
     if args.exit_zscore >= args.entry_zscore:
         parser.error("--exit-zscore must be less than --entry-zscore")
+    if args.prices_dir and args.cache_dir:
+        parser.error("--cache-dir has no effect with --prices-dir")
 
-    # Get API key
-    api_key = get_api_key(args.api_key)
+    if args.prices_dir:
+        print(
+            f"\nLoading price data for {args.stock_a} and {args.stock_b} from {args.prices_dir}..."
+        )
+        symbols = [args.stock_a.upper(), args.stock_b.upper()]
+        price_data = load_prices_dir(args.prices_dir, symbols, args.lookback_days)
+        for symbol in symbols:
+            if symbol not in price_data:
+                print(f"ERROR: No price file for {symbol} in {args.prices_dir}")
+        prices_a, prices_b = (price_data.get(symbol) for symbol in symbols)
+    else:
+        # Get API key
+        api_key = get_api_key(args.api_key)
 
-    # Fetch price data
-    print(f"\nFetching price data for {args.stock_a} and {args.stock_b}...")
+        # Fetch price data
+        print(f"\nFetching price data for {args.stock_a} and {args.stock_b}...")
 
-    prices_a = fetch_historical_prices(args.stock_a, api_key, args.lookback_days)
-    time.sleep(0.3)  # Rate limiting
-    prices_b = fetch_historical_prices(args.stock_b, api_key, args.lookback_days)
+        cache = PriceCache(args.cache_dir) if args.cache_dir else None
+        prices_a = fetch_historical_prices(args.stock_a, api_key, args.lookback_days, cache)
+        if cache is None:
+            time.sleep(0.3)  # Rate limiting
+        prices_b = fetch_historical_prices(args.stock_b, api_key, args.lookback_days, cache)
 
     if prices_a is None or prices_b is None:
         sys.exit(1)
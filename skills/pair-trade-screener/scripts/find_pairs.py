@@ -42,6 +42,7 @@ import math
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from itertools import combinations
 from pathlib import Path
@@ -49,6 +50,7 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 import requests
+from price_cache import PriceCache, load_prices_dir
 from scipy import stats
 from statsmodels_support import require_statsmodels
 
@@ -192,8 +194,13 @@ def fetch_historical_prices(symbol, api_key, lookback_days=730):
     return prices
 
 
-def fetch_price_data_batch(symbols, api_key, lookback_days=730):
-    """Fetch historical prices for multiple symbols"""
+def fetch_price_data_batch(symbols, api_key, lookback_days=730, cache=None):
+    """Fetch historical prices for multiple symbols
+
+    With a ``PriceCache``, symbols already fetched since the last session
+    close are read from disk (no request, no rate-limit pause) and stale
+    ones are topped up with only their newest bars.
+    """
     print(f"\n[2/5] Fetching {lookback_days} days of price data for {len(symbols)} stocks...")
 
     price_data = {}
@@ -202,17 +209,28 @@ def fetch_price_data_batch(symbols, api_key, lookback_days=730):
     for i, symbol in enumerate(symbols, 1):
         print(f"  [{i}/{len(symbols)}] Fetching {symbol}...", end="", flush=True)
 
-        prices = fetch_historical_prices(symbol, api_key, lookback_days)
+        source, requested = "", True
+        if cache is None:
+            prices = fetch_historical_prices(symbol, api_key, lookback_days)
+        else:
+            prices, status = cache.get(
+                symbol, lambda params, s=symbol: _fetch_raw_historical(s, api_key, params)
+            )
+            if prices is not None:
+                prices = prices.iloc[-lookback_days:]
+            source = f", {status.replace('_', ' ')}"
+            requested = status != "cached"
 
         if prices is not None and len(prices) >= 250:  # Require at least 250 days
             price_data[symbol] = prices
-            print(f" ✓ ({len(prices)} days)")
+            print(f" ✓ ({len(prices)} days{source})")
         else:
             failed_symbols.append(symbol)
             print(" ✗ (insufficient data)")
 
         # Rate limiting
-        time.sleep(0.3)
+        if requested:
+            time.sleep(0.3)
 
     print(f"\n  → Successfully fetched {len(price_data)} stocks")
     if failed_symbols:
@@ -221,6 +239,23 @@ def fetch_price_data_batch(symbols, api_key, lookback_days=730):
     return price_data
 
 
+def load_price_data_dir(prices_dir, symbols=None, lookback_days=730):
+    """Load price data offline from a directory of per-symbol CSV/Parquet files"""
+    print(f"\n[2/5] Loading {lookback_days} days of price data from {prices_dir}...")
+
+    loaded = load_prices_dir(prices_dir, symbols, lookback_days)
+    price_data = {symbol: prices for symbol, prices in loaded.items() if len(prices) >= 250}
+    failed_symbols = [
+        symbol.upper() for symbol in symbols or loaded if symbol.upper() not in price_data
+    ]
+
+    print(f"  → Loaded {len(price_data)} stocks")
+    if failed_symbols:
+        print(f"  → Missing or insufficient data: {', '.join(failed_symbols)}")
+
+    return price_data
+
+
 # =============================================================================
 # Statistical Analysis Functions
 # =============================================================================
@@ -252,6 +287,10 @@ def calculate_correlation(prices_a, prices_b):
     except ValueError:
         return None
 
+    return _aligned_correlation(aligned_a, aligned_b)
+
+
+def _aligned_correlation(aligned_a, aligned_b):
     correlation = aligned_a.corr(aligned_b)
     return correlation if np.isfinite(correlation) else None
 
@@ -259,7 +298,10 @@ def calculate_correlation(prices_a, prices_b):
 def calculate_beta(prices_a, prices_b):
     """Calculate hedge ratio (beta) using OLS regression"""
     aligned_a, aligned_b = _align_finite_prices(prices_a, prices_b)
+    return _aligned_beta(aligned_a, aligned_b)
+
 
+def _aligned_beta(aligned_a, aligned_b):
     if aligned_a.nunique() < 2 or aligned_b.nunique() < 2:
         raise ValueError("at least two finite observations and non-constant prices are required")
 
@@ -271,11 +313,19 @@ def calculate_beta(prices_a, prices_b):
 
 def test_cointegration(prices_a, prices_b, beta):
     """Test for cointegration using Augmented Dickey-Fuller test"""
+    require_statsmodels()
+    try:
+        aligned_a, aligned_b = _align_finite_prices(prices_a, prices_b)
+    except Exception:
+        return None
+    return _aligned_cointegration(aligned_a, aligned_b, beta)
+
+
+def _aligned_cointegration(aligned_a, aligned_b, beta):
     _, adfuller = require_statsmodels()
 
     # ADF test
     try:
-        aligned_a, aligned_b = _align_finite_prices(prices_a, prices_b)
         spread = aligned_a - (beta * aligned_b)
         result = adfuller(spread, maxlag=1, regression="c")
         adf_statistic = result[0]
@@ -361,6 +411,11 @@ def analyze_pair(symbol_a, symbol_b, prices_a, prices_b, min_correlation=0.70):
     if coint_result is None:
         return None
 
+    return _pair_result(symbol_a, symbol_b, correlation, beta, coint_result)
+
+
+def _pair_result(symbol_a, symbol_b, correlation, beta, coint_result):
+    """Steps 4-7 of ``analyze_pair``: half-life, z-score, signal, strength."""
     # Step 4: Calculate half-life (if cointegrated)
     half_life = None
     if coint_result["is_cointegrated"]:
@@ -402,37 +457,172 @@ def analyze_pair(symbol_a, symbol_b, prices_a, prices_b, min_correlation=0.70):
     }
 
 
-def screen_all_pairs(price_data, min_correlation=0.70):
-    """Screen all possible pairs from price data"""
-    print("\n[3/5] Calculating correlations and testing pairs...")
+# Pairs whose prefilter correlation falls within this distance below the
+# threshold are still checked exactly: the moment-based matrix can differ from
+# Series.corr in the last few bits.
+_CORRELATION_PREFILTER_MARGIN = 1e-6
+# Fewer surviving pairs than this are tested inline; pool start-up would
+# cost more than it saves.
+_MIN_POOL_PAIRS = 64
+# Per-process screening state (see _init_pair_worker).
+_PAIR_STATE = {}
+
+
+def build_price_matrix(price_data):
+    """Outer-join price series into one date-sorted float matrix.
+
+    Masking a matrix column pair with ``np.isfinite`` reproduces
+    ``_align_finite_prices`` exactly only for float series with a unique,
+    increasing index. Other series are returned in ``excluded`` and their
+    pairs go through ``analyze_pair`` unchanged.
+    """
+    eligible = {}
+    excluded = []
+    for symbol, prices in price_data.items():
+        if (
+            isinstance(prices, pd.Series)
+            and pd.api.types.is_float_dtype(prices.dtype)
+            and prices.index.is_unique
+            and prices.index.is_monotonic_increasing
+        ):
+            eligible[symbol] = prices
+        else:
+            excluded.append(symbol)
 
-    symbols = list(price_data.keys())
-    total_pairs = len(list(combinations(symbols, 2)))
+    if eligible:
+        try:
+            return pd.concat(eligible, axis=1, join="outer").sort_index(), excluded
+        except (TypeError, ValueError):
+            pass  # incompatible index types: fall back to per-pair alignment
+    return pd.DataFrame(), list(price_data)
+
+
+def pairwise_correlation_matrix(values):
+    """Pearson correlation and observation count over pairwise-finite rows.
+
+    ``values`` is a (dates x symbols) array with NaN for missing prices.
+    Returns ``(correlation, counts)`` symbol x symbol arrays; entries with
+    fewer than two observations or a constant column are NaN.
+    """
+    finite = np.isfinite(values)
+    weights = finite.astype(float)
+    # Center each column on its own mean first to limit cancellation in the
+    # sum-of-products formula (prices sit far from zero).
+    column_counts = np.maximum(weights.sum(axis=0), 1.0)
+    raw = np.where(finite, values, 0.0)
+    centered = np.where(finite, raw - raw.sum(axis=0) / column_counts, 0.0)
+
+    counts = weights.T @ weights
+    sums = centered.T @ weights  # sums[i, j]: sum of column i where j is finite
+    squares = (centered * centered).T @ weights
+    cross = centered.T @ centered
+    with np.errstate(divide="ignore", invalid="ignore"):
+        covariance = cross - sums * sums.T / counts
+        variance = squares - sums * sums / counts
+        correlation = covariance / np.sqrt(variance * variance.T)
+    return correlation, counts
+
+
+def _init_pair_worker(matrix, price_data, min_correlation):
+    _PAIR_STATE["index"] = matrix.index
+    _PAIR_STATE["values"] = matrix.to_numpy(dtype=float)
+    _PAIR_STATE["column"] = {symbol: k for k, symbol in enumerate(matrix.columns)}
+    _PAIR_STATE["price_data"] = price_data
+    _PAIR_STATE["min_correlation"] = min_correlation
+
+
+def _screen_pair(pair):
+    """Run the full ``analyze_pair`` statistics for one prefiltered pair."""
+    symbol_a, symbol_b = pair
+    column = _PAIR_STATE["column"]
+    min_correlation = _PAIR_STATE["min_correlation"]
+    try:
+        if symbol_a not in column or symbol_b not in column:
+            price_data = _PAIR_STATE["price_data"]
+            return analyze_pair(
+                symbol_a, symbol_b, price_data[symbol_a], price_data[symbol_b], min_correlation
+            )
 
-    print(f"  → Total possible pairs: {total_pairs}")
-    print(f"  → Minimum correlation: {min_correlation}")
+        values = _PAIR_STATE["values"]
+        prices_a = values[:, column[symbol_a]]
+        prices_b = values[:, column[symbol_b]]
+        finite = np.isfinite(prices_a) & np.isfinite(prices_b)
+        if finite.sum() < 100:
+            return None
+        index = _PAIR_STATE["index"][finite]
+        aligned_a = pd.Series(prices_a[finite], index=index, name="price_a")
+        aligned_b = pd.Series(prices_b[finite], index=index, name="price_b")
+
+        # Same sequence as analyze_pair, on the already-aligned observations.
+        correlation = _aligned_correlation(aligned_a, aligned_b)
+        if correlation is None or correlation < min_correlation:
+            return None
+        beta = _aligned_beta(aligned_a, aligned_b)["beta"]
+        coint_result = _aligned_cointegration(aligned_a, aligned_b, beta)
+        if coint_result is None:
+            return None
+        return _pair_result(symbol_a, symbol_b, correlation, beta, coint_result)
+    except (TypeError, ValueError):
+        return None
 
-    pairs_analyzed = 0
-    cointegrated_pairs = []
 
-    # Analyze all combinations
-    for symbol_a, symbol_b in combinations(symbols, 2):
-        pairs_analyzed += 1
+def screen_all_pairs(price_data, min_correlation=0.70, workers=1):
+    """Screen all possible pairs from price data.
 
-        if pairs_analyzed % 10 == 0 or pairs_analyzed == total_pairs:
-            print(f"  [{pairs_analyzed}/{total_pairs}] pairs analyzed...", end="\r", flush=True)
+    Staged so the expensive tests only run where they can matter:
 
-        try:
-            result = analyze_pair(
-                symbol_a, symbol_b, price_data[symbol_a], price_data[symbol_b], min_correlation
-            )
-        except (TypeError, ValueError):
-            result = None
+    1. One outer-joined price matrix for the whole universe.
+    2. One pairwise-complete correlation matrix; pairs with fewer than 100
+       shared observations or a correlation clearly below
+       ``min_correlation`` are dropped without further work.
+    3. Survivors get the ``analyze_pair`` statistics (exact correlation,
+       OLS beta, ADF, half-life, z-score) on observations aligned by masking
+       the matrix, across a process pool when ``workers > 1``.
 
-        if result and result["is_cointegrated"]:
-            cointegrated_pairs.append(result)
+    Results match running ``analyze_pair`` over every combination (same
+    pairs, same order, same values apart from ``timestamp``).
+    """
+    print("\n[3/5] Calculating correlations and testing pairs...")
 
-    print(f"\n  → Found {len(cointegrated_pairs)} cointegrated pairs")
+    symbols = list(price_data.keys())
+    pairs = list(combinations(symbols, 2))
+    total_pairs = len(pairs)
+
+    print(f"  → Total possible pairs: {total_pairs}")
+    print(f"  → Minimum correlation: {min_correlation}")
+
+    matrix, excluded = build_price_matrix(price_data)
+    candidates = pairs
+    if not matrix.empty:
+        correlation, counts = pairwise_correlation_matrix(matrix.to_numpy(dtype=float))
+        column = {symbol: k for k, symbol in enumerate(matrix.columns)}
+        threshold = min_correlation - _CORRELATION_PREFILTER_MARGIN
+        candidates = []
+        for symbol_a, symbol_b in pairs:
+            i, j = column.get(symbol_a), column.get(symbol_b)
+            if i is not None and j is not None:
+                # NaN correlations compare False and stay for the exact check.
+                if counts[i, j] < 100 or correlation[i, j] < threshold:
+                    continue
+            candidates.append((symbol_a, symbol_b))
+    print(f"  → Correlation prefilter: {len(candidates)} pairs to test")
+    if excluded:
+        print(f"  → Aligned per pair (irregular series): {', '.join(map(str, excluded))}")
+
+    if workers > 1 and len(candidates) >= _MIN_POOL_PAIRS:
+        chunksize = max(1, len(candidates) // (workers * 8))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_pair_worker,
+            initargs=(matrix, price_data, min_correlation),
+        ) as pool:
+            results = list(pool.map(_screen_pair, candidates, chunksize=chunksize))
+    else:
+        _init_pair_worker(matrix, price_data, min_correlation)
+        results = [_screen_pair(pair) for pair in candidates]
+
+    cointegrated_pairs = [result for result in results if result and result["is_cointegrated"]]
+    print(f"  → Found {len(cointegrated_pairs)} cointegrated pairs")
 
     return cointegrated_pairs
 
@@ -580,12 +770,32 @@ Examples:
         default="pair_analysis.json",
         help="Output JSON file (default: pair_analysis.json)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for the cointegration stage (default: CPU count)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Keep per-symbol price files here and only fetch bars newer than the cache",
+    )
+    parser.add_argument(
+        "--prices-dir",
+        type=str,
+        help="Offline mode: read <SYMBOL>.csv/.parquet price files instead of calling FMP",
+    )
     parser.add_argument("--api-key", type=str, help="FMP API key (or set FMP_API_KEY env variable)")
 
     args = parser.parse_args()
 
     # Validate inputs
-    if not args.sector and not args.symbols:
+    if args.prices_dir and args.sector:
+        parser.error("--sector needs the FMP API; use --symbols with --prices-dir")
+    if args.prices_dir and args.cache_dir:
+        parser.error("--cache-dir has no effect with --prices-dir")
+    if not args.sector and not args.symbols and not args.prices_dir:
         parser.error("Either --sector or --symbols must be provided")
 
     if args.sector and args.symbols:
@@ -594,6 +804,8 @@ Examples:
         parser.error("--min-correlation must be finite and between 0 and 1")
     if args.lookback_days < 250:
         parser.error("--lookback-days must be at least 250")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
     if not math.isfinite(args.min_market_cap) or args.min_market_cap < 0:
         parser.error("--min-market-cap must be finite and non-negative")
     custom_symbols = None
@@ -602,9 +814,6 @@ Examples:
         if any(not symbol for symbol in custom_symbols) or len(set(custom_symbols)) < 2:
             parser.error("--symbols must contain at least two distinct, non-empty symbols")
 
-    # Get API key
-    api_key = get_api_key(args.api_key)
-
     print("\n" + "=" * 70)
     print("PAIR TRADE SCREENER")
     print("=" * 70)
@@ -613,22 +822,29 @@ Examples:
     print(f"  Lookback Days: {args.lookback_days}")
     print(f"  Min Market Cap: ${args.min_market_cap:,.0f}")
 
-    # Get list of stocks to analyze
-    if args.sector:
-        stocks = fetch_sector_stocks(args.sector, api_key, args.min_market_cap)
-        symbols = [s["symbol"] for s in stocks]
+    if args.prices_dir:
+        price_data = load_price_data_dir(args.prices_dir, custom_symbols, args.lookback_days)
     else:
-        symbols = custom_symbols
+        # Get API key
+        api_key = get_api_key(args.api_key)
+
+        # Get list of stocks to analyze
+        if args.sector:
+            stocks = fetch_sector_stocks(args.sector, api_key, args.min_market_cap)
+            symbols = [s["symbol"] for s in stocks]
+        else:
+            symbols = custom_symbols
 
-    # Fetch price data
-    price_data = fetch_price_data_batch(symbols, api_key, args.lookback_days)
+        # Fetch price data
+        cache = PriceCache(args.cache_dir) if args.cache_dir else None
+        price_data = fetch_price_data_batch(symbols, api_key, args.lookback_days, cache)
 
     if len(price_data) < 2:
         print("\nERROR: Need at least 2 stocks with valid data")
         sys.exit(1)
 
     # Screen all pairs
-    pairs = screen_all_pairs(price_data, args.min_correlation)
+    pairs = screen_all_pairs(price_data, args.min_correlation, args.workers)
 
     if not pairs:
         print("\nNo cointegrated pairs found. Try:")
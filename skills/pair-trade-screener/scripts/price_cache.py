@@ -0,0 +1,203 @@
+"""Local price storage shared by the pair-trading scripts.
+
+Two ways to avoid re-downloading every symbol on each run:
+
+- ``PriceCache``: a directory of per-symbol CSV files (``date,close``) kept
+  up to date from FMP. A file written after the latest session close and
+  FMP's EOD publish time (18:00 New York) is served without a request; an
+  older one is topped up by fetching only the bars from its second-to-last
+  date onward. If that overlapping bar no
+  longer matches (a split or dividend re-based the adjusted history), the
+  full history is fetched again instead of mixing adjustment bases.
+- ``load_prices_dir``: offline mode. Reads ``<SYMBOL>.csv`` / ``<SYMBOL>.parquet``
+  files with a ``date`` column and an ``adjClose`` or ``close`` column.
+  A cache directory is itself a valid prices directory.
+
+Series are chronological, float-valued and named after the symbol, the same
+shape ``fetch_historical_prices`` returns.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pandas as pd
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _NY_TZ = ZoneInfo("America/New_York")
+except (ImportError, KeyError):  # no tzdata (e.g. bare Windows): EST approximation
+    _NY_TZ = timezone(timedelta(hours=-5))
+
+PRICE_FILE_SUFFIXES = (".csv", ".parquet")
+_PRICE_COLUMNS = ("adjClose", "adj_close", "close")
+
+
+# New York hours at which a cached file goes stale on a weekday: the 16:00
+# session close (drops a partial intraday bar) and 18:00, by which FMP has
+# published the closing bar (drops a file written before the bar existed).
+_EOD_REFRESH_HOURS = (16, 18)
+
+
+def _next_eod_refresh(now: float) -> float:
+    """Epoch seconds of the first EOD refresh point (see _EOD_REFRESH_HOURS) after ``now``.
+
+    Weekends are skipped; exchange holidays are not modelled, so on a holiday
+    a cached file merely goes stale early and is topped up.
+    """
+    current = datetime.fromtimestamp(now, _NY_TZ)
+    day = current.replace(hour=0, minute=0, second=0, microsecond=0)
+    while True:
+        if day.weekday() < 5:
+            for hour in _EOD_REFRESH_HOURS:
+                boundary = day.replace(hour=hour)
+                if boundary > current:
+                    return boundary.timestamp()
+        day += timedelta(days=1)
+
+
+def history_to_series(historical, symbol):
+    """Convert FMP ``historical`` rows to a chronological adjusted-close Series."""
+    rows = sorted(historical, key=lambda item: item["date"])
+    prices = pd.Series(
+        [item.get("adjClose") or item["close"] for item in rows],  # stable shape compat
+        index=pd.to_datetime([item["date"] for item in rows]),
+        name=symbol,
+        dtype=float,
+    )
+    return prices[~prices.index.duplicated(keep="last")]
+
+
+def _frame_to_series(frame, symbol, path):
+    if "date" in frame.columns:
+        frame = frame.set_index("date")
+    column = next((name for name in _PRICE_COLUMNS if name in frame.columns), None)
+    if column is None:
+        raise ValueError(f"{path} has no adjClose or close column")
+    prices = pd.Series(
+        pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=float),
+        index=pd.to_datetime(frame.index).rename(None),
+        name=symbol,
+    ).sort_index()
+    return prices[~prices.index.duplicated(keep="last")]
+
+
+def read_price_file(path, symbol=None):
+    """Read one CSV/Parquet price file into a chronological Series."""
+    path = Path(path)
+    symbol = symbol or path.stem.upper()
+    if path.suffix.lower() == ".parquet":
+        try:
+            frame = pd.read_parquet(path)
+        except ImportError as exc:
+            raise RuntimeError(
+                f"reading {path.name} requires pyarrow; convert it to CSV or install pyarrow"
+            ) from exc
+    else:
+        # round_trip: the default fast parser can be off by an ulp, which
+        # would make cached and freshly fetched histories differ.
+        frame = pd.read_csv(path, float_precision="round_trip")
+    return _frame_to_series(frame, symbol, path)
+
+
+def load_prices_dir(prices_dir, symbols=None, lookback_days=None):
+    """Load ``{symbol: Series}`` from a directory of price files.
+
+    ``symbols`` restricts (and orders) the result; file stems are matched
+    case-insensitively and missing symbols are simply absent. When
+    ``lookback_days`` is set, only the most recent that many bars are kept.
+    """
+    prices_dir = Path(prices_dir)
+    if not prices_dir.is_dir():
+        raise ValueError(f"prices directory not found: {prices_dir}")
+
+    files = {}
+    for path in sorted(prices_dir.iterdir()):
+        if path.suffix.lower() in PRICE_FILE_SUFFIXES and not path.name.startswith("."):
+            files.setdefault(path.stem.upper(), path)
+
+    wanted = list(files) if symbols is None else [symbol.upper() for symbol in symbols]
+    price_data = {}
+    for symbol in wanted:
+        if symbol not in files:
+            continue
+        prices = read_price_file(files[symbol], symbol)
+        price_data[symbol] = prices.iloc[-lookback_days:] if lookback_days else prices
+    return price_data
+
+
+class PriceCache:
+    """Per-symbol CSV store of full adjusted-close histories with incremental top-up."""
+
+    def __init__(self, cache_dir, clock=time.time):
+        self.cache_dir = Path(cache_dir)
+        self.clock = clock
+
+    def path(self, symbol):
+        return self.cache_dir / f"{symbol.upper().replace('/', '_')}.csv"
+
+    def read(self, symbol):
+        """Return ``(series, is_fresh)`` for ``symbol``; ``(None, False)`` on a miss."""
+        path = self.path(symbol)
+        try:
+            written_at = path.stat().st_mtime
+            prices = read_price_file(path, symbol)
+        except (OSError, ValueError):
+            return None, False
+        if prices.empty:
+            return None, False
+        return prices, _next_eod_refresh(written_at) > self.clock()
+
+    def write(self, symbol, prices):
+        """Atomically store ``prices`` so a concurrent reader never sees a torn file."""
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            frame = pd.DataFrame({"date": prices.index.strftime("%Y-%m-%d"), "close": prices})
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                frame.to_csv(f, index=False)
+            os.replace(tmp_path, self.path(symbol))
+        except OSError as e:
+            print(f"WARN: price cache write failed ({e})", file=sys.stderr)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    def get(self, symbol, fetch_raw):
+        """Return ``(series, status)`` for ``symbol``, fetching only what is missing.
+
+        ``fetch_raw(params)`` performs one FMP historical request and returns
+        its payload (or None). ``status`` is ``"cached"`` (no request),
+        ``"topped_up"``, ``"fetched"`` (full history), ``"stale"`` (top-up
+        failed; cached data returned) or ``"missing"``.
+        """
+        cached, fresh = self.read(symbol)
+        if cached is not None and fresh:
+            return cached, "cached"
+
+        if cached is not None and len(cached) >= 2:
+            # Re-fetch the second-to-last bar as an overlap check: the last
+            # cached bar may have been a partial intraday one.
+            anchor = cached.index[-2]
+            data = fetch_raw({"from": anchor.strftime("%Y-%m-%d")})
+            if not data or not data.get("historical"):
+                return cached, "stale"
+            recent = history_to_series(data["historical"], symbol)
+            if anchor in recent.index and recent[anchor] == cached[anchor]:
+                merged = pd.concat([cached[cached.index < anchor], recent[recent.index >= anchor]])
+                merged.name = symbol
+                self.write(symbol, merged)
+                return merged, "topped_up"
+
+        data = fetch_raw(None)
+        if not data or not data.get("historical"):
+            return (cached, "stale") if cached is not None else (None, "missing")
+        prices = history_to_series(data["historical"], symbol)
+        self.write(symbol, prices)
+        return prices, "fetched"
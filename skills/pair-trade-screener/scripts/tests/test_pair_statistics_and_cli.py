@@ -117,6 +117,61 @@ def test_screen_all_pairs_skips_malformed_pair_and_keeps_valid_pair():
     assert [result["pair"] for result in results] == ["AAA/BBB"]
 
 
+def _sector_prices(count=12, length=320):
+    rng = np.random.default_rng(11)
+    index = pd.date_range("2025-01-01", periods=length, freq="D")
+    market = np.cumsum(rng.normal(0, 1, length))
+    prices = {}
+    for position in range(count):
+        own = np.cumsum(rng.normal(0, rng.uniform(0.2, 1.5), length))
+        level = 100 + rng.uniform(0.3, 1.5) * market + own
+        prices[f"S{position:02d}"] = pd.Series(level - level.min() + 10, index=index)
+    # Irregular inputs the staged screener must handle like analyze_pair.
+    prices["S01"] = prices["S01"].iloc[25:]
+    prices["S02"].iloc[[40, 41]] = [np.nan, np.inf]
+    prices["S03"] = prices["S03"].round().astype("int64")
+    prices["S04"] = prices["S04"].sample(frac=1.0, random_state=3)
+    return prices
+
+
+@pytest.mark.parametrize("workers", (1, 2))
+def test_screen_all_pairs_matches_analyze_pair_on_every_combination(monkeypatch, workers):
+    from itertools import combinations
+
+    monkeypatch.setattr(find_pairs, "_MIN_POOL_PAIRS", 1)
+    prices = _sector_prices()
+    expected = []
+    for symbol_a, symbol_b in combinations(prices, 2):
+        result = find_pairs.analyze_pair(
+            symbol_a, symbol_b, prices[symbol_a], prices[symbol_b], 0.5
+        )
+        if result and result["is_cointegrated"]:
+            expected.append(result)
+
+    screened = find_pairs.screen_all_pairs(prices, 0.5, workers)
+
+    def without_timestamp(results):
+        return [{k: v for k, v in r.items() if k != "timestamp"} for r in results]
+
+    assert expected
+    assert without_timestamp(screened) == without_timestamp(expected)
+
+
+def test_correlation_matrix_matches_pairwise_pandas():
+    prices = _sector_prices(count=6)
+    matrix, excluded = find_pairs.build_price_matrix(prices)
+    assert excluded == ["S03", "S04"]
+
+    correlation, counts = find_pairs.pairwise_correlation_matrix(matrix.to_numpy())
+    for i, symbol_a in enumerate(matrix.columns):
+        for j, symbol_b in enumerate(matrix.columns):
+            aligned_a, aligned_b = find_pairs._align_finite_prices(
+                prices[symbol_a], prices[symbol_b]
+            )
+            assert counts[i, j] == len(aligned_a)
+            assert correlation[i, j] == pytest.approx(aligned_a.corr(aligned_b), abs=1e-9)
+
+
 @pytest.mark.parametrize(("zscore", "expected"), ((None, None), (0.0, 0.0)))
 def test_analyze_pair_preserves_non_actionable_zscores(monkeypatch, zscore, expected):
     prices_a, prices_b = _cointegrated_prices()
@@ -177,6 +232,7 @@ def test_statistical_api_reports_missing_dependency(monkeypatch, module):
         ["--symbols", "AAA,BBB", "--min-correlation", "nan"],
         ["--symbols", "AAA,BBB", "--min-correlation", "1.1"],
         ["--symbols", "AAA,BBB", "--lookback-days", "249"],
+        ["--symbols", "AAA,BBB", "--workers", "0"],
         ["--symbols", "AAA,AAA"],
     ),
 )
@@ -0,0 +1,235 @@
+"""Local price cache and offline prices directory."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import analyze_spread
+import find_pairs
+import numpy as np
+import pandas as pd
+import pytest
+from price_cache import PriceCache, load_prices_dir
+
+DAY = 24 * 3600
+
+
+def _history(length=300, scale=1.0, start="2024-01-01"):
+    """FMP-shaped rows, most recent first like the API."""
+    dates = pd.bdate_range(start, periods=length)
+    closes = 100 + np.cumsum(np.random.default_rng(5).normal(0, 1, length))
+    rows = [
+        {"date": day.strftime("%Y-%m-%d"), "close": close + 1.0, "adjClose": close * scale}
+        for day, close in zip(dates, closes)
+    ]
+    return rows[::-1]
+
+
+class _Feed:
+    """Serves the ``from`` tail of a history and records every request."""
+
+    def __init__(self, historical):
+        self.historical = historical
+        self.calls = []
+
+    def __call__(self, params):
+        self.calls.append(params)
+        start = (params or {}).get("from", "")
+        return {"historical": [row for row in self.historical if row["date"] >= start]}
+
+
+def _clock(start):
+    now = [start]
+    return now, lambda: now[0]
+
+
+def test_second_read_before_the_close_makes_no_request(tmp_path):
+    now, clock = _clock(pd.Timestamp("2025-03-03 12:00", tz="America/New_York").timestamp())
+    cache = PriceCache(tmp_path, clock=clock)
+    feed = _Feed(_history())
+
+    first, status = cache.get("AAA", feed)
+    assert status == "fetched" and feed.calls == [None]
+
+    second, status = cache.get("AAA", feed)
+    assert status == "cached" and len(feed.calls) == 1
+    pd.testing.assert_series_equal(second, first, check_index_type=False, check_freq=False)
+    assert first.index.is_monotonic_increasing and first.name == "AAA"
+
+
+def test_file_written_before_the_eod_publish_is_stale_next_session(tmp_path):
+    def ny(stamp):
+        return pd.Timestamp(stamp, tz="America/New_York").timestamp()
+
+    now, clock = _clock(0.0)
+    cache = PriceCache(tmp_path, clock=clock)
+    cache.get("AAA", _Feed(_history()))
+    path = cache.path("AAA")
+
+    # Written at 16:05, before FMP published that day's bar.
+    os.utime(path, (ny("2025-03-03 16:05"), ny("2025-03-03 16:05")))
+    now[0] = ny("2025-03-03 17:00")
+    assert cache.read("AAA")[1] is True
+    now[0] = ny("2025-03-04 10:00")
+    assert cache.read("AAA")[1] is False
+
+    # Written after the publish time: fresh until the next session close.
+    os.utime(path, (ny("2025-03-03 18:30"), ny("2025-03-03 18:30")))
+    assert cache.read("AAA")[1] is True
+    now[0] = ny("2025-03-04 16:00")
+    assert cache.read("AAA")[1] is False
+
+
+def test_stale_cache_fetches_only_the_newest_bars(tmp_path):
+    full = _history(320)
+    now, clock = _clock(0.0)
+    cache = PriceCache(tmp_path, clock=clock)
+    cache.get("AAA", _Feed(full[20:]))
+
+    now[0] = cache.path("AAA").stat().st_mtime + 7 * DAY
+    feed = _Feed(full)
+    prices, status = cache.get("AAA", feed)
+
+    assert status == "topped_up"
+    assert feed.calls == [{"from": full[21]["date"]}]
+    assert prices.tolist() == [row["adjClose"] for row in full[::-1]]
+    assert cache.read("AAA")[0].tolist() == prices.tolist()
+
+
+def test_rebased_history_is_refetched_in_full(tmp_path):
+    now, clock = _clock(0.0)
+    cache = PriceCache(tmp_path, clock=clock)
+    cache.get("AAA", _Feed(_history(300)[10:]))
+
+    now[0] = cache.path("AAA").stat().st_mtime + 7 * DAY
+    rebased = _history(300, scale=0.5)
+    feed = _Feed(rebased)
+    prices, status = cache.get("AAA", feed)
+
+    assert status == "fetched"
+    assert feed.calls[-1] is None
+    assert prices.tolist() == [row["adjClose"] for row in rebased[::-1]]
+
+
+def test_failed_top_up_returns_the_cached_history(tmp_path):
+    now, clock = _clock(0.0)
+    cache = PriceCache(tmp_path, clock=clock)
+    first, _status = cache.get("AAA", _Feed(_history()))
+
+    now[0] = cache.path("AAA").stat().st_mtime + 7 * DAY
+    prices, status = cache.get("AAA", lambda _params: None)
+
+    assert status == "stale"
+    assert prices.tolist() == first.tolist()
+
+
+def test_prices_dir_reads_csv_files_and_cache_directories(tmp_path):
+    rows = _history(300)[::-1]
+    frame = pd.DataFrame(rows)
+    frame.to_csv(tmp_path / "aaa.csv", index=False)
+    frame[["date", "close"]].iloc[::-1].to_csv(tmp_path / "BBB.csv", index=False)
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    loaded = load_prices_dir(tmp_path, ["AAA", "BBB", "CCC"], lookback_days=250)
+
+    assert list(loaded) == ["AAA", "BBB"]
+    assert loaded["AAA"].tolist() == [row["adjClose"] for row in rows[-250:]]
+    assert loaded["BBB"].tolist() == [row["close"] for row in rows[-250:]]
+    assert loaded["BBB"].index.is_monotonic_increasing
+
+    cache = PriceCache(tmp_path / "cache")
+    cache.get("AAA", _Feed(_history(300)))
+    assert load_prices_dir(tmp_path / "cache", lookback_days=250)["AAA"].equals(loaded["AAA"])
+
+    with pytest.raises(ValueError, match="prices directory not found"):
+        load_prices_dir(tmp_path / "missing")
+
+
+def test_batch_fetch_skips_requests_and_pauses_for_cached_symbols(tmp_path, monkeypatch):
+    histories = {"AAA": _history(300), "BBB": _history(300, scale=2.0)}
+    requests_made = []
+    sleeps = []
+
+    def fake_fetch(symbol, _api_key, params=None):
+        requests_made.append(symbol)
+        return {"historical": histories[symbol]}
+
+    monkeypatch.setattr(find_pairs, "_fetch_raw_historical", fake_fetch)
+    monkeypatch.setattr(find_pairs.time, "sleep", sleeps.append)
+    cache = PriceCache(tmp_path)
+
+    first = find_pairs.fetch_price_data_batch(["AAA", "BBB"], "key", 260, cache)
+    assert requests_made == ["AAA", "BBB"] and len(sleeps) == 2
+
+    second = find_pairs.fetch_price_data_batch(["AAA", "BBB"], "key", 260, cache)
+    assert requests_made == ["AAA", "BBB"] and len(sleeps) == 2
+    assert {s: p.tolist() for s, p in second.items()} == {s: p.tolist() for s, p in first.items()}
+    assert len(first["AAA"]) == 260
+
+
+def test_find_pairs_prices_dir_runs_without_an_api_key(monkeypatch, tmp_path):
+    for scale, symbol in ((1.0, "AAA"), (1.5, "BBB")):
+        pd.DataFrame(_history(300, scale=scale)).to_csv(tmp_path / f"{symbol}.csv", index=False)
+    captured = {}
+
+    def fake_screen(price_data, *_args):
+        captured.update(price_data)
+        return []
+
+    monkeypatch.delenv("FMP_API_KEY", raising=False)
+    monkeypatch.setattr(find_pairs, "screen_all_pairs", fake_screen)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "find_pairs.py",
+            "--prices-dir",
+            str(tmp_path),
+            "--lookback-days",
+            "260",
+            "--output",
+            str(tmp_path / "out.json"),
+        ],
+    )
+
+    find_pairs.main()
+
+    assert sorted(captured) == ["AAA", "BBB"]
+    assert all(len(prices) == 260 for prices in captured.values())
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    (
+        ["--sector", "Technology", "--prices-dir", "prices"],
+        ["--symbols", "AAA,BBB", "--prices-dir", "prices", "--cache-dir", "cache"],
+    ),
+)
+def test_find_pairs_rejects_conflicting_price_sources(monkeypatch, arguments):
+    monkeypatch.setattr(sys, "argv", ["find_pairs.py", *arguments])
+
+    with pytest.raises(SystemExit, match="2"):
+        find_pairs.main()
+
+
+def test_analyze_spread_prices_dir_reports_missing_symbol(monkeypatch, tmp_path, capsys):
+    pd.DataFrame(_history(300)).to_csv(tmp_path / "AAA.csv", index=False)
+    monkeypatch.delenv("FMP_API_KEY", raising=False)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "analyze_spread.py",
+            "--stock-a",
+            "AAA",
+            "--stock-b",
+            "BBB",
+            "--prices-dir",
+            str(tmp_path),
+        ],
+    )
+
+    with pytest.raises(SystemExit, match="1"):
+        analyze_spread.main()
+    assert "No price file for BBB" in capsys.readouterr().out
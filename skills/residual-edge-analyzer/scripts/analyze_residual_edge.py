@@ -21,6 +21,11 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
+try:  # Optional: the NumPy backend accelerates the O(N*k^2) kernels.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on runtime environment
+    np = None
+
 SCHEMA_VERSION = "1.0"
 EPSILON = 1e-12
 ANNUALIZATION_FACTORS = {"daily": 252, "weekly": 52, "monthly": 12}
@@ -69,10 +74,40 @@ DECLARATION_VALUES = {
 }
 
 
+BACKENDS = ("auto", "numpy", "python")
+_active_backend = "numpy" if np is not None else "python"
+
+
 class AnalysisError(ValueError):
     """Raised when the input contract cannot support a valid analysis."""
 
 
+def set_backend(name: str) -> str:
+    """Select the linear-algebra backend and return the one now active.
+
+    ``auto`` uses NumPy when it is importable and the dependency-free Python
+    kernels otherwise. Both backends produce the same results up to
+    floating-point summation order.
+    """
+    global _active_backend
+    if name not in BACKENDS:
+        raise AnalysisError(f"Unknown backend {name!r}; choose one of {', '.join(BACKENDS)}.")
+    if name == "numpy" and np is None:
+        raise AnalysisError("The numpy backend was requested but NumPy is not installed.")
+    if name == "auto":
+        name = "numpy" if np is not None else "python"
+    _active_backend = name
+    return name
+
+
+def active_backend() -> str:
+    return _active_backend
+
+
+def _use_numpy() -> bool:
+    return _active_backend == "numpy"
+
+
 def _mean(values: list[float]) -> float:
     return sum(values) / len(values)
 
@@ -105,6 +140,8 @@ def _round_value(value: Any, digits: int = 10) -> Any:
 def _matmul(left: list[list[float]], right: list[list[float]]) -> list[list[float]]:
     if not left or not right:
         return []
+    if _use_numpy():
+        return (np.asarray(left, dtype=float) @ np.asarray(right, dtype=float)).tolist()
     return [
         [
             sum(left[row][k] * right[k][col] for k in range(len(right)))
@@ -119,12 +156,19 @@ def _transpose(matrix: list[list[float]]) -> list[list[float]]:
 
 
 def _solve_and_inverse(
-    matrix: list[list[float]], vector: list[float]
+    matrix: list[list[float]], vector: list[float], invert: bool = True
 ) -> tuple[list[float], list[list[float]], float]:
-    """Solve Ax=b and invert A with partial-pivot Gauss-Jordan elimination."""
+    """Solve Ax=b and invert A with partial-pivot Gauss-Jordan elimination.
+
+    With ``invert=False`` only the solution is eliminated and the returned
+    inverse is empty; pivoting and the rank check are unchanged.
+    """
     size = len(matrix)
+    identity_width = size if invert else 0
     augmented = [
-        list(matrix[row]) + [1.0 if row == col else 0.0 for col in range(size)] + [vector[row]]
+        list(matrix[row])
+        + [1.0 if row == col else 0.0 for col in range(identity_width)]
+        + [vector[row]]
         for row in range(size)
     ]
     pivots: list[float] = []
@@ -150,13 +194,16 @@ def _solve_and_inverse(
                 for current, pivot_value in zip(augmented[row], augmented[col])
             ]
 
-    inverse = [row[size : 2 * size] for row in augmented]
+    inverse = [row[size : size + identity_width] for row in augmented] if invert else []
     solution = [row[-1] for row in augmented]
     pivot_ratio = min(pivots) / max(pivots)
     return solution, inverse, pivot_ratio
 
 
 def _cross_product(design: list[list[float]]) -> list[list[float]]:
+    if _use_numpy():
+        matrix = np.asarray(design, dtype=float)
+        return (matrix.T @ matrix).tolist()
     width = len(design[0])
     return [
         [sum(row[left] * row[right] for row in design) for right in range(width)]
@@ -165,6 +212,8 @@ def _cross_product(design: list[list[float]]) -> list[list[float]]:
 
 
 def _cross_vector(design: list[list[float]], values: list[float]) -> list[float]:
+    if _use_numpy():
+        return (np.asarray(design, dtype=float).T @ np.asarray(values, dtype=float)).tolist()
     width = len(design[0])
     return [sum(row[col] * value for row, value in zip(design, values)) for col in range(width)]
 
@@ -187,6 +236,8 @@ def _newey_west_covariance(
     inverse_xtx: list[list[float]],
     lags: int,
 ) -> list[list[float]]:
+    if _use_numpy():
+        return _newey_west_covariance_numpy(design, residuals, inverse_xtx, lags)
     width = len(design[0])
     meat = [[0.0 for _ in range(width)] for _ in range(width)]
 
@@ -216,6 +267,24 @@ def _newey_west_covariance(
     return _matmul(_matmul(inverse_xtx, meat), inverse_xtx)
 
 
+def _newey_west_covariance_numpy(
+    design: list[list[float]],
+    residuals: list[float],
+    inverse_xtx: list[list[float]],
+    lags: int,
+) -> list[list[float]]:
+    """Vectorized ``_newey_west_covariance``: each lag is one (k x N) @ (N x k) product."""
+    scores = np.asarray(design, dtype=float) * np.asarray(residuals, dtype=float)[:, None]
+    meat = scores.T @ scores
+    for lag in range(1, lags + 1):
+        weight = 1.0 - lag / (lags + 1.0)
+        lagged = scores[lag:].T @ scores[:-lag]
+        meat += weight * (lagged + lagged.T)
+    meat *= len(design) / max(1, len(design) - len(design[0]))
+    inverse = np.asarray(inverse_xtx, dtype=float)
+    return (inverse @ meat @ inverse).tolist()
+
+
 def _coefficient_transform(means: list[float], scales: list[float]) -> list[list[float]]:
     width = len(means) + 1
     transform = [[0.0 for _ in range(width)] for _ in range(width)]
@@ -747,6 +816,214 @@ def _declaration_warnings(config: dict[str, Any]) -> list[dict[str, str]]:
     return warnings
 
 
+def _window_moments(
+    rows: list[list[float]], start: int, end: int
+) -> tuple[list[float], list[list[float]]]:
+    """Column sums and upper-triangular cross-products of ``rows[start:end]``."""
+    width = len(rows[0])
+    sums = [0.0] * width
+    cross = [[0.0] * width for _ in range(width)]
+    for row in rows[start:end]:
+        for left in range(width):
+            value = row[left]
+            sums[left] += value
+            cross_row = cross[left]
+            for right in range(left, width):
+                cross_row[right] += value * row[right]
+    return sums, cross
+
+
+def _fit_from_moments(
+    sums: list[float],
+    cross: list[list[float]],
+    observation_count: int,
+    shifts: list[float],
+) -> dict[str, float] | None:
+    """Window statistics of ``fit_regression`` from shifted moments.
+
+    Column 0 is the strategy, columns 1.. the factors, each shifted by
+    ``shifts``. Returns None wherever ``fit_regression`` would raise (zero
+    factor variance, rank deficiency, zero strategy variance) and for
+    near-perfect fits, whose residual variance is below what moment
+    differences can resolve; the caller refits those windows directly.
+    """
+    width = len(sums)
+    count = observation_count
+    comoment = [[0.0] * width for _ in range(width)]
+    for left in range(width):
+        for right in range(left, width):
+            value = cross[left][right] - sums[left] * sums[right] / count
+            comoment[left][right] = comoment[right][left] = value
+    scales = [math.sqrt(max(0.0, comoment[col][col]) / count) for col in range(1, width)]
+    if any(scale <= EPSILON for scale in scales):
+        return None
+
+    # Same standardized normal equations (and rank check) as fit_regression;
+    # the intercept row decouples because standardized factors sum to zero.
+    matrix = [
+        [
+            comoment[left][right] / (scales[left - 1] * scales[right - 1])
+            for right in range(1, width)
+        ]
+        for left in range(1, width)
+    ]
+    vector = [comoment[col][0] / scales[col - 1] for col in range(1, width)]
+    try:
+        standardized_slopes, _inverse, _pivot_ratio = _solve_and_inverse(
+            matrix, vector, invert=False
+        )
+    except AnalysisError:
+        return None
+
+    total = comoment[0][0]
+    if total <= EPSILON:
+        return None
+    loadings = [slope / scale for slope, scale in zip(standardized_slopes, scales)]
+    explained = sum(loading * comoment[col][0] for col, loading in enumerate(loadings, start=1))
+    residual_sum = total - explained
+    if residual_sum <= 1e-8 * total:
+        return None
+
+    means = [total_sum / count + shift for total_sum, shift in zip(sums, shifts)]
+    return {
+        "intercept": means[0] - sum(loading * mean for loading, mean in zip(loadings, means[1:])),
+        "r_squared": 1.0 - residual_sum / total,
+        "residual_volatility_periodic": math.sqrt(residual_sum / (count - 1)),
+    }
+
+
+def _rolling_window_fits(
+    strategy_returns: list[float],
+    factor_columns: list[list[float]],
+    factor_names: list[str],
+    rolling_window: int,
+):
+    """Yield ``(end, fit)`` for every rolling window; ``fit`` is None if it cannot be estimated.
+
+    Refitting each window from scratch costs O(W*k^2) per step. Instead the
+    window's sums and cross-products are updated by adding the newest row and
+    removing the oldest (O(k^2)), and only the k x k normal equations are
+    solved. Columns are shifted by their full-sample means and the moments
+    are recomputed exactly once per ``rolling_window`` steps, which keeps
+    cancellation and drift far below reporting precision. Windows the
+    moments cannot resolve fall back to ``fit_regression``.
+    """
+    if _use_numpy():
+        yield from _rolling_window_fits_numpy(
+            strategy_returns, factor_columns, factor_names, rolling_window
+        )
+        return
+
+    columns = [strategy_returns, *factor_columns]
+    shifts = [_mean(column) for column in columns]
+    rows = [[value - shift for value, shift in zip(values, shifts)] for values in zip(*columns)]
+    width = len(columns)
+    sums: list[float] = []
+    cross: list[list[float]] = []
+
+    for end in range(rolling_window, len(rows) + 1):
+        start = end - rolling_window
+        if start % rolling_window == 0:
+            sums, cross = _window_moments(rows, start, end)
+        else:
+            newest, oldest = rows[end - 1], rows[start - 1]
+            for left in range(width):
+                sums[left] += newest[left] - oldest[left]
+                cross_row = cross[left]
+                for right in range(left, width):
+                    cross_row[right] += newest[left] * newest[right] - oldest[left] * oldest[right]
+
+        fit = _fit_from_moments(sums, cross, rolling_window, shifts)
+        if fit is None:
+            fit = _refit_window(strategy_returns, factor_columns, factor_names, start, end)
+        yield end, fit
+
+
+def _refit_window(
+    strategy_returns: list[float],
+    factor_columns: list[list[float]],
+    factor_names: list[str],
+    start: int,
+    end: int,
+) -> dict[str, Any] | None:
+    try:
+        return fit_regression(
+            strategy_returns[start:end],
+            [column[start:end] for column in factor_columns],
+            factor_names,
+            calculate_vif=False,
+        )
+    except AnalysisError:
+        return None
+
+
+def _rolling_window_fits_numpy(
+    strategy_returns: list[float],
+    factor_columns: list[list[float]],
+    factor_names: list[str],
+    rolling_window: int,
+):
+    """Vectorized ``_rolling_window_fits``.
+
+    Every window's moments come from differences of cumulative sums of the
+    mean-shifted rows and their outer products, and all standardized normal
+    equations are solved in one batched call. Windows that are close to any
+    degenerate case (tiny column variance, factor correlation matrix with a
+    small eigenvalue, near-perfect fit) are refit with ``fit_regression`` so
+    failures resolve exactly as in the Python path.
+    """
+    raw = np.column_stack([strategy_returns, *factor_columns]).astype(float)
+    shifts = raw.mean(axis=0)
+    data = raw - shifts
+    count = rolling_window
+    width = data.shape[1]
+
+    sums = np.cumsum(np.vstack([np.zeros((1, width)), data]), axis=0)
+    sums = sums[count:] - sums[:-count]
+    outer = data[:, :, None] * data[:, None, :]
+    cross = np.cumsum(np.concatenate([np.zeros((1, width, width)), outer]), axis=0)
+    comoment = cross[count:] - cross[:-count] - sums[:, :, None] * sums[:, None, :] / count
+
+    variances = np.clip(np.diagonal(comoment, axis1=1, axis2=2), 0.0, None) / count
+    sample_variances = data.var(axis=0)
+    degenerate = (variances <= 1e-6 * sample_variances).any(axis=1) | (variances <= EPSILON**2).any(
+        axis=1
+    )
+    scales = np.sqrt(np.where(degenerate[:, None], 1.0, variances))[:, 1:]
+    factor_scales = scales[:, :, None] * scales[:, None, :]
+    correlation = comoment[:, 1:, 1:] / (factor_scales * count)
+    correlation[degenerate] = np.eye(width - 1)
+    degenerate |= np.linalg.eigvalsh(correlation)[:, 0] <= 1e-4
+
+    vector = comoment[:, 1:, 0] / scales
+    solve_matrix = np.where(degenerate[:, None, None], np.eye(width - 1), correlation * count)
+    standardized_slopes = np.linalg.solve(solve_matrix, vector[:, :, None])[:, :, 0]
+    loadings = standardized_slopes / scales
+    total = comoment[:, 0, 0]
+    residual_sum = total - (loadings * comoment[:, 1:, 0]).sum(axis=1)
+    degenerate |= residual_sum <= 1e-8 * np.abs(total)
+
+    means = sums / count + shifts
+    intercepts = means[:, 0] - (loadings * means[:, 1:]).sum(axis=1)
+    safe_total = np.where(degenerate, 1.0, total)
+    r_squared = 1.0 - residual_sum / safe_total
+    volatility = np.sqrt(np.clip(residual_sum, 0.0, None) / (count - 1))
+
+    for index, flagged in enumerate(degenerate.tolist()):
+        end = index + count
+        if flagged:
+            yield end, _refit_window(strategy_returns, factor_columns, factor_names, index, end)
+        else:
+            yield (
+                end,
+                {
+                    "intercept": float(intercepts[index]),
+                    "r_squared": float(r_squared[index]),
+                    "residual_volatility_periodic": float(volatility[index]),
+                },
+            )
+
+
 def _rolling_analysis(
     strategy_returns: list[float],
     factor_columns: list[list[float]],
@@ -780,19 +1057,14 @@ def _rolling_analysis(
             ),
         }
 
+    # Window fits only feed alpha, R^2 and residual volatility, never the HAC
+    # standard errors, so `hac_lags` does not affect rolling results.
     windows = []
     failed_windows = 0
-    for end in range(rolling_window, len(strategy_returns) + 1):
-        start = end - rolling_window
-        try:
-            fit = fit_regression(
-                strategy_returns[start:end],
-                [column[start:end] for column in factor_columns],
-                factor_names,
-                hac_lags=hac_lags,
-                calculate_vif=False,
-            )
-        except AnalysisError:
+    for end, fit in _rolling_window_fits(
+        strategy_returns, factor_columns, factor_names, rolling_window
+    ):
+        if fit is None:
             failed_windows += 1
             continue
         residual_volatility = fit["residual_volatility_periodic"]
@@ -1257,12 +1529,19 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--config", required=True, type=Path, help="JSON analysis specification.")
     parser.add_argument("--output-json", required=True, type=Path, help="JSON report path.")
     parser.add_argument("--output-markdown", type=Path, help="Optional Markdown summary path.")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help="Linear-algebra backend (default: auto, NumPy when installed).",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
     args = _parse_args(argv)
     try:
+        set_backend(args.backend)
         report = analyze(args.input, args.config)
         args.output_json.parent.mkdir(parents=True, exist_ok=True)
         args.output_json.write_text(
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Benchmark the NumPy and pure-Python backends of the residual edge analyzer.
+
+Each case writes a synthetic daily return series (strategy, N baseline
+factors, a regime label) plus a config whose primary model uses every factor
+and whose sensitivity model uses the first one, then runs ``analyze()``
+end to end under each backend. The script reports timings and exits
+non-zero if any report value differs beyond floating-point tolerance.
+
+Usage:
+    python3 benchmark_backends.py                      # 10 years, 1-8 factors
+    python3 benchmark_backends.py --years 20 --factors 4 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import analyze_residual_edge as rea  # noqa: E402
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+def synthetic_returns(
+    observation_count: int, factor_count: int, seed: int = 7
+) -> list[dict[str, Any]]:
+    """Daily rows with correlated factors, a small alpha and a two-state regime."""
+    rng = random.Random(seed)
+    rows = []
+    current = date(2010, 1, 4)
+    for _ in range(observation_count):
+        market = rng.gauss(0.0004, 0.011)
+        factors = [market] + [
+            0.3 * market + rng.gauss(0.0001, 0.007) for _ in range(factor_count - 1)
+        ]
+        strategy = 0.0003 + sum(
+            (0.9 if position == 0 else 0.2) * value for position, value in enumerate(factors)
+        )
+        row: dict[str, Any] = {
+            "date": current.isoformat(),
+            "strategy_return": strategy + rng.gauss(0.0, 0.004),
+        }
+        row.update({f"factor_{position}": value for position, value in enumerate(factors)})
+        row["volatility_regime"] = "high" if abs(market) > 0.011 else "low"
+        rows.append(row)
+        current += timedelta(days=3 if current.weekday() == 4 else 1)
+    return rows
+
+
+def benchmark_config(factor_count: int, rolling_window: int) -> dict[str, Any]:
+    factors = [f"factor_{position}" for position in range(factor_count)]
+    return {
+        "schema_version": rea.SCHEMA_VERSION,
+        "date_column": "date",
+        "strategy_column": "strategy_return",
+        "return_unit": "decimal",
+        "frequency": "daily",
+        "primary_model": {"name": "all_factors", "baseline_columns": factors},
+        "sensitivity_models": (
+            [{"name": "market_only", "baseline_columns": factors[:1]}] if factor_count > 1 else []
+        ),
+        "regime_columns": ["volatility_regime"],
+        "rolling_window": rolling_window,
+        "hac_lags": "auto",
+        "include_series": False,
+        "data_declarations": {
+            "baseline_selection": "predeclared",
+            "strategy_return_basis": "net",
+            "baseline_return_basis": "net",
+            "analysis_scope": "out_of_sample",
+            "universe_data": "not_applicable",
+        },
+    }
+
+
+def _differences(left: Any, right: Any, path: str = "") -> list[str]:
+    if isinstance(left, float) and isinstance(right, float):
+        if math.isclose(left, right, rel_tol=1e-9, abs_tol=1e-12):
+            return []
+        return [f"{path}: {left!r} != {right!r}"]
+    if isinstance(left, dict) and isinstance(right, dict):
+        if left.keys() != right.keys():
+            return [f"{path}: keys differ"]
+        return [
+            diff
+            for key in left
+            for diff in _differences(left[key], right[key], f"{path}.{key}" if path else key)
+        ]
+    if isinstance(left, list) and isinstance(right, list):
+        if len(left) != len(right):
+            return [f"{path}: lengths differ"]
+        return [
+            diff
+            for index, (a, b) in enumerate(zip(left, right))
+            for diff in _differences(a, b, f"{path}[{index}]")
+        ]
+    return [] if left == right else [f"{path}: {left!r} != {right!r}"]
+
+
+def run_case(
+    factor_count: int,
+    observation_count: int,
+    rolling_window: int = TRADING_DAYS_PER_YEAR,
+    seed: int = 7,
+) -> dict[str, Any]:
+    """Analyze one synthetic dataset under both backends; ``match`` is True when they agree."""
+    rows = synthetic_returns(observation_count, factor_count, seed)
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = Path(directory) / "returns.csv"
+        config_path = Path(directory) / "config.json"
+        with csv_path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        config_path.write_text(
+            json.dumps(benchmark_config(factor_count, rolling_window)), encoding="utf-8"
+        )
+
+        previous = rea.active_backend()
+        reports, timings = {}, {}
+        try:
+            for backend in ("python", "numpy"):
+                rea.set_backend(backend)
+                started = time.perf_counter()
+                reports[backend] = rea.analyze(csv_path, config_path)
+                timings[backend] = time.perf_counter() - started
+        finally:
+            rea.set_backend(previous)
+
+    mismatches = _differences(reports["python"], reports["numpy"])
+    return {
+        "factors": factor_count,
+        "observations": observation_count,
+        "python_s": round(timings["python"], 3),
+        "numpy_s": round(timings["numpy"], 3),
+        "speedup": round(timings["python"] / max(timings["numpy"], 1e-9), 1),
+        "match": not mismatches,
+        "mismatches": mismatches[:10],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=float, default=10, help="Synthetic history in years")
+    parser.add_argument(
+        "--factors",
+        type=int,
+        nargs="+",
+        default=list(range(1, 9)),
+        help="Factor counts to benchmark (default: 1-8)",
+    )
+    parser.add_argument("--rolling-window", type=int, default=TRADING_DAYS_PER_YEAR)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if rea.np is None:
+        print("error: NumPy is not installed; nothing to compare", file=sys.stderr)
+        return 2
+    observation_count = int(args.years * TRADING_DAYS_PER_YEAR)
+    results = [
+        run_case(factor_count, observation_count, args.rolling_window, args.seed)
+        for factor_count in args.factors
+    ]
+    print(json.dumps(results, indent=2))
+    return 0 if all(result["match"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
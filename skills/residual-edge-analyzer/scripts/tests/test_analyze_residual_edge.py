@@ -140,6 +140,114 @@ def test_exact_collinearity_is_rejected(analyzer_module):
         analyzer_module.fit_regression(strategy, [first, second], ["first", "second"])
 
 
+def _refit_windows(module, strategy, factors, names, window):
+    fits = []
+    for end in range(window, len(strategy) + 1):
+        start = end - window
+        try:
+            fits.append(
+                module.fit_regression(
+                    strategy[start:end],
+                    [column[start:end] for column in factors],
+                    names,
+                    calculate_vif=False,
+                )
+            )
+        except module.AnalysisError:
+            fits.append(None)
+    return fits
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, analyzer_module):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    previous = analyzer_module.active_backend()
+    analyzer_module.set_backend(request.param)
+    yield request.param
+    analyzer_module.set_backend(previous)
+
+
+def test_incremental_rolling_fits_match_full_refits(analyzer_module, backend):
+    rows = _series(260)
+    strategy = [row["strategy_return"] for row in rows]
+    names = ["market_return", "momentum_return", "equal_weight_return"]
+    factors = [[row[name] for row in rows] for name in names]
+
+    incremental = list(analyzer_module._rolling_window_fits(strategy, factors, names, 40))
+    expected = _refit_windows(analyzer_module, strategy, factors, names, 40)
+
+    assert [end for end, _fit in incremental] == list(range(40, 261))
+    for (_end, fit), reference in zip(incremental, expected):
+        for key in ("intercept", "r_squared", "residual_volatility_periodic"):
+            assert fit[key] == pytest.approx(reference[key], rel=1e-9, abs=1e-14)
+
+
+def test_incremental_rolling_fits_handle_degenerate_windows(analyzer_module, backend):
+    """Collinear and perfectly explained windows resolve exactly as full refits do."""
+    market = [((index % 13) - 6) * 0.001 for index in range(120)]
+    other = [((index * 5 % 17) - 8) * 0.0008 for index in range(120)]
+    # Duplicate factor for the first 50 rows, then independent.
+    second = [2 * value if index < 50 else other[index] for index, value in enumerate(market)]
+    # No noise for the last 50 rows: those windows are perfect fits.
+    strategy = [
+        0.001 + 1.2 * value + (other[index] * 0.3 if index < 70 else 0.0)
+        for index, value in enumerate(market)
+    ]
+    names = ["market", "second"]
+
+    incremental = list(analyzer_module._rolling_window_fits(strategy, [market, second], names, 30))
+    expected = _refit_windows(analyzer_module, strategy, [market, second], names, 30)
+
+    assert [fit is None for _end, fit in incremental] == [fit is None for fit in expected]
+    assert any(fit is None for fit in expected)
+    for (_end, fit), reference in zip(incremental, expected):
+        if reference is not None:
+            assert fit["r_squared"] == pytest.approx(reference["r_squared"], abs=1e-12)
+            assert fit["residual_volatility_periodic"] == pytest.approx(
+                reference["residual_volatility_periodic"], abs=1e-14
+            )
+
+
+def test_fit_regression_backends_agree(analyzer_module, backend):
+    rows = _series(200)
+    strategy = [row["strategy_return"] for row in rows]
+    names = ["market_return", "momentum_return", "equal_weight_return"]
+    factors = [[row[name] for row in rows] for name in names]
+
+    result = analyzer_module.fit_regression(strategy, factors, names, hac_lags=5)
+    analyzer_module.set_backend("python")
+    reference = analyzer_module.fit_regression(strategy, factors, names, hac_lags=5)
+
+    for got, expected in zip(result["coefficients"], reference["coefficients"]):
+        assert got["estimate"] == pytest.approx(expected["estimate"], rel=1e-10)
+        assert got["hac_standard_error"] == pytest.approx(expected["hac_standard_error"], rel=1e-9)
+    assert result["vif"] == pytest.approx(reference["vif"], rel=1e-9)
+
+
+def test_backend_selection_is_validated(analyzer_module):
+    previous = analyzer_module.active_backend()
+    try:
+        assert analyzer_module.set_backend("python") == "python"
+        expected = "numpy" if analyzer_module.np is not None else "python"
+        assert analyzer_module.set_backend("auto") == expected
+        with pytest.raises(analyzer_module.AnalysisError, match="Unknown backend"):
+            analyzer_module.set_backend("fortran")
+    finally:
+        analyzer_module.set_backend(previous)
+
+
+def test_benchmark_reports_matching_backends():
+    pytest.importorskip("numpy")
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    import benchmark_backends
+
+    result = benchmark_backends.run_case(3, 320, rolling_window=60)
+
+    assert result["match"] is True, result["mismatches"]
+    assert result["observations"] == 320
+
+
 def test_analyze_finds_residual_edge_and_regimes(tmp_path, analyzer_module):
     csv_path, config_path = _write_case(tmp_path, _series(140), _config())
 
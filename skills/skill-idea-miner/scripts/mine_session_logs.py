@@ -10,6 +10,8 @@ import os
 import re
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -147,6 +149,105 @@ def list_session_logs(
 # ── Session parsing ──
 
 
+def _iter_log_lines(log_path: Path, offset: int = 0, line_num: int = 0):
+    """Yield ``(entry, end_offset, line_num)`` for each line of a log from ``offset``.
+
+    The file is read one line at a time in binary mode, so memory stays flat
+    for large logs and ``end_offset`` is an exact byte position to resume
+    from. ``entry`` is None for blank, malformed and non-object lines. A last
+    line without a newline that does not parse is probably still being
+    written, so it is left unconsumed for the next read.
+    """
+    with log_path.open("rb") as f:
+        f.seek(offset)
+        for raw in f:
+            line_num += 1
+            line = raw.strip()
+            entry = None
+            if line:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    if not raw.endswith(b"\n"):
+                        return
+                    logger.warning("Malformed JSON at %s:%d, skipping.", log_path.name, line_num)
+            offset += len(raw)
+            yield (entry if isinstance(entry, dict) else None), offset, line_num
+
+
+def _extract_entry(entry: dict) -> tuple[str | None, dict | None, list[str], list[dict]]:
+    """Split one log entry into (timestamp, timed entry, user messages, tool uses)."""
+    ts = entry.get("timestamp") or None
+    user_messages: list[str] = []
+    tool_uses: list[dict] = []
+
+    msg = entry.get("message", {})
+    if not isinstance(msg, dict):
+        return ts, None, user_messages, tool_uses
+    entry_type = entry.get("type") or msg.get("type", "")
+
+    # Skip sidechain messages (before timed_entries to avoid contamination)
+    if entry.get("isSidechain") or msg.get("isSidechain"):
+        return ts, None, user_messages, tool_uses
+
+    # Track timed entries for unresolved request detection
+    timed = {"timestamp": ts, "type": entry_type} if ts and entry_type else None
+
+    # User messages
+    if entry_type == "user" or msg.get("role") == "user":
+        user_type = entry.get("userType") or msg.get("userType", "")
+        if user_type != "external":
+            return ts, timed, user_messages, tool_uses
+
+        content = msg.get("content", "")
+        if isinstance(content, str):
+            if content.strip():
+                user_messages.append(content.strip())
+        elif isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict) and block.get("type") == "text":
+                    text_val = block.get("text", "").strip()
+                    if text_val:
+                        user_messages.append(text_val)
+
+    # Assistant messages → extract tool_use blocks
+    elif entry_type == "assistant" or msg.get("role") == "assistant":
+        content = msg.get("content", [])
+        if isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict) and block.get("type") == "tool_use":
+                    tool_uses.append(
+                        {
+                            "name": block.get("name", ""),
+                            "input": block.get("input", {}),
+                        }
+                    )
+
+    # Tool results → store for error detection
+    elif entry_type == "tool_result":
+        content = msg.get("content", "")
+        is_error = entry.get("is_error") or msg.get("is_error", False)
+        if is_error:
+            raw = content if isinstance(content, str) else str(content)
+            tool_uses.append(
+                {
+                    "name": "__tool_result_error__",
+                    "output": raw[:MAX_ERROR_OUTPUT_LEN],
+                }
+            )
+        elif isinstance(content, str):
+            # Check for error patterns in tool output
+            if _has_error_pattern(content):
+                tool_uses.append(
+                    {
+                        "name": "__tool_result_error__",
+                        "output": content[:MAX_ERROR_OUTPUT_LEN],
+                    }
+                )
+
+    return ts, timed, user_messages, tool_uses
+
+
 def parse_session(log_path: Path) -> dict:
     """Parse a JSONL session log file.
 
@@ -161,95 +262,20 @@ def parse_session(log_path: Path) -> dict:
     timed_entries: list[dict] = []
 
     try:
-        text = log_path.read_text(encoding="utf-8")
+        for entry, _offset, _line_num in _iter_log_lines(log_path):
+            if entry is None:
+                continue
+            ts, timed, messages, tools = _extract_entry(entry)
+            if ts:
+                timestamps.append(ts)
+            if timed:
+                timed_entries.append(timed)
+            user_messages.extend(messages)
+            tool_uses.extend(tools)
     except OSError as e:
         logger.warning("Could not read %s: %s", log_path, e)
         return {"user_messages": [], "tool_uses": [], "timestamps": []}
 
-    for line_num, line in enumerate(text.splitlines(), 1):
-        line = line.strip()
-        if not line:
-            continue
-
-        try:
-            entry = json.loads(line)
-        except json.JSONDecodeError:
-            logger.warning("Malformed JSON at %s:%d, skipping.", log_path.name, line_num)
-            continue
-
-        if not isinstance(entry, dict):
-            continue
-
-        # Extract timestamp
-        ts = entry.get("timestamp")
-        if ts:
-            timestamps.append(ts)
-
-        msg = entry.get("message", {})
-        if not isinstance(msg, dict):
-            continue
-        entry_type = entry.get("type") or msg.get("type", "")
-
-        # Skip sidechain messages (before timed_entries to avoid contamination)
-        if entry.get("isSidechain") or msg.get("isSidechain"):
-            continue
-
-        # Track timed entries for unresolved request detection
-        if ts and entry_type:
-            timed_entries.append({"timestamp": ts, "type": entry_type})
-
-        # User messages
-        if entry_type == "user" or msg.get("role") == "user":
-            user_type = entry.get("userType") or msg.get("userType", "")
-            if user_type != "external":
-                continue
-
-            content = msg.get("content", "")
-            if isinstance(content, str):
-                if content.strip():
-                    user_messages.append(content.strip())
-            elif isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "text":
-                        text_val = block.get("text", "").strip()
-                        if text_val:
-                            user_messages.append(text_val)
-
-        # Assistant messages → extract tool_use blocks
-        elif entry_type == "assistant" or msg.get("role") == "assistant":
-            content = msg.get("content", [])
-            if isinstance(content, list):
-                for block in content:
-                    if isinstance(block, dict) and block.get("type") == "tool_use":
-                        tool_uses.append(
-                            {
-                                "name": block.get("name", ""),
-                                "input": block.get("input", {}),
-                            }
-                        )
-
-        # Tool results → store for error detection
-        elif entry_type == "tool_result":
-            content = msg.get("content", "")
-            is_error = entry.get("is_error") or msg.get("is_error", False)
-            if is_error:
-                raw = content if isinstance(content, str) else str(content)
-                tool_uses.append(
-                    {
-                        "name": "__tool_result_error__",
-                        "output": raw[:MAX_ERROR_OUTPUT_LEN],
-                    }
-                )
-            elif isinstance(content, str):
-                # Check for error patterns in tool output
-                if _has_error_pattern(content):
-                    tool_uses.append(
-                        {
-                            "name": "__tool_result_error__",
-                            "output": content[:MAX_ERROR_OUTPUT_LEN],
-                        }
-                    )
-
     return {
         "user_messages": user_messages,
         "tool_uses": tool_uses,
@@ -454,6 +480,233 @@ def _parse_timestamp(ts: str) -> datetime | None:
         return None
 
 
+# ── Incremental mining ──
+
+
+class SessionSignalState:
+    """Running signal totals for one session, resumable after more lines are appended.
+
+    Feeding a log's entries in order yields the same ``signals()`` as
+    ``detect_signals(parse_session(...))``, but only the state the detectors
+    need is kept (counts, capped samples, tool-sequence counts and the user
+    messages still waiting for a response), so it can be stored in a
+    checkpoint and extended with the next run's new lines.
+    """
+
+    def __init__(self, state: dict | None = None):
+        state = state or {}
+        self.user_message_count: int = state.get("user_message_count", 0)
+        self.tool_use_count: int = state.get("tool_use_count", 0)
+        self.user_samples: list[str] = state.get("user_samples", [])
+        self.skills: dict[str, int] = state.get("skills", {})
+        self.error_count: int = state.get("error_count", 0)
+        self.error_samples: list[str] = state.get("error_samples", [])
+        self.tool_name_count: int = state.get("tool_name_count", 0)
+        self.tool_tail: list[str] = state.get("tool_tail", [])
+        self.sequences: dict[str, int] = state.get("sequences", {})
+        self.automation_samples: list[str] = state.get("automation_samples", [])
+        self.unresolved_count: int = state.get("unresolved_count", 0)
+        self.pending_requests: list[dict] = state.get("pending_requests", [])
+
+    def add_entry(self, entry: dict) -> None:
+        _ts, timed, messages, tools = _extract_entry(entry)
+        if timed:
+            self.add_timed_entry(timed)
+        for msg in messages:
+            self.add_user_message(msg)
+        for tool in tools:
+            self.add_tool_use(tool)
+
+    def add_user_message(self, msg: str) -> None:
+        self.user_message_count += 1
+        if len(self.user_samples) < MAX_USER_MESSAGES_PER_SESSION:
+            self.user_samples.append(msg)
+        for sample in _detect_automation_requests([msg])["samples"]:
+            if sample not in self.automation_samples:
+                self.automation_samples.append(sample)
+
+    def add_tool_use(self, tool: dict) -> None:
+        self.tool_use_count += 1
+        for skill, count in _detect_skill_usage([tool])["skills"].items():
+            self.skills[skill] = self.skills.get(skill, 0) + count
+
+        name = tool.get("name", "")
+        if name == "__tool_result_error__":
+            self.error_count += 1
+            output = tool.get("output", "")
+            if output and len(self.error_samples) < 5:
+                self.error_samples.append(output[:200])
+        if name.startswith("__"):
+            return
+        self.tool_name_count += 1
+        window = [*self.tool_tail, name]
+        if len(window) == 3:
+            key = " -> ".join(window)
+            self.sequences[key] = self.sequences.get(key, 0) + 1
+        self.tool_tail = window[-2:]
+
+    def add_timed_entry(self, entry: dict) -> None:
+        # Same rule as _detect_unresolved_requests: each user message is judged
+        # by the first response entry with a parseable timestamp after it.
+        entry_type = entry.get("type")
+        if entry_type == "user":
+            if _parse_timestamp(entry.get("timestamp", "")) is not None:
+                self.pending_requests.append(
+                    {"timestamp": entry["timestamp"], "found_response": False}
+                )
+            return
+        if entry_type not in _RESPONSE_TYPES:
+            return
+        t2 = _parse_timestamp(entry.get("timestamp", ""))
+        for pending in self.pending_requests:
+            pending["found_response"] = True
+        if t2 is None:
+            return
+        for pending in self.pending_requests:
+            t1 = _parse_timestamp(pending["timestamp"])
+            if (t2 - t1).total_seconds() >= 300:
+                self.unresolved_count += 1
+        self.pending_requests = []
+
+    def signals(self) -> dict:
+        """Signals in the ``detect_signals`` shape for everything fed so far."""
+        if self.tool_name_count < 9:
+            patterns: list[str] = []
+        else:
+            patterns = [key for key, count in self.sequences.items() if count >= 3]
+        unresolved = self.unresolved_count + sum(
+            1 for pending in self.pending_requests if pending["found_response"]
+        )
+        return {
+            "skill_usage": {"count": len(self.skills), "skills": dict(self.skills)},
+            "errors": {"count": self.error_count, "samples": list(self.error_samples)},
+            "repetitive_patterns": {"count": len(patterns), "patterns": patterns},
+            "automation_requests": {
+                "count": len(self.automation_samples),
+                "samples": list(self.automation_samples),
+            },
+            "unresolved_requests": {"count": unresolved},
+        }
+
+    def to_state(self) -> dict:
+        return {
+            "user_message_count": self.user_message_count,
+            "tool_use_count": self.tool_use_count,
+            "user_samples": self.user_samples,
+            "skills": self.skills,
+            "error_count": self.error_count,
+            "error_samples": self.error_samples,
+            "tool_name_count": self.tool_name_count,
+            "tool_tail": self.tool_tail,
+            "sequences": self.sequences,
+            "automation_samples": self.automation_samples,
+            "unresolved_count": self.unresolved_count,
+            "pending_requests": self.pending_requests,
+        }
+
+
+def mine_session(log_path: Path, record: dict | None = None) -> dict:
+    """Parse the lines appended to ``log_path`` since ``record`` was taken.
+
+    ``record`` is a previous return value: ``{"inode", "offset", "lines",
+    "state"}``. It is discarded, and the log re-read from the start, when the
+    file now has a different inode or is shorter than the recorded offset
+    (replaced or truncated). Returns the updated record.
+    """
+    try:
+        stat = log_path.stat()
+    except OSError as e:
+        logger.warning("Could not stat %s: %s", log_path, e)
+        return {"inode": None, "offset": 0, "lines": 0, "state": SessionSignalState().to_state()}
+
+    if record and (record.get("inode") != stat.st_ino or record.get("offset", 0) > stat.st_size):
+        logger.info("%s was replaced or truncated; re-reading it.", log_path.name)
+        record = None
+    record = record or {}
+    state = SessionSignalState(record.get("state"))
+    offset = record.get("offset", 0)
+    lines = record.get("lines", 0)
+
+    try:
+        for entry, end_offset, line_num in _iter_log_lines(log_path, offset, lines):
+            if entry is not None:
+                state.add_entry(entry)
+            offset, lines = end_offset, line_num
+    except OSError as e:
+        logger.warning("Could not read %s: %s", log_path, e)
+
+    return {"inode": stat.st_ino, "offset": offset, "lines": lines, "state": state.to_state()}
+
+
+class SessionCheckpoint:
+    """Per-log read positions and signal state, persisted as JSON.
+
+    Records are keyed by absolute log path, so a re-run only parses the
+    bytes each session log gained since the previous run.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.sessions: dict[str, dict] = {}
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == self.VERSION:
+            self.sessions = payload.get("sessions", {})
+
+    @staticmethod
+    def _key(log_path: Path) -> str:
+        return os.path.abspath(log_path)
+
+    def get(self, log_path: Path) -> dict | None:
+        return self.sessions.get(self._key(log_path))
+
+    def put(self, log_path: Path, record: dict) -> None:
+        self.sessions[self._key(log_path)] = record
+
+    def save(self) -> None:
+        """Atomically write the checkpoint, dropping records whose logs are gone."""
+        sessions = {key: rec for key, rec in self.sessions.items() if os.path.exists(key)}
+        tmp_path = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": self.VERSION, "sessions": sessions}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write checkpoint %s: %s", self.path, e)
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
+def mine_sessions(
+    log_paths: list[Path],
+    checkpoint: SessionCheckpoint | None = None,
+    workers: int = 1,
+) -> list[SessionSignalState]:
+    """Mine each log (resuming from ``checkpoint`` when given), in input order.
+
+    With ``workers > 1`` logs are parsed in a process pool. The checkpoint is
+    updated in memory; the caller decides when to ``save()`` it.
+    """
+    prior = [checkpoint.get(path) if checkpoint else None for path in log_paths]
+    if workers > 1 and len(log_paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(log_paths))) as pool:
+            records = list(pool.map(mine_session, log_paths, prior))
+    else:
+        records = [mine_session(path, record) for path, record in zip(log_paths, prior)]
+
+    if checkpoint is not None:
+        for path, record in zip(log_paths, records):
+            if record["inode"] is not None:
+                checkpoint.put(path, record)
+    return [SessionSignalState(record["state"]) for record in records]
+
+
 # ── LLM abstraction ──
 
 
@@ -715,25 +968,27 @@ def run(args: argparse.Namespace) -> int:
     logger.info("Found %d session logs.", len(session_logs))
 
     # Parse and detect signals per session
+    checkpoint = SessionCheckpoint(args.checkpoint) if args.checkpoint else None
+    sessions = mine_sessions([log_path for _, log_path in session_logs], checkpoint, args.workers)
+    if checkpoint is not None:
+        checkpoint.save()
+
     all_signals: list[dict] = []
     all_user_samples: list[str] = []
 
-    for project_name, log_path in session_logs:
-        logger.info("Parsing %s (%s)", log_path.name, project_name)
-        parsed = parse_session(log_path)
-        signals = detect_signals(parsed)
+    for (project_name, log_path), session in zip(session_logs, sessions):
+        logger.info("Mined %s (%s)", log_path.name, project_name)
 
         # Collect user message samples
-        user_samples = parsed.get("user_messages", [])[:MAX_USER_MESSAGES_PER_SESSION]
-        all_user_samples.extend(user_samples)
+        all_user_samples.extend(session.user_samples[:MAX_USER_MESSAGES_PER_SESSION])
 
         all_signals.append(
             {
                 "project": project_name,
                 "session": log_path.name,
-                "signals": signals,
-                "user_message_count": len(parsed.get("user_messages", [])),
-                "tool_use_count": len(parsed.get("tool_uses", [])),
+                "signals": session.signals(),
+                "user_message_count": session.user_message_count,
+                "tool_use_count": session.tool_use_count,
             }
         )
 
@@ -841,6 +1096,18 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         action="store_true",
         help="Skip LLM abstraction step",
     )
+    parser.add_argument(
+        "--checkpoint",
+        default=None,
+        help="JSON file recording how far each session log has been mined; "
+        "later runs only parse lines appended since (default: off)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to parse session logs (default: 1)",
+    )
     return parser.parse_args(argv)
 
 
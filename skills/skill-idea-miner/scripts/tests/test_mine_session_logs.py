@@ -679,6 +679,8 @@ def test_run_converts_name_to_title_and_adds_id(mine_module, tmp_path: Path):
         project=None,
         lookback_days=7,
         dry_run=False,
+        checkpoint=None,
+        workers=1,
     )
 
     # Patch dependencies to isolate the enrichment logic
@@ -691,13 +693,10 @@ def test_run_converts_name_to_title_and_adds_id(mine_module, tmp_path: Path):
         ),
         patch.object(
             mine_module,
-            "parse_session",
-            return_value={
-                "user_messages": ["hello"],
-                "tool_uses": [],
-                "timestamps": [],
-                "timed_entries": [],
-            },
+            "mine_sessions",
+            return_value=[
+                mine_module.SessionSignalState({"user_message_count": 1, "user_samples": ["hello"]})
+            ],
         ),
         patch.object(mine_module, "abstract_with_llm", return_value=fake_candidates),
     ):
@@ -880,6 +879,8 @@ def test_run_normalizes_null_title_from_name_then_filters(mine_module, tmp_path:
         project=None,
         lookback_days=7,
         dry_run=False,
+        checkpoint=None,
+        workers=1,
     )
 
     with (
@@ -891,13 +892,10 @@ def test_run_normalizes_null_title_from_name_then_filters(mine_module, tmp_path:
         ),
         patch.object(
             mine_module,
-            "parse_session",
-            return_value={
-                "user_messages": ["hello"],
-                "tool_uses": [],
-                "timestamps": [],
-                "timed_entries": [],
-            },
+            "mine_sessions",
+            return_value=[
+                mine_module.SessionSignalState({"user_message_count": 1, "user_samples": ["hello"]})
+            ],
         ),
         patch.object(mine_module, "abstract_with_llm", return_value=fake_candidates),
     ):
@@ -912,3 +910,163 @@ def test_run_normalizes_null_title_from_name_then_filters(mine_module, tmp_path:
     # codebase-navigator should be filtered out after name->title normalization
     assert len(candidates) == 1
     assert candidates[0]["title"] == "earnings-tool"
+
+
+# ── Incremental mining ──
+
+
+def _session_lines() -> list[str]:
+    """A session exercising every signal, including an unparseable response timestamp."""
+    entries = []
+    minute = 0
+
+    def stamp() -> str:
+        return f"2026-02-28T{10 + minute // 60:02d}:{minute % 60:02d}:00Z"
+
+    for round_num in range(4):
+        entries.append(
+            {
+                "type": "user",
+                "message": {"type": "user", "content": f"Please automate report {round_num}"},
+                "userType": "external",
+                "timestamp": stamp(),
+            }
+        )
+        minute += 7 if round_num % 2 else 1
+        entries.append(
+            {
+                "type": "assistant",
+                "message": {
+                    "content": [
+                        {"type": "tool_use", "name": "Read", "input": {"file_path": "a.md"}},
+                        {
+                            "type": "tool_use",
+                            "name": "Bash",
+                            "input": {"command": "python3 skills/vcp-screener/scripts/x.py"},
+                        },
+                        {"type": "tool_use", "name": "Edit", "input": {}},
+                    ]
+                },
+                "timestamp": stamp(),
+            }
+        )
+        entries.append(
+            {
+                "type": "tool_result",
+                "message": {"content": f"Error: failed run {round_num}"},
+                "timestamp": stamp(),
+            }
+        )
+        minute += 1
+    entries.append(
+        {
+            "type": "user",
+            "message": {"content": "create one more"},
+            "userType": "external",
+            "timestamp": stamp(),
+        }
+    )
+    entries.append({"type": "assistant", "message": {"content": []}, "timestamp": "not-a-time"})
+    entries.append({"type": "user", "isSidechain": True, "message": {}, "timestamp": stamp()})
+    return [json.dumps(entry) for entry in entries] + ["{broken json"]
+
+
+def _summary(state) -> dict:
+    return {
+        "signals": state.signals(),
+        "user_message_count": state.user_message_count,
+        "tool_use_count": state.tool_use_count,
+        "user_samples": state.user_samples,
+    }
+
+
+def test_incremental_mining_matches_full_parse(mine_module, tmp_path: Path):
+    """Mining a growing log chunk by chunk gives the same signals as one full parse."""
+    lines = _session_lines()
+    log = tmp_path / "session.jsonl"
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    parsed = mine_module.parse_session(log)
+    expected = {
+        "signals": mine_module.detect_signals(parsed),
+        "user_message_count": len(parsed["user_messages"]),
+        "tool_use_count": len(parsed["tool_uses"]),
+        "user_samples": parsed["user_messages"][: mine_module.MAX_USER_MESSAGES_PER_SESSION],
+    }
+    assert expected["signals"]["repetitive_patterns"]["count"] > 0
+    assert expected["signals"]["unresolved_requests"]["count"] > 0
+
+    for split in range(1, len(lines)):
+        log.write_text("\n".join(lines[:split]) + "\n", encoding="utf-8")
+        record = mine_module.mine_session(log)
+        record = json.loads(json.dumps(record))  # as stored in the checkpoint
+        with log.open("a", encoding="utf-8") as f:
+            f.write("\n".join(lines[split:]) + "\n")
+        record = mine_module.mine_session(log, record)
+
+        assert record["offset"] == log.stat().st_size
+        assert _summary(mine_module.SessionSignalState(record["state"])) == expected
+
+
+def test_incremental_mining_leaves_partial_last_line(mine_module, tmp_path: Path):
+    """A half-written last line is picked up once the writer finishes it."""
+    line = json.dumps(
+        {
+            "type": "user",
+            "message": {"content": "Analyze AAPL"},
+            "userType": "external",
+            "timestamp": "2026-02-28T10:00:00Z",
+        }
+    )
+    log = tmp_path / "session.jsonl"
+    log.write_text(line + "\n" + line[:20], encoding="utf-8")
+
+    record = mine_module.mine_session(log)
+    assert record["offset"] == len(line) + 1
+    assert record["state"]["user_message_count"] == 1
+
+    with log.open("a", encoding="utf-8") as f:
+        f.write(line[20:] + "\n")
+    record = mine_module.mine_session(log, record)
+    assert record["offset"] == log.stat().st_size
+    assert record["state"]["user_message_count"] == 2
+
+
+def test_incremental_mining_rereads_replaced_log(mine_module, tmp_path: Path):
+    """A truncated or replaced log is mined from the start again."""
+    lines = _session_lines()
+    log = tmp_path / "session.jsonl"
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    record = mine_module.mine_session(log)
+
+    log.write_text(lines[0] + "\n", encoding="utf-8")
+    assert mine_module.mine_session(log, record)["state"]["user_message_count"] == 1
+
+    stale = {**record, "inode": record["inode"] + 1, "offset": 0}
+    log.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    rerun = mine_module.mine_session(log, stale)
+    assert rerun["state"] == record["state"]
+
+
+def test_mine_sessions_checkpoint_and_workers(mine_module, tmp_path: Path):
+    """The checkpoint round-trips and a process pool gives the inline results."""
+    lines = _session_lines()
+    logs = []
+    for name, count in (("a", 5), ("b", len(lines)), ("c", 9)):
+        log = tmp_path / f"{name}.jsonl"
+        log.write_text("\n".join(lines[:count]) + "\n", encoding="utf-8")
+        logs.append(log)
+
+    checkpoint = mine_module.SessionCheckpoint(tmp_path / "state" / "checkpoint.json")
+    first = mine_module.mine_sessions(logs, checkpoint)
+    checkpoint.save()
+    pooled = mine_module.mine_sessions(logs, workers=2)
+    assert [_summary(s) for s in pooled] == [_summary(s) for s in first]
+
+    reloaded = mine_module.SessionCheckpoint(tmp_path / "state" / "checkpoint.json")
+    assert reloaded.get(logs[1])["offset"] == logs[1].stat().st_size
+    again = mine_module.mine_sessions(logs, reloaded)
+    assert [_summary(s) for s in again] == [_summary(s) for s in first]
+
+    logs[2].unlink()
+    reloaded.save()
+    assert mine_module.SessionCheckpoint(reloaded.path).get(logs[2]) is None
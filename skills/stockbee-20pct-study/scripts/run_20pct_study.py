@@ -17,6 +17,8 @@ import os
 import statistics
 import sys
 import time
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
@@ -54,6 +56,80 @@ class Bar:
     volume: int = 0
 
 
+@dataclass(frozen=True)
+class PriceSeries:
+    """Columnar daily OHLCV for one symbol, sorted oldest -> newest.
+
+    Dates are stored as ``date.toordinal()`` values so as-of and event-date
+    lookups are binary searches.  A typed array per column holds a bar in
+    ~44 bytes instead of a ``Bar`` object plus its date string.  Indexing
+    returns a ``Bar`` for code that wants a single row.
+    """
+
+    ordinals: array
+    open: array
+    high: array
+    low: array
+    close: array
+    volume: array
+
+    @classmethod
+    def from_bars(cls, bars: Iterable[Bar]) -> PriceSeries:
+        series = cls(array("i"), array("d"), array("d"), array("d"), array("d"), array("q"))
+        for bar in bars:
+            series.ordinals.append(parse_date(bar.date).toordinal())
+            series.open.append(bar.open)
+            series.high.append(bar.high)
+            series.low.append(bar.low)
+            series.close.append(bar.close)
+            series.volume.append(int(bar.volume))
+        return series
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __getitem__(self, idx: int) -> Bar:
+        return Bar(
+            self.date(idx),
+            self.open[idx],
+            self.high[idx],
+            self.low[idx],
+            self.close[idx],
+            self.volume[idx],
+        )
+
+    def date(self, idx: int) -> str:
+        return date.fromordinal(self.ordinals[idx]).isoformat()
+
+    def as_of_index(self, as_of: str | None) -> int | None:
+        """Index of the last bar on or before *as_of* (the last bar when None)."""
+        if not self.ordinals:
+            return None
+        if as_of is None:
+            return len(self) - 1
+        idx = bisect_right(self.ordinals, parse_date(as_of).toordinal()) - 1
+        return idx if idx >= 0 else None
+
+    def index_of(self, iso_date: str) -> int | None:
+        """Index of the bar dated exactly *iso_date* (``YYYY-MM-DD``), if any."""
+        try:
+            target = parse_date(iso_date)
+        except ValueError:
+            return None
+        if target.isoformat() != iso_date:
+            return None
+        ordinal = target.toordinal()
+        idx = bisect_left(self.ordinals, ordinal)
+        if idx < len(self.ordinals) and self.ordinals[idx] == ordinal:
+            return idx
+        return None
+
+
+def as_price_series(bars: PriceSeries | Iterable[Bar]) -> PriceSeries:
+    """Return *bars* as a PriceSeries (already-columnar input is returned as-is)."""
+    return bars if isinstance(bars, PriceSeries) else PriceSeries.from_bars(bars)
+
+
 class ApiCallBudgetExceeded(Exception):
     """Raised when max_api_calls is exhausted."""
 
@@ -284,17 +360,17 @@ def normalize_price_bars(payload: Any, symbol: str | None = None) -> list[Bar]:
     return [dedup[d] for d in sorted(dedup)]
 
 
-def load_prices_json(path: PathLike) -> dict[str, list[Bar]]:
+def load_prices_json(path: PathLike) -> dict[str, PriceSeries]:
     with open(path, encoding="utf-8") as handle:
         payload = json.load(handle)
 
-    prices: dict[str, list[Bar]] = {}
+    prices: dict[str, PriceSeries] = {}
 
     def add_symbol(symbol: str, rows: Any) -> None:
         normalized = normalize_symbol(symbol)
         bars = normalize_price_bars(rows, symbol=normalized)
         if bars:
-            prices[normalized] = bars
+            prices[normalized] = PriceSeries.from_bars(bars)
 
     if isinstance(payload, dict):
         container = payload.get("prices") or payload.get("data") or payload.get("ohlcv")
@@ -314,7 +390,7 @@ def load_prices_json(path: PathLike) -> dict[str, list[Bar]]:
     return {symbol: bars for symbol, bars in prices.items() if bars}
 
 
-def rows_to_prices_by_symbol(rows: list[Any]) -> dict[str, list[Bar]]:
+def rows_to_prices_by_symbol(rows: list[Any]) -> dict[str, PriceSeries]:
     grouped: dict[str, list[dict[str, Any]]] = defaultdict(list)
     for row in rows:
         if not isinstance(row, dict):
@@ -322,23 +398,23 @@ def rows_to_prices_by_symbol(rows: list[Any]) -> dict[str, list[Bar]]:
         symbol = normalize_symbol(row.get("symbol") or row.get("ticker"))
         if symbol:
             grouped[symbol].append(row)
-    result: dict[str, list[Bar]] = {}
+    result: dict[str, PriceSeries] = {}
     for symbol, items in grouped.items():
         bars = normalize_price_bars(items, symbol=symbol)
         if bars:
-            result[symbol] = bars
+            result[symbol] = PriceSeries.from_bars(bars)
     return result
 
 
 def fetch_prices_from_fmp(
     args: argparse.Namespace, days: int = 320
-) -> tuple[dict[str, list[Bar]], dict[str, Any]]:
+) -> tuple[dict[str, PriceSeries], dict[str, Any]]:
     client = FMPClient(api_key=args.api_key, max_api_calls=args.max_api_calls)
     if args.fmp_universe:
         symbols = client.get_stock_list(limit=args.max_symbols)
     else:
         symbols = [normalize_symbol(symbol) for symbol in (args.symbols or [])]
-    prices: dict[str, list[Bar]] = {}
+    prices: dict[str, PriceSeries] = {}
     for symbol in symbols:
         try:
             bars = normalize_price_bars(
@@ -350,7 +426,7 @@ def fetch_prices_from_fmp(
             print(f"WARN: failed to fetch {symbol}: {exc}", file=sys.stderr)
             continue
         if bars:
-            prices[symbol] = bars
+            prices[symbol] = PriceSeries.from_bars(bars)
     return prices, client.stats()
 
 
@@ -407,7 +483,9 @@ def deep_merge(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
-def find_as_of_index(bars: list[Bar], as_of: str | None) -> int | None:
+def find_as_of_index(bars: PriceSeries | list[Bar], as_of: str | None) -> int | None:
+    if isinstance(bars, PriceSeries):
+        return bars.as_of_index(as_of)
     if not bars:
         return None
     if as_of is None:
@@ -477,8 +555,196 @@ def determine_episode_id(
     return f"{symbol}:{event_date}:{direction}"
 
 
+def screen_twenty_pct_move(
+    bars: PriceSeries,
+    idx: int | None,
+    lookback_days: int,
+    min_abs_return_pct: float,
+    min_price: float,
+    min_dollar_volume: float,
+    include_down_movers: bool,
+) -> tuple[str | None, str | None]:
+    """Return ``(direction, None)`` if bar *idx* is a qualifying mover, else ``(None, reason)``.
+
+    *reason* is the ``skipped`` counter key used in detection metadata.
+    """
+    if idx is None:
+        return None, "no_as_of_bar"
+    if idx < lookback_days:
+        return None, "insufficient_lookback"
+    close = bars.close[idx]
+    return_pct = pct_change(close, bars.close[idx - lookback_days])
+    direction: str | None = None
+    if return_pct + PCT_EPSILON >= min_abs_return_pct:
+        direction = "UP"
+    elif include_down_movers and return_pct - PCT_EPSILON <= -min_abs_return_pct:
+        direction = "DOWN"
+    if direction is None:
+        return None, "threshold_not_met"
+    if close < min_price:
+        return None, "below_min_price"
+    if close * bars.volume[idx] < min_dollar_volume:
+        return None, "below_min_dollar_volume"
+    return direction, None
+
+
+def build_event_record(
+    symbol: str,
+    bars: PriceSeries,
+    idx: int,
+    direction: str,
+    as_of: str | None,
+    lookback_days: int,
+    min_price: float,
+    min_dollar_volume: float,
+    prior_records: list[dict[str, Any]],
+    episode_gap_days: int,
+    extra_quality_flags: list[str],
+) -> dict[str, Any]:
+    """Build the study record for a mover found by screen_twenty_pct_move().
+
+    *prior_records* are the records episode ids are resolved against; only
+    entries for *symbol* matter, so callers may pass a per-symbol subset.
+    """
+    current_bar = bars[idx]
+    lookback_bar = bars[idx - lookback_days]
+    previous_bar = bars[idx - 1] if idx > 0 else lookback_bar
+    return_pct = pct_change(current_bar.close, lookback_bar.close)
+    dollar_volume = current_bar.close * current_bar.volume
+
+    start_20, start_252 = max(0, idx - 20), max(0, idx - 252)
+    volumes_20 = bars.volume[start_20:idx]
+    avg_volume_20 = average(volumes_20)
+    avg_dollar_volume_20 = average(
+        [close * volume for close, volume in zip(bars.close[start_20:idx], volumes_20)]
+    )
+    volume_ratio_20 = current_bar.volume / avg_volume_20 if avg_volume_20 else 0.0
+    high_52w = max(bars.high[start_252 : idx + 1], default=current_bar.high)
+    low_52w = min(bars.low[start_252 : idx + 1], default=current_bar.low)
+    distance_to_52w_high_pct = pct_change(current_bar.close, high_52w)
+    distance_to_52w_low_pct = pct_change(current_bar.close, low_52w)
+    prior_20d_return_pct = (
+        pct_change(previous_bar.close, bars.close[max(0, idx - 21)]) if idx >= 21 else 0.0
+    )
+    prior_50d_return_pct = (
+        pct_change(previous_bar.close, bars.close[max(0, idx - 51)]) if idx >= 51 else 0.0
+    )
+    close_loc = close_location_pct(current_bar)
+    range_pct = safe_pct(current_bar.high - current_bar.low, previous_bar.close)
+    gap_pct = pct_change(current_bar.open, previous_bar.close)
+    pattern_label = classify_chart_pattern(
+        direction=direction,
+        close_location=close_loc,
+        gap_pct=gap_pct,
+        range_pct=range_pct,
+        return_pct=return_pct,
+        distance_to_52w_high_pct=distance_to_52w_high_pct,
+        volume_ratio_20=volume_ratio_20,
+        prior_20d_return_pct=prior_20d_return_pct,
+    )
+    close_quality = classify_close_quality(close_loc, direction)
+    extension_risk = classify_extension_risk(abs(return_pct), abs(prior_20d_return_pct), close_loc)
+    data_quality_flags = data_quality_flags_for_event(
+        bars=bars,
+        idx=idx,
+        current_bar=current_bar,
+        return_pct=return_pct,
+        avg_dollar_volume_20=avg_dollar_volume_20,
+    )
+    data_quality_flags = list(dict.fromkeys([*data_quality_flags, *extra_quality_flags]))
+    catalyst = default_catalyst(direction)
+    scores = score_event(
+        direction=direction,
+        catalyst=catalyst,
+        dollar_volume=dollar_volume,
+        volume_ratio_20=volume_ratio_20,
+        close_location=close_loc,
+        distance_to_52w_high_pct=distance_to_52w_high_pct,
+        pattern_label=pattern_label,
+        extension_risk=extension_risk,
+        data_quality_flags=data_quality_flags,
+    )
+    event_date = current_bar.date
+    episode_id = determine_episode_id(
+        symbol, event_date, direction, prior_records, episode_gap_days
+    )
+    record_id = f"{symbol}:{event_date}:{direction}:{lookback_days}D"
+    event = {
+        "schema_version": SCHEMA_VERSION,
+        "source_skill": SKILL_NAME,
+        "record_id": record_id,
+        "episode_id": episode_id,
+        "symbol": symbol,
+        "event_date": event_date,
+        "direction": direction,
+        "window_days": lookback_days,
+        "event_day_index": episode_day_index(
+            episode_id, symbol, direction, current_bar.date, prior_records
+        ),
+        "price_snapshot": {
+            "open": round(current_bar.open, 4),
+            "high": round(current_bar.high, 4),
+            "low": round(current_bar.low, 4),
+            "close": round(current_bar.close, 4),
+            "previous_close": round(previous_bar.close, 4),
+            "lookback_close": round(lookback_bar.close, 4),
+            "return_pct": round(return_pct, 4),
+            "day_return_pct": round(pct_change(current_bar.close, previous_bar.close), 4),
+            "gap_pct": round(gap_pct, 4),
+            "range_pct": round(range_pct, 4),
+            "close_location_pct": round(close_loc, 2),
+        },
+        "liquidity": {
+            "volume": current_bar.volume,
+            "avg_volume_20d": round(avg_volume_20, 2),
+            "volume_ratio_20d": round(volume_ratio_20, 3),
+            "dollar_volume": round(dollar_volume, 2),
+            "avg_dollar_volume_20d": round(avg_dollar_volume_20, 2),
+            "price_pass": current_bar.close >= min_price,
+            "liquidity_pass": dollar_volume >= min_dollar_volume,
+        },
+        "technical_context": {
+            "distance_to_52w_high_pct": round(distance_to_52w_high_pct, 4),
+            "distance_to_52w_low_pct": round(distance_to_52w_low_pct, 4),
+            "prior_20d_return_pct": round(prior_20d_return_pct, 4),
+            "prior_50d_return_pct": round(prior_50d_return_pct, 4),
+            "base_length_days": estimate_base_length(bars, idx),
+            "base_depth_pct": round(estimate_base_depth_pct(bars, idx), 4),
+            "pattern_label": pattern_label,
+            "close_quality": close_quality,
+            "extension_risk": extension_risk,
+        },
+        "catalyst": catalyst,
+        "theme_context": {
+            "theme_label": "UNKNOWN",
+            "theme_cluster_count": 0,
+            "sector": None,
+            "industry": None,
+        },
+        "scores": scores,
+        "labels": labels_for_event(direction, pattern_label, close_quality, extension_risk, scores),
+        "handoffs": handoff_flags(direction, catalyst["label"], pattern_label, scores),
+        "outcomes": {f"{h}d": None for h in DEFAULT_HORIZONS},
+        "data_quality": {
+            "flags": data_quality_flags,
+            "data_quality_score": scores["data_quality_score"],
+        },
+        "human_review": {
+            "reviewed": False,
+            "label_override": None,
+            "notes": None,
+        },
+        "raw": {
+            "as_of_requested": as_of,
+            "as_of_effective": event_date,
+            "lookback_bar_date": lookback_bar.date,
+        },
+    }
+    return event
+
+
 def detect_twenty_pct_events(
-    prices: dict[str, list[Bar]],
+    prices: dict[str, PriceSeries | list[Bar]],
     as_of: str | None,
     lookback_days: int,
     min_abs_return_pct: float,
@@ -495,166 +761,36 @@ def detect_twenty_pct_events(
     skipped = defaultdict(int)
     effective_dates: list[str] = []
 
-    for symbol, bars in sorted(prices.items()):
-        idx = find_as_of_index(bars, as_of)
-        if idx is None:
-            skipped["no_as_of_bar"] += 1
-            continue
-        if idx < lookback_days:
-            skipped["insufficient_lookback"] += 1
-            continue
-        current_bar = bars[idx]
-        lookback_bar = bars[idx - lookback_days]
-        previous_bar = bars[idx - 1] if idx > 0 else lookback_bar
-        return_pct = pct_change(current_bar.close, lookback_bar.close)
-        direction: str | None = None
-        if return_pct + PCT_EPSILON >= min_abs_return_pct:
-            direction = "UP"
-        elif include_down_movers and return_pct - PCT_EPSILON <= -min_abs_return_pct:
-            direction = "DOWN"
+    for symbol, raw_bars in sorted(prices.items()):
+        bars = as_price_series(raw_bars)
+        idx = bars.as_of_index(as_of)
+        direction, reason = screen_twenty_pct_move(
+            bars,
+            idx,
+            lookback_days=lookback_days,
+            min_abs_return_pct=min_abs_return_pct,
+            min_price=min_price,
+            min_dollar_volume=min_dollar_volume,
+            include_down_movers=include_down_movers,
+        )
         if direction is None:
-            skipped["threshold_not_met"] += 1
-            continue
-        if current_bar.close < min_price:
-            skipped["below_min_price"] += 1
-            continue
-        dollar_volume = current_bar.close * current_bar.volume
-        if dollar_volume < min_dollar_volume:
-            skipped["below_min_dollar_volume"] += 1
+            skipped[reason] += 1
             continue
-
-        history_20 = bars[max(0, idx - 20) : idx]
-        history_252 = bars[max(0, idx - 252) : idx + 1]
-        avg_volume_20 = average([bar.volume for bar in history_20])
-        avg_dollar_volume_20 = average([bar.close * bar.volume for bar in history_20])
-        volume_ratio_20 = current_bar.volume / avg_volume_20 if avg_volume_20 else 0.0
-        high_52w = max([bar.high for bar in history_252], default=current_bar.high)
-        low_52w = min([bar.low for bar in history_252], default=current_bar.low)
-        distance_to_52w_high_pct = pct_change(current_bar.close, high_52w)
-        distance_to_52w_low_pct = pct_change(current_bar.close, low_52w)
-        prior_20d_return_pct = (
-            pct_change(previous_bar.close, bars[max(0, idx - 21)].close) if idx >= 21 else 0.0
-        )
-        prior_50d_return_pct = (
-            pct_change(previous_bar.close, bars[max(0, idx - 51)].close) if idx >= 51 else 0.0
-        )
-        close_loc = close_location_pct(current_bar)
-        range_pct = safe_pct(current_bar.high - current_bar.low, previous_bar.close)
-        gap_pct = pct_change(current_bar.open, previous_bar.close)
-        pattern_label = classify_chart_pattern(
-            direction=direction,
-            close_location=close_loc,
-            gap_pct=gap_pct,
-            range_pct=range_pct,
-            return_pct=return_pct,
-            distance_to_52w_high_pct=distance_to_52w_high_pct,
-            volume_ratio_20=volume_ratio_20,
-            prior_20d_return_pct=prior_20d_return_pct,
-        )
-        close_quality = classify_close_quality(close_loc, direction)
-        extension_risk = classify_extension_risk(
-            abs(return_pct), abs(prior_20d_return_pct), close_loc
-        )
-        data_quality_flags = data_quality_flags_for_event(
+        event = build_event_record(
+            symbol=symbol,
             bars=bars,
             idx=idx,
-            current_bar=current_bar,
-            return_pct=return_pct,
-            avg_dollar_volume_20=avg_dollar_volume_20,
-        )
-        data_quality_flags = list(dict.fromkeys([*data_quality_flags, *extra_quality_flags]))
-        catalyst = default_catalyst(direction)
-        scores = score_event(
             direction=direction,
-            catalyst=catalyst,
-            dollar_volume=dollar_volume,
-            volume_ratio_20=volume_ratio_20,
-            close_location=close_loc,
-            distance_to_52w_high_pct=distance_to_52w_high_pct,
-            pattern_label=pattern_label,
-            extension_risk=extension_risk,
-            data_quality_flags=data_quality_flags,
-        )
-        event_date = current_bar.date
-        episode_id = determine_episode_id(
-            symbol, event_date, direction, existing_records + events, episode_gap_days
+            as_of=as_of,
+            lookback_days=lookback_days,
+            min_price=min_price,
+            min_dollar_volume=min_dollar_volume,
+            prior_records=existing_records + events,
+            episode_gap_days=episode_gap_days,
+            extra_quality_flags=extra_quality_flags,
         )
-        record_id = f"{symbol}:{event_date}:{direction}:{lookback_days}D"
-        event = {
-            "schema_version": SCHEMA_VERSION,
-            "source_skill": SKILL_NAME,
-            "record_id": record_id,
-            "episode_id": episode_id,
-            "symbol": symbol,
-            "event_date": event_date,
-            "direction": direction,
-            "window_days": lookback_days,
-            "event_day_index": episode_day_index(
-                episode_id, symbol, direction, current_bar.date, existing_records + events
-            ),
-            "price_snapshot": {
-                "open": round(current_bar.open, 4),
-                "high": round(current_bar.high, 4),
-                "low": round(current_bar.low, 4),
-                "close": round(current_bar.close, 4),
-                "previous_close": round(previous_bar.close, 4),
-                "lookback_close": round(lookback_bar.close, 4),
-                "return_pct": round(return_pct, 4),
-                "day_return_pct": round(pct_change(current_bar.close, previous_bar.close), 4),
-                "gap_pct": round(gap_pct, 4),
-                "range_pct": round(range_pct, 4),
-                "close_location_pct": round(close_loc, 2),
-            },
-            "liquidity": {
-                "volume": current_bar.volume,
-                "avg_volume_20d": round(avg_volume_20, 2),
-                "volume_ratio_20d": round(volume_ratio_20, 3),
-                "dollar_volume": round(dollar_volume, 2),
-                "avg_dollar_volume_20d": round(avg_dollar_volume_20, 2),
-                "price_pass": current_bar.close >= min_price,
-                "liquidity_pass": dollar_volume >= min_dollar_volume,
-            },
-            "technical_context": {
-                "distance_to_52w_high_pct": round(distance_to_52w_high_pct, 4),
-                "distance_to_52w_low_pct": round(distance_to_52w_low_pct, 4),
-                "prior_20d_return_pct": round(prior_20d_return_pct, 4),
-                "prior_50d_return_pct": round(prior_50d_return_pct, 4),
-                "base_length_days": estimate_base_length(bars, idx),
-                "base_depth_pct": round(estimate_base_depth_pct(bars, idx), 4),
-                "pattern_label": pattern_label,
-                "close_quality": close_quality,
-                "extension_risk": extension_risk,
-            },
-            "catalyst": catalyst,
-            "theme_context": {
-                "theme_label": "UNKNOWN",
-                "theme_cluster_count": 0,
-                "sector": None,
-                "industry": None,
-            },
-            "scores": scores,
-            "labels": labels_for_event(
-                direction, pattern_label, close_quality, extension_risk, scores
-            ),
-            "handoffs": handoff_flags(direction, catalyst["label"], pattern_label, scores),
-            "outcomes": {f"{h}d": None for h in DEFAULT_HORIZONS},
-            "data_quality": {
-                "flags": data_quality_flags,
-                "data_quality_score": scores["data_quality_score"],
-            },
-            "human_review": {
-                "reviewed": False,
-                "label_override": None,
-                "notes": None,
-            },
-            "raw": {
-                "as_of_requested": as_of,
-                "as_of_effective": event_date,
-                "lookback_bar_date": lookback_bar.date,
-            },
-        }
         events.append(event)
-        effective_dates.append(event_date)
+        effective_dates.append(event["event_date"])
 
     metadata = {
         "schema_version": SCHEMA_VERSION,
@@ -672,6 +808,79 @@ def detect_twenty_pct_events(
     return events, metadata
 
 
+def backfill_twenty_pct_events(
+    prices: dict[str, PriceSeries | list[Bar]],
+    dates: list[str],
+    lookback_days: int,
+    min_abs_return_pct: float,
+    min_price: float,
+    min_dollar_volume: float,
+    include_down_movers: bool,
+    existing_records: list[dict[str, Any]] | None = None,
+    episode_gap_days: int = 5,
+    extra_data_quality_flags: Iterable[str] | None = None,
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    """Detect events for every date in *dates* in one pass over each symbol's bars.
+
+    Produces the same events, in the same (date, symbol) order, and the same
+    summed ``skipped`` counts as calling detect_twenty_pct_events() once per
+    date with ``existing_records + events so far``.  Bars must be sorted
+    oldest -> newest (PriceSeries or normalize_price_bars() output) and
+    *dates* sorted ascending.
+
+    Each symbol's as-of index advances with a pointer instead of a date
+    scan, and episode ids are resolved against that symbol's own records
+    rather than the whole growing event list.
+    """
+    extra_quality_flags = [str(flag) for flag in (extra_data_quality_flags or []) if flag]
+    records_by_symbol: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for record in existing_records or []:
+        records_by_symbol[normalize_symbol(record.get("symbol"))].append(record)
+    skipped: dict[str, int] = defaultdict(int)
+    found: list[tuple[int, dict[str, Any]]] = []
+
+    date_ordinals = [parse_date(as_of).toordinal() for as_of in dates]
+    for symbol, raw_bars in sorted(prices.items()):
+        bars = as_price_series(raw_bars)
+        symbol_records = records_by_symbol[symbol]
+        idx = -1
+        for date_pos, (as_of, ordinal) in enumerate(zip(dates, date_ordinals)):
+            while idx + 1 < len(bars) and bars.ordinals[idx + 1] <= ordinal:
+                idx += 1
+            direction, reason = screen_twenty_pct_move(
+                bars,
+                idx if idx >= 0 else None,
+                lookback_days=lookback_days,
+                min_abs_return_pct=min_abs_return_pct,
+                min_price=min_price,
+                min_dollar_volume=min_dollar_volume,
+                include_down_movers=include_down_movers,
+            )
+            if direction is None:
+                skipped[reason] += 1
+                continue
+            event = build_event_record(
+                symbol=symbol,
+                bars=bars,
+                idx=idx,
+                direction=direction,
+                as_of=as_of,
+                lookback_days=lookback_days,
+                min_price=min_price,
+                min_dollar_volume=min_dollar_volume,
+                prior_records=symbol_records,
+                episode_gap_days=episode_gap_days,
+                extra_quality_flags=extra_quality_flags,
+            )
+            symbol_records.append(event)
+            found.append((date_pos, event))
+
+    # Symbols were walked in sorted order, so a stable sort by date restores
+    # the per-date scan order.
+    found.sort(key=lambda item: item[0])
+    return [event for _, event in found], dict(skipped)
+
+
 def episode_day_index(
     episode_id: str,
     symbol: str,
@@ -758,25 +967,24 @@ def classify_chart_pattern(
     return "MOMENTUM_EVENT"
 
 
-def estimate_base_length(bars: list[Bar], idx: int, max_lookback: int = 80) -> int:
+def estimate_base_length(bars: PriceSeries, idx: int, max_lookback: int = 80) -> int:
     if idx <= 0:
         return 0
-    current_close = bars[idx].close
-    threshold = current_close * 0.75
+    threshold = bars.close[idx] * 0.75
     count = 0
-    for bar in reversed(bars[max(0, idx - max_lookback) : idx]):
-        if bar.close < threshold:
+    for close in reversed(bars.close[max(0, idx - max_lookback) : idx]):
+        if close < threshold:
             break
         count += 1
     return count
 
 
-def estimate_base_depth_pct(bars: list[Bar], idx: int, lookback: int = 50) -> float:
-    segment = bars[max(0, idx - lookback) : idx]
-    if not segment:
+def estimate_base_depth_pct(bars: PriceSeries, idx: int, lookback: int = 50) -> float:
+    start = max(0, idx - lookback)
+    if start >= idx:
         return 0.0
-    high = max(bar.high for bar in segment)
-    low = min(bar.low for bar in segment)
+    high = max(bars.high[start:idx])
+    low = min(bars.low[start:idx])
     return safe_pct(high - low, high)
 
 
@@ -790,7 +998,7 @@ def default_catalyst(direction: str) -> dict[str, Any]:
 
 
 def data_quality_flags_for_event(
-    bars: list[Bar],
+    bars: PriceSeries,
     idx: int,
     current_bar: Bar,
     return_pct: float,
@@ -806,8 +1014,8 @@ def data_quality_flags_for_event(
     if abs(return_pct) > 200:
         flags.append("EXTREME_MOVE_CHECK_SPLIT_OR_CORPORATE_ACTION")
     if idx > 0:
-        previous = bars[idx - 1]
-        if current_bar.open > previous.close * 4 or current_bar.open < previous.close * 0.25:
+        previous_close = bars.close[idx - 1]
+        if current_bar.open > previous_close * 4 or current_bar.open < previous_close * 0.25:
             flags.append("POSSIBLE_SPLIT_OR_SPECIAL_DISTRIBUTION")
     return flags
 
@@ -1073,7 +1281,7 @@ def enrich_events_with_news(
 
 def update_forward_outcomes(
     records: list[dict[str, Any]],
-    prices: dict[str, list[Bar]],
+    prices: dict[str, PriceSeries | list[Bar]],
     horizons: Iterable[int],
 ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     updated_records: list[dict[str, Any]] = []
@@ -1083,17 +1291,13 @@ def update_forward_outcomes(
         symbol = normalize_symbol(record.get("symbol"))
         event_date = str(record.get("event_date") or "")
         direction = str(record.get("direction") or "UP")
-        bars = prices.get(symbol, [])
-        idx = None
-        for i, bar in enumerate(bars):
-            if bar.date == event_date:
-                idx = i
-                break
+        bars = as_price_series(prices.get(symbol, []))
+        idx = bars.index_of(event_date)
         if idx is None:
             counts["missing_event_bar"] += 1
             updated_records.append(updated)
             continue
-        entry_close = bars[idx].close
+        entry_close = bars.close[idx]
         outcomes = dict(updated.get("outcomes") or {})
         for horizon in horizons:
             horizon = int(horizon)
@@ -1107,11 +1311,10 @@ def update_forward_outcomes(
                 }
                 counts["pending"] += 1
                 continue
-            future = bars[idx + 1 : idx + horizon + 1]
-            close_bar = bars[idx + horizon]
-            high = max(bar.high for bar in future)
-            low = min(bar.low for bar in future)
-            close_return = pct_change(close_bar.close, entry_close)
+            close = bars.close[idx + horizon]
+            high = max(bars.high[idx + 1 : idx + horizon + 1])
+            low = min(bars.low[idx + 1 : idx + horizon + 1])
+            close_return = pct_change(close, entry_close)
             mfe = pct_change(high, entry_close)
             mae = pct_change(low, entry_close)
             if direction == "DOWN":
@@ -1134,8 +1337,8 @@ def update_forward_outcomes(
                 "status": "MATURED",
                 "horizon_days": horizon,
                 "entry_close": round(entry_close, 4),
-                "close_date": close_bar.date,
-                "close": round(close_bar.close, 4),
+                "close_date": bars.date(idx + horizon),
+                "close": round(close, 4),
                 "close_return_pct": round(close_return, 4),
                 "mfe_pct": round(mfe, 4),
                 "mae_pct": round(mae, 4),
@@ -1511,7 +1714,7 @@ def parse_horizons(value: str) -> list[int]:
 
 def load_prices_for_args(
     args: argparse.Namespace, days: int = 320
-) -> tuple[dict[str, list[Bar]], dict[str, Any]]:
+) -> tuple[dict[str, PriceSeries], dict[str, Any]]:
     if getattr(args, "prices_json", None):
         return load_prices_json(args.prices_json), {
             "source": "prices_json",
@@ -1651,33 +1854,31 @@ def command_backfill(args: argparse.Namespace) -> int:
     prices = load_prices_json(args.prices_json)
     start = parse_date(args.from_date)
     end = parse_date(args.to_date)
-    all_dates = sorted(
-        {
-            bar.date
-            for bars in prices.values()
-            for bar in bars
-            if start <= parse_date(bar.date) <= end
-        }
-    )
-    all_events: list[dict[str, Any]] = []
-    skipped_total = defaultdict(int)
-    extra_flags = [] if args.survivorship_complete else [BACKFILL_SURVIVORSHIP_BIAS_FLAG]
-    for as_of in all_dates:
-        events, metadata = detect_twenty_pct_events(
-            prices=prices,
-            as_of=as_of,
-            lookback_days=args.lookback_days,
-            min_abs_return_pct=args.min_abs_return_pct,
-            min_price=args.min_price,
-            min_dollar_volume=args.min_dollar_volume,
-            include_down_movers=args.include_down_movers,
-            existing_records=state + all_events,
-            episode_gap_days=args.episode_gap_days,
-            extra_data_quality_flags=extra_flags,
+    first, last = start.toordinal(), end.toordinal()
+    all_dates = [
+        date.fromordinal(ordinal).isoformat()
+        for ordinal in sorted(
+            {
+                ordinal
+                for series in prices.values()
+                for ordinal in series.ordinals
+                if first <= ordinal <= last
+            }
         )
-        all_events.extend(events)
-        for reason, count in metadata.get("skipped", {}).items():
-            skipped_total[reason] += count
+    ]
+    extra_flags = [] if args.survivorship_complete else [BACKFILL_SURVIVORSHIP_BIAS_FLAG]
+    all_events, skipped_total = backfill_twenty_pct_events(
+        prices=prices,
+        dates=all_dates,
+        lookback_days=args.lookback_days,
+        min_abs_return_pct=args.min_abs_return_pct,
+        min_price=args.min_price,
+        min_dollar_volume=args.min_dollar_volume,
+        include_down_movers=args.include_down_movers,
+        existing_records=state,
+        episode_gap_days=args.episode_gap_days,
+        extra_data_quality_flags=extra_flags,
+    )
     state = upsert_records(state, all_events)
     write_state(args.state_file, state)
     metadata = {
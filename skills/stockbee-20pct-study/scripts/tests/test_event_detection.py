@@ -1,4 +1,5 @@
 import importlib.util
+import json
 import sys
 from pathlib import Path
 
@@ -112,6 +113,101 @@ def test_episode_id_reuses_recent_same_symbol_direction():
     assert events[0]["event_day_index"] == 2
 
 
+def test_backfill_single_pass_matches_per_date_detection():
+    import random
+    from datetime import date, timedelta
+
+    rng = random.Random(7)
+    start = date(2025, 1, 1)
+    prices = {}
+    for n in range(12):
+        bars, close = [], 20.0
+        for day in range(70):
+            if rng.random() < 0.1:  # missing sessions: as-of falls back to the prior bar
+                continue
+            close *= 1 + rng.choice([0.0, 0.02, -0.02, 0.12, -0.12])
+            bars.append(
+                mod.Bar(
+                    date=(start + timedelta(days=day + n)).isoformat(),
+                    open=close * 0.98,
+                    high=close * 1.03,
+                    low=close * 0.96,
+                    close=close,
+                    volume=rng.choice([0, 50_000, 2_000_000]),
+                )
+            )
+        prices[f"S{n:02d}"] = bars
+    state = [
+        {
+            "record_id": "S03:2025-02-01:UP:5D",
+            "episode_id": "S03:2025-02-01:UP",
+            "symbol": "s03",
+            "direction": "UP",
+            "event_date": "2025-02-01",
+        }
+    ]
+    dates = sorted({bar.date for bars in prices.values() for bar in bars})[10:60]
+    params = {
+        "lookback_days": 5,
+        "min_abs_return_pct": 20,
+        "min_price": 1,
+        "min_dollar_volume": 100_000,
+        "include_down_movers": True,
+        "episode_gap_days": 5,
+        "extra_data_quality_flags": [mod.BACKFILL_SURVIVORSHIP_BIAS_FLAG],
+    }
+
+    expected, expected_skipped = [], {}
+    for as_of in dates:
+        events, metadata = mod.detect_twenty_pct_events(
+            prices=prices, as_of=as_of, existing_records=state + expected, **params
+        )
+        expected.extend(events)
+        for reason, count in metadata["skipped"].items():
+            expected_skipped[reason] = expected_skipped.get(reason, 0) + count
+
+    events, skipped = mod.backfill_twenty_pct_events(
+        prices=prices, dates=dates, existing_records=state, **params
+    )
+    assert len(expected) > 20
+    assert len({event["episode_id"] for event in expected}) < len(expected)
+    assert events == expected
+    assert skipped == expected_skipped
+
+
+def test_price_series_date_lookups(tmp_path):
+    path = tmp_path / "prices.json"
+    path.write_text(
+        json.dumps(
+            {
+                "prices": {
+                    "abc": [
+                        {"date": "2026-01-07", "open": 1, "high": 2, "low": 1, "close": 2},
+                        {"date": "2026-01-05", "open": 1, "high": 2, "low": 1, "close": 1},
+                        {"date": "2026-01-09T00:00:00", "open": 2, "high": 3, "low": 2, "close": 3},
+                    ]
+                }
+            }
+        )
+    )
+    series = mod.load_prices_json(path)["ABC"]
+
+    assert isinstance(series, mod.PriceSeries)
+    assert [series.date(i) for i in range(len(series))] == [
+        "2026-01-05",
+        "2026-01-07",
+        "2026-01-09",
+    ]
+    assert series[1] == mod.Bar("2026-01-07", 1.0, 2.0, 1.0, 2.0, 0)
+    assert series.as_of_index("2026-01-04") is None
+    assert series.as_of_index("2026-01-08") == 1
+    assert series.as_of_index(None) == 2
+    assert series.index_of("2026-01-09") == 2
+    assert series.index_of("2026-01-08") is None
+    assert series.index_of("2026-01-09T00:00:00") is None
+    assert mod.as_price_series(series) is series
+
+
 def test_upsert_records_preserves_review_fields_and_updates_outcomes():
     existing = [
         {
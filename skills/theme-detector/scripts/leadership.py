@@ -9,7 +9,7 @@ symbol can count as both EP9M and range expansion on the same day.
 import csv
 import json
 import math
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional
 
@@ -45,7 +45,12 @@ class ScanHit:
     catalyst: Optional[str] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Every field is a scalar, so a shallow field copy equals asdict()
+        # without its per-field deepcopy (this runs once per hit per theme).
+        return {name: getattr(self, name) for name in _SCAN_HIT_FIELDS}
+
+
+_SCAN_HIT_FIELDS = tuple(field.name for field in fields(ScanHit))
 
 
 def load_scan_hits(path: str, run_date: str) -> tuple[list[ScanHit], dict]:
@@ -97,9 +102,10 @@ def aggregate_leadership(
     """Aggregate leadership evidence for each theme."""
     result: dict[str, dict] = {}
     hits_by_theme: dict[str, list[ScanHit]] = {}
+    index = ThemeIndex(themes)
 
     for hit in scan_hits:
-        matched_names = _matched_theme_names(hit, themes)
+        matched_names = index.matched_theme_names(hit)
         for name in matched_names:
             hits_by_theme.setdefault(name, []).append(hit)
 
@@ -112,7 +118,9 @@ def aggregate_leadership(
                 counts[hit.scan_type] += 1
 
         if hits:
-            score = calculate_leadership_score(name, counts, history)
+            score = calculate_leadership_score(
+                name, counts, history, prior_counts=prior_count_table(history, name)
+            )
             coverage = 1.0
         else:
             score = None
@@ -142,12 +150,23 @@ def aggregate_leadership(
     return result
 
 
-def calculate_leadership_score(theme_name: str, counts: dict[str, int], history: dict) -> float:
-    """Calculate 0-100 leadership score from hit counts and prior history."""
+def calculate_leadership_score(
+    theme_name: str,
+    counts: dict[str, int],
+    history: dict,
+    prior_counts: Optional[dict[str, list[int]]] = None,
+) -> float:
+    """Calculate 0-100 leadership score from hit counts and prior history.
+
+    ``prior_counts`` is the theme's row of ``prior_count_table``; it is
+    derived from ``history`` when omitted.
+    """
+    if prior_counts is None:
+        prior_counts = prior_count_table(history, theme_name)
     weighted = 0.0
     for scan_type, weight in LEADERSHIP_WEIGHTS.items():
         value = counts.get(scan_type, 0)
-        prior = _prior_counts(history, theme_name, scan_type)
+        prior = prior_counts.get(scan_type, [])
         component = _count_component_score(value, prior)
         weighted += component * weight
     weight_sum = sum(LEADERSHIP_WEIGHTS.values())
@@ -345,26 +364,42 @@ def _is_high_rs(row: dict) -> bool:
     return rs >= 90.0
 
 
-def _matched_theme_names(hit: ScanHit, themes: list[dict]) -> list[str]:
-    if hit.theme_guess:
-        return [hit.theme_guess]
-    matches = []
-    for theme in themes:
-        name = theme.get("theme_name") or theme.get("name")
-        industries = {ind.get("name") for ind in theme.get("matching_industries", [])}
-        stocks = set(theme.get("static_stocks", []) or theme.get("representative_stocks", []))
-        if (hit.industry and hit.industry in industries) or hit.symbol in stocks:
-            matches.append(name)
-    return matches
-
-
-def _prior_counts(history: dict, theme_name: str, scan_type: str) -> list[int]:
-    records = history.get(theme_name, [])
-    counts = []
-    for record in records:
+class ThemeIndex:
+    """Inverted theme membership index: industry -> themes and symbol -> themes.
+
+    Built once per config so matching a scan hit costs two dict lookups
+    instead of rebuilding every theme's industry and stock sets per hit.
+    """
+
+    def __init__(self, themes: list[dict]):
+        self.names = [theme.get("theme_name") or theme.get("name") for theme in themes]
+        self.by_industry: dict[str, list[int]] = {}
+        self.by_symbol: dict[str, list[int]] = {}
+        for position, theme in enumerate(themes):
+            for industry in {ind.get("name") for ind in theme.get("matching_industries", [])}:
+                self.by_industry.setdefault(industry, []).append(position)
+            stocks = theme.get("static_stocks", []) or theme.get("representative_stocks", [])
+            for symbol in set(stocks):
+                self.by_symbol.setdefault(symbol, []).append(position)
+
+    def matched_theme_names(self, hit: ScanHit) -> list[str]:
+        """Names of themes matching the hit's industry or symbol, in config order."""
+        if hit.theme_guess:
+            return [hit.theme_guess]
+        positions = self.by_symbol.get(hit.symbol, [])
+        if hit.industry and hit.industry in self.by_industry:
+            positions = set(positions).union(self.by_industry[hit.industry])
+        return [self.names[position] for position in sorted(positions)]
+
+
+def prior_count_table(history: dict, theme_name: str) -> dict[str, list[int]]:
+    """Per-scan-type leadership counts of a theme's last 20 history records."""
+    table: dict[str, list[int]] = {scan_type: [] for scan_type in SCAN_TYPES}
+    for record in history.get(theme_name, [])[-20:]:
         leadership_counts = record.get("leadership_counts") or {}
-        counts.append(int(leadership_counts.get(scan_type, 0) or 0))
-    return counts[-20:]
+        for scan_type, counts in table.items():
+            counts.append(int(leadership_counts.get(scan_type, 0) or 0))
+    return table
 
 
 def _merge_hit_metrics(hits: list[ScanHit]) -> dict:
@@ -1,15 +1,19 @@
 """Tests for stock leadership scan-hit detection and aggregation."""
 
 import json
+from dataclasses import asdict
 
 from leadership import (
+    SCAN_TYPES,
     ScanHit,
+    ThemeIndex,
     aggregate_leadership,
     blend_theme_heat,
     calculate_leader_candidates,
     calculate_leadership_score,
     detect_scan_hits_from_row,
     load_scan_hits,
+    prior_count_table,
 )
 
 
@@ -298,3 +302,66 @@ def test_leadership_aggregation_exposes_fresh_and_extended_symbols():
     assert evidence["fresh_leadership_symbols"] == ["NVDA"]
     assert evidence["extended_symbols"] == ["NVDA"]
     assert evidence["leader_candidates"][0]["is_extended"] is True
+
+
+def test_theme_index_matches_industry_or_symbol_in_config_order():
+    themes = [
+        {"theme_name": "Cloud", "matching_industries": [{"name": "Software - Infrastructure"}]},
+        {
+            "theme_name": "AI & Semiconductors",
+            "matching_industries": [{"name": "Semiconductors"}],
+            "static_stocks": ["NVDA", "MSFT"],
+        },
+        {"theme_name": "Mega Caps", "representative_stocks": ["MSFT"]},
+        {"theme_name": "Chips", "matching_industries": [{"name": "Semiconductors"}]},
+    ]
+    index = ThemeIndex(themes)
+
+    def names(symbol, industry=None, theme_guess=None):
+        hit = ScanHit(
+            date="2026-07-04",
+            symbol=symbol,
+            scan_type="high_rs",
+            industry=industry,
+            theme_guess=theme_guess,
+        )
+        return index.matched_theme_names(hit)
+
+    assert names("MSFT", "Software - Infrastructure") == [
+        "Cloud",
+        "AI & Semiconductors",
+        "Mega Caps",
+    ]
+    assert names("AMD", "Semiconductors") == ["AI & Semiconductors", "Chips"]
+    assert names("NVDA", "Semiconductors") == ["AI & Semiconductors", "Chips"]
+    assert names("XOM", "Oil & Gas") == []
+    assert names("XOM", theme_guess="Energy") == ["Energy"]
+
+
+def test_prior_count_table_uses_last_twenty_records():
+    history = {
+        "AI & Semiconductors": [
+            {"leadership_counts": {"ep9m": day, "high_rs": None}} for day in range(30)
+        ]
+        + [{"leadership_counts": None}]
+    }
+
+    table = prior_count_table(history, "AI & Semiconductors")
+
+    assert list(table) == SCAN_TYPES
+    assert table["ep9m"] == list(range(11, 30)) + [0]
+    assert table["high_rs"] == [0] * 20
+    assert prior_count_table(history, "Unknown") == {scan_type: [] for scan_type in SCAN_TYPES}
+    assert calculate_leadership_score(
+        "AI & Semiconductors", {"ep9m": 3}, history
+    ) == calculate_leadership_score("AI & Semiconductors", {"ep9m": 3}, {}, prior_counts=table)
+
+
+def test_scan_hit_to_dict_matches_asdict():
+    hit = detect_scan_hits_from_row(
+        {"symbol": "nvda", "rs_rating": 0.95, "industry": "Semiconductors", "close": 120},
+        "2026-07-04",
+    )[0]
+
+    assert hit.to_dict() == asdict(hit)
+    assert list(hit.to_dict()) == list(asdict(hit))
@@ -263,7 +263,7 @@ class TestThemeDetectorE2E:
         monkeypatch.setattr(
             uptrend_client,
             "fetch_sector_uptrend_data",
-            lambda: {
+            lambda data_dir=None: {
                 "Technology": {
                     "ratio": 0.55,
                     "ma_10": 0.45,
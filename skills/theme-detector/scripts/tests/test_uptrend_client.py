@@ -1,9 +1,9 @@
-"""Tests for uptrend_client.is_data_stale (business day logic)."""
+"""Tests for uptrend_client: is_data_stale (business day logic) and offline input."""
 
 from datetime import datetime
 from unittest.mock import patch
 
-from uptrend_client import is_data_stale
+from uptrend_client import fetch_sector_uptrend_data, is_data_stale
 
 
 class TestIsDataStale:
@@ -72,3 +72,26 @@ class TestIsDataStale:
             mock_dt.now.return_value = self._mock_now(2026, 2, 17)  # Tuesday
             # Friday to Tuesday = 2 bdays, threshold=1 -> stale
             assert is_data_stale("2026-02-13", threshold_bdays=1) is True
+
+
+class TestFetchSectorUptrendDataDir:
+    """fetch_sector_uptrend_data(data_dir=...) reads a prefetched CSV, never HTTP."""
+
+    CSV = (
+        "worksheet,date,count,total,ratio,ma_10,slope,trend\n"
+        "all,2026-02-13,900,3000,0.30,0.28,0.002,up\n"
+        "sec_technology,2026-02-12,100,400,0.25,0.24,,\n"
+        "sec_technology,2026-02-13,110,400,0.275,0.25,0.004,up\n"
+    )
+
+    def test_reads_local_file(self, tmp_path):
+        (tmp_path / "uptrend_ratio_timeseries.csv").write_text(self.CSV, encoding="utf-8")
+        with patch("uptrend_client.requests.get") as mock_get:
+            result = fetch_sector_uptrend_data(data_dir=str(tmp_path))
+        mock_get.assert_not_called()
+        assert list(result) == ["Technology"]
+        assert result["Technology"]["ratio"] == 0.275
+        assert result["Technology"]["latest_date"] == "2026-02-13"
+
+    def test_missing_file_returns_empty(self, tmp_path):
+        assert fetch_sector_uptrend_data(data_dir=str(tmp_path)) == {}
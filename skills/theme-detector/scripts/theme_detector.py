@@ -329,6 +329,11 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Run date for deterministic history/scan processing (YYYY-MM-DD)",
     )
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="Read uptrend_ratio_timeseries.csv from this directory instead of downloading it",
+    )
     return parser.parse_args()
 
 
@@ -806,7 +811,7 @@ def main():
     # Step 7: Fetch uptrend-dashboard data
     # -----------------------------------------------------------------------
     print("Fetching uptrend ratio data...", file=sys.stderr)
-    sector_uptrend = fetch_sector_uptrend_data()
+    sector_uptrend = fetch_sector_uptrend_data(data_dir=args.data_dir)
     stale_data = False
 
     if sector_uptrend:
@@ -10,6 +10,7 @@ Data Source: https://github.com/tradermonty/uptrend-dashboard
 
 import csv
 import io
+import os
 import sys
 from datetime import datetime, timedelta
 from typing import Optional
@@ -115,11 +116,12 @@ def is_data_stale(latest_date_str: str, threshold_bdays: int = 2) -> bool:
         return True
 
 
-def fetch_sector_uptrend_data() -> dict[str, dict]:
+def fetch_sector_uptrend_data(data_dir: Optional[str] = None) -> dict[str, dict]:
     """Fetch sector uptrend ratio data from timeseries CSV.
 
-    Downloads the full timeseries, extracts the latest row per sector,
-    and calculates slope from the last 5 data points.
+    Downloads the full timeseries (or reads uptrend_ratio_timeseries.csv from
+    ``data_dir`` when given), extracts the latest row per sector, and
+    calculates slope from the last 5 data points.
 
     Returns:
         Dict mapping display sector name to:
@@ -132,20 +134,30 @@ def fetch_sector_uptrend_data() -> dict[str, dict]:
         }
         Empty dict on failure.
     """
-    if not HAS_REQUESTS:
-        print("WARNING: requests library not installed.", file=sys.stderr)
-        return {}
-
-    try:
-        response = requests.get(TIMESERIES_URL, timeout=30)
-        response.raise_for_status()
-    except Exception as e:
-        print(f"WARNING: Failed to fetch uptrend timeseries: {e}", file=sys.stderr)
-        return {}
+    if data_dir:
+        path = os.path.join(data_dir, TIMESERIES_URL.rsplit("/", 1)[-1])
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except OSError as e:
+            print(f"WARNING: Failed to read uptrend timeseries: {e}", file=sys.stderr)
+            return {}
+    else:
+        if not HAS_REQUESTS:
+            print("WARNING: requests library not installed.", file=sys.stderr)
+            return {}
+
+        try:
+            response = requests.get(TIMESERIES_URL, timeout=30)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"WARNING: Failed to fetch uptrend timeseries: {e}", file=sys.stderr)
+            return {}
+        text = response.text
 
     # Parse all rows, grouped by worksheet
     sector_rows: dict[str, list[dict]] = {}
-    reader = csv.DictReader(io.StringIO(response.text))
+    reader = csv.DictReader(io.StringIO(text))
     for row in reader:
         ws = row.get("worksheet", "").strip()
         if ws == "all" or not ws.startswith("sec_"):
@@ -127,6 +127,29 @@ def test_ingest_vcp(tmp_path: Path):
     assert thesis["origin"]["raw_provenance"]["entry_ready"] is True
 
 
+def test_ingest_writes_index_once_per_file(tmp_path: Path, monkeypatch):
+    """A multi-record file is registered in one thesis_store.batch()."""
+    state_dir = tmp_path / "theses"
+    records = [
+        {"symbol": symbol, "distance_from_pivot_pct": 1.0, "entry_ready": True}
+        for symbol in ("PLTR", "NVDA", "AMD")
+    ]
+    input_file = _write_json(tmp_path, {"results": records})
+    index_writes = []
+    real_write_json = thesis_store._atomic_write_json
+
+    def counting_write_json(path, data, fsync=False):
+        index_writes.append(path)
+        real_write_json(path, data, fsync=fsync)
+
+    monkeypatch.setattr(thesis_store, "_atomic_write_json", counting_write_json)
+    ids = thesis_ingest.ingest("vcp-screener", input_file, str(state_dir))
+
+    assert len(ids) == 3
+    assert len(index_writes) == 1
+    assert thesis_store.validate_state(state_dir)["ok"] is True
+
+
 # -- Tests: pead adapter -------------------------------------------------------
 
 
@@ -694,6 +694,160 @@ def test_validate_state_detects_orphan(tmp_path: Path):
     assert tid in result["orphaned_in_index"]
 
 
+# -- Tests: secondary indexes in _index.json ----------------------------------
+
+
+def test_index_persists_reverse_maps(tmp_path: Path):
+    """_index.json carries by_fingerprint / by_status / review_queue maps."""
+    tid_a = thesis_store.register(tmp_path, _make_thesis_data(ticker="AAPL"))
+    tid_b = thesis_store.register(tmp_path, _make_thesis_data(ticker="MSFT"))
+    thesis_store.update(tmp_path, tid_b, {"monitoring": {"next_review_date": "2026-01-01"}})
+    thesis_store.transition(tmp_path, tid_a, "ENTRY_READY", "ok")
+
+    with open(tmp_path / thesis_store.INDEX_FILE) as f:
+        index = json.load(f)
+    assert index["version"] == thesis_store.INDEX_VERSION
+    fp_a = index["theses"][tid_a]["origin_fingerprint"]
+    assert index["by_fingerprint"][fp_a] == tid_a
+    assert index["by_status"] == {"IDEA": [tid_b], "ENTRY_READY": [tid_a]}
+    assert [tid for _, tid in index["review_queue"]] == [tid_b, tid_a]
+    assert index["review_queue"][0] == ["2026-01-01", tid_b]
+
+    thesis_store.terminate(tmp_path, tid_b, "INVALIDATED", "thesis broken")
+    index = thesis_store._load_index(tmp_path)
+    assert [tid for _, tid in index["review_queue"]] == [tid_a]
+    assert thesis_store.validate_state(tmp_path)["ok"] is True
+
+
+def test_fingerprint_lookup_skips_yaml_scan_on_full_index(tmp_path: Path, monkeypatch):
+    """A consistent index answers dedup hits and misses without reading YAML."""
+    tid = thesis_store.register(tmp_path, _make_thesis_data())
+
+    def no_yaml_scan(*args, **kwargs):
+        raise AssertionError("YAML fallback scan must not run on a consistent index")
+
+    monkeypatch.setattr(thesis_store.yaml, "safe_load", no_yaml_scan)
+    fingerprint = thesis_store._load_index(tmp_path)["theses"][tid]["origin_fingerprint"]
+    assert thesis_store._find_by_fingerprint(tmp_path, fingerprint) == tid
+    assert thesis_store._find_by_fingerprint(tmp_path, "0" * 16) is None
+
+
+def test_list_review_due_ordered_by_date(tmp_path: Path):
+    """Review queue results come back in (next_review_date, thesis_id) order."""
+    tids = {}
+    for ticker, nrd in (("AAPL", "2026-02-10"), ("MSFT", "2026-01-05"), ("KO", "2026-03-01")):
+        tids[ticker] = thesis_store.register(tmp_path, _make_thesis_data(ticker=ticker))
+        thesis_store.update(tmp_path, tids[ticker], {"monitoring": {"next_review_date": nrd}})
+
+    due = thesis_store.list_review_due(tmp_path, "2026-02-10")
+    assert [row["thesis_id"] for row in due] == [tids["MSFT"], tids["AAPL"]]
+
+
+def test_v1_index_upgraded_on_load(tmp_path: Path):
+    """An index written before the reverse maps existed still serves lookups."""
+    tid = thesis_store.register(tmp_path, _make_thesis_data())
+    thesis_store.update(tmp_path, tid, {"monitoring": {"next_review_date": "2026-01-01"}})
+    index = thesis_store._load_index(tmp_path)
+    legacy = {"version": 1, "theses": index["theses"]}
+    (tmp_path / thesis_store.INDEX_FILE).write_text(json.dumps(legacy))
+
+    assert [row["thesis_id"] for row in thesis_store.list_review_due(tmp_path, "2026-01-31")] == [
+        tid
+    ]
+    assert [row["thesis_id"] for row in thesis_store.query(tmp_path, status="IDEA")] == [tid]
+    assert thesis_store.validate_state(tmp_path)["ok"] is True
+
+
+def test_validate_state_detects_stale_reverse_maps(tmp_path: Path):
+    """Hand-edited entries that bypass the maps are reported; rebuild fixes them."""
+    tid = thesis_store.register(tmp_path, _make_thesis_data())
+    index = thesis_store._load_index(tmp_path)
+    index["review_queue"] = []
+    index["by_status"] = {"CLOSED": [tid]}
+    thesis_store._save_index(tmp_path, index)
+
+    result = thesis_store.validate_state(tmp_path)
+    assert not result["ok"]
+    assert result["secondary_index_errors"] == ["by_status", "review_queue"]
+
+    thesis_store.rebuild_index(tmp_path)
+    assert thesis_store.validate_state(tmp_path)["secondary_index_errors"] == []
+
+
+# -- Tests: batch() -----------------------------------------------------------
+
+
+def test_batch_writes_index_once(tmp_path: Path, monkeypatch):
+    """Many mutations inside batch() flush the index a single time."""
+    index_writes = []
+    real_write_json = thesis_store._atomic_write_json
+
+    def counting_write_json(path, data, fsync=False):
+        index_writes.append(path)
+        real_write_json(path, data, fsync=fsync)
+
+    monkeypatch.setattr(thesis_store, "_atomic_write_json", counting_write_json)
+    with thesis_store.batch(tmp_path):
+        tids = [
+            thesis_store.register(tmp_path, _make_thesis_data(ticker=t))
+            for t in ("AAPL", "MSFT", "KO")
+        ]
+        thesis_store.transition(tmp_path, tids[0], "ENTRY_READY", "setup ready")
+        thesis_store.open_position(tmp_path, tids[0], 150.0, "2026-03-14T10:00:00+00:00")
+        assert not (tmp_path / f"{tids[0]}.yaml").exists()
+        assert index_writes == []
+
+    assert index_writes == [tmp_path / thesis_store.INDEX_FILE]
+    assert thesis_store.get(tmp_path, tids[0])["status"] == "ACTIVE"
+    assert [row["ticker"] for row in thesis_store.list_active(tmp_path)] == ["AAPL"]
+    assert thesis_store.validate_state(tmp_path)["ok"] is True
+
+
+def test_batch_reads_see_pending_changes(tmp_path: Path):
+    """get/query/dedup inside a batch observe earlier pending writes."""
+    with thesis_store.batch(tmp_path):
+        tid = thesis_store.register(tmp_path, _make_thesis_data())
+        assert thesis_store.register(tmp_path, _make_thesis_data()) == tid
+        thesis_store.transition(tmp_path, tid, "ENTRY_READY", "ok")
+        assert thesis_store.get(tmp_path, tid)["status"] == "ENTRY_READY"
+        assert [row["thesis_id"] for row in thesis_store.query(tmp_path, status="ENTRY_READY")] == [
+            tid
+        ]
+    assert len(list(tmp_path.glob("th_*.yaml"))) == 1
+
+
+def test_batch_discards_everything_on_error(tmp_path: Path):
+    """An exception in the block, or a thesis failing validation at flush, writes nothing."""
+    existing = thesis_store.register(tmp_path, _make_thesis_data(ticker="KO"))
+    before = _index_file_hash(tmp_path), _state_file_hash(tmp_path, existing)
+
+    with pytest.raises(RuntimeError):
+        with thesis_store.batch(tmp_path):
+            thesis_store.register(tmp_path, _make_thesis_data(ticker="MSFT"))
+            thesis_store.transition(tmp_path, existing, "ENTRY_READY", "ok")
+            raise RuntimeError("abort")
+
+    with pytest.raises(ValueError, match="Schema validation failed"):
+        with thesis_store.batch(tmp_path):
+            thesis_store.register(tmp_path, _make_thesis_data(ticker="MSFT"))
+            thesis_store.update(tmp_path, existing, {"confidence_score": 5})
+
+    assert (_index_file_hash(tmp_path), _state_file_hash(tmp_path, existing)) == before
+    assert [p.stem for p in tmp_path.glob("th_*.yaml")] == [existing]
+
+
+def test_batch_on_sqlite_backend(tmp_path: Path):
+    """The SQLite index is upserted once at flush with the pending entries."""
+    thesis_store.migrate_to_sqlite(tmp_path)
+    with thesis_store.batch(tmp_path):
+        tid = thesis_store.register(tmp_path, _make_thesis_data())
+        thesis_store.transition(tmp_path, tid, "ENTRY_READY", "ok")
+        assert thesis_store.query(tmp_path, status="ENTRY_READY")[0]["thesis_id"] == tid
+    assert [row["thesis_id"] for row in thesis_store.query(tmp_path, status="ENTRY_READY")] == [tid]
+    assert not (tmp_path / thesis_store.INDEX_FILE).exists()
+    assert thesis_store.validate_state(tmp_path)["ok"] is True
+
+
 # -- Tests: link_report -------------------------------------------------------
 
 
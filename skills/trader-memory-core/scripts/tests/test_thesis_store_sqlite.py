@@ -0,0 +1,162 @@
+"""Tests for the optional SQLite index backend (thesis_index_sqlite.py)."""
+
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+import thesis_index_sqlite
+import thesis_store
+
+# -- Helpers -------------------------------------------------------------------
+
+
+def _make_thesis_data(ticker="AAPL", **overrides):
+    data = {
+        "ticker": ticker,
+        "thesis_type": "dividend_income",
+        "thesis_statement": f"{ticker} dividend income thesis for testing",
+        "origin": {"skill": "test-skill", "output_file": "test_output.json"},
+    }
+    data.update(overrides)
+    return data
+
+
+def _populate(state_dir: Path) -> dict:
+    """Register a small journal and walk theses through a few lifecycle states."""
+    ids = {}
+    ids["aapl"] = thesis_store.register(state_dir, _make_thesis_data("AAPL"))
+    ids["msft"] = thesis_store.register(
+        state_dir, _make_thesis_data("MSFT", thesis_type="growth_momentum")
+    )
+    ids["ko"] = thesis_store.register(state_dir, _make_thesis_data("KO", _source_date="2026-01-05"))
+    thesis_store.transition(state_dir, ids["aapl"], "ENTRY_READY", "setup ready")
+    thesis_store.open_position(state_dir, ids["aapl"], 150.0, "2026-03-14T10:00:00+00:00")
+    thesis_store.transition(state_dir, ids["msft"], "ENTRY_READY", "setup ready")
+    thesis_store.open_position(state_dir, ids["msft"], 400.0, "2026-03-14T10:00:00+00:00")
+    thesis_store.close(state_dir, ids["msft"], "target_hit", 440.0, "2026-04-01T10:00:00+00:00")
+    return ids
+
+
+# -- Tests ---------------------------------------------------------------------
+
+
+def test_migrate_creates_indexed_db_and_moves_json_aside(tmp_path: Path):
+    ids = _populate(tmp_path)
+    before = thesis_store._load_index(tmp_path)
+
+    result = thesis_store.migrate_to_sqlite(tmp_path)
+
+    assert result == {"migrated": 3, "skipped": []}
+    assert thesis_index_sqlite.is_enabled(tmp_path)
+    assert not (tmp_path / thesis_store.INDEX_FILE).exists()
+    assert (tmp_path / f"{thesis_store.INDEX_FILE}.pre-sqlite").exists()
+    assert thesis_store._load_index(tmp_path)["theses"] == {
+        tid: before["theses"][tid] for tid in sorted(ids.values())
+    }
+
+    conn = sqlite3.connect(tmp_path / thesis_store.SQLITE_INDEX_FILE)
+    indexed = {row[1] for row in conn.execute("PRAGMA index_list(theses)")}
+    conn.close()
+    for column in (
+        "ticker",
+        "status",
+        "thesis_type",
+        "created_at",
+        "next_review_date",
+        "origin_fingerprint",
+    ):
+        assert f"ix_theses_{column}" in indexed
+
+
+def test_migrate_twice_raises(tmp_path: Path):
+    thesis_store.migrate_to_sqlite(tmp_path)
+    with pytest.raises(ValueError, match="already uses the SQLite index"):
+        thesis_store.migrate_to_sqlite(tmp_path)
+
+
+def test_public_api_parity_with_json_backend(tmp_path: Path):
+    json_dir = tmp_path / "json"
+    sqlite_dir = tmp_path / "sqlite"
+    thesis_store.migrate_to_sqlite(sqlite_dir)  # empty dir: new journal on SQLite
+    for state_dir in (json_dir, sqlite_dir):
+        _populate(state_dir)
+        # Enter ENTRY_READY in reverse registration order: results must still
+        # follow registration order on both backends.
+        nvda = thesis_store.register(state_dir, _make_thesis_data("NVDA"))
+        amd = thesis_store.register(state_dir, _make_thesis_data("AMD"))
+        thesis_store.transition(state_dir, amd, "ENTRY_READY", "setup ready")
+        thesis_store.transition(state_dir, nvda, "ENTRY_READY", "setup ready")
+
+    def strip_ids(rows):
+        return [{k: v for k, v in row.items() if k != "thesis_id"} for row in rows]
+
+    for kwargs in (
+        {},
+        {"ticker": "aapl"},
+        {"status": "CLOSED"},
+        {"status": "ENTRY_READY"},
+        {"thesis_type": "dividend_income"},
+        {"date_from": "2026-01-01", "date_to": "2026-01-31"},
+    ):
+        assert strip_ids(thesis_store.query(sqlite_dir, **kwargs)) == strip_ids(
+            thesis_store.query(json_dir, **kwargs)
+        )
+    assert strip_ids(thesis_store.list_active(sqlite_dir)) == strip_ids(
+        thesis_store.list_active(json_dir)
+    )
+    for as_of in ("2026-01-01", "2026-02-04", "2099-12-31"):
+        assert strip_ids(thesis_store.list_review_due(sqlite_dir, as_of)) == strip_ids(
+            thesis_store.list_review_due(json_dir, as_of)
+        )
+    assert [row["ticker"] for row in thesis_store.query(json_dir, status="ENTRY_READY")] == [
+        "NVDA",
+        "AMD",
+    ]
+    assert not (sqlite_dir / thesis_store.INDEX_FILE).exists()
+
+
+def test_register_dedup_uses_fingerprint_index(tmp_path: Path, monkeypatch):
+    thesis_store.migrate_to_sqlite(tmp_path)
+    tid = thesis_store.register(tmp_path, _make_thesis_data())
+
+    def no_yaml_scan(*args, **kwargs):
+        raise AssertionError("YAML fallback scan must not run on a consistent index")
+
+    monkeypatch.setattr(thesis_store.yaml, "safe_load", no_yaml_scan)
+    assert thesis_store.register(tmp_path, _make_thesis_data()) == tid
+    assert thesis_store._find_by_fingerprint(tmp_path, "0" * 16) is None
+
+
+def test_fingerprint_falls_back_to_yaml_when_index_partial(tmp_path: Path):
+    thesis_store.migrate_to_sqlite(tmp_path)
+    tid = thesis_store.register(tmp_path, _make_thesis_data())
+    fingerprint = thesis_store.get(tmp_path, tid)["origin_fingerprint"]
+    thesis_index_sqlite.replace_all(tmp_path, {"version": 1, "theses": {}})
+
+    assert thesis_store._find_by_fingerprint(tmp_path, fingerprint) == tid
+
+
+def test_rebuild_and_validate_state_on_sqlite(tmp_path: Path):
+    ids = _populate(tmp_path)
+    thesis_store.migrate_to_sqlite(tmp_path)
+    assert thesis_store.validate_state(tmp_path)["ok"] is True
+
+    thesis_index_sqlite.replace_all(tmp_path, {"version": 1, "theses": {}})
+    report = thesis_store.validate_state(tmp_path)
+    assert report["ok"] is False
+    assert report["missing_in_index"] == sorted(ids.values())
+
+    rebuilt = thesis_store.rebuild_index(tmp_path)
+    assert len(rebuilt["theses"]) == 3
+    assert thesis_store.validate_state(tmp_path)["ok"] is True
+    assert not (tmp_path / thesis_store.INDEX_FILE).exists()
+
+
+def test_cli_migrate_sqlite(tmp_path: Path, capsys):
+    _populate(tmp_path)
+    assert thesis_store.main(["--state-dir", str(tmp_path), "migrate-sqlite"]) == 0
+    assert json.loads(capsys.readouterr().out)["migrated"] == 3
+    assert thesis_store.main(["--state-dir", str(tmp_path), "list", "--status", "ACTIVE"]) == 0
+    listed = json.loads(capsys.readouterr().out)
+    assert [row["ticker"] for row in listed] == ["AAPL"]
@@ -0,0 +1,194 @@
+"""Trader Memory Core — optional SQLite index backend.
+
+A state dir that contains ``_index.sqlite3`` keeps its thesis index in an
+SQLite table instead of ``_index.json``.  Secondary indexes on ticker,
+status, thesis_type, created_at, next_review_date and origin_fingerprint turn
+``query`` / ``list_review_due`` / fingerprint dedup into index lookups instead
+of a full reload + scan of the JSON index.
+
+Thesis bodies stay in ``th_*.yaml`` (the canonical record read by other
+skills), so only the index layer changes.  ``thesis_store`` routes through
+this module automatically whenever the database file exists; create it with
+``thesis_store.migrate_to_sqlite()`` (CLI: ``migrate-sqlite``).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+DB_FILE = "_index.sqlite3"
+
+# Column order mirrors thesis_store._project_index_fields().
+INDEX_FIELDS = (
+    "ticker",
+    "status",
+    "thesis_type",
+    "created_at",
+    "updated_at",
+    "next_review_date",
+    "review_status",
+    "origin_fingerprint",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS theses (
+    thesis_id TEXT PRIMARY KEY,
+    ticker TEXT COLLATE NOCASE,
+    status TEXT,
+    thesis_type TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    next_review_date TEXT,
+    review_status TEXT,
+    origin_fingerprint TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_theses_ticker ON theses (ticker);
+CREATE INDEX IF NOT EXISTS ix_theses_status ON theses (status);
+CREATE INDEX IF NOT EXISTS ix_theses_thesis_type ON theses (thesis_type);
+CREATE INDEX IF NOT EXISTS ix_theses_created_at ON theses (created_at);
+CREATE INDEX IF NOT EXISTS ix_theses_next_review_date ON theses (next_review_date);
+CREATE INDEX IF NOT EXISTS ix_theses_origin_fingerprint ON theses (origin_fingerprint);
+"""
+
+_COLUMNS = ", ".join(INDEX_FIELDS)
+_UPSERT = (
+    f"INSERT INTO theses (thesis_id, {_COLUMNS}) "
+    f"VALUES (?, {', '.join('?' for _ in INDEX_FIELDS)}) "
+    "ON CONFLICT(thesis_id) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in INDEX_FIELDS)
+)
+
+
+def db_path(state_dir: Path) -> Path:
+    return state_dir / DB_FILE
+
+
+def is_enabled(state_dir: Path) -> bool:
+    """True when *state_dir* has been migrated to the SQLite backend."""
+    return db_path(state_dir).exists()
+
+
+def _connect(state_dir: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path(state_dir))
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _row_values(thesis_id: str, entry: dict) -> tuple:
+    return (thesis_id, *(entry.get(name) for name in INDEX_FIELDS))
+
+
+def _rows_to_entries(rows) -> list[dict]:
+    return [{"thesis_id": row["thesis_id"], **{k: row[k] for k in INDEX_FIELDS}} for row in rows]
+
+
+def create(state_dir: Path) -> None:
+    """Create an empty database (schema + indexes) in *state_dir*."""
+    with closing(_connect(state_dir)):
+        pass
+
+
+def upsert(state_dir: Path, thesis_id: str, entry: dict) -> None:
+    """Insert or update one index row (rowid, and so list order, is preserved)."""
+    with closing(_connect(state_dir)) as conn, conn:
+        conn.execute(_UPSERT, _row_values(thesis_id, entry))
+
+
+def upsert_many(state_dir: Path, entries: dict) -> None:
+    """Upsert ``{thesis_id: entry}`` rows in a single transaction."""
+    with closing(_connect(state_dir)) as conn, conn:
+        conn.executemany(_UPSERT, [_row_values(tid, entry) for tid, entry in entries.items()])
+
+
+def load_all(state_dir: Path) -> dict:
+    """Return the whole index in the ``_index.json`` shape."""
+    with closing(_connect(state_dir)) as conn:
+        rows = conn.execute(f"SELECT thesis_id, {_COLUMNS} FROM theses ORDER BY rowid").fetchall()
+    theses = {}
+    for entry in _rows_to_entries(rows):
+        theses[entry.pop("thesis_id")] = entry
+    return {"version": 1, "theses": theses}
+
+
+def replace_all(state_dir: Path, index: dict) -> None:
+    """Replace every row with the entries of an ``_index.json``-shaped dict."""
+    with closing(_connect(state_dir)) as conn, conn:
+        conn.execute("DELETE FROM theses")
+        conn.executemany(
+            _UPSERT,
+            [_row_values(tid, entry) for tid, entry in index.get("theses", {}).items()],
+        )
+
+
+def count(state_dir: Path) -> int:
+    with closing(_connect(state_dir)) as conn:
+        return conn.execute("SELECT COUNT(*) FROM theses").fetchone()[0]
+
+
+def find_by_fingerprint(state_dir: Path, fingerprint: str) -> str | None:
+    with closing(_connect(state_dir)) as conn:
+        row = conn.execute(
+            "SELECT thesis_id FROM theses WHERE origin_fingerprint = ? ORDER BY rowid LIMIT 1",
+            (fingerprint,),
+        ).fetchone()
+    return row["thesis_id"] if row else None
+
+
+def query(
+    state_dir: Path,
+    *,
+    ticker: str | None = None,
+    status: str | None = None,
+    thesis_type: str | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> list[dict]:
+    """Indexed equivalent of the ``thesis_store.query`` index scan."""
+    clauses, params = [], []
+    if ticker:
+        clauses.append("ticker = ?")
+        params.append(ticker)
+    if status:
+        clauses.append("status = ?")
+        params.append(status)
+    if thesis_type:
+        clauses.append("thesis_type = ?")
+        params.append(thesis_type)
+    if date_from:
+        clauses.append("created_at >= ?")
+        params.append(date_from)
+    if date_to:
+        clauses.append("created_at <= ?")
+        params.append(date_to)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    with closing(_connect(state_dir)) as conn:
+        rows = conn.execute(
+            f"SELECT thesis_id, {_COLUMNS} FROM theses{where} ORDER BY rowid", params
+        ).fetchall()
+    return _rows_to_entries(rows)
+
+
+def review_candidates(state_dir: Path, as_of: str, terminal_statuses) -> list[dict]:
+    """Non-terminal rows whose next_review_date sorts on or before *as_of*.
+
+    Rows come back in (next_review_date, thesis_id) order, matching the JSON
+    backend's review_queue.
+
+    The schema restricts next_review_date to ``YYYY-MM-DD``, so string order is
+    date order; the caller still re-parses each date to keep the JSON path's
+    handling of malformed values.
+    """
+    terminal = sorted(terminal_statuses)
+    placeholders = ", ".join("?" for _ in terminal)
+    with closing(_connect(state_dir)) as conn:
+        rows = conn.execute(
+            f"SELECT thesis_id, {_COLUMNS} FROM theses "
+            f"WHERE next_review_date IS NOT NULL AND next_review_date <= ? "
+            f"AND (status IS NULL OR status NOT IN ({placeholders})) "
+            "ORDER BY next_review_date, thesis_id",
+            [as_of, *terminal],
+        ).fetchall()
+    return _rows_to_entries(rows)
@@ -527,22 +527,24 @@ def ingest(
     records = _extract_records(data, source)
 
     thesis_ids = []
-    for record in records:
-        try:
-            thesis_data = adapter(record, input_file)
-        except ValueError as e:
-            logger.error("Adapter error for %s: %s", source, e)
-            continue
-        if thesis_data is None:
-            continue  # skipped (e.g., edge research_only)
-        # Inject source date so thesis_id and created_at reflect the report date
-        if source_date and "_source_date" not in thesis_data:
-            thesis_data["_source_date"] = source_date
-        try:
-            tid = thesis_store.register(state_path, thesis_data)
-            thesis_ids.append(tid)
-        except ValueError as e:
-            logger.error("Failed to register from %s: %s", source, e)
+    # One batch: the index is written once for the whole file, not per record.
+    with thesis_store.batch(state_path):
+        for record in records:
+            try:
+                thesis_data = adapter(record, input_file)
+            except ValueError as e:
+                logger.error("Adapter error for %s: %s", source, e)
+                continue
+            if thesis_data is None:
+                continue  # skipped (e.g., edge research_only)
+            # Inject source date so thesis_id and created_at reflect the report date
+            if source_date and "_source_date" not in thesis_data:
+                thesis_data["_source_date"] = source_date
+            try:
+                tid = thesis_store.register(state_path, thesis_data)
+                thesis_ids.append(tid)
+            except ValueError as e:
+                logger.error("Failed to register from %s: %s", source, e)
 
     return thesis_ids
 
@@ -570,8 +572,9 @@ def ingest_bulk_csv(
         prepared.append(thesis_data)
 
     thesis_ids = []
-    for thesis_data in prepared:
-        thesis_ids.append(thesis_store.register(state_path, thesis_data))
+    with thesis_store.batch(state_path):
+        for thesis_data in prepared:
+            thesis_ids.append(thesis_store.register(state_path, thesis_data))
     return thesis_ids
 
 
@@ -2,10 +2,19 @@
 
 Provides atomic read/write operations for thesis YAML files and the
 _index.json summary.  All writes use tempfile + os.replace for safety.
+A state dir migrated with migrate_to_sqlite() keeps the index in
+_index.sqlite3 instead (see thesis_index_sqlite.py); the public API is
+identical for both backends.
+
+Many mutations can be grouped with ``with batch(state_dir): ...``: thesis
+bodies and the index are held in memory for the duration of the block and
+flushed once on exit (see batch()).
 """
 
 from __future__ import annotations
 
+import bisect
+import copy
 import hashlib
 import json
 import logging
@@ -15,6 +24,7 @@ import re
 import sys
 import tempfile
 import uuid
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -22,6 +32,12 @@ from typing import Any
 import yaml
 from jsonschema import Draft7Validator, FormatChecker
 
+try:
+    import thesis_index_sqlite
+except ModuleNotFoundError:  # loaded by file path (e.g. from another skill)
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    import thesis_index_sqlite
+
 logger = logging.getLogger(__name__)
 
 # -- Constants ----------------------------------------------------------------
@@ -77,6 +93,13 @@ _TYPE_ABBR = {
 _VALID_THESIS_TYPES = set(_TYPE_ABBR.keys())
 
 INDEX_FILE = "_index.json"
+# v2 adds reverse maps next to "theses"; v1 files are upgraded on load.
+INDEX_VERSION = 2
+_SECONDARY_INDEX_KEYS = ("by_fingerprint", "by_status", "review_queue")
+SQLITE_INDEX_FILE = thesis_index_sqlite.DB_FILE
+
+# Open batch() blocks keyed by absolute state dir (see _Batch).
+_BATCHES: dict[str, _Batch] = {}
 
 _SCHEMA_PATH = Path(__file__).resolve().parent.parent / "schemas" / "thesis.schema.json"
 _SCHEMA: dict | None = None
@@ -774,12 +797,28 @@ def _compute_origin_fingerprint(thesis_data: dict) -> str:
 
 
 def _find_by_fingerprint(state_dir: Path, fingerprint: str) -> str | None:
-    """Find thesis ID by fingerprint. Index first, always YAML fallback."""
-    index = _load_index(state_dir)
-    for tid, entry in index.get("theses", {}).items():
-        if entry.get("origin_fingerprint") == fingerprint:
+    """Find thesis ID by fingerprint. Index first, YAML fallback.
+
+    The lookup goes through the by_fingerprint map (or, on the SQLite
+    backend, an indexed query).  The YAML scan only runs when the index
+    entry count disagrees with the th_*.yaml file count (i.e. the index is
+    partial) or the map points at an entry with a different fingerprint.
+    """
+    if _use_sqlite(state_dir):
+        tid = thesis_index_sqlite.find_by_fingerprint(state_dir, fingerprint)
+        if tid is not None:
             return tid
-    # Always fall back to YAML scan (index may be partial)
+        if thesis_index_sqlite.count(state_dir) == _thesis_file_count(state_dir):
+            return None
+    else:
+        index = _load_index(state_dir)
+        tid = index["by_fingerprint"].get(fingerprint)
+        if tid is not None:
+            if index["theses"].get(tid, {}).get("origin_fingerprint") == fingerprint:
+                return tid
+        elif len(index["theses"]) == _thesis_file_count(state_dir):
+            return None
+    # Fall back to YAML scan (index is partial or its reverse map is stale)
     for yaml_path in state_dir.glob("th_*.yaml"):
         try:
             thesis = yaml.safe_load(yaml_path.read_text())
@@ -790,12 +829,15 @@ def _find_by_fingerprint(state_dir: Path, fingerprint: str) -> str | None:
     return None
 
 
-def _atomic_write_yaml(path: Path, data: dict) -> None:
+def _atomic_write_yaml(path: Path, data: dict, fsync: bool = False) -> None:
     """Write YAML atomically using tempfile + os.replace."""
     fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
             yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp, path)
     except BaseException:
         try:
@@ -805,13 +847,16 @@ def _atomic_write_yaml(path: Path, data: dict) -> None:
         raise
 
 
-def _atomic_write_json(path: Path, data: dict) -> None:
+def _atomic_write_json(path: Path, data: dict, fsync: bool = False) -> None:
     """Write JSON atomically using tempfile + os.replace."""
     fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
             f.write("\n")
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
         os.replace(tmp, path)
     except BaseException:
         try:
@@ -821,22 +866,119 @@ def _atomic_write_json(path: Path, data: dict) -> None:
         raise
 
 
-def _load_index(state_dir: Path) -> dict:
-    """Load _index.json or return empty index."""
+def _fsync_dir(path: Path) -> None:
+    """Persist directory entries (renames) where the platform supports it."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class _Batch:
+    """Pending writes for one state dir inside a batch() block."""
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = state_dir
+        self.theses: dict[str, dict] = {}  # thesis_id -> pending body
+        self.unvalidated: set[str] = set()
+        self.created: set[str] = set()  # pending ids with no YAML file yet
+        self.index: dict | None = None
+        self.index_replaced = False
+        self.disk_count: int | None = None
+
+    def load_index(self) -> dict:
+        if self.index is None:
+            self.index = _ensure_secondary_indexes(_read_index(self.state_dir))
+        return self.index
+
+    def flush(self) -> None:
+        """Validate each changed thesis once, then write everything.
+
+        Validation runs before the first write, so a rejected thesis leaves
+        the state dir untouched.  YAML bodies are written (and fsynced)
+        before the index, so an interrupted flush is recoverable with
+        rebuild_index().
+        """
+        for tid in sorted(self.unvalidated):
+            _validate_thesis(self.theses[tid])
+        if not self.theses and not self.index_replaced:
+            return
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        for tid, thesis in self.theses.items():
+            _atomic_write_yaml(self.state_dir / f"{tid}.yaml", thesis, fsync=True)
+        index = self.load_index()
+        if thesis_index_sqlite.is_enabled(self.state_dir):
+            if self.index_replaced:
+                thesis_index_sqlite.replace_all(self.state_dir, index)
+            else:
+                thesis_index_sqlite.upsert_many(
+                    self.state_dir, {tid: index["theses"][tid] for tid in self.theses}
+                )
+        else:
+            _atomic_write_json(self.state_dir / INDEX_FILE, index, fsync=True)
+        _fsync_dir(self.state_dir)
+
+
+def _active_batch(state_dir: Path) -> _Batch | None:
+    if not _BATCHES:
+        return None
+    return _BATCHES.get(os.path.abspath(state_dir))
+
+
+def _use_sqlite(state_dir: Path) -> bool:
+    """Route reads to SQLite, unless a batch holds the index in memory."""
+    return thesis_index_sqlite.is_enabled(state_dir) and _active_batch(state_dir) is None
+
+
+def _thesis_file_count(state_dir: Path) -> int:
+    """Number of th_*.yaml files, counting those pending in a batch."""
+    batch = _active_batch(state_dir)
+    if batch is None:
+        return sum(1 for _ in state_dir.glob("th_*.yaml"))
+    if batch.disk_count is None:
+        batch.disk_count = sum(1 for _ in state_dir.glob("th_*.yaml"))
+    return batch.disk_count + len(batch.created)
+
+
+def _read_index(state_dir: Path) -> dict:
+    if thesis_index_sqlite.is_enabled(state_dir):
+        return thesis_index_sqlite.load_all(state_dir)
     idx_path = state_dir / INDEX_FILE
     if idx_path.exists():
         with open(idx_path) as f:
-            return json.load(f)
-    return {"version": 1, "theses": {}}
+            return _ensure_secondary_indexes(json.load(f))
+    return _empty_index()
+
+
+def _load_index(state_dir: Path) -> dict:
+    """Load _index.json (or the SQLite index) or return empty index."""
+    batch = _active_batch(state_dir)
+    if batch is not None:
+        return batch.load_index()
+    return _read_index(state_dir)
 
 
 def _save_index(state_dir: Path, index: dict) -> None:
-    """Save _index.json atomically."""
+    """Save _index.json atomically (or replace every SQLite index row)."""
+    batch = _active_batch(state_dir)
+    if batch is not None:
+        batch.index = _ensure_secondary_indexes(index)
+        batch.index_replaced = True
+        return
+    if thesis_index_sqlite.is_enabled(state_dir):
+        thesis_index_sqlite.replace_all(state_dir, index)
+        return
     _atomic_write_json(state_dir / INDEX_FILE, index)
 
 
 def _load_thesis(state_dir: Path, thesis_id: str) -> dict:
-    """Load a thesis YAML file."""
+    """Load a thesis YAML file (or its pending copy inside a batch)."""
+    batch = _active_batch(state_dir)
+    if batch is not None and thesis_id in batch.theses:
+        return copy.deepcopy(batch.theses[thesis_id])
     path = state_dir / f"{thesis_id}.yaml"
     if not path.exists():
         raise FileNotFoundError(f"Thesis not found: {thesis_id}")
@@ -844,10 +986,27 @@ def _load_thesis(state_dir: Path, thesis_id: str) -> dict:
         return yaml.safe_load(f)
 
 
-def _save_thesis(state_dir: Path, thesis: dict) -> None:
-    """Validate and save a thesis YAML file atomically."""
-    _validate_thesis(thesis)
-    path = state_dir / f"{thesis['thesis_id']}.yaml"
+def _save_thesis(state_dir: Path, thesis: dict, validated: bool = False) -> None:
+    """Validate and save a thesis YAML file atomically.
+
+    ``validated=True`` skips the check when the caller has just run
+    _validate_thesis() on this exact dict.  Inside a batch the body is held
+    in memory and validated once when the batch flushes.
+    """
+    tid = thesis["thesis_id"]
+    batch = _active_batch(state_dir)
+    if batch is not None:
+        if tid not in batch.theses and not (state_dir / f"{tid}.yaml").exists():
+            batch.created.add(tid)
+        batch.theses[tid] = copy.deepcopy(thesis)
+        if validated:
+            batch.unvalidated.discard(tid)
+        else:
+            batch.unvalidated.add(tid)
+        return
+    if not validated:
+        _validate_thesis(thesis)
+    path = state_dir / f"{tid}.yaml"
     _atomic_write_yaml(path, thesis)
 
 
@@ -933,15 +1092,149 @@ def _project_index_fields(thesis: dict) -> dict:
     }
 
 
+def _empty_index() -> dict:
+    return {
+        "version": INDEX_VERSION,
+        "theses": {},
+        "by_fingerprint": {},
+        "by_status": {},
+        "review_queue": [],
+    }
+
+
+def _review_queue_key(entry: dict) -> str | None:
+    """next_review_date if the entry belongs in the review queue, else None."""
+    if entry.get("status") in _TERMINAL_STATUSES:
+        return None
+    nrd = entry.get("next_review_date")
+    if isinstance(nrd, str) and _DATE_RE.match(nrd):
+        return nrd
+    return None
+
+
+def _build_secondary_indexes(theses: dict) -> dict:
+    """Derive the reverse maps stored alongside ``theses`` in _index.json.
+
+    - by_fingerprint: origin_fingerprint -> thesis_id (first registrant wins)
+    - by_status: status -> [thesis_id, ...]
+    - review_queue: [[next_review_date, thesis_id], ...] sorted, non-terminal only
+    """
+    by_fingerprint: dict[str, str] = {}
+    by_status: dict[str, list[str]] = {}
+    review_queue = []
+    for tid, entry in theses.items():
+        fingerprint = entry.get("origin_fingerprint")
+        if fingerprint:
+            by_fingerprint.setdefault(fingerprint, tid)
+        if entry.get("status"):
+            by_status.setdefault(entry["status"], []).append(tid)
+        key = _review_queue_key(entry)
+        if key:
+            review_queue.append([key, tid])
+    review_queue.sort()
+    return {
+        "by_fingerprint": by_fingerprint,
+        "by_status": by_status,
+        "review_queue": review_queue,
+    }
+
+
+def _ensure_secondary_indexes(index: dict) -> dict:
+    """Add the reverse maps to a v1 (or SQLite-loaded) index in place."""
+    if not all(key in index for key in _SECONDARY_INDEX_KEYS):
+        index.update(_build_secondary_indexes(index.setdefault("theses", {})))
+        index["version"] = INDEX_VERSION
+    return index
+
+
 def _update_index_entry(index: dict, thesis: dict) -> None:
-    """Update the index entry for a thesis."""
+    """Update the index entry for a thesis and keep the reverse maps in step.
+
+    Each map is patched incrementally (dict ops plus a bisect into the sorted
+    review queue), so an upsert stays O(log n) apart from status list edits.
+    """
+    _ensure_secondary_indexes(index)
     tid = thesis["thesis_id"]
-    index["theses"][tid] = _project_index_fields(thesis)
+    old = index["theses"].get(tid) or {}
+    new = _project_index_fields(thesis)
+    index["theses"][tid] = new
+
+    by_fingerprint = index["by_fingerprint"]
+    old_fp, new_fp = old.get("origin_fingerprint"), new.get("origin_fingerprint")
+    if old_fp != new_fp and old_fp and by_fingerprint.get(old_fp) == tid:
+        del by_fingerprint[old_fp]
+    if new_fp:
+        by_fingerprint.setdefault(new_fp, tid)
+
+    by_status = index["by_status"]
+    old_status, new_status = old.get("status"), new.get("status")
+    if old_status != new_status:
+        if old_status and tid in by_status.get(old_status, []):
+            by_status[old_status].remove(tid)
+            if not by_status[old_status]:
+                del by_status[old_status]
+        if new_status:
+            by_status.setdefault(new_status, []).append(tid)
+
+    queue = index["review_queue"]
+    old_key, new_key = _review_queue_key(old), _review_queue_key(new)
+    if old_key != new_key:
+        if old_key:
+            pos = bisect.bisect_left(queue, [old_key, tid])
+            if pos < len(queue) and queue[pos] == [old_key, tid]:
+                del queue[pos]
+        if new_key:
+            bisect.insort(queue, [new_key, tid])
+
+
+def _index_upsert(state_dir: Path, thesis: dict) -> None:
+    """Persist one thesis's index entry on whichever backend *state_dir* uses."""
+    batch = _active_batch(state_dir)
+    if batch is not None:
+        _update_index_entry(batch.load_index(), thesis)
+        return
+    if thesis_index_sqlite.is_enabled(state_dir):
+        thesis_index_sqlite.upsert(state_dir, thesis["thesis_id"], _project_index_fields(thesis))
+        return
+    index = _load_index(state_dir)
+    _update_index_entry(index, thesis)
+    _save_index(state_dir, index)
 
 
 # -- Public API ---------------------------------------------------------------
 
 
+@contextmanager
+def batch(state_dir: Path):
+    """Group many mutations on *state_dir* into one flush.
+
+    Inside the block every public function (register, update, transition,
+    trim, close, mark_reviewed, ...) applies its change to an in-memory copy
+    of the thesis and index, and reads (get, query, fingerprint dedup) see
+    those pending changes.  On normal exit each changed thesis is validated
+    once, its YAML is written, and the index is written a single time,
+    instead of one full index rewrite per call.  If the block raises, or a
+    pending thesis fails validation at flush, nothing is written.
+
+    Other processes (and skills reading th_*.yaml directly) only see the
+    changes after the block exits.  Nested blocks on the same state dir join
+    the outer batch.  A batch is not meant to be shared across threads.
+    """
+    key = os.path.abspath(state_dir)
+    if key in _BATCHES:
+        yield
+        return
+    pending = _Batch(Path(state_dir))
+    _BATCHES[key] = pending
+    try:
+        yield
+    except BaseException:
+        del _BATCHES[key]
+        raise
+    del _BATCHES[key]
+    pending.flush()
+
+
 def _build_thesis_for_registration(thesis_data: dict) -> dict:
     """Build and validate the full thesis object without writing it."""
     required = ["ticker", "thesis_type", "thesis_statement"]
@@ -1062,12 +1355,10 @@ def register(state_dir: Path, thesis_data: dict) -> str:
         )
         return existing_tid
 
-    # Persist
-    _save_thesis(state_dir, thesis)
+    # Persist (already validated by _build_thesis_for_registration)
+    _save_thesis(state_dir, thesis, validated=True)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Registered thesis %s for %s", thesis["thesis_id"], thesis["ticker"])
     return thesis["thesis_id"]
@@ -1103,9 +1394,26 @@ def query(
 
     Returns list of matching index entries (lightweight, not full thesis).
     """
+    if _use_sqlite(state_dir):
+        return thesis_index_sqlite.query(
+            state_dir,
+            ticker=ticker,
+            status=status,
+            thesis_type=thesis_type,
+            date_from=date_from,
+            date_to=date_to,
+        )
     index = _load_index(state_dir)
+    theses = index["theses"]
+    if status:
+        # by_status lists theses in the order they entered the status; use it
+        # only for membership so results keep registration (index) order.
+        members = set(index["by_status"].get(status, ()))
+        candidates = [(tid, entry) for tid, entry in theses.items() if tid in members]
+    else:
+        candidates = theses.items()
     results = []
-    for tid, entry in index.get("theses", {}).items():
+    for tid, entry in candidates:
         if ticker and entry.get("ticker", "").upper() != ticker.upper():
             continue
         if status and entry.get("status") != status:
@@ -1204,9 +1512,7 @@ def update(state_dir: Path, thesis_id: str, fields: dict) -> dict:
     thesis["updated_at"] = now
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     return thesis
 
@@ -1272,9 +1578,7 @@ def transition(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Transitioned %s: %s → %s (%s)", thesis_id, current, new_status, reason)
     return thesis
@@ -1391,9 +1695,7 @@ def attach_position(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Attached position to %s: %s shares", thesis_id, thesis["position"]["shares"])
     return thesis
@@ -1578,9 +1880,7 @@ def attach_futures_position(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info(
         "Attached futures position to %s: %s %s contracts (%s, mult=%s)",
@@ -1601,9 +1901,7 @@ def link_report(state_dir: Path, thesis_id: str, skill: str, file: str, date: st
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     return thesis
 
@@ -1961,9 +2259,7 @@ def close(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info(
         "Closed %s: %s, P&L=%.2f%%",
@@ -2035,9 +2331,7 @@ def _close_futures(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info(
         "Closed %s: %s, P&L=%.2f",
@@ -2188,9 +2482,7 @@ def trim(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info(
         "Trimmed %s: sold %s @ %.4f → %s remaining, status %s",
@@ -2341,9 +2633,7 @@ def _trim_futures(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info(
         "Trimmed %s: sold %s contracts @ %.4f → %s remaining, status %s",
@@ -2473,9 +2763,7 @@ def open_position(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Opened position %s at %.2f", thesis_id, actual_price)
     return thesis
@@ -2604,9 +2892,7 @@ def _open_futures_position(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info(
         "Opened futures position %s at %.2f (%s contracts)",
@@ -2768,9 +3054,7 @@ def terminate(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Terminated %s → INVALIDATED: %s", thesis_id, exit_reason)
     return thesis
@@ -2851,9 +3135,7 @@ def _terminate_futures(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Terminated %s → INVALIDATED: %s", thesis["thesis_id"], exit_reason)
     return thesis
@@ -2906,9 +3188,7 @@ def mark_reviewed(
 
     _save_thesis(state_dir, thesis)
 
-    index = _load_index(state_dir)
-    _update_index_entry(index, thesis)
-    _save_index(state_dir, index)
+    _index_upsert(state_dir, thesis)
 
     logger.info("Reviewed %s: %s → next %s", thesis_id, outcome, next_review)
     return thesis
@@ -2927,12 +3207,27 @@ def list_review_due(state_dir: Path, as_of: str) -> list[dict]:
         as_of: Date string (YYYY-MM-DD) for comparison.
 
     Returns:
-        List of index entries for theses due for review.
+        List of index entries for theses due for review, ordered by
+        (next_review_date, thesis_id).  The JSON backend bisects the sorted
+        review_queue instead of parsing every entry's date.
     """
     as_of_date = date.fromisoformat(as_of)
-    index = _load_index(state_dir)
+    if _use_sqlite(state_dir):
+        candidates = thesis_index_sqlite.review_candidates(
+            state_dir, as_of_date.isoformat(), _TERMINAL_STATUSES
+        )
+        entries = ((entry.pop("thesis_id"), entry) for entry in candidates)
+    else:
+        index = _load_index(state_dir)
+        queue = index["review_queue"]
+        end = bisect.bisect_right(queue, [as_of_date.isoformat(), "\uffff"])
+        entries = [
+            (tid, index["theses"][tid])
+            for nrd, tid in queue[:end]
+            if index["theses"].get(tid, {}).get("next_review_date") == nrd
+        ]
     results = []
-    for tid, entry in index.get("theses", {}).items():
+    for tid, entry in entries:
         if entry.get("status") in _TERMINAL_STATUSES:
             continue
         nrd = entry.get("next_review_date")
@@ -2951,12 +3246,14 @@ def list_review_due(state_dir: Path, as_of: str) -> list[dict]:
 def rebuild_index(state_dir: Path) -> dict:
     """Rebuild _index.json from valid th_*.yaml files.
 
-    Skips files that fail schema or business invariant validation.
+    Skips files that fail schema or business invariant validation.  The
+    reverse maps (by_fingerprint, by_status, review_queue) are regenerated
+    along with the entries.
 
     Returns:
         The rebuilt index dict.
     """
-    index = {"version": 1, "theses": {}}
+    index = _empty_index()
     for yaml_path in sorted(state_dir.glob("th_*.yaml")):
         try:
             thesis = yaml.safe_load(yaml_path.read_text())
@@ -2972,12 +3269,57 @@ def rebuild_index(state_dir: Path) -> dict:
     return index
 
 
+def migrate_to_sqlite(state_dir: Path) -> dict:
+    """One-shot migration of a YAML + _index.json state dir to the SQLite index.
+
+    Rows are rebuilt from the validated th_*.yaml files (the canonical record,
+    exactly as rebuild_index() does), then _index.json is renamed to
+    _index.json.pre-sqlite so the inactive JSON index cannot drift silently.
+    To roll back, delete _index.sqlite3 and run rebuild-index.
+
+    Returns:
+        {"migrated": int, "skipped": [file names failing validation]}
+
+    Raises:
+        ValueError: If *state_dir* already uses the SQLite index.
+    """
+    if thesis_index_sqlite.is_enabled(state_dir):
+        raise ValueError(f"{state_dir} already uses the SQLite index ({SQLITE_INDEX_FILE})")
+    state_dir.mkdir(parents=True, exist_ok=True)
+
+    index = _empty_index()
+    skipped = []
+    for yaml_path in sorted(state_dir.glob("th_*.yaml")):
+        try:
+            thesis = yaml.safe_load(yaml_path.read_text())
+            if thesis and "thesis_id" in thesis:
+                _validate_thesis(thesis)
+                _update_index_entry(index, thesis)
+        except Exception as e:
+            logger.warning("Skipping invalid file %s: %s", yaml_path.name, e)
+            skipped.append(yaml_path.name)
+
+    thesis_index_sqlite.create(state_dir)
+    try:
+        thesis_index_sqlite.replace_all(state_dir, index)
+    except BaseException:
+        thesis_index_sqlite.db_path(state_dir).unlink()
+        raise
+    json_path = state_dir / INDEX_FILE
+    if json_path.exists():
+        os.replace(json_path, state_dir / f"{INDEX_FILE}.pre-sqlite")
+
+    logger.info("Migrated %d theses to %s", len(index["theses"]), SQLITE_INDEX_FILE)
+    return {"migrated": len(index["theses"]), "skipped": skipped}
+
+
 def validate_state(state_dir: Path) -> dict:
     """Check file ⇔ index consistency and schema validity.
 
     Returns:
         {"ok": bool, "missing_in_index": [...], "orphaned_in_index": [...],
-         "field_mismatches": [...], "schema_errors": [...]}
+         "field_mismatches": [...], "schema_errors": [...],
+         "secondary_index_errors": [names of stale _index.json reverse maps]}
     """
     index = _load_index(state_dir)
     index_ids = set(index.get("theses", {}).keys())
@@ -3018,11 +3360,26 @@ def validate_state(state_dir: Path) -> dict:
                     }
                 )
 
+    secondary_index_errors = []
+    if not thesis_index_sqlite.is_enabled(state_dir):
+        expected_maps = _build_secondary_indexes(index["theses"])
+        for key in _SECONDARY_INDEX_KEYS:
+            stored = index.get(key)
+            expected_map = expected_maps[key]
+            if key == "by_status":
+                # List order records when theses entered a status; only
+                # membership matters for consistency.
+                stored = {k: sorted(v) for k, v in (stored or {}).items()}
+                expected_map = {k: sorted(v) for k, v in expected_map.items()}
+            if stored != expected_map:
+                secondary_index_errors.append(key)
+
     ok = (
         not missing_in_index
         and not orphaned_in_index
         and not field_mismatches
         and not schema_errors
+        and not secondary_index_errors
     )
     return {
         "ok": ok,
@@ -3030,6 +3387,7 @@ def validate_state(state_dir: Path) -> dict:
         "orphaned_in_index": sorted(orphaned_in_index),
         "field_mismatches": field_mismatches,
         "schema_errors": schema_errors,
+        "secondary_index_errors": secondary_index_errors,
     }
 
 
@@ -3189,6 +3547,9 @@ def main(argv: list[str] | None = None) -> int:
     # doctor
     sub.add_parser("doctor", help="Validate file/index consistency")
 
+    # migrate-sqlite
+    sub.add_parser("migrate-sqlite", help="One-shot migration of _index.json to the SQLite index")
+
     # mark-reviewed
     mr_p = sub.add_parser("mark-reviewed", help="Record a review")
     mr_p.add_argument("thesis_id", help="Thesis ID")
@@ -3341,6 +3702,9 @@ def main(argv: list[str] | None = None) -> int:
     elif args.command == "doctor":
         result = validate_state(state_dir)
         print(json.dumps(result, indent=2))
+    elif args.command == "migrate-sqlite":
+        result = migrate_to_sqlite(state_dir)
+        print(json.dumps(result, indent=2))
     elif args.command == "mark-reviewed":
         t = mark_reviewed(
             state_dir,
@@ -8,10 +8,14 @@ No API key required - uses publicly available CSV files.
 Data Sources:
 - Timeseries: uptrend_ratio_timeseries.csv (all + 11 sectors, 2023/08~present)
 - Sector Summary: sector_summary.csv (latest snapshot)
+
+With ``data_dir`` set, the same file names are read from a local directory
+(e.g. one prefetched by the daily dashboard) instead of downloaded.
 """
 
 import csv
 import io
+import os
 import sys
 from typing import Optional
 
@@ -87,11 +91,26 @@ def build_summary_from_timeseries(sector_timeseries: dict[str, dict]) -> list[di
 class UptrendDataFetcher:
     """Client for Monty's Uptrend Ratio Dashboard CSV data"""
 
-    def __init__(self):
+    def __init__(self, data_dir: Optional[str] = None):
+        self.data_dir = data_dir
         self.session = requests.Session()
         self._timeseries_cache: Optional[list[dict]] = None
         self._sector_summary_cache: Optional[list[dict]] = None
 
+    def _read_csv_text(self, url: str) -> str:
+        """Return the CSV text for ``url``, from ``data_dir`` when one is set.
+
+        Raises:
+            requests.exceptions.RequestException, OSError: on failure.
+        """
+        if self.data_dir:
+            path = os.path.join(self.data_dir, url.rsplit("/", 1)[-1])
+            with open(path, encoding="utf-8") as f:
+                return f.read()
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return response.text
+
     def fetch_timeseries(self) -> list[dict]:
         """Download and parse the timeseries CSV.
 
@@ -103,14 +122,13 @@ class UptrendDataFetcher:
             return self._timeseries_cache
 
         try:
-            response = self.session.get(TIMESERIES_URL, timeout=30)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
+            text = self._read_csv_text(TIMESERIES_URL)
+        except (requests.exceptions.RequestException, OSError) as e:
             print(f"WARNING: Failed to fetch timeseries CSV: {e}", file=sys.stderr)
             return []
 
         rows = []
-        reader = csv.DictReader(io.StringIO(response.text))
+        reader = csv.DictReader(io.StringIO(text))
         for row in reader:
             parsed = _parse_timeseries_row(row)
             if parsed:
@@ -130,14 +148,13 @@ class UptrendDataFetcher:
             return self._sector_summary_cache
 
         try:
-            response = self.session.get(SECTOR_SUMMARY_URL, timeout=30)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
+            text = self._read_csv_text(SECTOR_SUMMARY_URL)
+        except (requests.exceptions.RequestException, OSError) as e:
             print(f"WARNING: Failed to fetch sector summary CSV: {e}", file=sys.stderr)
             return []
 
         rows = []
-        reader = csv.DictReader(io.StringIO(response.text))
+        reader = csv.DictReader(io.StringIO(text))
         for row in reader:
             parsed = _parse_sector_summary_row(row)
             if parsed:
@@ -229,6 +229,17 @@ class TestUptrendDataFetcherMocked:
             fetcher.fetch_timeseries()
             assert mock_get.call_count == 1
 
+    def test_data_dir_reads_local_files_without_http(self, tmp_path):
+        (tmp_path / "uptrend_ratio_timeseries.csv").write_text(SAMPLE_CSV, encoding="utf-8")
+        fetcher = UptrendDataFetcher(data_dir=str(tmp_path))
+        with patch.object(fetcher.session, "get") as mock_get:
+            rows = fetcher.fetch_timeseries()
+            summary = fetcher.fetch_sector_summary()
+        mock_get.assert_not_called()
+        assert [row["worksheet"] for row in rows] == ["all", "sec_technology"]
+        # sector_summary.csv was not prefetched: same empty result as a failed download
+        assert summary == []
+
 
 # --- build_summary_from_timeseries edge cases ---
 
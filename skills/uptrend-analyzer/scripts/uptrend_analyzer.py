@@ -46,6 +46,14 @@ def parse_arguments():
     parser.add_argument(
         "--output-dir", default="reports/", help="Output directory for reports (default: reports/)"
     )
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help=(
+            "Read uptrend_ratio_timeseries.csv and sector_summary.csv from this "
+            "directory instead of downloading them"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -64,7 +72,7 @@ def main():
     print("Step 1: Fetching CSV Data")
     print("-" * 70)
 
-    fetcher = UptrendDataFetcher()
+    fetcher = UptrendDataFetcher(data_dir=args.data_dir)
 
     print("  Fetching timeseries data...", end=" ", flush=True)
     timeseries = fetcher.fetch_timeseries()
@@ -46,7 +46,21 @@ def calculate_relative_strength(
     Returns:
         Dict with score (0-100), rs_rank_estimate, weighted_rs, period details
     """
-    if not stock_prices or len(stock_prices) < 63:
+    stock_closes = [d.get("close", d.get("adjClose", 0)) for d in stock_prices or []]
+    sp500_closes = [d.get("close", d.get("adjClose", 0)) for d in sp500_prices or []]
+    return calculate_relative_strength_from_closes(stock_closes, sp500_closes)
+
+
+def calculate_relative_strength_from_closes(
+    stock_closes: list[float],
+    sp500_closes: list[float],
+) -> dict:
+    """
+    Same as ``calculate_relative_strength`` on pre-extracted close columns
+    (most recent first). Used by the walk-forward scanner, which extracts the
+    closes once per ticker instead of once per as-of cursor.
+    """
+    if not stock_closes or len(stock_closes) < 63:
         return {
             "score": 0,
             "rs_rank_estimate": 0,
@@ -54,7 +68,7 @@ def calculate_relative_strength(
             "error": "Insufficient stock price data (need 63+ days)",
         }
 
-    if not sp500_prices or len(sp500_prices) < 63:
+    if not sp500_closes or len(sp500_closes) < 63:
         return {
             "score": 0,
             "rs_rank_estimate": 0,
@@ -62,9 +76,6 @@ def calculate_relative_strength(
             "error": "Insufficient S&P 500 price data (need 63+ days)",
         }
 
-    stock_closes = [d.get("close", d.get("adjClose", 0)) for d in stock_prices]
-    sp500_closes = [d.get("close", d.get("adjClose", 0)) for d in sp500_prices]
-
     weighted_rs = 0.0
     total_weight = 0.0
     period_details = []
@@ -27,6 +27,7 @@ def calculate_trend_template(
     rs_rank: Optional[int] = None,
     ext_threshold: float = 8.0,
     max_sma200_extension: float = 50.0,
+    closes: Optional[list[float]] = None,
 ) -> dict:
     """
     Evaluate stock against Minervini's 7-point Trend Template.
@@ -35,6 +36,8 @@ def calculate_trend_template(
         historical_prices: Daily OHLCV data (most recent first), need 200+ days
         quote_data: Current quote with price, yearHigh, yearLow
         rs_rank: Pre-calculated RS rank estimate (0-99). If None, criterion 7 is skipped.
+        closes: Optional close column already extracted from
+            ``historical_prices`` (walk-forward scanner); skips re-extraction.
 
     Returns:
         Dict with score (0-100), criteria details, pass/fail status
@@ -47,7 +50,8 @@ def calculate_trend_template(
             "error": "Insufficient historical data (need 50+ days)",
         }
 
-    closes = [d.get("close", d.get("adjClose", 0)) for d in historical_prices]
+    if closes is None:
+        closes = [d.get("close", d.get("adjClose", 0)) for d in historical_prices]
     price = quote_data.get("price", closes[0] if closes else 0)
     year_high = quote_data.get("yearHigh", 0)
     year_low = quote_data.get("yearLow", 0)
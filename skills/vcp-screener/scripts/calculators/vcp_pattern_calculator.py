@@ -29,6 +29,7 @@ def calculate_vcp_pattern(
     t1_depth_min: float = 8.0,
     contraction_ratio: float = 0.75,
     wide_and_loose_threshold: float = 15.0,
+    window: Optional[dict] = None,
 ) -> dict:
     """
     Detect Volatility Contraction Pattern in price data.
@@ -44,6 +45,10 @@ def calculate_vcp_pattern(
         min_contraction_days: Minimum days for a contraction to count
         wide_and_loose_threshold: Final contraction depth % above which (combined
             with <10-day duration) flags a wide-and-loose pattern (default 15.0)
+        window: Optional columns of ``historical_prices[:lookback_days]``
+            precomputed by the walk-forward scanner: chronological ``highs``,
+            ``lows``, ``closes``, ``dates`` lists and ``atr`` ``{period: ATR}``
+            for ``atr_period``, 10 and 50
 
     Returns:
         Dict with score (0-100), contractions list, pattern validity, pivot point,
@@ -74,16 +79,30 @@ def calculate_vcp_pattern(
         return empty_result
 
     # Extract price arrays
-    highs = [d.get("high", d.get("close", 0)) for d in prices]
-    lows = [d.get("low", d.get("close", 0)) for d in prices]
-    closes = [d.get("close", 0) for d in prices]
-    dates = [d.get("date", f"day-{i}") for i, d in enumerate(prices)]
+    if window is not None:
+        highs, lows, closes, dates = (
+            window["highs"],
+            window["lows"],
+            window["closes"],
+            window["dates"],
+        )
+    else:
+        highs = [d.get("high", d.get("close", 0)) for d in prices]
+        lows = [d.get("low", d.get("close", 0)) for d in prices]
+        closes = [d.get("close", 0) for d in prices]
+        dates = [d.get("date", f"day-{i}") for i, d in enumerate(prices)]
 
     # Step A: Find swing points using ZigZag (primary) with fixed-window fallback
-    atr_val = _calculate_atr(highs, lows, closes, atr_period)
-    atr_10 = _calculate_atr(highs, lows, closes, 10)
-    atr_50 = _calculate_atr(highs, lows, closes, 50)
-    zz_highs, zz_lows = _zigzag_swing_points(highs, lows, closes, dates, atr_multiplier, atr_period)
+    if window is not None:
+        atr = window["atr"]
+        atr_val, atr_10, atr_50 = atr[atr_period], atr[10], atr[50]
+    else:
+        atr_val = _calculate_atr(highs, lows, closes, atr_period)
+        atr_10 = _calculate_atr(highs, lows, closes, 10)
+        atr_50 = _calculate_atr(highs, lows, closes, 50)
+    zz_highs, zz_lows = _zigzag_swing_points(
+        highs, lows, closes, dates, atr_multiplier, atr_period, atr=atr_val
+    )
 
     # Use ZigZag results if they have enough points, otherwise fallback
     if len(zz_highs) >= 1 and len(zz_lows) >= 1:
@@ -240,6 +259,7 @@ def _zigzag_swing_points(
     dates: list[str],
     atr_multiplier: float = 1.5,
     atr_period: int = 14,
+    atr: Optional[float] = None,
 ) -> tuple:
     """ATR-based ZigZag swing detection.
 
@@ -253,6 +273,7 @@ def _zigzag_swing_points(
         dates: Date strings (chronological, oldest first)
         atr_multiplier: Multiplier for ATR threshold
         atr_period: ATR calculation period
+        atr: ATR(atr_period) of these bars when the caller already has it
 
     Returns:
         (swing_highs: [(idx, val)], swing_lows: [(idx, val)])
@@ -261,7 +282,8 @@ def _zigzag_swing_points(
     if n < atr_period + 1:
         return [], []
 
-    atr = _calculate_atr(highs, lows, closes, atr_period)
+    if atr is None:
+        atr = _calculate_atr(highs, lows, closes, atr_period)
     if atr <= 0:
         return [], []
 
@@ -35,6 +35,8 @@ def calculate_volume_pattern(
     pivot_price: Optional[float] = None,
     contractions: Optional[list[dict]] = None,
     breakout_volume_ratio: float = 1.5,
+    volumes: Optional[list[float]] = None,
+    closes: Optional[list[float]] = None,
 ) -> dict:
     """
     Analyze volume behavior near the VCP pivot point.
@@ -50,6 +52,8 @@ def calculate_volume_pattern(
         historical_prices: Daily OHLCV data (most recent first), need 50+ days
         pivot_price: The pivot (breakout) price level. If None, uses recent high.
         contractions: List of contraction dicts with high_idx/low_idx (chronological)
+        volumes / closes: Optional columns already extracted from
+            ``historical_prices`` (walk-forward scanner); skips re-extraction.
 
     Returns:
         Dict with score (0-100), dry_up_ratio, volume details
@@ -61,8 +65,10 @@ def calculate_volume_pattern(
             "error": "Insufficient data (need 20+ days)",
         }
 
-    volumes = [d.get("volume", 0) for d in historical_prices]
-    closes = [d.get("close", d.get("adjClose", 0)) for d in historical_prices]
+    if volumes is None:
+        volumes = [d.get("volume", 0) for d in historical_prices]
+    if closes is None:
+        closes = [d.get("close", d.get("adjClose", 0)) for d in historical_prices]
 
     # 50-day average volume (or available)
     vol_period = min(50, len(volumes))
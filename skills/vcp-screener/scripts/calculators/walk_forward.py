@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Walk-Forward Series - per-ticker columns shared by every as-of cursor
+
+The historical scanner evaluates the same ticker at hundreds of as-of offsets.
+Each ``analyze_stock`` call used to re-extract closes/highs/lows from the bar
+dicts of the whole remaining history and re-run the true-range loop for every
+ATR, which made stride 1 impractical.
+
+``WalkForwardSeries`` extracts those columns once per ticker (most-recent-first,
+same ``dict.get`` fallbacks as the calculators) and precomputes the true range
+of every bar.  Per-cursor values are then read from the columns:
+
+- ``closes_from(o)`` / ``sp500_closes_from(o)``: the close column as seen from
+  ``historical[o:]`` (a list slice, no dict access)
+- ``quote(o)``: the synthesized quote of ``build_quote_from_history``
+- ``vcp_window(o, lookback_days)``: chronological highs/lows/closes/dates of
+  the VCP lookback window plus its ATR(10/14/50)
+- ``volume_window(o, lookback_days)``: volume/close columns of that window
+
+Window sums are taken over the same elements in the same order as the
+calculators (no running sums), so every value is bit-identical to the
+per-cursor path.
+"""
+
+from typing import Optional
+
+ATR_PERIODS = (10, 14, 50)
+
+_NO_DATE = object()
+
+
+class WalkForwardSeries:
+    """Column view of one ticker's most-recent-first history plus SPY."""
+
+    def __init__(
+        self,
+        historical: list[dict],
+        sp500_history: Optional[list[dict]] = None,
+        year_window_bars: int = 252,
+    ):
+        self.num_bars = len(historical)
+        self.year_window_bars = year_window_bars
+
+        # Trend template / RS closes fall back to adjClose; the VCP calculator
+        # and the synthesized quote use their own defaults, kept separate so a
+        # bar with missing fields resolves exactly as it does per cursor.
+        self.closes = [d.get("close", d.get("adjClose", 0)) for d in historical]
+        self.sp500_closes = [d.get("close", d.get("adjClose", 0)) for d in sp500_history or []]
+        self.has_sp500 = bool(sp500_history)
+
+        self.vcp_highs = [d.get("high", d.get("close", 0)) for d in historical]
+        self.vcp_lows = [d.get("low", d.get("close", 0)) for d in historical]
+        self.vcp_closes = [d.get("close", 0) for d in historical]
+        self.dates = [d.get("date", _NO_DATE) for d in historical]
+        self.all_dated = _NO_DATE not in self.dates
+
+        self.quote_highs = [d.get("high", 0) for d in historical]
+        self.quote_lows = [d.get("low", 0) for d in historical]
+        self.volumes = [d.get("volume", 0) for d in historical]
+
+        # true_ranges[j]: TR of bar j against the older bar j + 1.
+        highs, lows, closes = self.vcp_highs, self.vcp_lows, self.vcp_closes
+        self.true_ranges = [
+            max(
+                highs[j] - lows[j],
+                abs(highs[j] - closes[j + 1]),
+                abs(lows[j] - closes[j + 1]),
+            )
+            for j in range(self.num_bars - 1)
+        ]
+
+    def closes_from(self, offset: int) -> list[float]:
+        """Closes of ``historical[offset:]`` (most recent first)."""
+        return self.closes[offset:] if offset > 0 else self.closes
+
+    def sp500_closes_from(self, offset: int) -> list[float]:
+        """SPY closes sliced like ``analyze_stock`` slices ``sp500_history``."""
+        if offset > 0 and self.has_sp500:
+            return self.sp500_closes[offset:]
+        return self.sp500_closes
+
+    def quote(self, offset: int) -> dict:
+        """Same fields as ``historical_scanner.build_quote_from_history``."""
+        if offset < 0 or offset >= self.num_bars:
+            return {"price": 0, "yearHigh": 0, "yearLow": 0, "avgVolume": 0, "marketCap": 0}
+
+        end = offset + self.year_window_bars
+        year_high = max(self.quote_highs[offset:end])
+        year_low = min(low for low in self.quote_lows[offset:end] if low > 0)
+        vol_window = self.volumes[offset : offset + 50]
+        return {
+            "price": self.vcp_closes[offset],
+            "yearHigh": year_high,
+            "yearLow": year_low,
+            "avgVolume": int(sum(vol_window) / len(vol_window)),
+            "marketCap": 0,
+        }
+
+    def vcp_window(self, offset: int, lookback_days: int) -> dict:
+        """Columns ``calculate_vcp_pattern`` derives from its lookback window.
+
+        ATRs mirror ``vcp_pattern_calculator._calculate_atr`` on the
+        chronological window: 0.0 unless the window holds ``period + 1`` bars,
+        otherwise the mean of the newest ``period`` true ranges summed oldest
+        first.
+        """
+        end = offset + lookback_days
+        n = min(lookback_days, self.num_bars - offset)
+        dates = self.dates[offset:end][::-1]
+        if not self.all_dated:
+            dates = [f"day-{i}" if d is _NO_DATE else d for i, d in enumerate(dates)]
+
+        atr = {}
+        for period in ATR_PERIODS:
+            if n < period + 1:
+                atr[period] = 0.0
+            else:
+                atr[period] = sum(self.true_ranges[offset : offset + period][::-1]) / period
+        return {
+            "highs": self.vcp_highs[offset:end][::-1],
+            "lows": self.vcp_lows[offset:end][::-1],
+            "closes": self.vcp_closes[offset:end][::-1],
+            "dates": dates,
+            "atr": atr,
+        }
+
+    def volume_window(self, offset: int, lookback_days: int) -> dict:
+        """Volume and close columns of ``historical[offset:offset + lookback_days]``."""
+        end = offset + lookback_days
+        return {"volumes": self.volumes[offset:end], "closes": self.closes[offset:end]}
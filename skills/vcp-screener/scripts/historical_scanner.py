@@ -10,6 +10,8 @@ and what happened after each one?"
 Pipeline:
   1. Fetch a long history (e.g. ~5 years) once.
   2. Walk the as-of cursor backwards in time at ``stride_days`` (default 5).
+     Per-ticker columns (closes, true ranges, quote inputs) are extracted
+     once up front so each cursor only reads them.
   3. At each cursor position, synthesize a quote (no future-bar peeking) and
      call ``analyze_stock(..., as_of_offset=cursor)``.
   4. For every ``valid_vcp=True`` detection, compute the forward outcome
@@ -32,6 +34,7 @@ import screen_vcp  # noqa: E402  — bound at module load so tests can monkeypat
 
 # `historical_scanner.screen_vcp.analyze_stock` deterministically.
 from calculators.forward_outcome import calculate_forward_outcome  # noqa: E402
+from calculators.walk_forward import WalkForwardSeries  # noqa: E402
 
 _TICKER_RE = re.compile(r"^[A-Z][A-Z0-9.\-]{0,11}$")
 
@@ -99,6 +102,7 @@ def scan_history(
     outcome_days: int = 60,
     lookback_days: int = 120,
     analyzer_kwargs: dict | None = None,
+    walk_forward: bool = True,
 ) -> list[dict]:
     """Walk ``historical`` from oldest scannable bar to ``outcome_days`` ago,
     detect VCPs, deduplicate, and attach forward outcomes.
@@ -114,6 +118,10 @@ def scan_history(
         lookback_days: Window passed to the VCP calculator (default 120).
         analyzer_kwargs: Extra kwargs forwarded to ``analyze_stock`` (e.g.
             ``min_contractions``, ``t1_depth_min``, etc.).
+        walk_forward: Extract the ticker's columns and true ranges once
+            (``WalkForwardSeries``) and let every cursor read them, instead of
+            re-deriving them from the bar dicts per cursor. Output is
+            identical; it is what makes ``stride_days=1`` practical.
 
     Returns:
         List of detection dicts (chronological), each shaped as the
@@ -125,6 +133,9 @@ def scan_history(
 
     analyzer_kwargs = dict(analyzer_kwargs or {})
     analyzer_kwargs.pop("as_of_offset", None)  # caller cannot override the cursor
+    series = WalkForwardSeries(historical, sp500_history) if walk_forward else None
+    if series is not None:
+        analyzer_kwargs["walk_forward"] = series
 
     # Largest scannable offset is len(historical) - lookback_days; smaller
     # offsets get less forward data (outcomes resolve via timeout /
@@ -139,7 +150,10 @@ def scan_history(
     detections: list[dict] = []
 
     for offset in offsets:
-        quote = build_quote_from_history(historical, offset)
+        if series is not None:
+            quote = series.quote(offset)
+        else:
+            quote = build_quote_from_history(historical, offset)
         if quote.get("price", 0) <= 0:
             continue
 
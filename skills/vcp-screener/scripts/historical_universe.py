@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Historical VCP Universe Scan — run ``scan_history`` over many tickers.
+
+Builds a VCP outcome dataset (every historical detection plus its forward
+outcome) for a whole universe in one run instead of one ``--history`` call
+per ticker:
+
+  1. SPY history is fetched once and handed to every worker process via the
+     pool initializer (not re-pickled per task).
+  2. Ticker histories are fetched in chunks by the caller-supplied fetcher
+     while the process pool scans previously fetched tickers.
+  3. As each ticker finishes, its detections are appended to a JSONL sink,
+     followed by a ``ticker`` marker row, and the file is flushed.
+  4. ``resume=True`` skips tickers that already have an ``ok`` marker in the
+     sink.  Rows of a ticker whose marker never got written (crash, Ctrl-C)
+     and a torn trailing line are dropped first, so resumed sinks never hold
+     duplicate detections.
+
+Sink rows (one JSON object per line):
+  {"record": "detection", "symbol": ..., <analyze_stock fields>,
+   "as_of_date": ..., "forward_outcome": {...}}
+  {"record": "ticker", "symbol": ..., "status": "ok" | "no_data" | "error",
+   "bars": N, "detections": K, "error": null | "..."}
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from historical_scanner import scan_history  # noqa: E402
+
+# Per-process state set by _init_worker (SPY history + scan parameters).
+_WORKER_STATE: dict = {}
+
+
+def _init_worker(sp500_history: list[dict], scan_kwargs: dict) -> None:
+    _WORKER_STATE["sp500_history"] = sp500_history
+    _WORKER_STATE["scan_kwargs"] = scan_kwargs
+
+
+def _scan_ticker(symbol: str, historical: list[dict], meta: dict) -> list[dict]:
+    return scan_history(
+        symbol,
+        historical,
+        _WORKER_STATE["sp500_history"],
+        sector=meta.get("sector", "Unknown"),
+        company_name=meta.get("company_name", ""),
+        **_WORKER_STATE["scan_kwargs"],
+    )
+
+
+def load_completed(sink_path: str) -> set[str]:
+    """Return tickers with an ``ok`` marker, repairing the sink in place.
+
+    Detection rows of tickers without an ``ok`` marker, stale non-ok markers
+    (those tickers are retried) and unparseable lines are removed with an
+    atomic rewrite; the file is left untouched when nothing needs dropping.
+    """
+    if not os.path.exists(sink_path):
+        return set()
+
+    rows = []
+    torn = False
+    with open(sink_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                torn = True
+
+    completed = {
+        row.get("symbol")
+        for row in rows
+        if row.get("record") == "ticker" and row.get("status") == "ok"
+    }
+    kept = [row for row in rows if row.get("symbol") in completed]
+    if torn or len(kept) != len(rows):
+        tmp_path = f"{sink_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for row in kept:
+                f.write(json.dumps(row, default=str) + "\n")
+        os.replace(tmp_path, sink_path)
+    return completed
+
+
+def _write_ticker(sink, symbol: str, detections: list[dict], status: dict) -> None:
+    for detection in detections:
+        sink.write(json.dumps({"record": "detection", **detection}, default=str) + "\n")
+    marker = {"record": "ticker", "symbol": symbol, "detections": len(detections), **status}
+    sink.write(json.dumps(marker, default=str) + "\n")
+    sink.flush()
+    os.fsync(sink.fileno())
+
+
+def scan_universe(
+    symbols: Iterable[str],
+    fetch_histories: Callable[[list[str]], dict[str, list[dict]]],
+    sp500_history: list[dict],
+    sink_path: str,
+    *,
+    metadata: dict[str, dict] | None = None,
+    workers: int = 1,
+    resume: bool = False,
+    fetch_chunk: int = 20,
+    stride_days: int = 5,
+    outcome_days: int = 60,
+    lookback_days: int = 120,
+    analyzer_kwargs: dict | None = None,
+    on_ticker: Callable[[str, dict], None] | None = None,
+) -> dict:
+    """Scan every symbol's history for VCPs and stream results to ``sink_path``.
+
+    Args:
+        symbols: Tickers to scan, in order.
+        fetch_histories: Called with a chunk of symbols; returns
+            ``{symbol: most-recent-first bars}``. Missing symbols are recorded
+            with status ``no_data``.
+        sp500_history: SPY bars shared by every scan (fetched once).
+        sink_path: JSONL output; appended to when ``resume`` is set.
+        metadata: Optional ``{symbol: {"sector": ..., "company_name": ...}}``.
+        workers: Process count; 1 scans inline in the calling process.
+        resume: Skip tickers already marked ``ok`` in ``sink_path``.
+        fetch_chunk: Symbols per ``fetch_histories`` call.
+        stride_days / outcome_days / lookback_days / analyzer_kwargs:
+            Forwarded to ``scan_history``.
+        on_ticker: Progress callback ``(symbol, marker_row)``.
+
+    Returns:
+        Counts: ``tickers``, ``skipped`` (already done), ``ok``, ``no_data``,
+        ``errors``, ``detections``.
+    """
+    if not resume and os.path.exists(sink_path):
+        raise FileExistsError(f"{sink_path} already exists; pass resume=True to continue it")
+    done = load_completed(sink_path) if resume else set()
+
+    symbols = list(dict.fromkeys(symbols))
+    pending = [s for s in symbols if s not in done]
+    metadata = metadata or {}
+    scan_kwargs = {
+        "stride_days": stride_days,
+        "outcome_days": outcome_days,
+        "lookback_days": lookback_days,
+        "analyzer_kwargs": analyzer_kwargs,
+    }
+    stats = {
+        "tickers": len(symbols),
+        "skipped": len(symbols) - len(pending),
+        "ok": 0,
+        "no_data": 0,
+        "errors": 0,
+        "detections": 0,
+    }
+
+    sink_dir = os.path.dirname(os.path.abspath(sink_path))
+    os.makedirs(sink_dir, exist_ok=True)
+
+    with open(sink_path, "a", encoding="utf-8") as sink:
+
+        def record(symbol: str, detections: list[dict], status: dict) -> None:
+            _write_ticker(sink, symbol, detections, status)
+            key = "errors" if status["status"] == "error" else status["status"]
+            stats[key] += 1
+            stats["detections"] += len(detections)
+            if on_ticker is not None:
+                on_ticker(symbol, {"symbol": symbol, "detections": len(detections), **status})
+
+        def fetched_chunks():
+            for start in range(0, len(pending), fetch_chunk):
+                chunk = pending[start : start + fetch_chunk]
+                histories = fetch_histories(chunk)
+                for symbol in chunk:
+                    historical = histories.get(symbol) or []
+                    if not historical:
+                        record(symbol, [], {"status": "no_data", "bars": 0, "error": None})
+                    else:
+                        yield symbol, historical
+
+        if workers <= 1:
+            _init_worker(sp500_history, scan_kwargs)
+            for symbol, historical in fetched_chunks():
+                status = {"status": "ok", "bars": len(historical), "error": None}
+                try:
+                    detections = _scan_ticker(symbol, historical, metadata.get(symbol, {}))
+                except Exception as exc:  # one bad ticker must not end the run
+                    detections = []
+                    status.update(status="error", error=f"{type(exc).__name__}: {exc}")
+                record(symbol, detections, status)
+            return stats
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(sp500_history, scan_kwargs),
+        ) as pool:
+            in_flight: dict = {}
+
+            def drain(block_until: int) -> None:
+                # Write finished tickers until at most ``block_until`` remain.
+                while len(in_flight) > block_until:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        symbol, bars = in_flight.pop(future)
+                        status = {"status": "ok", "bars": bars, "error": None}
+                        try:
+                            detections = future.result()
+                        except Exception as exc:
+                            detections = []
+                            status.update(status="error", error=f"{type(exc).__name__}: {exc}")
+                        record(symbol, detections, status)
+
+            # Bound queued histories to 2x workers so memory stays flat on
+            # large universes while fetching keeps the pool busy.
+            for symbol, historical in fetched_chunks():
+                future = pool.submit(_scan_ticker, symbol, historical, metadata.get(symbol, {}))
+                in_flight[future] = (symbol, len(historical))
+                drain(2 * workers)
+            drain(0)
+
+    return stats
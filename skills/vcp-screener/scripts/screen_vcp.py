@@ -15,6 +15,9 @@ Usage:
     # Full S&P 500 (requires paid API tier)
     python3 screen_vcp.py --full-sp500
 
+    # Historical VCP outcome dataset over a universe (resumable JSONL)
+    python3 screen_vcp.py --history --full-sp500 --workers 8 --resume
+
 Output:
     - JSON: vcp_screener_YYYY-MM-DD_HHMMSS.json
     - Markdown: vcp_screener_YYYY-MM-DD_HHMMSS.md
@@ -34,11 +37,13 @@ from calculators.pattern_classifier import classify_pattern
 from calculators.pivot_proximity_calculator import calculate_pivot_proximity
 from calculators.relative_strength_calculator import (
     calculate_relative_strength,
+    calculate_relative_strength_from_closes,
     rank_relative_strength_universe,
 )
 from calculators.trend_template_calculator import calculate_trend_template
 from calculators.vcp_pattern_calculator import calculate_vcp_pattern
 from calculators.volume_pattern_calculator import calculate_volume_pattern
+from calculators.walk_forward import WalkForwardSeries
 from fmp_client import FMPClient
 from report_generator import generate_json_report, generate_markdown_report
 from scorer import calculate_composite_score
@@ -56,6 +61,13 @@ def parse_arguments():
     parser.add_argument(
         "--api-key", help="FMP API key (defaults to FMP_API_KEY environment variable)"
     )
+    parser.add_argument(
+        "--fmp-plan",
+        choices=["starter", "premium", "ultimate"],
+        default=None,
+        help="FMP plan tier; enables concurrent fetching paced to the plan's "
+        "calls/min (defaults to FMP_PLAN environment variable, else serial)",
+    )
     parser.add_argument(
         "--max-candidates",
         type=int,
@@ -175,7 +187,7 @@ def parse_arguments():
         ),
     )
 
-    hist_group = parser.add_argument_group("Historical single-ticker mode")
+    hist_group = parser.add_argument_group("Historical mode (single ticker or universe)")
     # --history accepts an optional integer: scan-window length in trading days.
     # Bare --history uses DEFAULT_HISTORY_DAYS (5 years). The total fetch is
     # this value plus lookback, outcome window, and a safety buffer (computed
@@ -209,6 +221,25 @@ def parse_arguments():
         default=60,
         help="Forward window for outcome evaluation (default 60)",
     )
+    hist_group.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Universe history mode: scan processes (default: CPU count)",
+    )
+    hist_group.add_argument(
+        "--sink",
+        default=None,
+        help=(
+            "Universe history mode: JSONL output for detections "
+            "(default: OUTPUT_DIR/vcp_history_universe.jsonl)"
+        ),
+    )
+    hist_group.add_argument(
+        "--resume",
+        action="store_true",
+        help="Universe history mode: continue an existing sink, skipping finished tickers",
+    )
 
     args = parser.parse_args()
 
@@ -231,8 +262,8 @@ def parse_arguments():
     if not (30 <= args.lookback_days <= 365):
         parser.error("--lookback-days must be 30-365")
     if args.history is not None:
-        if not args.ticker:
-            parser.error("--history requires --ticker SYM")
+        if not (args.ticker or args.universe or args.full_sp500):
+            parser.error("--history requires --ticker SYM, --universe SYM ... or --full-sp500")
         if not (100 <= args.history <= 5040):
             parser.error(
                 "--history must be 100-5040 trading days (approximately 5 months to 20 years)"
@@ -241,6 +272,8 @@ def parse_arguments():
             parser.error("--stride-days must be 1-60")
         if not (5 <= args.outcome_days <= 252):
             parser.error("--outcome-days must be 5-252")
+        if args.workers < 1:
+            parser.error("--workers must be >= 1")
 
     return args
 
@@ -321,6 +354,7 @@ def analyze_stock(
     max_sma200_extension: float = 50.0,
     wide_and_loose_threshold: float = 15.0,
     as_of_offset: int = 0,
+    walk_forward: Optional[WalkForwardSeries] = None,
 ) -> Optional[dict]:
     """
     Full VCP analysis for a single stock (Phase 3).
@@ -336,6 +370,10 @@ def analyze_stock(
             ``sp500_history`` is sliced identically so RS comparisons stay
             aligned. Bars more recent than ``historical[as_of_offset]`` are
             ignored.
+        walk_forward: Optional ``WalkForwardSeries`` built from the same
+            ``historical`` / ``sp500_history``. Closes and ATRs are then read
+            from its precomputed columns instead of being re-extracted at
+            every cursor; results are identical.
     """
     # Historical mode: shift the as-of cursor by slicing both arrays so
     # historical[as_of_offset] becomes index 0 for every downstream calculator.
@@ -348,7 +386,13 @@ def analyze_stock(
     market_cap = quote.get("marketCap", 0)
 
     # 1. Relative Strength (needed for Trend Template criterion 7)
-    rs_result = calculate_relative_strength(historical, sp500_history)
+    closes = walk_forward.closes_from(as_of_offset) if walk_forward is not None else None
+    if walk_forward is not None:
+        rs_result = calculate_relative_strength_from_closes(
+            closes, walk_forward.sp500_closes_from(as_of_offset)
+        )
+    else:
+        rs_result = calculate_relative_strength(historical, sp500_history)
     rs_rank = rs_result.get("rs_rank_estimate", 0)
 
     # 2. Trend Template
@@ -358,6 +402,7 @@ def analyze_stock(
         rs_rank=rs_rank,
         ext_threshold=ext_threshold,
         max_sma200_extension=max_sma200_extension,
+        closes=closes,
     )
 
     # 3. VCP Pattern Detection
@@ -370,6 +415,9 @@ def analyze_stock(
         t1_depth_min=t1_depth_min,
         contraction_ratio=contraction_ratio,
         wide_and_loose_threshold=wide_and_loose_threshold,
+        window=walk_forward.vcp_window(as_of_offset, lookback_days)
+        if walk_forward is not None
+        else None,
     )
 
     # 4. Volume Pattern
@@ -384,6 +432,11 @@ def analyze_stock(
         pivot_price=pivot_price,
         contractions=vcp_result.get("contractions"),
         breakout_volume_ratio=breakout_volume_ratio,
+        **(
+            walk_forward.volume_window(as_of_offset, lookback_days)
+            if walk_forward is not None
+            else {}
+        ),
     )
 
     # 5. Pivot Proximity
@@ -554,6 +607,21 @@ def compute_entry_ready(
     return True
 
 
+def historical_analyzer_kwargs(args) -> dict:
+    """VCP tuning flags forwarded to ``analyze_stock`` by the historical modes."""
+    return {
+        "ext_threshold": args.ext_threshold,
+        "min_contractions": args.min_contractions,
+        "t1_depth_min": args.t1_depth_min,
+        "contraction_ratio": args.contraction_ratio,
+        "atr_multiplier": args.atr_multiplier,
+        "min_contraction_days": args.min_contraction_days,
+        "breakout_volume_ratio": args.breakout_volume_ratio,
+        "max_sma200_extension": args.max_sma200_extension,
+        "wide_and_loose_threshold": args.wide_and_loose_threshold,
+    }
+
+
 def run_historical(args, client) -> None:
     """Historical single-ticker scan: fetch long history, walk the as-of
     cursor, attach forward outcomes, write reports. Exits via return."""
@@ -602,17 +670,7 @@ def run_historical(args, client) -> None:
         f"  Sweeping history (stride={args.stride_days}d, "
         f"lookback={args.lookback_days}d, outcome={args.outcome_days}d)..."
     )
-    analyzer_kwargs = {
-        "ext_threshold": args.ext_threshold,
-        "min_contractions": args.min_contractions,
-        "t1_depth_min": args.t1_depth_min,
-        "contraction_ratio": args.contraction_ratio,
-        "atr_multiplier": args.atr_multiplier,
-        "min_contraction_days": args.min_contraction_days,
-        "breakout_volume_ratio": args.breakout_volume_ratio,
-        "max_sma200_extension": args.max_sma200_extension,
-        "wide_and_loose_threshold": args.wide_and_loose_threshold,
-    }
+    analyzer_kwargs = historical_analyzer_kwargs(args)
     detections = scan_history(
         ticker,
         historical,
@@ -659,6 +717,94 @@ def run_historical(args, client) -> None:
     print()
 
 
+def run_historical_universe(args, client) -> None:
+    """Historical scan over ``--universe`` / ``--full-sp500``: fetch SPY once,
+    scan tickers on a process pool, stream detections to a JSONL sink."""
+    from historical_scanner import sanitize_ticker
+    from historical_universe import scan_universe
+
+    metadata: dict[str, dict] = {}
+    if args.universe:
+        try:
+            symbols = [sanitize_ticker(sym) for sym in args.universe]
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        constituents = client.get_sp500_constituents()
+        if not constituents:
+            print("ERROR: Unable to fetch S&P 500 constituents", file=sys.stderr)
+            sys.exit(1)
+        symbols = [c["symbol"] for c in constituents]
+        metadata = {
+            c["symbol"]: {
+                "sector": c.get("sector", "Unknown"),
+                "company_name": c.get("name", c["symbol"]),
+            }
+            for c in constituents
+        }
+
+    # Same fetch sizing as the single-ticker scan (see run_historical).
+    fetch_days = args.history + args.lookback_days + args.outcome_days + 60
+    sink_path = args.sink or os.path.join(args.output_dir, "vcp_history_universe.jsonl")
+    if os.path.exists(sink_path) and not args.resume:
+        print(
+            f"ERROR: {sink_path} already exists; pass --resume to continue it "
+            "or --sink to start a new file",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    print()
+    print(f"Historical VCP Universe Scan — {len(symbols)} tickers")
+    print("-" * 70)
+    print(f"  Fetching {fetch_days}-day SPY history...", end=" ", flush=True)
+    spy_data = client.get_historical_prices("SPY", days=fetch_days)
+    sp500_history = spy_data.get("historical", []) if spy_data else []
+    print(f"OK ({len(sp500_history)} bars)" if sp500_history else "WARN - unavailable")
+
+    def fetch_histories(chunk: list[str]) -> dict[str, list[dict]]:
+        histories = client.get_batch_historical(chunk, days=fetch_days)
+        # Histories are handed to the pool once; don't keep every ticker's
+        # bars alive in the client's in-memory response cache.
+        for sym in chunk:
+            client.cache.pop(f"prices_{sym}_{fetch_days}", None)
+        return histories
+
+    def progress(symbol: str, marker: dict) -> None:
+        detail = marker["error"] or f"{marker['detections']} detections"
+        print(f"    {symbol}: {marker['status']} ({detail})", flush=True)
+
+    print(
+        f"  Sweeping histories (workers={args.workers}, stride={args.stride_days}d, "
+        f"lookback={args.lookback_days}d, outcome={args.outcome_days}d) -> {sink_path}"
+    )
+    stats = scan_universe(
+        symbols,
+        fetch_histories,
+        sp500_history,
+        sink_path,
+        metadata=metadata,
+        workers=args.workers,
+        resume=args.resume,
+        stride_days=args.stride_days,
+        outcome_days=args.outcome_days,
+        lookback_days=args.lookback_days,
+        analyzer_kwargs=historical_analyzer_kwargs(args),
+        on_ticker=progress,
+    )
+
+    print()
+    print("=" * 70)
+    print("Historical VCP universe scan complete")
+    print("=" * 70)
+    print(f"  Tickers:    {stats['tickers']} ({stats['skipped']} already in sink)")
+    print(f"  Scanned:    {stats['ok']} ok, {stats['no_data']} no data, {stats['errors']} errors")
+    print(f"  Detections: {stats['detections']}")
+    print(f"  Sink:       {sink_path}")
+    print()
+
+
 def main():
     args = parse_arguments()
 
@@ -674,7 +820,7 @@ def main():
 
     # Initialize FMP client
     try:
-        client = FMPClient(api_key=args.api_key)
+        client = FMPClient(api_key=args.api_key, plan=args.fmp_plan)
         print("FMP API client initialized")
     except ValueError as e:
         print(f"ERROR: {e}", file=sys.stderr)
@@ -684,7 +830,10 @@ def main():
     # Historical single-ticker mode dispatch — completes via early return.
     # ------------------------------------------------------------------------
     if args.history is not None:
-        run_historical(args, client)
+        if args.ticker:
+            run_historical(args, client)
+        else:
+            run_historical_universe(args, client)
         return
 
     # ========================================================================
@@ -761,13 +910,8 @@ def main():
     candidate_symbols = [c[0] for c in candidates]
     print(f"  Fetching 260-day histories for {len(candidate_symbols)} candidates...")
 
-    candidate_histories = {}
-    for i, sym in enumerate(candidate_symbols):
-        if (i + 1) % 20 == 0 or i == len(candidate_symbols) - 1:
-            print(f"    Progress: {i + 1}/{len(candidate_symbols)}", flush=True)
-        data = client.get_historical_prices(sym, days=260)
-        if data and "historical" in data:
-            candidate_histories[sym] = data["historical"]
+    candidate_histories = client.get_batch_historical(candidate_symbols, days=260)
+    print(f"    Fetched {len(candidate_histories)}/{len(candidate_symbols)} histories", flush=True)
 
     # Apply Trend Template filter
     print("  Applying 7-point Trend Template...", end=" ", flush=True)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Tests for the multi-ticker historical VCP scan (historical_universe.py)."""
+
+import json
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+from test_historical_vcp import _random_walk_prices  # noqa: E402
+
+SYMBOLS = ["AAA", "BBB", "CCC"]
+
+
+def _universe():
+    return {sym: _random_walk_prices(700, seed=i, vol=0.025) for i, sym in enumerate(SYMBOLS)}
+
+
+def _spy():
+    return _random_walk_prices(700, seed=99, start=400.0, vol=0.01)
+
+
+def _rows(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _detections_by_symbol(rows):
+    out = {}
+    for row in rows:
+        if row["record"] == "detection":
+            out.setdefault(row["symbol"], []).append(
+                {k: v for k, v in row.items() if k != "record"}
+            )
+    return out
+
+
+class _Fetcher:
+    def __init__(self, histories):
+        self.histories = histories
+        self.requested = []
+
+    def __call__(self, chunk):
+        self.requested.extend(chunk)
+        return {s: self.histories[s] for s in chunk if s in self.histories}
+
+
+class TestScanUniverse:
+    def test_sink_matches_single_ticker_scans(self, tmp_path):
+        from historical_scanner import scan_history
+        from historical_universe import scan_universe
+
+        histories, spy = _universe(), _spy()
+        sink = tmp_path / "out.jsonl"
+        stats = scan_universe([*SYMBOLS, "NONE"], _Fetcher(histories), spy, str(sink))
+
+        rows = _rows(sink)
+        markers = {r["symbol"]: r for r in rows if r["record"] == "ticker"}
+        assert markers["NONE"]["status"] == "no_data"
+        assert all(markers[s]["status"] == "ok" for s in SYMBOLS)
+
+        by_symbol = _detections_by_symbol(rows)
+        expected_total = 0
+        for sym in SYMBOLS:
+            expected = json.loads(json.dumps(scan_history(sym, histories[sym], spy), default=str))
+            assert by_symbol.get(sym, []) == expected
+            assert markers[sym]["detections"] == len(expected)
+            expected_total += len(expected)
+        assert expected_total > 0
+        assert stats == {
+            "tickers": 4,
+            "skipped": 0,
+            "ok": 3,
+            "no_data": 1,
+            "errors": 0,
+            "detections": expected_total,
+        }
+
+    def test_process_pool_writes_same_rows(self, tmp_path):
+        from historical_universe import scan_universe
+
+        histories, spy = _universe(), _spy()
+        scan_universe(SYMBOLS, _Fetcher(histories), spy, str(tmp_path / "inline.jsonl"))
+        scan_universe(
+            SYMBOLS,
+            _Fetcher(histories),
+            spy,
+            str(tmp_path / "pool.jsonl"),
+            workers=2,
+            fetch_chunk=1,
+        )
+
+        inline = _rows(tmp_path / "inline.jsonl")
+        pooled = _rows(tmp_path / "pool.jsonl")
+        assert _detections_by_symbol(pooled) == _detections_by_symbol(inline)
+        assert sorted(r["symbol"] for r in pooled if r["record"] == "ticker") == SYMBOLS
+
+    def test_existing_sink_requires_resume(self, tmp_path):
+        from historical_universe import scan_universe
+
+        sink = tmp_path / "out.jsonl"
+        sink.write_text("")
+        with pytest.raises(FileExistsError):
+            scan_universe(SYMBOLS, _Fetcher({}), _spy(), str(sink))
+
+    def test_resume_skips_finished_and_drops_partial_ticker(self, tmp_path):
+        from historical_universe import scan_universe
+
+        histories, spy = _universe(), _spy()
+        full = tmp_path / "full.jsonl"
+        scan_universe(SYMBOLS, _Fetcher(histories), spy, str(full))
+        rows = _rows(full)
+
+        # Simulate a crash while writing BBB: AAA is complete, BBB has
+        # detection rows but no marker, and the last line is torn.
+        aaa = [r for r in rows if r["symbol"] == "AAA"]
+        bbb_detections = [r for r in rows if r["symbol"] == "BBB" and r["record"] == "detection"]
+        assert bbb_detections, "fixture must give BBB detections to drop"
+        crashed = tmp_path / "crashed.jsonl"
+        lines = [json.dumps(r) for r in aaa + bbb_detections]
+        crashed.write_text("\n".join(lines) + '\n{"record": "detec')
+
+        fetcher = _Fetcher(histories)
+        stats = scan_universe(SYMBOLS, fetcher, spy, str(crashed), resume=True)
+
+        assert fetcher.requested == ["BBB", "CCC"]
+        assert stats["skipped"] == 1 and stats["ok"] == 2
+        assert _detections_by_symbol(_rows(crashed)) == _detections_by_symbol(rows)
+
+    def test_worker_error_is_recorded_and_run_continues(self, tmp_path):
+        from historical_universe import scan_universe
+
+        histories = _universe()
+        histories["BBB"] = [{"date": "bad"}] * 400  # no prices -> scan raises
+        sink = tmp_path / "out.jsonl"
+        stats = scan_universe(SYMBOLS, _Fetcher(histories), _spy(), str(sink))
+
+        markers = {r["symbol"]: r for r in _rows(sink) if r["record"] == "ticker"}
+        assert markers["BBB"]["status"] == "error"
+        assert markers["CCC"]["status"] == "ok"
+        assert stats["errors"] == 1
+
+        # Errored tickers are retried on resume.
+        assert (
+            scan_universe(SYMBOLS, _Fetcher(_universe()), _spy(), str(sink), resume=True)["ok"] == 1
+        )
+
+
+class _StubUniverseClient:
+    def __init__(self, histories, spy):
+        self.histories = histories
+        self.spy = spy
+        self.cache = {}
+        self.spy_calls = 0
+
+    def get_historical_prices(self, symbol, days=365):
+        assert symbol == "SPY"
+        self.spy_calls += 1
+        return {"symbol": "SPY", "historical": self.spy}
+
+    def get_batch_historical(self, symbols, days=260):
+        return {s: self.histories[s] for s in symbols if s in self.histories}
+
+
+class TestRunHistoricalUniverse:
+    def _args(self, tmp_path, **overrides):
+        args = types.SimpleNamespace(
+            universe=list(SYMBOLS),
+            history=300,
+            stride_days=10,
+            outcome_days=60,
+            lookback_days=120,
+            output_dir=str(tmp_path),
+            sink=None,
+            resume=False,
+            workers=1,
+            ext_threshold=8.0,
+            min_contractions=2,
+            t1_depth_min=10.0,
+            contraction_ratio=0.70,
+            atr_multiplier=1.5,
+            min_contraction_days=5,
+            breakout_volume_ratio=1.5,
+            max_sma200_extension=50.0,
+            wide_and_loose_threshold=15.0,
+        )
+        vars(args).update(overrides)
+        return args
+
+    def test_fetches_spy_once_and_writes_sink(self, tmp_path):
+        from screen_vcp import run_historical_universe
+
+        client = _StubUniverseClient(_universe(), _spy())
+        run_historical_universe(self._args(tmp_path), client)
+
+        assert client.spy_calls == 1
+        markers = [
+            r for r in _rows(tmp_path / "vcp_history_universe.jsonl") if r["record"] == "ticker"
+        ]
+        assert [m["symbol"] for m in markers] == SYMBOLS
+
+        with pytest.raises(SystemExit):
+            run_historical_universe(self._args(tmp_path), client)
+        run_historical_universe(self._args(tmp_path, resume=True), client)
+
+    def test_cli_accepts_universe_history(self, monkeypatch):
+        from screen_vcp import parse_arguments
+
+        monkeypatch.setattr(
+            sys, "argv", ["screen_vcp.py", "--history", "--universe", "AAPL", "MSFT", "--resume"]
+        )
+        args = parse_arguments()
+        assert args.ticker is None and args.universe == ["AAPL", "MSFT"] and args.resume
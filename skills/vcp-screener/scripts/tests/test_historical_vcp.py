@@ -6,6 +6,7 @@ Covers:
 - build_quote_from_history (no-lookahead contract)
 - calculate_forward_outcome (breakout / stop-hit / timeout paths)
 - HistoricalScanner walk + dedup
+- WalkForwardSeries equivalence with the per-cursor path
 """
 
 import os
@@ -421,6 +422,64 @@ class TestHistoricalScannerDedup:
         assert scan_history("TEST", hist, spy, lookback_days=120) == []
 
 
+# ===========================================================================
+# WalkForwardSeries — precomputed columns must not change any output
+# ===========================================================================
+
+
+def _random_walk_prices(n, seed, start=50.0, vol=0.02):
+    """Noisy most-recent-first OHLCV so real VCPs (and gaps in fields) occur."""
+    import random
+
+    rng = random.Random(seed)
+    close = start
+    bars = []
+    for i in range(n):
+        close *= 1 + rng.gauss(0.0006, vol)
+        bars.append(
+            {
+                "date": f"d{i:05d}",
+                "open": close,
+                "high": close * (1 + abs(rng.gauss(0, 0.01))),
+                "low": close * (1 - abs(rng.gauss(0, 0.01))),
+                "close": close,
+                "adjClose": close,
+                "volume": rng.randint(500_000, 3_000_000),
+            }
+        )
+    return bars[::-1]
+
+
+class TestWalkForwardSeries:
+    def test_analyze_stock_matches_per_cursor_path(self):
+        from calculators.walk_forward import WalkForwardSeries
+        from historical_scanner import build_quote_from_history
+        from screen_vcp import analyze_stock
+
+        hist = _random_walk_prices(600, seed=3)
+        spy = _random_walk_prices(600, seed=4, start=400.0, vol=0.01)
+        del hist[10]["date"]  # exercise the day-N date fallback
+        series = WalkForwardSeries(hist, spy)
+
+        for offset in (0, 1, 17, 250, 480):
+            assert series.quote(offset) == build_quote_from_history(hist, offset)
+            quote = build_quote_from_history(hist, offset)
+            expected = analyze_stock("T", hist, quote, spy, as_of_offset=offset)
+            actual = analyze_stock("T", hist, quote, spy, as_of_offset=offset, walk_forward=series)
+            assert actual == expected
+
+    @pytest.mark.parametrize("stride", [5, 1])
+    def test_scan_history_identical_to_legacy_walk(self, stride):
+        from historical_scanner import scan_history
+
+        hist = _random_walk_prices(900, seed=8, vol=0.025)
+        spy = _random_walk_prices(900, seed=9, start=400.0, vol=0.01)
+
+        legacy = scan_history("T", hist, spy, stride_days=stride, walk_forward=False)
+        assert legacy  # the fixture must actually produce detections
+        assert scan_history("T", hist, spy, stride_days=stride) == legacy
+
+
 class TestHistoryFlagParsing:
     """--history takes an optional integer (trading days to scan).
     Bare --history defaults to the canonical 5-year window."""